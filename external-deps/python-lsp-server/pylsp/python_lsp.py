@@ -1,12 +1,15 @@
 # Copyright 2017-2020 Palantir Technologies, Inc.
 # Copyright 2021- Python Language Server Contributors.
 
+import hashlib
 import logging
 import os
 import socketserver
 import sys
 import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
 from typing import Any
 
@@ -28,6 +31,8 @@
 
 
 LINT_DEBOUNCE_S = 0.5  # 500 ms
+LINT_MAX_WORKERS = 8
+LINT_CACHE_SIZE = 256
 PARENT_PROCESS_WATCH_INTERVAL = 10  # 10 s
 MAX_WORKERS = 64
 PYTHON_FILE_EXTENSIONS = (".py", ".pyi")
@@ -113,7 +118,6 @@ def start_ws_lang_server(port, check_parent_process, handler_class) -> None:
     # imports needed only for websockets based server
     try:
         import asyncio
-        from concurrent.futures import ThreadPoolExecutor
 
         import websockets
     except ImportError as e:
@@ -211,6 +215,12 @@ def __init__(
         self._dispatchers = []
         self._shutdown = False
 
+        # Linting state
+        self._lint_executor = None
+        self._lint_cache = OrderedDict()
+        self._lint_cache_lock = threading.Lock()
+        self._lint_results = {}
+
     def start(self) -> None:
         """Entry point for the server."""
         self._jsonrpc_stream_reader.listen(self._endpoint.consume)
@@ -254,6 +264,8 @@ def m_invalid_request_after_shutdown(self, **_kwargs):
         }
 
     def m_exit(self, **_kwargs) -> None:
+        if self._lint_executor is not None:
+            self._lint_executor.shutdown(wait=False)
         self._endpoint.shutdown()
         if self._jsonrpc_stream_reader is not None:
             self._jsonrpc_stream_reader.close()
@@ -469,11 +481,153 @@ def lint(self, doc_uri, is_saved) -> None:
     def _lint_text_document(
         self, doc_uri, workspace, is_saved, doc_version=None
     ) -> None:
-        workspace.publish_diagnostics(
-            doc_uri,
-            flatten(self._hook("pylsp_lint", doc_uri, is_saved=is_saved)),
-            doc_version,
+        """
+        Lint a text document.
+
+        Each linter runs concurrently in a thread pool and the diagnostics are
+        published every time one of them finishes, together with the latest
+        ones reported by the others. Results are cached per linter by the
+        document contents and settings, so linting a known state again
+        (e.g. after an undo) doesn't run the linter.
+        """
+        hook_impls = self._lint_hook_impls()
+        if hook_impls is None:
+            workspace.publish_diagnostics(
+                doc_uri,
+                flatten(self._hook("pylsp_lint", doc_uri, is_saved=is_saved)),
+                doc_version,
+            )
+            return
+
+        # Lint a snapshot of the document, so the diagnostics correspond to
+        # the source that was hashed even if the document changes while the
+        # linters run in other threads.
+        document = workspace.get_document(doc_uri)
+        source = document.source
+        document = workspace._create_document(
+            doc_uri, source=source, version=document.version
+        )
+        source_hash = hashlib.sha256(
+            source.encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        settings_hash = hashlib.sha256(
+            repr(self.config.settings(document_path=document.path)).encode()
+        ).hexdigest()
+        plugin_names = [impl.plugin_name for impl in hook_impls]
+
+        # Start from the last diagnostics of the linters that are still
+        # enabled, so results are not lost while the others are running.
+        # A newer lint of the same document replaces this dict, which tells
+        # this one to stop publishing.
+        previous_results = self._lint_results.get(doc_uri, {})
+        results = {
+            name: previous_results[name]
+            for name in plugin_names
+            if name in previous_results
+        }
+        self._lint_results[doc_uri] = results
+
+        def publish():
+            # Keep the same order the hook would use
+            workspace.publish_diagnostics(
+                doc_uri,
+                flatten(
+                    results[name] for name in reversed(plugin_names) if name in results
+                ),
+                doc_version,
+            )
+
+        hook_kwargs = {
+            "config": self.config,
+            "workspace": workspace,
+            "document": document,
+            "is_saved": is_saved,
+        }
+
+        futures = {}
+        for impl in hook_impls:
+            cache_key = (
+                doc_uri,
+                impl.plugin_name,
+                source_hash,
+                settings_hash,
+                is_saved,
+            )
+            with self._lint_cache_lock:
+                diagnostics = self._lint_cache.get(cache_key)
+                if diagnostics is not None:
+                    self._lint_cache.move_to_end(cache_key)
+
+            if diagnostics is not None:
+                results[impl.plugin_name] = diagnostics
+            else:
+                future = self._get_lint_executor().submit(
+                    self._run_lint_hook, impl, hook_kwargs
+                )
+                futures[future] = (impl.plugin_name, cache_key)
+
+        if not futures:
+            publish()
+            return
+
+        for future in as_completed(futures):
+            plugin_name, cache_key = futures[future]
+            diagnostics = future.result()
+            if diagnostics is None:
+                # The linter failed, so don't cache its result
+                diagnostics = []
+            else:
+                with self._lint_cache_lock:
+                    self._lint_cache[cache_key] = diagnostics
+                    if len(self._lint_cache) > LINT_CACHE_SIZE:
+                        self._lint_cache.popitem(last=False)
+
+            if self._lint_results.get(doc_uri) is not results:
+                # The document was closed or is being linted again
+                continue
+
+            results[plugin_name] = diagnostics
+            publish()
+
+    def _lint_hook_impls(self):
+        """
+        Return the enabled implementations of the pylsp_lint hook.
+
+        None is returned if they can't be called independently because some
+        of them wrap the others.
+        """
+        hook_caller = self.config.plugin_manager.subset_hook_caller(
+            "pylsp_lint", self.config.disabled_plugins
         )
+        hook_impls = hook_caller.get_hookimpls()
+        if any(
+            impl.hookwrapper or getattr(impl, "wrapper", False) for impl in hook_impls
+        ):
+            return None
+        return hook_impls
+
+    def _get_lint_executor(self):
+        if self._lint_executor is None:
+            self._lint_executor = ThreadPoolExecutor(
+                max_workers=LINT_MAX_WORKERS, thread_name_prefix="pylsp-lint"
+            )
+        return self._lint_executor
+
+    @staticmethod
+    def _run_lint_hook(hook_impl, hook_kwargs):
+        """Run a single pylsp_lint implementation, returning None on errors."""
+        try:
+            diagnostics = hook_impl.function(
+                *[hook_kwargs[argname] for argname in hook_impl.argnames]
+            )
+        except Exception:
+            log.exception("Failed to run %s linter", hook_impl.plugin_name)
+            return None
+        return diagnostics or []
+
+    def _clear_lint_cache(self) -> None:
+        with self._lint_cache_lock:
+            self._lint_cache.clear()
 
     def _lint_notebook_document(self, notebook_document, workspace) -> None:
         """
@@ -671,6 +825,7 @@ def m_notebook_document__did_change(
 
     def m_text_document__did_close(self, textDocument=None, **_kwargs) -> None:
         workspace = self._match_uri_to_workspace(textDocument["uri"])
+        self._lint_results.pop(textDocument["uri"], None)
         workspace.publish_diagnostics(textDocument["uri"], [])
         workspace.rm_document(textDocument["uri"])
 
@@ -832,6 +987,7 @@ def m_text_document__signature_help(
     def m_workspace__did_change_configuration(self, settings=None) -> None:
         if self.config is not None:
             self.config.update((settings or {}).get("pylsp", {}))
+        self._clear_lint_cache()
         for workspace in self.workspaces.values():
             workspace.update_config(settings)
             self._hook("pylsp_workspace_configuration_changed")
@@ -908,6 +1064,10 @@ def m_workspace__did_change_watched_files(self, changes=None, **_kwargs):
             # Only externally changed python files and lint configs may result in changed diagnostics.
             return
 
+        # Linters like pylint or flake8 can depend on other files or read
+        # their own config files, so cached results may no longer be valid.
+        self._clear_lint_cache()
+
         for workspace in self.workspaces.values():
             for doc_uri in workspace.documents:
                 # Changes in doc_uri are already handled by m_text_document__did_save
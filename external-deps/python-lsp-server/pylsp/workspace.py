@@ -2,7 +2,6 @@
 # Copyright 2021- Python Language Server Contributors.
 
 import functools
-import io
 import logging
 import os
 import re
@@ -414,6 +413,8 @@ def __init__(
         self._workspace = workspace
         self._local = local
         self._source = source
+        self._lines = None
+        self._line_offsets = None
         self._extra_sys_path = extra_sys_path or []
         self._rope_project_builder = rope_project_builder
         self._lock = RLock()
@@ -431,16 +432,42 @@ def _rope_resource(self, rope_config):
     @property
     @lock
     def lines(self):
-        return self.source.splitlines(True)
+        return list(self._get_lines())
 
     @property
     @lock
     def source(self):
         if self._source is None:
+            if self._lines is not None:
+                # Incremental changes are kept as a list of lines, so only
+                # join them when the full text is actually requested.
+                self._source = "".join(self._lines)
+                return self._source
             with open(self.path, encoding="utf-8") as f:
                 return f.read()
         return self._source
 
+    def _get_lines(self):
+        """
+        Return the cached list of lines of the document.
+
+        Callers must not modify the returned list.
+        """
+        if self._lines is None:
+            if self._source is None:
+                # Don't cache the contents of documents read from disk
+                # because they can change behind our back.
+                return self.source.splitlines(True)
+            self._lines = self._source.splitlines(True)
+            self._line_offsets = [0]
+        return self._lines
+
+    def _set_source(self, source):
+        """Replace the whole text of the document."""
+        self._source = source
+        self._lines = None
+        self._line_offsets = None
+
     def update_config(self, settings) -> None:
         self._config.update((settings or {}).get("pylsp", {}))
 
@@ -452,7 +479,7 @@ def apply_change(self, change):
 
         if not change_range:
             # The whole file has changed
-            self._source = text
+            self._set_source(text)
             return
 
         start_line = change_range["start"]["line"]
@@ -460,42 +487,60 @@ def apply_change(self, change):
         end_line = change_range["end"]["line"]
         end_col = change_range["end"]["character"]
 
-        # Check for an edit occuring at the very end of the file
-        lines = self.lines
-        if start_line == len(lines):
-            self._source = self.source + text
-            return
-
-        new = io.StringIO()
+        lines = self._get_lines()
+        if self._lines is None:
+            # The document was read from disk, so start tracking its lines
+            lines = list(lines)
+            self._lines = lines
+            self._line_offsets = [0]
 
-        # Iterate over the existing document until we hit the edit range,
-        # at which point we write the new text, then loop until we hit
-        # the end of the range and continue writing.
-        for i, line in enumerate(lines):
-            if i < start_line:
-                new.write(line)
-                continue
-
-            if i > end_line:
-                new.write(line)
-                continue
+        # Check for an edit occuring at the very end of the file
+        if start_line >= len(lines):
+            start_line = len(lines)
+            start_col = 0
+        if end_line >= len(lines):
+            end_line = len(lines)
+            end_col = 0
+
+        # Only the lines touched by the edit are rebuilt. One line of context
+        # is added on each side so that line breaks created or removed by
+        # the edit (e.g. a lone "\r" followed by "\n", or a deleted line
+        # break) are split again exactly as they would be in the full text.
+        first = max(start_line - 1, 0)
+        last = min(end_line + 2, len(lines))
+
+        head = "".join(lines[first:start_line])
+        if start_line < len(lines):
+            head += lines[start_line][:start_col]
+        tail = lines[end_line][end_col:] if end_line < len(lines) else ""
+        tail += "".join(lines[end_line + 1 : last])
+
+        lines[first:last] = (head + text + tail).splitlines(True)
+        self._source = None
+
+        # Offsets of the lines after the edit have to be computed again
+        del self._line_offsets[first + 1 :]
 
-            if i == start_line:
-                new.write(line[:start_col])
-                new.write(text)
+    @lock
+    def offset_at_position(self, position):
+        """Return the byte-offset pointed at by the given position."""
+        lines = self._get_lines()
+        line = min(position["line"], len(lines))
 
-            if i == end_line:
-                new.write(line[end_col:])
+        if self._lines is None:
+            return position["character"] + len("".join(lines[:line]))
 
-        self._source = new.getvalue()
+        # Extend the cumulative line offsets lazily up to the requested line
+        offsets = self._line_offsets
+        for i in range(len(offsets) - 1, line):
+            offsets.append(offsets[i] + len(lines[i]))
 
-    def offset_at_position(self, position):
-        """Return the byte-offset pointed at by the given position."""
-        return position["character"] + len("".join(self.lines[: position["line"]]))
+        return position["character"] + offsets[line]
 
+    @lock
     def word_at_position(self, position):
         """Get the word under the cursor returning the start and end positions."""
-        lines = self.lines
+        lines = self._get_lines()
         if position["line"] >= len(lines):
             return ""
 
@@ -0,0 +1,76 @@
+"""Benchmark incremental document changes.
+
+Replays a typing session over a large file, the same way a client sends
+``textDocument/didChange`` notifications, and reports how long applying the
+changes and resolving positions takes.
+"""
+
+import time
+from argparse import ArgumentParser
+from unittest import mock
+
+from pylsp.workspace import Document
+
+LINE = "    result = some_function(argument_one, argument_two)  # comment\n"
+SNIPPET = "value = compute(x, y)\n"
+
+
+def typing_session(num_lines: int):
+    """Yield changes typing a snippet char by char at several places."""
+    for line in (num_lines // 10, num_lines // 2, num_lines - 10):
+        character = 4
+        for char in SNIPPET:
+            yield {
+                "text": char,
+                "range": {
+                    "start": {"line": line, "character": character},
+                    "end": {"line": line, "character": character},
+                },
+            }
+            if char == "\n":
+                line += 1
+                character = 0
+            else:
+                character += 1
+
+        # Delete what was typed on the last line with backspace
+        for _ in range(SNIPPET.index("\n")):
+            yield {
+                "text": "",
+                "range": {
+                    "start": {"line": line - 1, "character": character - 1},
+                    "end": {"line": line - 1, "character": character},
+                },
+            }
+            character -= 1
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workspace = mock.MagicMock()
+    source = LINE * args.lines
+    changes = list(typing_session(args.lines))
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        doc = Document("file:///benchmark.py", workspace, source)
+        start = time.perf_counter()
+        for change in changes:
+            doc.apply_change(change)
+            position = change["range"]["start"]
+            doc.offset_at_position(position)
+            doc.word_at_position(position)
+        best = min(best, time.perf_counter() - start)
+
+    print(
+        f"{len(changes)} changes on {args.lines} lines: "
+        f"{best * 1000:.1f} ms ({best * 1e6 / len(changes):.1f} us/change)"
+    )
+
+
+if __name__ == "__main__":
+    main()
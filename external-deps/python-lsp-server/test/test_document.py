@@ -103,3 +103,76 @@ def test_document_end_of_file_edit(workspace) -> None:
         "print 'b'\n",
         "o",
     ]
+
+
+def test_document_line_break_edits(workspace) -> None:
+    doc = Document("file:///uri", workspace, "a\r\nb\nc")
+
+    # Join the last two lines
+    doc.apply_change(
+        {
+            "text": "",
+            "range": {
+                "start": {"line": 1, "character": 1},
+                "end": {"line": 2, "character": 0},
+            },
+        }
+    )
+    assert doc.lines == ["a\r\n", "bc"]
+
+    # Splitting a "\r\n" line break creates an empty line
+    doc.apply_change(
+        {
+            "text": "\n",
+            "range": {
+                "start": {"line": 0, "character": 1},
+                "end": {"line": 0, "character": 1},
+            },
+        }
+    )
+    assert doc.lines == ["a\n", "\r\n", "bc"]
+
+    # A "\n" inserted right after a lone "\r" merges both line breaks
+    doc.apply_change(
+        {
+            "text": "\r",
+            "range": {
+                "start": {"line": 0, "character": 1},
+                "end": {"line": 1, "character": 2},
+            },
+        }
+    )
+    doc.apply_change(
+        {
+            "text": "\n",
+            "range": {
+                "start": {"line": 1, "character": 0},
+                "end": {"line": 1, "character": 0},
+            },
+        }
+    )
+    assert doc.lines == ["a\r\n", "bc"]
+    assert doc.source == "a\r\nbc"
+
+
+def test_document_incremental_offsets(workspace) -> None:
+    doc = Document("file:///uri", workspace, "import sys\n\ndef main():\n")
+    assert doc.offset_at_position({"line": 2, "character": 4}) == 16
+
+    doc.apply_change(
+        {
+            "text": "import os\n",
+            "range": {
+                "start": {"line": 1, "character": 0},
+                "end": {"line": 1, "character": 0},
+            },
+        }
+    )
+    assert doc.source == "import sys\nimport os\n\ndef main():\n"
+    assert doc.offset_at_position({"line": 3, "character": 4}) == 26
+    assert doc.offset_at_position({"line": 10, "character": 0}) == len(doc.source)
+    assert doc.word_at_position({"line": 1, "character": 8}) == "os"
+
+    # Modifying the returned lines doesn't change the document
+    doc.lines.append("print(1)\n")
+    assert len(doc.lines) == 4
@@ -4,11 +4,13 @@
 import os
 import sys
 import time
+from unittest.mock import patch
 
 import pytest
 from flaky import flaky
 from pylsp_jsonrpc.exceptions import JsonRpcMethodNotFound
 
+from pylsp import hookimpl, uris
 from test.test_utils import ClientServerPair, send_initialize_request
 
 RUNNING_IN_CI = bool(os.environ.get("CI"))
@@ -84,3 +86,55 @@ def test_missing_message(client_server_pair) -> None:
         client._endpoint.request("unknown_method").result(
             timeout=CALL_TIMEOUT_IN_SECONDS
         )
+
+
+def test_lint_cache(pylsp, tmpdir) -> None:
+    calls = []
+
+    class CountingLinter:
+        @hookimpl
+        def pylsp_lint(document):
+            calls.append(document.source)
+            return [{"source": "counting", "message": document.source}]
+
+    pylsp.config.plugin_manager.register(CountingLinter, name="counting")
+    doc_uri = uris.from_fs_path(str(tmpdir.join("lint.py")))
+    pylsp.workspace.put_document(doc_uri, "a = 1\n")
+
+    with patch.object(pylsp.workspace, "publish_diagnostics") as publish:
+        pylsp._lint_text_document(doc_uri, pylsp.workspace, is_saved=False)
+        diagnostics = publish.call_args[0][1]
+        assert {"source": "counting", "message": "a = 1\n"} in diagnostics
+
+        # Change the document and get back to the previous state
+        pylsp.workspace.get_document(doc_uri).apply_change({"text": "b = 2\n"})
+        pylsp._lint_text_document(doc_uri, pylsp.workspace, is_saved=False)
+        pylsp.workspace.get_document(doc_uri).apply_change({"text": "a = 1\n"})
+        pylsp._lint_text_document(doc_uri, pylsp.workspace, is_saved=False)
+
+        assert publish.call_args[0][1] == diagnostics
+
+    assert calls == ["a = 1\n", "b = 2\n"]
+
+
+def test_lint_cache_document_changed(pylsp, tmpdir) -> None:
+    doc_uri = uris.from_fs_path(str(tmpdir.join("lint.py")))
+    pylsp.workspace.put_document(doc_uri, "a = 1\n")
+
+    class ChangingLinter:
+        @hookimpl
+        def pylsp_lint(document):
+            # Simulate the document changing while the linter runs
+            pylsp.workspace.get_document(doc_uri).apply_change({"text": "b = 2\n"})
+            return [{"source": "changing", "message": document.source}]
+
+    pylsp.config.plugin_manager.register(ChangingLinter, name="changing")
+
+    with patch.object(pylsp.workspace, "publish_diagnostics") as publish:
+        pylsp._lint_text_document(doc_uri, pylsp.workspace, is_saved=False)
+
+        # The diagnostics correspond to the source that was linted
+        assert {"source": "changing", "message": "a = 1\n"} in publish.call_args[0][1]
+
+        pylsp._lint_text_document(doc_uri, pylsp.workspace, is_saved=False)
+        assert {"source": "changing", "message": "b = 2\n"} in publish.call_args[0][1]
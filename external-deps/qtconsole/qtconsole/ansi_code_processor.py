@@ -385,6 +385,11 @@ class QtAnsiCodeProcessor(AnsiCodeProcessor):
     # Set the default color map for super class.
     default_color_map = darkbg_color_map.copy()
 
+    def __init__(self):
+        # Formats for the style attributes used so far
+        self._formats = {}
+        super().__init__()
+
     def get_color(self, color, intensity=0):
         """ Returns a QColor for a given color code or rgb list, or None if one
             cannot be constructed.
@@ -410,6 +415,27 @@ def get_color(self, color, intensity=0):
 
     def get_format(self):
         """ Returns a QTextCharFormat that encodes the current style attributes.
+
+        Formats are cached, so they must not be modified.
+        """
+        key = (
+            self._get_color_key(self.foreground_color),
+            self._get_color_key(self.background_color),
+            self.intensity,
+            self.bold,
+            self.italic,
+            self.underline,
+        )
+        format = self._formats.get(key)
+        if format is None:
+            format = self._formats[key] = self._create_format()
+        return format
+
+    def _get_color_key(self, color):
+        return tuple(color) if isinstance(color, list) else color
+
+    def _create_format(self):
+        """ Create a QTextCharFormat for the current style attributes.
         """
         format = QtGui.QTextCharFormat()
 
@@ -452,3 +478,4 @@ def set_background_color(self, style):
 
         # Update the current color map with the new defaults.
         self.color_map.update(self.default_color_map)
+        self._formats = {}
@@ -307,6 +307,10 @@ def __init__(self, parent=None, **kw):
         # case of lots of output from kernel.
         self._pending_insert_text = []
 
+        # Number of newlines in the pending text, to only clip it to the
+        # buffer size from time to time.
+        self._pending_insert_lines = 0
+
         # Timer to flush the pending stream messages. The interval is adjusted
         # later based on actual time taken for flushing a screen (buffer_size)
         # of output text.
@@ -1049,8 +1053,11 @@ def _append_custom(self, insert, input, before_prompt=False, *args, **kwargs):
             # Insert at current printing point.
             # If cursor is before prompt jump to end, but only if there
             # is a prompt (before_prompt_pos != end)
-            if cursor.position() <= self._append_before_prompt_pos \
-                    and self._append_before_prompt_pos != self._get_end_pos():
+            end_pos = self._get_end_pos()
+            before_prompt_pos = min(
+                self._append_before_prompt_cursor.position(), end_pos)
+            if cursor.position() <= before_prompt_pos \
+                    and before_prompt_pos != end_pos:
                 cursor.movePosition(QtGui.QTextCursor.End)
 
             if insert != self._insert_plain_text:
@@ -1724,6 +1731,7 @@ def _flush_pending_stream(self):
         """
         text = self._pending_insert_text
         self._pending_insert_text = []
+        self._pending_insert_lines = 0
         buffer_size = self._control.document().maximumBlockCount()
         if buffer_size > 0:
             text = self._get_last_lines_from_list(text, buffer_size)
@@ -1852,6 +1860,44 @@ def _get_last_lines(self, text, num_lines, return_count=False):
         else:
             return text[pos:]
 
+    def _collapse_carriage_returns(self, text):
+        """ Collapse the lines of text that are rewritten with carriage
+        returns, like progress bars, so that only their final content is
+        inserted.
+
+        Lines with ANSI escape codes or other special characters are left
+        untouched because the length of their visible text is not known.
+        """
+        if text.count('\r') < 2:
+            return text
+
+        lines = text.split('\n')
+        for i, line in enumerate(lines):
+            # Keep the carriage return of \r\n and the final one, which
+            # affects the text inserted next.
+            ends_with_cr = line.endswith('\r')
+            if ends_with_cr:
+                line = line[:-1]
+
+            if line.count('\r') > 1 and not any(
+                    char in line for char in '\x1b\a\b\f'):
+                first, *rewrites = line.split('\r')
+                visible = ''
+                for rewrite in rewrites:
+                    visible = rewrite + visible[len(rewrite):]
+                line = first + '\r' + visible
+
+            lines[i] = line + '\r' if ends_with_cr else line
+
+        return '\n'.join(lines)
+
+    def _document_ends_with_prompt(self, document):
+        """ Check if the document ends with the prompt.
+        """
+        if '\n' in self._prompt:
+            return document.toPlainText().endswith(self._prompt)
+        return document.lastBlock().text().endswith(self._prompt)
+
     def _get_last_lines_from_list(self, text_list, num_lines):
         """ Get the list of text clipped to last specified lines.
         """
@@ -2141,7 +2187,6 @@ def _insert_plain_text(self, cursor, text, flush=False):
         """ Inserts plain text using the specified cursor, processing ANSI codes
             if enabled.
         """
-        should_autoscroll = self._viewport_at_end()
         # maximumBlockCount() can be different from self.buffer_size in
         # case input prompt is active.
         buffer_size = self._control.document().maximumBlockCount()
@@ -2149,13 +2194,20 @@ def _insert_plain_text(self, cursor, text, flush=False):
         if (self._executing and not flush and
                 self._pending_text_flush_interval.isActive() and
                 cursor.position() == self._insert_text_cursor.position()):
-            # Queue the text to insert in case it is being inserted at end
+            # Queue the text to insert in case it is being inserted at end.
+            # It's clipped to the buffer size only when it has twice as many
+            # lines, to not go through all of it each time.
             self._pending_insert_text.append(text)
-            if buffer_size > 0:
+            self._pending_insert_lines += text.count('\n')
+            if 0 < buffer_size < self._pending_insert_lines // 2:
                 self._pending_insert_text = self._get_last_lines_from_list(
                     self._pending_insert_text, buffer_size)
+                self._pending_insert_lines = sum(
+                    t.count('\n') for t in self._pending_insert_text)
             return
 
+        should_autoscroll = self._viewport_at_end()
+
         if self._executing and not self._pending_text_flush_interval.isActive():
             self._pending_text_flush_interval.start()
 
@@ -2165,8 +2217,34 @@ def _insert_plain_text(self, cursor, text, flush=False):
 
         cursor.beginEditBlock()
         if self.ansi_codes:
+            if not getattr(cursor, '_insert_mode', False):
+                text = self._collapse_carriage_returns(text)
+
+            # Consecutive text and newlines to insert at the end of the
+            # document with the same format are inserted all at once.
+            bulk_text = []
+            bulk_format = None
+
             for substring in self._ansi_processor.split_string(text):
-                for act in self._ansi_processor.actions:
+                actions = self._ansi_processor.actions
+                if cursor.atEnd():
+                    if substring is None:
+                        if len(actions) == 1 and actions[0].action == 'newline':
+                            bulk_text.append('\n')
+                            continue
+                    elif not actions:
+                        format = self._ansi_processor.get_format()
+                        if bulk_format is None or format == bulk_format:
+                            bulk_format = format
+                            bulk_text.append(substring)
+                            continue
+
+                if bulk_text:
+                    self._insert_bulk_text(cursor, bulk_text, bulk_format)
+                    bulk_text = []
+                    bulk_format = None
+
+                for act in actions:
 
                     # Unlike real terminal emulators, we don't distinguish
                     # between the screen and the scrollback buffer. A screen
@@ -2247,9 +2325,8 @@ def _insert_plain_text(self, cursor, text, flush=False):
                     elif act.action == 'newline':
                         if (
                             cursor.block() != cursor.document().lastBlock()
-                            and not cursor.document()
-                            .toPlainText()
-                            .endswith(self._prompt)
+                            and not self._document_ends_with_prompt(
+                                cursor.document())
                         ):
                             cursor.movePosition(QtGui.QTextCursor.NextBlock)
                         else:
@@ -2275,6 +2352,9 @@ def _insert_plain_text(self, cursor, text, flush=False):
                         swallow = min(n, remain)             # number of character to swallow
                         cursor.setPosition(pos + swallow, QtGui.QTextCursor.KeepAnchor)
                     cursor.insertText(substring, format)
+
+            if bulk_text:
+                self._insert_bulk_text(cursor, bulk_text, bulk_format)
         else:
             cursor.insertText(text)
         cursor.endEditBlock()
@@ -2282,6 +2362,14 @@ def _insert_plain_text(self, cursor, text, flush=False):
         if should_autoscroll:
             self._scroll_to_end()
 
+    def _insert_bulk_text(self, cursor, text_list, format=None):
+        """ Insert a list of strings at the end of the document with a single
+            operation.
+        """
+        if format is None:
+            format = self._ansi_processor.get_format()
+        cursor.insertText(''.join(text_list), format)
+
     def _insert_plain_text_into_buffer(self, cursor, text):
         """ Inserts text into the input buffer using the specified cursor (which
             must be in the input buffer), ensuring that continuation prompts are
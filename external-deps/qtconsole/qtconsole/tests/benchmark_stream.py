@@ -0,0 +1,89 @@
+"""
+Benchmark for the output of streams in the console.
+
+It replays stream traffic, i.e. the texts of the stream messages sent by a
+kernel, as fast as possible while the console is executing, and prints how
+long it takes until everything is shown.
+
+Run it with `python -m qtconsole.tests.benchmark_stream [recording.json]`,
+where the recording is a JSON list of texts. Without one, it replays
+synthetic traffic made of training logs, progress bars and colored logging
+messages.
+"""
+
+import json
+import sys
+import time
+
+from qtpy import QtWidgets
+
+from qtconsole.console_widget import ConsoleWidget
+
+
+def synthetic_traffic(n_epochs=20, n_steps=500):
+    """Get the texts of stream messages of a typical training loop."""
+    texts = []
+    for epoch in range(n_epochs):
+        texts.append(
+            f"\x1b[32mINFO\x1b[0m Starting epoch {epoch + 1}/{n_epochs}\n"
+        )
+        for step in range(n_steps):
+            percent = 100 * (step + 1) // n_steps
+            bar = ("#" * (percent // 10)).ljust(10)
+            texts.append(
+                f"\r{percent:3d}%|{bar}| {step + 1}/{n_steps} "
+                f"[loss={1 / (step + 1):.4f}]"
+            )
+            if step % 10 == 0:
+                texts.append(
+                    f"\nstep {step} - loss: {1 / (step + 1):.6f} - "
+                    f"accuracy: {step / n_steps:.4f}\n"
+                )
+        texts.append("\n")
+    return texts
+
+
+def replay(texts, buffer_size=500, events_every=20):
+    """
+    Replay stream texts in a console and return the time it took to show
+    them.
+
+    Qt events are processed every `events_every` texts, as if that many
+    messages arrived between iterations of the event loop.
+    """
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    console = ConsoleWidget(buffer_size=buffer_size)
+    console.resize(800, 600)
+    console.show()
+    app.processEvents()
+
+    console._executing = True
+    start = time.perf_counter()
+    for i, text in enumerate(texts):
+        console._append_plain_text(text, before_prompt=True)
+        if i % events_every == 0:
+            app.processEvents()
+    console._flush_pending_stream()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    console.close()
+    return elapsed
+
+
+def benchmark(path=None):
+    """Print the time taken to replay stream traffic."""
+    if path is None:
+        texts = synthetic_traffic()
+    else:
+        with open(path) as f:
+            texts = json.load(f)
+
+    n_chars = sum(len(text) for text in texts)
+    elapsed = replay(texts)
+    print(f"{len(texts)} messages, {n_chars} characters: {elapsed:.2f} s "
+          f"({n_chars / elapsed / 1e3:.0f} kchars/s)")
+
+
+if __name__ == '__main__':
+    benchmark(*sys.argv[1:2])
@@ -408,6 +408,29 @@ def test_print_carriage_return(self):
         self.assert_text_equal(w._get_cursor(),
             "Hello\u20290123456789\u2029\u2029prompt>\u2029Bar\u2029")
 
+    def test_print_progress_bars(self):
+        """ Test that text inserted at once and in chunks is shown the same,
+            with progress bars, colors and newlines.
+        """
+        w = ConsoleWidget()
+        assert w._collapse_carriage_returns(
+            'a\r10%\r20%\r3\r\n\rab\rc\r') == 'a\r30%\r\n\rcb\r'
+
+        test_inputs = ['\x1b[32mINFO\x1b[0m Start\n', 'a',
+                       '\r 10%|#', '\r 20%|##', '\r3', '\nline\n',
+                       '\r 50%\r\n', 'x\r\x1b[31mred\x1b[0m\r', 'yz\n\n']
+        expected_output = ('INFO Start\u2029320%|##\u2029line\u2029'
+                           ' 50%\u2029yzd\u2029\u2029')
+
+        cursor = w._get_prompt_cursor()
+        w._insert_plain_text(cursor, ''.join(test_inputs))
+        self.assert_text_equal(cursor, expected_output)
+
+        cursor.insertText('')
+        for text in test_inputs:
+            w._insert_plain_text(cursor, text)
+        self.assert_text_equal(cursor, expected_output)
+
     def test_link_handling(self):
         noButton = QtCore.Qt.NoButton
         noButtons = QtCore.Qt.NoButton
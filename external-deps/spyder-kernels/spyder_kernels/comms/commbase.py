@@ -37,9 +37,14 @@
             'call_args': The function args,
             'call_kwargs': The function kwargs,
             'buffered_args': The args index that are in the buffers,
-            'buffered_kwargs': the kwargs keys that are in the buffers
+            'buffered_kwargs': the kwargs keys that are in the buffers,
+            'pickled_args': [index, number of buffers] of the args that are
+                            PickledValues,
+            'pickled_kwargs': [key, number of buffers] of the kwargs that
+                              are PickledValues
           }
-        - The buffer contains any bytes in the arguments
+        - The buffer contains any bytes in the arguments, followed by the
+          buffers of any PickledValue in them
     - If the 'settings' has `'blocking' =  True`, a reply is sent.
       (spyder_msg_type = 'remote_call_reply'):
         - The 'content' is a dict with: {
@@ -47,22 +52,54 @@
                         exception to be raised.
             'call_id': The uuid from above,
             'call_name': The function name (mostly for debugging),
-            'call_return_value': The return value of the function
+            'call_return_value': The return value of the function,
+            'pickled_return_value': whether the return value is a
+                                    PickledValue
            }
-        - The buffer contains the return value if it is bytes
+        - The buffer contains the return value if it is bytes or the buffers
+          of the PickledValue.
+
+PickledValue is used to send arbitrary Python objects. They are pickled with
+protocol 5, so the data of objects that support it (e.g. bytes, bytearrays,
+Numpy arrays or pandas dataframes) is sent as separate binary buffers instead
+of being copied inside the pickle stream.
+
+Messages whose buffers are larger than BUFFER_CHUNK_SIZE are split:
+    - The buffers are first sent in a series of messages
+      (spyder_msg_type = 'buffer_chunk'):
+        - The 'content' is a dict with: {
+            'transfer_id': uuid of the transfer,
+            'call_id': The call_id of the message content, if any,
+            'offset': Position of this chunk in the transfer,
+            'total': Total size of the buffers
+          }
+        - The buffer contains the chunk.
+    - The message is then sent without buffers but with a 'transfer' key
+      in msg_dict, which is a dict {
+        'transfer_id': uuid of the transfer,
+        'sizes': The sizes of the original buffers
+      }
+    The receiving side reassembles the buffers before handling the message
+    and can report the progress of the transfer with `_on_transfer_progress`.
 """
 import logging
+import pickle
 import sys
 import uuid
 import traceback
 import builtins
 
+import cloudpickle
+
 
 logger = logging.getLogger(__name__)
 
 # Max timeout (in secs) for blocking calls
 TIMEOUT = 3
 
+# Messages with more bytes than this in their buffers are sent in chunks
+BUFFER_CHUNK_SIZE = 2 ** 24
+
 
 class CommError(RuntimeError):
     pass
@@ -94,6 +131,44 @@ def stacksummary_from_json(stack):
     ])
 
 
+class PickledValue:
+    """
+    Python object that is sent through comms with out-of-band buffers.
+
+    The first buffer is the pickle stream and the others are the data of
+    the objects that support pickle protocol 5, which are not copied.
+    """
+
+    def __init__(self, buffers):
+        self.buffers = buffers
+
+    @classmethod
+    def dumps(cls, value):
+        """Pickle value."""
+        buffers = []
+        data = cloudpickle.dumps(
+            value, protocol=5, buffer_callback=buffers.append
+        )
+        return cls([data] + [buffer.raw() for buffer in buffers])
+
+    def loads(self):
+        """Unpickle the value."""
+        data, *buffers = self.buffers
+
+        # Buffers received as a single message are read-only, but objects
+        # such as Numpy arrays must be writable to be edited.
+        buffers = [
+            bytearray(buffer) if memoryview(buffer).readonly else buffer
+            for buffer in buffers
+        ]
+        return pickle.loads(data, buffers=buffers)
+
+    @property
+    def nbytes(self):
+        """Total size of the buffers."""
+        return sum(memoryview(buffer).nbytes for buffer in self.buffers)
+
+
 class CommsErrorWrapper():
     def __init__(self, call_name, call_id):
         self.call_name = call_name
@@ -197,11 +272,17 @@ def __init__(self):
         # Lists of reply numbers
         self._reply_inbox = {}
         self._reply_waitlist = {}
+        # Buffers being received in chunks
+        self._transfers = {}
+        # Whether the other side can receive buffers in chunks
+        self.chunk_buffers = True
 
         self._register_message_handler(
             'remote_call', self._handle_remote_call)
         self._register_message_handler(
             'remote_call_reply', self._handle_remote_call_reply)
+        self._register_message_handler(
+            'buffer_chunk', self._handle_buffer_chunk)
 
     def get_comm_id_list(self, comm_id=None):
         """Get a list of comms id."""
@@ -276,14 +357,73 @@ def _send_message(
         """
         if not self.is_open(comm_id):
             raise CommError("The comm is not connected.")
+
+        msg_dict = {
+            'spyder_msg_type': spyder_msg_type,
+            'content': content,
+        }
+        messages = self._split_message(msg_dict, buffers)
+
         id_list = self.get_comm_id_list(comm_id)
         for comm_id in id_list:
-            msg_dict = {
-                'spyder_msg_type': spyder_msg_type,
-                'content': content,
-            }
-
-            self._comms[comm_id]['comm'].send(msg_dict, buffers=buffers)
+            for msg_dict, buffers in messages:
+                self._comms[comm_id]['comm'].send(msg_dict, buffers=buffers)
+
+    def _split_message(self, msg_dict, buffers):
+        """
+        Split a message with large buffers in chunks.
+
+        Returns a list of (msg_dict, buffers) to send in order. The chunks
+        are views of the original buffers, so nothing is copied here.
+        """
+        if not buffers or not self.chunk_buffers:
+            return [(msg_dict, buffers)]
+
+        views = [memoryview(buffer).cast('B') for buffer in buffers]
+        total = sum(view.nbytes for view in views)
+        if total <= BUFFER_CHUNK_SIZE:
+            return [(msg_dict, buffers)]
+
+        transfer_id = uuid.uuid4().hex
+        call_id = None
+        if isinstance(msg_dict['content'], dict):
+            call_id = msg_dict['content'].get('call_id')
+
+        messages = []
+        offset = 0
+        chunk = []
+        chunk_size = 0
+        for view in views:
+            while view.nbytes > 0:
+                piece = view[:BUFFER_CHUNK_SIZE - chunk_size]
+                view = view[piece.nbytes:]
+                chunk.append(piece)
+                chunk_size += piece.nbytes
+                if chunk_size == BUFFER_CHUNK_SIZE or (
+                        offset + chunk_size == total):
+                    messages.append((
+                        {
+                            'spyder_msg_type': 'buffer_chunk',
+                            'content': {
+                                'transfer_id': transfer_id,
+                                'call_id': call_id,
+                                'offset': offset,
+                                'total': total,
+                            },
+                        },
+                        chunk
+                    ))
+                    offset += chunk_size
+                    chunk = []
+                    chunk_size = 0
+
+        msg_dict = dict(msg_dict)
+        msg_dict['transfer'] = {
+            'transfer_id': transfer_id,
+            'sizes': [view.nbytes for view in views],
+        }
+        messages.append((msg_dict, None))
+        return messages
 
     @property
     def _comm_name(self):
@@ -338,11 +478,63 @@ def _comm_message(self, msg):
         spyder_msg_type = msg_dict['spyder_msg_type']
         buffers = msg['buffers']
 
+        if 'transfer' in msg_dict:
+            buffers = self._pop_transfer_buffers(msg_dict['transfer'])
+
         if spyder_msg_type in self._message_handlers:
             self._message_handlers[spyder_msg_type](msg_dict, buffers)
         else:
             logger.debug("No such spyder message type: %s" % spyder_msg_type)
 
+    def _handle_buffer_chunk(self, msg_dict, buffers):
+        """Copy a chunk of buffers in its transfer."""
+        content = msg_dict['content']
+        transfer_id = content['transfer_id']
+        total = content['total']
+
+        if transfer_id not in self._transfers:
+            self._transfers[transfer_id] = [bytearray(total), 0]
+        transfer = self._transfers[transfer_id]
+
+        offset = content['offset']
+        for buffer in buffers:
+            view = memoryview(buffer).cast('B')
+            transfer[0][offset:offset + view.nbytes] = view
+            offset += view.nbytes
+            transfer[1] += view.nbytes
+
+        self._on_transfer_progress(content['call_id'], transfer[1], total)
+
+    def _pop_transfer_buffers(self, transfer_info):
+        """Get the buffers of a finished transfer."""
+        data, received = self._transfers.pop(transfer_info['transfer_id'])
+        if received != len(data):
+            raise CommError("Incomplete transfer of buffers.")
+
+        # Split without copying
+        view = memoryview(data)
+        buffers = []
+        offset = 0
+        for size in transfer_info['sizes']:
+            buffers.append(view[offset:offset + size])
+            offset += size
+        return buffers
+
+    def _on_transfer_progress(self, call_id, received, total):
+        """
+        Called when a chunk of buffers is received.
+
+        Parameters
+        ----------
+        call_id: str or None
+            The call_id of the message being received, if any.
+        received: int
+            Number of bytes received so far.
+        total: int
+            Total number of bytes of the transfer.
+        """
+        pass
+
     def _handle_remote_call(self, msg, buffers):
         """Handle a remote call."""
         msg_dict = msg['content']
@@ -353,10 +545,17 @@ def _handle_remote_call(self, msg, buffers):
             kwargs = msg_dict['call_kwargs']
 
             if buffers:
+                buffers = list(buffers)
                 for idx in msg_dict['buffered_args']:
                     args[idx] = buffers.pop(0)
                 for name in msg_dict['buffered_kwargs']:
                     kwargs[name] = buffers.pop(0)
+                for idx, nbuffers in msg_dict.get('pickled_args', []):
+                    args[idx] = PickledValue(buffers[:nbuffers])
+                    del buffers[:nbuffers]
+                for name, nbuffers in msg_dict.get('pickled_kwargs', []):
+                    kwargs[name] = PickledValue(buffers[:nbuffers])
+                    del buffers[:nbuffers]
                 assert len(buffers) == 0
 
             return_value = self._remote_callback(
@@ -399,15 +598,21 @@ def _set_call_return_value(self, call_dict, return_value, is_error=False):
             return
 
         buffers = None
+        pickled_return_value = False
         if isinstance(return_value, bytes):
             buffers = [return_value]
             return_value = None
+        elif isinstance(return_value, PickledValue):
+            buffers = return_value.buffers
+            return_value = None
+            pickled_return_value = True
 
         content = {
             'is_error': is_error,
             'call_id': call_dict['call_id'],
             'call_name': call_dict['call_name'],
-            'call_return_value': return_value
+            'call_return_value': return_value,
+            'pickled_return_value': pickled_return_value
         }
 
         self._send_message(
@@ -492,6 +697,8 @@ def _handle_remote_call_reply(self, msg_dict, buffers):
         # Prepare return value
         if is_error:
             return_value = CommsErrorWrapper.from_json(return_value)
+        elif content.get('pickled_return_value', False):
+            return_value = PickledValue(buffers)
         elif buffers:
             assert len(buffers) == 1
             return_value = buffers[0]
@@ -568,7 +775,8 @@ def __call__(self, *args, **kwargs):
         """
         Transmit the call to the other side of the tunnel.
 
-        The args and kwargs have to be JSON-serializable or bytes.
+        The args and kwargs have to be JSON-serializable, bytes or
+        PickledValues.
         """
         blocking = 'blocking' in self._settings and self._settings['blocking']
         self._settings['send_reply'] = blocking or self._callback is not None
@@ -577,6 +785,9 @@ def __call__(self, *args, **kwargs):
         buffers = []
         buffered_args = []
         buffered_kwargs = []
+        pickled_buffers = []
+        pickled_args = []
+        pickled_kwargs = []
         args = list(args)
 
         for i, arg in enumerate(args):
@@ -584,6 +795,10 @@ def __call__(self, *args, **kwargs):
                 buffers.append(arg)
                 buffered_args.append(i)
                 args[i] = None
+            elif isinstance(arg, PickledValue):
+                pickled_buffers.extend(arg.buffers)
+                pickled_args.append([i, len(arg.buffers)])
+                args[i] = None
 
         for name in kwargs:
             arg = kwargs[name]
@@ -591,6 +806,13 @@ def __call__(self, *args, **kwargs):
                 buffers.append(arg)
                 buffered_kwargs.append(name)
                 kwargs[name] = None
+            elif isinstance(arg, PickledValue):
+                pickled_buffers.extend(arg.buffers)
+                pickled_kwargs.append([name, len(arg.buffers)])
+                kwargs[name] = None
+
+        # Buffers of pickled values go after the ones of bytes
+        buffers.extend(pickled_buffers)
 
         call_id = uuid.uuid4().hex
         call_dict = {
@@ -600,7 +822,9 @@ def __call__(self, *args, **kwargs):
             'call_args': args,
             'call_kwargs': kwargs,
             'buffered_args': buffered_args,
-            'buffered_kwargs': buffered_kwargs
+            'buffered_kwargs': buffered_kwargs,
+            'pickled_args': pickled_args,
+            'pickled_kwargs': pickled_kwargs
         }
 
         if not self._comms_wrapper.is_open(self._comm_id):
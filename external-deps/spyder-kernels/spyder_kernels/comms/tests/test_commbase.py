@@ -10,8 +10,14 @@
 Tests for commbase.py
 """
 
+# Standard library imports
+import pickle
+
 # Local imports
+from spyder_kernels.comms import commbase
 from spyder_kernels.comms.commbase import (
+    CommBase,
+    PickledValue,
     stacksummary_from_json,
     stacksummary_to_json,
 )
@@ -27,3 +33,58 @@ def test_stacksummary_roundtrip():
     ]
     stacksummary = stacksummary_from_json(json)
     assert stacksummary_to_json(stacksummary) == json
+
+
+def test_pickled_value_roundtrip():
+    """Test that PickledValue sends buffers out of band."""
+    data = b"x" * 1000
+    value = PickledValue.dumps({"data": pickle.PickleBuffer(data)})
+
+    assert len(value.buffers) == 2
+    assert value.nbytes > 1000
+
+    # Buffers received as a single message are read-only
+    loaded = PickledValue([bytes(b) for b in value.buffers]).loads()
+    assert loaded == {"data": bytearray(data)}
+
+
+def test_split_message(monkeypatch):
+    """Test that messages with large buffers are sent in chunks."""
+    monkeypatch.setattr(commbase, "BUFFER_CHUNK_SIZE", 10)
+
+    comm = CommBase()
+    progress = []
+    comm._on_transfer_progress = (
+        lambda call_id, received, total: progress.append(received)
+    )
+    received = []
+    comm._register_message_handler(
+        "test", lambda msg_dict, buffers: received.append(buffers)
+    )
+
+    buffers = [b"a" * 7, b"", b"b" * 18]
+    content = {"call_id": "id"}
+    messages = comm._split_message(
+        {"spyder_msg_type": "test", "content": content}, buffers
+    )
+    assert len(messages) == 4
+    assert messages[-1][1] is None
+
+    for msg_dict, msg_buffers in messages:
+        comm._comm_message(
+            {
+                "content": {"comm_id": 0, "data": msg_dict},
+                "buffers": msg_buffers,
+            }
+        )
+
+    assert progress == [10, 20, 25]
+    assert [bytes(b) for b in received[0]] == buffers
+    assert comm._transfers == {}
+
+    # Small messages are sent as they are
+    assert comm._split_message({}, [b"a"]) == [({}, [b"a"])]
+
+    # Nothing is split if the other side can't receive chunks
+    comm.chunk_buffers = False
+    assert comm._split_message({}, buffers) == [({}, buffers)]
@@ -33,7 +33,8 @@
 
 # Local imports
 import spyder_kernels
-from spyder_kernels.comms.commbase import stacksummary_to_json
+from spyder_kernels.comms.commbase import (
+    PickledValue, stacksummary_to_json)
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder_kernels.comms.decorators import (
     register_comm_handlers, comm_handler)
@@ -48,7 +49,12 @@
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.mpl import automatic_backend, MPL_BACKENDS_TO_SPYDER
 from spyder_kernels.utils.nsview import (
-    get_remote_data, make_remote_view, get_size)
+    get_fingerprint,
+    get_remote_data,
+    get_size,
+    make_remote_view,
+    make_remote_view_entry,
+)
 from spyder_kernels.utils.style import create_pygments_dict
 from spyder_kernels.console.shell import SpyderShell
 from spyder_kernels.comms.utils import WriteContext
@@ -78,6 +84,8 @@ def __init__(self, *args, **kwargs):
         register_comm_handlers(self.shell, self.frontend_comm)
 
         self.namespace_view_settings = {}
+        self._namespace_delta_state = {}
+        self._namespace_delta_seq = 0
         self.faulthandler_handle = None
         self._cwd_initialised = False
 
@@ -135,8 +143,7 @@ def get_state(self):
         with WriteContext("get_state"):
             if self._cwd_initialised:
                 state["cwd"] = self.get_cwd()
-            state["namespace_view"] = self.get_namespace_view()
-            state["var_properties"] = self.get_var_properties()
+            state["namespace_view_delta"] = self.get_namespace_view_delta()
         return state
 
     def publish_state(self):
@@ -353,26 +360,116 @@ def get_var_properties(self):
 
             properties = {}
             for name, value in list(data.items()):
-                properties[name] = {
-                    'is_list':  self._is_list(value),
-                    'is_dict':  self._is_dict(value),
-                    'is_set': self._is_set(value),
-                    'len': self._get_len(value),
-                    'is_array': self._is_array(value),
-                    'is_image': self._is_image(value),
-                    'is_data_frame': self._is_data_frame(value),
-                    'is_series': self._is_series(value),
-                    'array_shape': self._get_array_shape(value),
-                    'array_ndim': self._get_array_ndim(value)
-                }
+                properties[name] = self._get_var_properties_entry(value)
 
             return properties
         else:
             return None
 
     @comm_handler
-    def get_value(self, name, encoded=False):
-        """Get the value of a variable"""
+    def get_namespace_view_delta(self, full=False):
+        """
+        Return the changes in the namespace view since the last delta.
+
+        This merges `get_namespace_view` and `get_var_properties` in a single
+        message that only contains the variables that were added, changed or
+        removed since the last time this was called. To avoid recomputing the
+        view of variables that didn't change, a cheap fingerprint of them is
+        saved when possible.
+
+        Parameters
+        ----------
+        full: bool
+            If True, return all variables instead of only the changed ones.
+            This is used when the frontend (re)connects and doesn't affect the
+            deltas that other callers receive.
+
+        Returns
+        -------
+        A dictionary with the following structure
+
+        {
+            'full': bool,
+            'seq': int,
+            'changed': {
+                'a': {'view': {...}, 'properties': {...}}
+            },
+            'removed': ['b']
+        }
+
+        Here:
+        * 'full' is True if 'changed' contains the whole namespace, so that
+          the frontend has to discard the variables it had before.
+        * 'seq' is the number of the last delta. Deltas that are not full
+          have consecutive numbers, so the frontend can detect that it missed
+          one (e.g. because publishing it failed) and ask for the full view.
+        * 'view' and 'properties' are the entries for the variable returned
+          by `get_namespace_view` and `get_var_properties`, respectively.
+        """
+        settings = self.namespace_view_settings
+        if not settings:
+            return None
+
+        ns = self.shell._get_current_namespace()
+        data = get_remote_data(ns, settings, mode='editable',
+                               more_excluded_names=EXCLUDED_NAMES)
+
+        # Saved views are useless if the settings changed
+        state = self._namespace_delta_state
+        if state.get('settings') != settings:
+            state = {}
+            full = True
+
+        previous_entries = state.get('entries', {})
+        entries = {}
+        changed = {}
+        for name, value in list(data.items()):
+            fingerprint = get_fingerprint(value)
+            previous = previous_entries.get(name)
+            if (
+                previous is not None
+                and fingerprint is not None
+                and previous[0] == fingerprint
+            ):
+                entry = previous[1]
+            else:
+                entry = {
+                    'view': make_remote_view_entry(value, settings),
+                    'properties': self._get_var_properties_entry(value)
+                }
+
+            entries[name] = (fingerprint, entry)
+            if full or previous is None or previous[1] != entry:
+                changed[name] = entry
+
+        removed = [] if full else [
+            name for name in previous_entries if name not in entries]
+
+        # Requests for the full view don't update the saved state so that
+        # deltas keep being relative to the last delta that was published.
+        if not full or not state:
+            self._namespace_delta_seq += 1
+            self._namespace_delta_state = {
+                'settings': dict(settings),
+                'entries': entries
+            }
+
+        return {
+            'full': full,
+            'seq': self._namespace_delta_seq,
+            'changed': changed,
+            'removed': removed
+        }
+
+    @comm_handler
+    def get_value(self, name, encoded=False, out_of_band=False):
+        """
+        Get the value of a variable.
+
+        If encoded is True, the value is encoded with cloudpickle. If
+        out_of_band is also True, it's sent as a PickledValue, so that its
+        data is transferred as binary buffers without being copied.
+        """
         ns = self.shell._get_current_namespace()
         value = ns[name]
 
@@ -384,6 +481,8 @@ def get_value(self, name, encoded=False):
             value = value.to_pandas()
 
         if encoded:
+            if out_of_band:
+                return PickledValue.dumps(value)
             # Encode with cloudpickle
             value = cloudpickle.dumps(value)
         return value
@@ -393,7 +492,10 @@ def set_value(self, name, value, encoded=False):
         """Set the value of a variable"""
         if encoded:
             # Decode_value
-            value = cloudpickle.loads(value)
+            if isinstance(value, PickledValue):
+                value = value.loads()
+            else:
+                value = cloudpickle.loads(value)
 
         ns = self.shell._get_reference_namespace(name)
         ns[name] = value
@@ -657,6 +759,8 @@ def set_configuration(self, conf):
                 self.publish_state()
             elif key == "pdb":
                 self.shell.set_pdb_configuration(value)
+            elif key == "profiler":
+                self.shell.set_profiler_configuration(value)
             elif key == "faulthandler":
                 if value:
                     ret[key] = self.enable_faulthandler()
@@ -872,6 +976,21 @@ def get_pythonenv_info(self):
 
     # -- Private API ---------------------------------------------------
     # --- For the Variable Explorer
+    def _get_var_properties_entry(self, value):
+        """Get the properties of a variable for the Variable Explorer."""
+        return {
+            'is_list':  self._is_list(value),
+            'is_dict':  self._is_dict(value),
+            'is_set': self._is_set(value),
+            'len': self._get_len(value),
+            'is_array': self._is_array(value),
+            'is_image': self._is_image(value),
+            'is_data_frame': self._is_data_frame(value),
+            'is_series': self._is_series(value),
+            'array_shape': self._get_array_shape(value),
+            'array_ndim': self._get_array_ndim(value)
+        }
+
     def _get_len(self, var):
         """Return sequence length"""
         try:
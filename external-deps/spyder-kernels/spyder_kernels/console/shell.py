@@ -55,6 +55,7 @@ def __init__(self, *args, **kwargs):
         self._request_pdb_stop = False
         self.special = None
         self._pdb_conf = {}
+        self.profiler_conf = {}
         super(SpyderShell, self).__init__(*args, **kwargs)
         self._allow_kbdint = False
         self.register_debugger_sigint()
@@ -221,6 +222,19 @@ def set_pdb_configuration(self, pdb_conf):
                 if self.pdb_session:
                     setattr(self.pdb_session, key, pdb_conf[key])
 
+    def set_profiler_configuration(self, profiler_conf):
+        """
+        Set profiler configuration.
+
+        Parameters
+        ----------
+        profiler_conf: dict
+            Dictionary containing the configuration. Its keys are `sampling`,
+            to sample code instead of tracing all calls to functions, and
+            `sampling_interval`, the time between samples in milliseconds.
+        """
+        self.profiler_conf.update(profiler_conf)
+
     def is_debugging(self):
         """
         Check if we are currently debugging.
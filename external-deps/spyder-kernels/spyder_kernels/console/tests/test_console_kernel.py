@@ -28,11 +28,12 @@
 from IPython.core import release as ipython_release
 from jupyter_core import paths
 from jupyter_client import BlockingKernelClient
+import cloudpickle
 import numpy as np
 import pytest
 
 # Local imports
-from spyder_kernels.comms.commbase import CommBase
+from spyder_kernels.comms.commbase import CommBase, PickledValue
 from spyder_kernels.customize.spyderpdb import SpyderPdb
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.pythonenv import PythonEnvType
@@ -336,6 +337,53 @@ def test_get_var_properties(kernel):
     assert "'array_ndim': None" in var_properties
 
 
+def test_get_namespace_view_delta(kernel):
+    """
+    Test that only the variables that changed are sent in namespace deltas.
+    """
+    asyncio.run(kernel.do_execute('a = 1; b = [1]; c = "c"', True))
+
+    delta = kernel.get_namespace_view_delta()
+    assert delta['full']
+    assert set(delta['changed']) == {'a', 'b', 'c'}
+    seq = delta['seq']
+    assert delta['changed']['a']['view']['view'] == '1'
+    assert delta['changed']['b']['properties']['is_list']
+
+    # Nothing changed
+    delta = kernel.get_namespace_view_delta()
+    assert not delta['full']
+    assert delta['changed'] == {}
+    assert delta['removed'] == []
+    assert delta['seq'] == seq + 1
+
+    # Mutated, reassigned, new and removed variables
+    asyncio.run(
+        kernel.do_execute('a = 2; b.append(2); d = 1.5; del c', True)
+    )
+    delta = kernel.get_namespace_view_delta()
+    assert set(delta['changed']) == {'a', 'b', 'd'}
+    assert delta['changed']['b']['view']['size'] == 2
+    assert delta['removed'] == ['c']
+
+    # Full views don't affect the following deltas
+    asyncio.run(kernel.do_execute('a = 3', True))
+    delta = kernel.get_namespace_view_delta(full=True)
+    assert delta['full']
+    assert set(delta['changed']) == {'a', 'b', 'd'}
+    assert delta['seq'] == seq + 2
+    delta = kernel.get_namespace_view_delta()
+    assert set(delta['changed']) == {'a'}
+    assert delta['seq'] == seq + 3
+
+    # Changing the settings sends everything again
+    kernel.namespace_view_settings = dict(
+        kernel.namespace_view_settings, minmax=True
+    )
+    delta = kernel.get_namespace_view_delta()
+    assert delta['full']
+
+
 def test_get_value(kernel):
     """Test getting the value of a variable."""
     name = 'a'
@@ -345,6 +393,29 @@ def test_get_value(kernel):
     assert kernel.get_value(name) == 124
 
 
+def test_get_value_out_of_band(kernel):
+    """Test getting the value of a variable with out-of-band buffers."""
+    asyncio.run(kernel.do_execute("import numpy as np", True))
+    asyncio.run(kernel.do_execute("arr = np.arange(1000)", True))
+
+    value = kernel.get_value('arr', encoded=True, out_of_band=True)
+    assert isinstance(value, PickledValue)
+
+    # The array data is not in the pickle stream
+    assert len(value.buffers) == 2
+    assert len(value.buffers[0]) < 1000
+
+    arr = value.loads()
+    assert np.array_equal(arr, np.arange(1000))
+
+    # It can be modified
+    arr[0] = 10
+
+    # Set it back
+    kernel.set_value('arr', PickledValue.dumps(arr), encoded=True)
+    assert kernel.get_value('arr')[0] == 10
+
+
 def test_get_value_with_polars(kernel):
     """Test getting the value of a Polars DataFrame or Series."""
     import pandas
@@ -1333,6 +1404,65 @@ def test_debug_namespace(tmpdir):
                     break
 
 
+@pytest.mark.flaky(max_runs=3)
+@pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="Requires sys.monitoring"
+)
+def test_debug_continue_with_monitoring(tmpdir):
+    """
+    Test that the debugger stops at breakpoints when continuing with
+    sys.monitoring.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        # Write code to a file
+        d = tmpdir.join("pdb-monitoring-test.py")
+        d.write(
+            "def func(x):\n"
+            "    return x + 1\n"
+            "breakpoint()\n"
+            "total = 0\n"
+            "for i in range(1000):\n"
+            "    total = func(total)\n"
+            "print('total', total)"
+        )
+
+        # Run code file `d`
+        client.execute("%runfile {}".format(repr(str(d))))
+
+        # Set a conditional breakpoint and continue to it
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input('b 2, i == 500')
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input('c')
+
+        # Make sure we stopped at the right iteration
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input('print("i =", i)')
+
+        t0 = time.time()
+        while True:
+            assert time.time() - t0 < 5
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg.get('msg_type') == 'stream':
+                if 'i = 500' in msg["content"].get("text"):
+                    break
+
+        # Continue until the end
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input('c')
+
+        t0 = time.time()
+        while True:
+            assert time.time() - t0 < 5
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg.get('msg_type') == 'stream':
+                if 'total 1000' in msg["content"].get("text"):
+                    break
+
+
 def test_interrupt_short_loop():
     """
     Test that the kernel can be interrupted by calling a comm handler.
@@ -48,6 +48,7 @@
 from spyder_kernels.customize.utils import (
     capture_last_Expr, canonic, create_pathlist, exec_encapsulate_locals
 )
+from spyder_kernels.utils.profiling import SamplingProfiler
 
 
 # For logging
@@ -62,6 +63,24 @@ def profile_with_context(*args, **kwargs):
         print("\nProfiling was interrupted")
 
 
+def sample_with_context(code, glob, loc, filename, interval):
+    """Profile code by sampling it and stream results to the frontend."""
+
+    def send_chunk(chunk):
+        try:
+            frontend_request(blocking=False).update_profile_data(chunk)
+        except CommError:
+            logger.debug("Could not send profile data to the frontend.")
+
+    profiler = SamplingProfiler(interval=interval, callback=send_chunk)
+    try:
+        profiler.runctx(code, glob, loc)
+    except KeyboardInterrupt:
+        print("\nProfiling was interrupted")
+    finally:
+        profiler.dump_stats(filename)
+
+
 def runfile_arguments(func):
     """Decorator to add runfile magic arguments to magic."""
     decorators = [
@@ -347,6 +366,16 @@ def _profile_exec(self):
             # Get a file to save the results
             profile_filename = os.path.join(tempdir, "profile.prof")
 
+            # Sample the code instead of tracing all calls if requested
+            profiler_conf = self.shell.profiler_conf
+            if profiler_conf.get("sampling", False):
+                profile_fun = partial(
+                    sample_with_context,
+                    interval=profiler_conf.get("sampling_interval", 5) / 1000,
+                )
+            else:
+                profile_fun = profile_with_context
+
             try:
                 if self.shell.is_debugging():
                     def prof_exec(code, glob=None, loc=None):
@@ -355,15 +384,13 @@ def prof_exec(code, glob=None, loc=None):
                         necessary for profiling.
                         """
                         return sys.call_tracing(
-                            profile_with_context,
+                            profile_fun,
                             (code, glob, loc, profile_filename),
                         )
 
                     yield prof_exec
                 else:
-                    yield partial(
-                        profile_with_context, filename=profile_filename
-                    )
+                    yield partial(profile_fun, filename=profile_filename)
             finally:
                 # Reset tracing function
                 sys.settrace(trace_fun)
@@ -42,6 +42,10 @@
 
 logger = logging.getLogger(__name__)
 
+# sys.monitoring (PEP 669) is used to continue to breakpoints on Python 3.12+
+MONITORING_AVAILABLE = hasattr(sys, "monitoring")
+MONITORING_TOOL_NAME = "spyder_debugger"
+
 
 class DebugWrapper:
     """
@@ -133,6 +137,16 @@ def __init__(self, *args, **kwargs):
         self._canonic_inode_to_filename = {}
         self._canonic_filename_to_inode = {}
 
+        # Use sys.monitoring instead of sys.settrace when continuing
+        self.continue_with_monitoring = (
+            MONITORING_AVAILABLE
+            # Python 3.14+ can run the whole debugger with sys.monitoring
+            and getattr(self, "backend", "settrace") == "settrace"
+        )
+        self._monitoring = False
+        self._monitoring_thread = None
+        self._monitored_code = set()
+
     # --- Methods overriden for code execution
     def print_exclamation_warning(self):
         """Print pdb warning for exclamation mark."""
@@ -260,9 +274,19 @@ def interrupt(self):
         self.interrupting = True
         self.message("\nProgram interrupted. (Use 'cont' to resume).")
         self.set_step()
+        if self._monitoring:
+            # There's no trace function, so we need to get line events
+            # everywhere to be able to stop.
+            sys.monitoring.restart_events()
+            sys.monitoring.set_events(
+                sys.monitoring.DEBUGGER_ID,
+                sys.monitoring.get_events(sys.monitoring.DEBUGGER_ID)
+                | sys.monitoring.events.LINE
+            )
 
     def set_quit(self):
         """Register that debugger is not tracing."""
+        self._stop_monitoring()
         self.shell.remove_pdb_session(self)
         super(SpyderPdb, self).set_quit()
 
@@ -569,6 +593,8 @@ def set_continue(self):
         """
         # Don't stop except at breakpoints or when finished
         self._set_stopinfo(self.botframe, None, -1)
+        if self.continue_with_monitoring:
+            self._start_monitoring()
 
     def do_debug(self, arg):
         """
@@ -684,6 +710,7 @@ def canonic(self, filename):
 
     def do_exitdb(self, arg):
         """Exit the debugger"""
+        self._stop_monitoring()
         self._set_stopinfo(self.botframe, None, -1)
         sys.settrace(None)
         frame = sys._getframe().f_back
@@ -877,7 +904,10 @@ def run(self, cmd, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).run(cmd, globals, locals)
+            try:
+                super(SpyderPdb, self).run(cmd, globals, locals)
+            finally:
+                self._stop_monitoring()
 
     def runeval(self, expr, globals=None, locals=None):
         """Debug an expression executed via the eval() function.
@@ -885,7 +915,10 @@ def runeval(self, expr, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runeval(expr, globals, locals)
+            try:
+                super(SpyderPdb, self).runeval(expr, globals, locals)
+            finally:
+                self._stop_monitoring()
 
     def runcall(self, *args, **kwds):
         """Debug a single function call.
@@ -893,7 +926,158 @@ def runcall(self, *args, **kwds):
         Return the result of the function call.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runcall(*args, **kwds)
+            try:
+                super(SpyderPdb, self).runcall(*args, **kwds)
+            finally:
+                self._stop_monitoring()
+
+    # --- Methods to continue to breakpoints with sys.monitoring
+    def _start_monitoring(self):
+        """
+        Stop tracing and wait for breakpoints with sys.monitoring.
+
+        Line events are only enabled for code objects of files with
+        breakpoints, and each location that is not a breakpoint is disabled
+        after its first event. This makes code run close to native speed
+        until a breakpoint is hit, where tracing is restored.
+        """
+        monitoring = sys.monitoring
+        events = monitoring.events
+        tool_id = monitoring.DEBUGGER_ID
+
+        if not self._monitoring:
+            try:
+                monitoring.use_tool_id(tool_id, MONITORING_TOOL_NAME)
+            except ValueError:
+                # Another debugger or tool is using sys.monitoring, so keep
+                # using sys.settrace.
+                logger.debug(
+                    "Can't continue with sys.monitoring because its debugger "
+                    "id is used by %s", monitoring.get_tool(tool_id)
+                )
+                return
+
+            monitoring.register_callback(
+                tool_id, events.PY_START, self._monitor_code_start
+            )
+            monitoring.register_callback(
+                tool_id, events.PY_RESUME, self._monitor_code_start
+            )
+            monitoring.register_callback(
+                tool_id, events.LINE, self._monitor_line
+            )
+            monitoring.register_callback(
+                tool_id, events.PY_RETURN, self._monitor_return
+            )
+            self._monitoring = True
+
+        self._monitoring_thread = threading.get_ident()
+
+        # Breakpoints could have changed, so check all code objects again
+        for code in self._monitored_code:
+            monitoring.set_local_events(tool_id, code, 0)
+        self._monitored_code = set()
+        monitoring.restart_events()
+        monitoring.set_events(tool_id, events.PY_START | events.PY_RESUME)
+
+        # Code objects of the frames that are already running won't get a
+        # start event, so check them now and remove their trace function.
+        frame = sys._getframe().f_back
+        while frame is not None:
+            self._monitor_code(frame.f_code, running=True)
+            frame.f_trace = None
+            if frame is self.botframe:
+                break
+            frame = frame.f_back
+        sys.settrace(None)
+
+    def _stop_monitoring(self):
+        """Stop waiting for breakpoints with sys.monitoring."""
+        if not self._monitoring:
+            return
+        self._monitoring = False
+
+        monitoring = sys.monitoring
+        events = monitoring.events
+        tool_id = monitoring.DEBUGGER_ID
+
+        monitoring.set_events(tool_id, 0)
+        for code in self._monitored_code:
+            monitoring.set_local_events(tool_id, code, 0)
+        self._monitored_code = set()
+        for event in (
+            events.PY_START, events.PY_RESUME, events.LINE, events.PY_RETURN
+        ):
+            monitoring.register_callback(tool_id, event, None)
+        monitoring.free_tool_id(tool_id)
+
+    def _resume_tracing(self, frame):
+        """Go back to sys.settrace from sys.monitoring at frame."""
+        self._stop_monitoring()
+        while frame is not None:
+            frame.f_trace = self.trace_dispatch
+            if frame is self.botframe:
+                break
+            frame = frame.f_back
+        sys.settrace(self.trace_dispatch)
+
+    def _monitor_code(self, code, running=False):
+        """Enable the events needed for a code object."""
+        local_events = 0
+        if self.canonic(code.co_filename) in self.breaks:
+            local_events |= sys.monitoring.events.LINE
+        if running and os.path.dirname(spyder_kernels.__file__) in (
+            code.co_filename
+        ):
+            # Needed to detect when our code runner finishes (see stop_here)
+            local_events |= sys.monitoring.events.PY_RETURN
+
+        if local_events:
+            sys.monitoring.set_local_events(
+                sys.monitoring.DEBUGGER_ID, code, local_events
+            )
+            self._monitored_code.add(code)
+
+    def _monitor_code_start(self, code, instruction_offset):
+        """Callback for the PY_START and PY_RESUME events."""
+        self._monitor_code(code)
+        # Each code object only needs to be checked once
+        return sys.monitoring.DISABLE
+
+    def _monitor_line(self, code, line_number):
+        """Callback for the LINE event."""
+        if threading.get_ident() != self._monitoring_thread:
+            return
+
+        frame = sys._getframe(1)
+        if self.stopframe is not self.botframe or self.stoplineno != -1:
+            # We were interrupted, so trace until we can stop
+            self._resume_tracing(frame)
+            self.dispatch_line(frame)
+            return
+
+        filename = self.canonic(code.co_filename)
+        if line_number not in self.breaks.get(filename, []):
+            return sys.monitoring.DISABLE
+
+        if not self.break_here(frame):
+            # The breakpoint condition is false or it has to be ignored
+            return
+
+        self._resume_tracing(frame)
+        self.user_line(frame)
+        if self.quitting:
+            raise bdb.BdbQuit
+
+    def _monitor_return(self, code, instruction_offset, retval):
+        """Callback for the PY_RETURN event."""
+        if threading.get_ident() != self._monitoring_thread:
+            return
+
+        frame = sys._getframe(1)
+        if frame.f_locals.get("__tracebackhide__") == "__pdb_exit__":
+            self._stop_monitoring()
+            self.onecmd('exit')
 
     def set_remote_filename(self, filename):
         """Set remote filename to signal Spyder on mainpyfile."""
@@ -51,7 +51,44 @@ def test_umr_run(user_module):
     umr = UserModuleReloader()
 
     from foo1.bar import square
-    assert umr.run() == ['foo1', 'foo1.bar']
+    assert square(2) == 4
+
+    # Unchanged modules are not reloaded
+    assert umr.run() == []
+
+    # Only changed modules are reloaded
+    import foo1.bar
+    modfile = foo1.bar.__file__
+    with open(modfile, 'a') as f:
+        f.write('\n# Changed\n')
+    assert umr.run() == ['foo1.bar']
+
+    assert foo1.bar.square(3) == 9
+    assert umr.run() == []
+
+
+def test_umr_run_dependents(user_module, tmpdir):
+    """Test that UMR reloads the modules that import a changed one."""
+    # Create user modules that depend on foo4.bar
+    user_module('foo4')
+    tmpdir.join('foo4').join('__init__.py').write('from .bar import square')
+    tmpdir.join('foo4').join('baz.py').write(
+        'def cube(x):\n    return x**3\n')
+    tmpdir.join('foo4_user.py').write('import foo4')
+
+    # Create UMR
+    umr = UserModuleReloader()
+
+    import foo4_user
+    import foo4.baz
+    assert foo4_user.foo4.square(2) == 4
+    assert foo4.baz.cube(2) == 8
+    assert umr.run() == []
+
+    # Change foo4.bar
+    tmpdir.join('foo4').join('bar.py').write(
+        'def square(x):\n    return x*x\n')
+    assert sorted(umr.run()) == ['foo4', 'foo4.bar', 'foo4_user']
 
 
 def test_umr_previous_modules(user_module):
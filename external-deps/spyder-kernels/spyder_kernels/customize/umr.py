@@ -5,8 +5,11 @@
 
 """User module reloader."""
 
+import ast
+import importlib.util
 import os
 import sys
+import time
 
 from spyder_kernels.customize.utils import path_is_library
 
@@ -16,6 +19,9 @@ class UserModuleReloader:
     User Module Reloader (UMR) aims at deleting user modules
     to force Python to deeply reload them during import
 
+    Only modules whose file changed since they were imported are deleted,
+    together with the user modules that import them, directly or not.
+
     pathlist [list]: blacklist in terms of module path
     namelist [list]: blacklist in terms of module name
     """
@@ -43,12 +49,29 @@ def __init__(self, namelist=None, pathlist=None, shell=None):
         # tensorflow: See spyder-ide/spyder#8697
         other_modules = ['pytorch', 'pythoncom', 'tensorflow']
         self.namelist = namelist + spy_modules + mpl_modules + other_modules
+        self._namelist = set(self.namelist)
 
         self.pathlist = pathlist
         self._shell = shell
 
-        # List of previously loaded modules
-        self.previous_modules = list(sys.modules.keys())
+        # Names of previously loaded modules
+        self.previous_modules = set(sys.modules.keys())
+
+        # Whether modules are reloadable, by module name and path
+        self._reloadable = {}
+
+        # Stat of the file of each user module when it was first seen, and
+        # names of the modules it imports.
+        self._module_stats = {}
+        self._module_imports = {}
+
+        # Imports of files, by path and stat, to not parse them again when
+        # modules are reloaded without changes.
+        self._imports_cache = {}
+
+        # Modules imported after this time could have changed after being
+        # imported.
+        self._last_run_ns = time.time_ns()
 
         # Check if the UMR is enabled or not
         enabled = os.environ.get("SPY_UMR_ENABLED", "")
@@ -60,17 +83,122 @@ def __init__(self, namelist=None, pathlist=None, shell=None):
 
     def is_module_reloadable(self, module, modname):
         """Decide if a module is reloadable or not."""
-        if (
-            path_is_library(getattr(module, '__file__', None), self.pathlist)
-            or self.is_module_in_namelist(modname)
-        ):
-            return False
-        else:
-            return True
+        path = getattr(module, '__file__', None)
+        key = (modname, path)
+        reloadable = self._reloadable.get(key)
+        if reloadable is None:
+            reloadable = not (
+                path_is_library(path, self.pathlist)
+                or self.is_module_in_namelist(modname)
+            )
+            self._reloadable[key] = reloadable
+        return reloadable
 
     def is_module_in_namelist(self, modname):
         """Decide if a module can be reloaded or not according to its name."""
-        return set(modname.split('.')) & set(self.namelist)
+        return set(modname.split('.')) & self._namelist
+
+    def get_module_imports(self, module, modname):
+        """
+        Get the names of the modules imported by a module, including their
+        parent packages.
+
+        Imports are found in the module source, so they include the ones done
+        inside functions.
+        """
+        path = getattr(module, '__file__', None)
+        stat = self._get_stat(path)
+        if stat is None or not path.endswith('.py'):
+            return set()
+
+        key = (path, stat)
+        if key in self._imports_cache:
+            return self._imports_cache[key]
+
+        try:
+            with open(path, 'rb') as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (OSError, SyntaxError, ValueError):
+            tree = None
+
+        package = getattr(module, '__package__', None) or ''
+        imports = set()
+        for node in ast.walk(tree) if tree is not None else []:
+            if isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                try:
+                    base = importlib.util.resolve_name(
+                        '.' * node.level + (node.module or ''), package
+                    )
+                except (ImportError, ValueError):
+                    continue
+                imports.add(base)
+
+                # Imported names can be submodules
+                imports.update(f"{base}.{alias.name}" for alias in node.names)
+
+        # Importing a module also imports its parent packages
+        for name in list(imports):
+            while '.' in name:
+                name = name.rpartition('.')[0]
+                imports.add(name)
+
+        imports.discard(modname)
+        self._imports_cache[key] = imports
+        return imports
+
+    def _get_stat(self, path):
+        """Get the modification time and size of a file, if it exists."""
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_changed_modules(self, user_modules):
+        """Get the names of the user modules whose file changed."""
+        changed = set()
+        for modname, module in user_modules.items():
+            stat = self._get_stat(getattr(module, '__file__', None))
+            previous_stat = self._module_stats.get(modname)
+
+            if previous_stat is None:
+                # The module was imported after the last run, so it could
+                # have changed after being imported if its file is newer.
+                if stat is None or stat[0] >= self._last_run_ns:
+                    changed.add(modname)
+                else:
+                    self._module_stats[modname] = stat
+                    self._module_imports[modname] = self.get_module_imports(
+                        module, modname
+                    )
+            elif stat != previous_stat:
+                changed.add(modname)
+
+        return changed
+
+    def _get_dependents(self, modnames):
+        """
+        Get the names of the user modules that import any of `modnames`,
+        directly or not, including them.
+        """
+        importers = {}
+        for modname, imports in self._module_imports.items():
+            for name in imports:
+                importers.setdefault(name, []).append(modname)
+
+        dependents = set(modnames)
+        pending = list(modnames)
+        while pending:
+            for modname in importers.get(pending.pop(), []):
+                if modname not in dependents:
+                    dependents.add(modname)
+                    pending.append(modname)
+
+        return dependents
 
     def run(self):
         """
@@ -79,16 +207,38 @@ def run(self):
         Do not del modules which are considered as system modules, i.e.
         modules installed in subdirectories of Python interpreter's binary
         Do not del C modules
+        Do not del modules that didn't change and don't import any that did
         """
-        modnames_to_reload = []
-        for modname, module in list(sys.modules.items()):
-            if modname not in self.previous_modules:
-                # Decide if a module can be reloaded or not
-                if self.is_module_reloadable(module, modname):
-                    modnames_to_reload.append(modname)
-                    del sys.modules[modname]
-                else:
-                    continue
+        run_ns = time.time_ns()
+
+        user_modules = {
+            modname: module
+            for modname, module in list(sys.modules.items())
+            if (
+                modname not in self.previous_modules
+                and self.is_module_reloadable(module, modname)
+            )
+        }
+
+        # Forget modules that were removed by other means
+        for modname in list(self._module_stats):
+            if modname not in user_modules:
+                del self._module_stats[modname]
+                del self._module_imports[modname]
+
+        changed = self._get_changed_modules(user_modules)
+        to_reload = self._get_dependents(changed) & user_modules.keys()
+
+        # Keep the order of sys.modules, which is the import order
+        modnames_to_reload = [
+            modname for modname in user_modules if modname in to_reload
+        ]
+        for modname in modnames_to_reload:
+            del sys.modules[modname]
+            self._module_stats.pop(modname, None)
+            self._module_imports.pop(modname, None)
+
+        self._last_run_ns = run_ns
 
         # Report reloaded modules
         if self.verbose and modnames_to_reload:
@@ -17,14 +17,11 @@
 import os
 import os.path as osp
 import tarfile
-import tempfile
-import shutil
 import types
 import json
 import inspect
 import dis
-import copy
-import glob
+import mmap
 import pickle
 
 # Local imports
@@ -186,13 +183,6 @@ def load_array(filename):
         return None, str(error)
 
 
-def __save_array(data, basename, index):
-    """Save numpy array"""
-    fname = basename + '_%04d.npy' % index
-    np.save(fname, data)
-    return fname
-
-
 # ---- For PIL images
 # -----------------------------------------------------------------------------
 if sys.byteorder == 'little':
@@ -266,100 +256,107 @@ def load_json(filename):
 
 # ---- For Spydata files
 # -----------------------------------------------------------------------------
+# Version 2 files contain one pickle per variable, saved with protocol 5 and
+# its out-of-band buffers (e.g. the data of Numpy arrays) in separate members,
+# plus an index listing them. Version 1 files contain a single pickle and
+# one .npy file per array.
+SPYDATA_FORMAT_VERSION = 2
+SPYDATA_INDEX = 'spydata.json'
+
+# Buffers smaller than this are read in memory instead of memory-mapped
+SPYDATA_MMAP_MIN_SIZE = 2**20
+
+
+class _MemoryviewReader:
+    """File-like object to read a memoryview without copying it."""
+
+    def __init__(self, view):
+        self._view = view.cast('B')
+        self._position = 0
+
+    def read(self, size=-1):
+        start = self._position
+        if size is None or size < 0:
+            self._position = len(self._view)
+        else:
+            self._position = min(start + size, len(self._view))
+        return self._view[start:self._position]
+
+
+def _add_tar_member(tar, name, view):
+    """Add a member to tar from a memoryview or bytes, without copying it."""
+    view = memoryview(view)
+    info = tarfile.TarInfo(name)
+    info.size = view.nbytes
+    tar.addfile(info, _MemoryviewReader(view))
+
+
 def save_dictionary(data, filename):
     """Save dictionary in a single file .spydata file"""
     filename = osp.abspath(filename)
-    old_cwd = os.getcwd()
-    os.chdir(osp.dirname(filename))
     error_message = None
     skipped_keys = []
-    data_copy = {}
+    variables = []
+
+    # Write to a temporary file first, so that the file being replaced is
+    # kept if saving fails and arrays memory-mapped from it remain valid.
+    tmp_filename = filename + '.tmp'
 
     try:
-        # Copy dictionary before modifying it to fix #6689
-        for obj_name, obj_value in data.items():
-            # Skip modules, since they can't be pickled, users virtually never
-            # would want them to be and so they don't show up in the skip list.
-            # Skip callables, since they are only pickled by reference and thus
-            # must already be present in the user's environment anyway.
-            if not (callable(obj_value) or isinstance(obj_value,
-                                                      types.ModuleType)):
-                # If an object cannot be deepcopied, then it cannot be pickled.
-                # Ergo, we skip it and list it later.
+        # Use PAX (POSIX.1-2001) format instead of default GNU.
+        # This improves interoperability and UTF-8/long variable name support.
+        with tarfile.open(tmp_filename, "w", format=tarfile.PAX_FORMAT) as tar:
+            for obj_name, obj_value in data.items():
+                # Skip modules, since they can't be pickled, users virtually
+                # never would want them to be and so they don't show up in
+                # the skip list.
+                # Skip callables, since they are only pickled by reference and
+                # thus must already be present in the user's environment
+                # anyway.
+                if callable(obj_value) or isinstance(obj_value,
+                                                     types.ModuleType):
+                    continue
+
+                # Large buffers (e.g. arrays data) are not copied to the
+                # pickle but passed to buffer_callback, so that they can be
+                # written directly from memory.
+                buffers = []
                 try:
-                    data_copy[obj_name] = copy.deepcopy(obj_value)
+                    pickled = pickle.dumps(
+                        obj_value,
+                        protocol=5,
+                        buffer_callback=buffers.append
+                    )
+                    views = [buffer.raw() for buffer in buffers]
                 except Exception:
                     skipped_keys.append(obj_name)
-        data = data_copy
-        if not data:
-            raise RuntimeError('No supported objects to save')
-
-        saved_arrays = {}
-        if np.ndarray is not FakeObject:
-            # Saving numpy arrays with np.save
-            arr_fname = osp.splitext(filename)[0]
-            for name in list(data.keys()):
-                try:
-                    if (isinstance(data[name], np.ndarray) and
-                            data[name].size > 0):
-                        # Save arrays at data root
-                        fname = __save_array(data[name], arr_fname,
-                                             len(saved_arrays))
-                        saved_arrays[(name, None)] = osp.basename(fname)
-                        data.pop(name)
-                    elif isinstance(data[name], (list, dict)):
-                        # Save arrays nested in lists or dictionaries
-                        if isinstance(data[name], list):
-                            iterator = enumerate(data[name])
-                        else:
-                            iterator = iter(list(data[name].items()))
-                        to_remove = []
-                        for index, value in iterator:
-                            if (isinstance(value, np.ndarray) and
-                                    value.size > 0):
-                                fname = __save_array(value, arr_fname,
-                                                     len(saved_arrays))
-                                saved_arrays[(name, index)] = (
-                                    osp.basename(fname))
-                                to_remove.append(index)
-                        for index in sorted(to_remove, reverse=True):
-                            data[name].pop(index)
-                except (RuntimeError, pickle.PicklingError, TypeError,
-                        AttributeError, IndexError):
-                    # If an array can't be saved with numpy for some reason,
-                    # leave the object intact and try to save it normally.
-                    pass
-            if saved_arrays:
-                data['__saved_arrays__'] = saved_arrays
-
-        pickle_filename = osp.splitext(filename)[0] + '.pickle'
-        # Attempt to pickle everything.
-        # If pickling fails, iterate through to eliminate problem objs & retry.
-        with open(pickle_filename, 'w+b') as fdesc:
-            try:
-                pickle.dump(data, fdesc, protocol=2)
-            except (pickle.PicklingError, AttributeError, TypeError,
-                    ImportError, IndexError, RuntimeError):
-                data_filtered = {}
-                for obj_name, obj_value in data.items():
-                    try:
-                        pickle.dumps(obj_value, protocol=2)
-                    except Exception:
-                        skipped_keys.append(obj_name)
-                    else:
-                        data_filtered[obj_name] = obj_value
-                if not data_filtered:
-                    raise RuntimeError('No supported objects to save')
-                pickle.dump(data_filtered, fdesc, protocol=2)
-
-        # Use PAX (POSIX.1-2001) format instead of default GNU.
-        # This improves interoperability and UTF-8/long variable name support.
-        with tarfile.open(filename, "w", format=tarfile.PAX_FORMAT) as tar:
-            for fname in ([pickle_filename]
-                          + [fn for fn in list(saved_arrays.values())]):
-                tar.add(osp.basename(fname))
-                os.remove(fname)
-    except (RuntimeError, pickle.PicklingError, TypeError) as error:
+                    continue
+
+                prefix = 'data/%04d' % len(variables)
+                variable = {
+                    'name': obj_name,
+                    'pickle': prefix + '.pickle',
+                    'buffers': [],
+                }
+                _add_tar_member(tar, variable['pickle'], pickled)
+                del pickled
+                for index, view in enumerate(views):
+                    buffer_name = prefix + '_%04d.buffer' % index
+                    _add_tar_member(tar, buffer_name, view)
+                    variable['buffers'].append(buffer_name)
+                variables.append(variable)
+
+            if not variables:
+                raise RuntimeError('No supported objects to save')
+
+            index = {
+                'version': SPYDATA_FORMAT_VERSION,
+                'variables': variables,
+            }
+            _add_tar_member(tar, SPYDATA_INDEX, json.dumps(index).encode())
+
+        os.replace(tmp_filename, filename)
+    except (RuntimeError, pickle.PicklingError, TypeError, OSError) as error:
         error_message = str(error)
     else:
         if skipped_keys:
@@ -367,70 +364,103 @@ def save_dictionary(data, filename):
             error_message = ('Some objects could not be saved: '
                              + ', '.join(skipped_keys))
     finally:
-        os.chdir(old_cwd)
+        if osp.isfile(tmp_filename):
+            os.remove(tmp_filename)
     return error_message
 
 
-def is_within_directory(directory, target):
-    """Check if a file is within a directory."""
-    abs_directory = os.path.abspath(directory)
-    abs_target = os.path.abspath(target)
-    prefix = os.path.commonprefix([abs_directory, abs_target])
-    return prefix == abs_directory
+def _read_buffer(tar, member, fileno):
+    """
+    Read a buffer saved in a tar member.
+
+    Large buffers are memory-mapped copy-on-write, so they are only read
+    from disk when accessed and can be modified without changing the file.
+    This is not done on Windows because it would prevent saving over the
+    file while the buffers are in use.
+    """
+    if (
+        member.size >= SPYDATA_MMAP_MIN_SIZE
+        and os.name != 'nt'
+        and member.isreg()
+        and not member.issparse()
+    ):
+        # Offsets of memory maps must be multiples of the allocation
+        # granularity
+        offset = member.offset_data % mmap.ALLOCATIONGRANULARITY
+        buffer = mmap.mmap(
+            fileno,
+            offset + member.size,
+            access=mmap.ACCESS_COPY,
+            offset=member.offset_data - offset
+        )
+        return memoryview(buffer)[offset:]
+
+    buffer = bytearray(member.size)
+    tar.extractfile(member).readinto(buffer)
+    return buffer
+
+
+def _load_dictionary_v1(tar):
+    """Load dictionary from a tar with the first version of the format."""
+    members = {member.name: member for member in tar.getmembers()}
+
+    # 'New' format (Spyder >=2.2)
+    pickle_name = [name for name in members if name.endswith('.pickle')][0]
+    data = pickle.loads(tar.extractfile(members[pickle_name]).read())
 
+    if np.load is not FakeObject:
+        # Loading numpy arrays saved with np.save
+        try:
+            saved_arrays = data.pop('__saved_arrays__')
+            for (name, index), fname in list(saved_arrays.items()):
+                arr = np.load(tar.extractfile(members[fname]),
+                              allow_pickle=True)
+                if index is None:
+                    data[name] = arr
+                elif isinstance(data[name], dict):
+                    data[name][index] = arr
+                else:
+                    data[name].insert(index, arr)
+        except KeyError:
+            pass
 
-def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-    """Safely extract a tar file."""
-    for member in tar.getmembers():
-        member_path = os.path.join(path, member.name)
-        if not is_within_directory(path, member_path):
-            raise Exception(
-                f"Attempted path traversal in tar file {tar.name!r}"
-            )
-    tar.extractall(path, members, numeric_owner=numeric_owner)
+    return data
 
 
 def load_dictionary(filename):
     """Load dictionary from .spydata file"""
     filename = osp.abspath(filename)
-    old_cwd = os.getcwd()
-    tmp_folder = tempfile.mkdtemp()
-    os.chdir(tmp_folder)
     data = None
     error_message = None
     try:
-        with tarfile.open(filename, "r") as tar:
-            safe_extract(tar)
-
-        pickle_filename = glob.glob('*.pickle')[0]
-        # 'New' format (Spyder >=2.2)
-        with open(pickle_filename, 'rb') as fdesc:
-            data = pickle.loads(fdesc.read())
-        saved_arrays = {}
-        if np.load is not FakeObject:
-            # Loading numpy arrays saved with np.save
+        with open(filename, 'rb') as fid, \
+                tarfile.open(fileobj=fid, mode='r') as tar:
             try:
-                saved_arrays = data.pop('__saved_arrays__')
-                for (name, index), fname in list(saved_arrays.items()):
-                    arr = np.load(osp.join(tmp_folder, fname), allow_pickle=True)
-                    if index is None:
-                        data[name] = arr
-                    elif isinstance(data[name], dict):
-                        data[name][index] = arr
-                    else:
-                        data[name].insert(index, arr)
+                index_member = tar.getmember(SPYDATA_INDEX)
             except KeyError:
-                pass
+                return _load_dictionary_v1(tar), None
+
+            index = json.load(tar.extractfile(index_member))
+            if index['version'] > SPYDATA_FORMAT_VERSION:
+                raise ValueError(
+                    'This file was saved with a newer version of Spyder'
+                )
+
+            members = {member.name: member for member in tar.getmembers()}
+            data = {}
+            for variable in index['variables']:
+                pickled = tar.extractfile(members[variable['pickle']]).read()
+                buffers = [
+                    _read_buffer(tar, members[name], fid.fileno())
+                    for name in variable['buffers']
+                ]
+                data[variable['name']] = pickle.loads(
+                    pickled, buffers=buffers
+                )
     # Except AttributeError from e.g. trying to load function no longer present
     except (AttributeError, EOFError, ValueError) as error:
+        data = None
         error_message = str(error)
-    # To ensure working dir gets changed back and temp dir wiped no matter what
-    finally:
-        os.chdir(old_cwd)
-        try:
-            shutil.rmtree(tmp_folder)
-        except OSError as error:
-            error_message = str(error)
     return data, error_message
 
 
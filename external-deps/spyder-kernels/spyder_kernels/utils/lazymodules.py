@@ -41,18 +41,27 @@ def __init__(self, modname, second_level_attrs=None):
         self.__spy_modname__ = modname
         self.__spy_mod__ = FakeObject
 
+        # Whether the module was already imported or found to be missing
+        self.__spy_resolved__ = False
+
         # Set required second level attributes
         if second_level_attrs is not None:
             for attr in second_level_attrs:
                 setattr(self.__spy_mod__, attr, FakeObject)
 
     def __getattr__(self, name):
+        # Fast path: this is called for each attribute access, e.g. several
+        # times per variable when building the Variable Explorer view.
+        if self.__spy_resolved__:
+            if self.__spy_mod__ is FakeObject:
+                return FakeObject
+            return getattr(self.__spy_mod__, name)
+
         if is_module_installed(self.__spy_modname__):
             self.__spy_mod__ = __import__(self.__spy_modname__)
-        else:
-            return self.__spy_mod__
+        self.__spy_resolved__ = True
 
-        return getattr(self.__spy_mod__, name)
+        return self.__getattr__(name)
 
 
 # =============================================================================
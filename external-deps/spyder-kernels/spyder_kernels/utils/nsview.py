@@ -9,6 +9,7 @@
 """
 Utilities to build a namespace view.
 """
+import functools
 from itertools import islice
 import inspect
 import pathlib
@@ -21,6 +22,7 @@
 #==============================================================================
 # Numpy support
 #==============================================================================
+@functools.lru_cache(maxsize=1)
 def get_numeric_numpy_types():
     return (np.int64, np.int32, np.int16, np.int8, np.uint64, np.uint32,
             np.uint16, np.uint8, np.float64, np.float32, np.float16,
@@ -87,6 +89,12 @@ def try_to_eval(value):
 
 def get_size(item):
     """Return shape/size/len of an item of arbitrary type"""
+    item_type = type(item)
+    if item_type in BUILTIN_SIZED_TYPES:
+        return len(item)
+    elif item_type in BUILTIN_TYPE_STRINGS:
+        return 1
+
     try:
         if (
             hasattr(item, 'size') and hasattr(item.size, 'compute') or
@@ -195,38 +203,44 @@ def str_to_timedelta(value):
 #==============================================================================
 # Supported types
 #==============================================================================
+# Type strings of the types that can be edited
+EDITABLE_TYPE_STRINGS = {
+    'bool',
+    'int',
+    'long',
+    'float',
+    'complex',
+    'list',
+    'set',
+    'frozenset',
+    'dict',
+    'tuple',
+    'str',
+    'unicode',
+    'NDArray',
+    'MaskedArray',
+    'Matrix',
+    'DataFrame',
+    'Series',
+    'PIL.Image.Image',
+    'datetime.date',
+    'datetime.timedelta',
+}
+
+
 def is_editable_type(value):
     """
     Return True if data type is editable with a standard GUI-based editor,
     like CollectionsEditor, ArrayEditor, QDateEdit or a simple QLineEdit.
     """
+    value_type = type(value)
+    if value_type in BUILTIN_TYPE_STRINGS:
+        return value_type in EDITABLE_BUILTIN_TYPES
+
     if not is_known_type(value):
         return False
     else:
-        supported_types = [
-            'bool',
-            'int',
-            'long',
-            'float',
-            'complex',
-            'list',
-            'set',
-            'frozenset',
-            'dict',
-            'tuple',
-            'str',
-            'unicode',
-            'NDArray',
-            'MaskedArray',
-            'Matrix',
-            'DataFrame',
-            'Series',
-            'PIL.Image.Image',
-            'datetime.date',
-            'datetime.timedelta',
-        ]
-
-        if (get_type_string(value) not in supported_types and
+        if (get_type_string(value) not in EDITABLE_TYPE_STRINGS and
                 not isinstance(value, pd.Index)):
             np_dtype = get_numpy_dtype(value)
             if np_dtype is None or not hasattr(value, 'size'):
@@ -336,8 +350,31 @@ def collections_display(value, level):
     return display
 
 
+def truncate_display(display):
+    """
+    Truncate display at 70 chars to avoid freezing Spyder because of large
+    displays.
+    """
+    if len(display) > 70:
+        if isinstance(display, bytes):
+            ellipses = b' ...'
+        else:
+            ellipses = ' ...'
+        display = display[:70].rstrip() + ellipses
+    return display
+
+
 def value_to_display(value, minmax=False, level=0):
     """Convert value for display purpose"""
+    # Builtin types don't need the checks and Numpy printoptions below
+    display_function = BUILTIN_DISPLAY_FUNCTIONS.get(type(value))
+    if display_function is not None:
+        try:
+            display = display_function(value, level)
+        except Exception:
+            display = default_display(value)
+        return truncate_display(display)
+
     # To save current Numpy printoptions
     np_printoptions = FakeObject
     printable_numpy_types = get_numeric_numpy_types() + (np.str_,)
@@ -444,14 +481,7 @@ def value_to_display(value, minmax=False, level=0):
     except Exception:
         display = default_display(value)
 
-    # Truncate display at 70 chars to avoid freezing Spyder
-    # because of large displays
-    if len(display) > 70:
-        if isinstance(display, bytes):
-            ellipses = b' ...'
-        else:
-            ellipses = ' ...'
-        display = display[:70].rstrip() + ellipses
+    display = truncate_display(display)
 
     # Restore Numpy printoptions
     if np_printoptions is not FakeObject:
@@ -514,6 +544,10 @@ def display_to_value(value, default_value, ignore_errors=True):
 # =============================================================================
 def get_type_string(item):
     """Return type string of an object."""
+    type_string = BUILTIN_TYPE_STRINGS.get(type(item))
+    if type_string is not None:
+        return type_string
+
     # The try/except is necessary to fix spyder-ide/spyder#19516.
     try:
         # Numpy objects (don't change the order!)
@@ -534,8 +568,13 @@ def get_type_string(item):
     except Exception:
         pass
 
+    return get_type_string_from_type(type(item))
+
+
+def get_type_string_from_type(item_type):
+    """Return type string of a type, from its repr."""
     found = re.findall(r"<(?:type|class) '(\S*)'>",
-                       str(type(item)))
+                       str(item_type))
     if found:
         if found[0] == 'type':
             return 'class'
@@ -571,6 +610,75 @@ def get_human_readable_type(item):
         return 'Unknown'
 
 
+# =============================================================================
+# Builtin types
+# =============================================================================
+# Values of these types are the most common ones in namespaces, so the
+# results of the functions above are precomputed for them or dispatched by
+# type, instead of going through all their checks. Only exact types are
+# considered because subclasses can be displayed differently.
+def _display_repr(value, level):
+    return repr(value)
+
+
+def _display_as_str(value, level):
+    return str(value)
+
+
+def _display_string(value, level):
+    if level > 0:
+        return "'" + value + "'"
+    return value
+
+
+def _display_bytes(value, level):
+    try:
+        display = str(value, 'utf8')
+        if level > 0:
+            display = "'" + display + "'"
+    except:
+        display = value
+        if level > 0:
+            display = b"'" + display + b"'"
+    return display
+
+
+def _display_collection(value, level):
+    return collections_display(value, level + 1)
+
+
+BUILTIN_DISPLAY_FUNCTIONS = {
+    bool: _display_repr,
+    int: _display_repr,
+    float: _display_repr,
+    complex: _display_repr,
+    type(None): _display_repr,
+    str: _display_string,
+    bytes: _display_bytes,
+    list: _display_collection,
+    set: _display_collection,
+    frozenset: _display_collection,
+    tuple: _display_collection,
+    dict: _display_collection,
+    datetime.date: _display_as_str,
+    datetime.datetime: _display_as_str,
+    datetime.timedelta: _display_as_str,
+}
+
+BUILTIN_TYPE_STRINGS = {
+    builtin_type: get_type_string_from_type(builtin_type)
+    for builtin_type in BUILTIN_DISPLAY_FUNCTIONS
+}
+
+BUILTIN_SIZED_TYPES = {str, bytes, list, set, frozenset, tuple, dict}
+
+EDITABLE_BUILTIN_TYPES = {
+    builtin_type
+    for builtin_type, type_string in BUILTIN_TYPE_STRINGS.items()
+    if type_string in EDITABLE_TYPE_STRINGS
+}
+
+
 #==============================================================================
 # Globals filter: filter namespace dictionaries (to be edited in
 # CollectionsEditor)
@@ -580,11 +688,16 @@ def is_supported(value, check_all=False, filters=None, iterate=False):
     assert filters is not None
     if value is None:
         return True
-    if is_callable_or_module(value):
+    if type(value) in BUILTIN_TYPE_STRINGS:
+        # Builtin values are not callables or modules
+        if type(value) not in EDITABLE_BUILTIN_TYPES:
+            return False
+    elif is_callable_or_module(value):
         return True
     elif not is_editable_type(value):
         return False
-    elif not isinstance(value, filters):
+
+    if not isinstance(value, filters):
         return False
     elif iterate:
         if isinstance(value, (list, tuple, set, frozenset)):
@@ -655,6 +768,20 @@ def get_supported_types():
     """
     Return a dictionnary containing types lists supported by the
     namespace browser.
+    """
+    return {
+        mode: list(types) for mode, types in _get_supported_types().items()
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _get_supported_types():
+    """
+    Return a dictionnary containing types tuples supported by the
+    namespace browser.
+
+    This is cached to not import Numpy, Pandas and PIL (or fail to) each time
+    the namespace view is computed.
 
     Note:
     If you update this list, don't forget to update variablexplorer.rst
@@ -690,7 +817,9 @@ def get_supported_types():
         editable_types.append(Image.Image)
     except:
         pass
-    return dict(picklable=picklable_types, editable=editable_types)
+    return dict(
+        picklable=tuple(picklable_types), editable=tuple(editable_types)
+    )
 
 
 def get_remote_data(data, settings, mode, more_excluded_names=None):
@@ -701,7 +830,7 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
         * mode (string): 'editable' or 'picklable'
         * more_excluded_names: additional excluded names (list)
     """
-    supported_types = get_supported_types()
+    supported_types = _get_supported_types()
     assert mode in list(supported_types.keys())
     excluded_names = list(settings['excluded_names'])
     if more_excluded_names is not None:
@@ -709,7 +838,7 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
     return globalsfilter(
         data,
         check_all=settings['check_all'],
-        filters=tuple(supported_types[mode]),
+        filters=supported_types[mode],
         exclude_private=settings['exclude_private'],
         exclude_uppercase=settings['exclude_uppercase'],
         exclude_capitalized=settings['exclude_capitalized'],
@@ -718,6 +847,17 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
         excluded_names=excluded_names, filter_on=settings['filter_on'])
 
 
+def make_remote_view_entry(value, settings):
+    """Make the remote view of a single value."""
+    return {
+        'type':  get_human_readable_type(value),
+        'size':  get_size(value),
+        'view':  value_to_display(value, minmax=settings['minmax']),
+        'python_type': get_type_string(value),
+        'numpy_type': get_numpy_type_string(value)
+    }
+
+
 def make_remote_view(data, settings, more_excluded_names=None):
     """
     Make a remote view of dictionary *data*
@@ -727,13 +867,29 @@ def make_remote_view(data, settings, more_excluded_names=None):
                            more_excluded_names=more_excluded_names)
     remote = {}
     for key, value in list(data.items()):
-        view = value_to_display(value, minmax=settings['minmax'])
-        remote[key] = {
-            'type':  get_human_readable_type(value),
-            'size':  get_size(value),
-            'view':  view,
-            'python_type': get_type_string(value),
-            'numpy_type': get_numpy_type_string(value)
-        }
+        remote[key] = make_remote_view_entry(value, settings)
 
     return remote
+
+
+# Types whose instances can't change after being created, so they can be
+# fingerprinted cheaply.
+SCALAR_TYPES = (bool, int, float, complex, type(None), range)
+STRING_TYPES = (str, bytes)
+
+
+def get_fingerprint(value):
+    """
+    Return a cheap fingerprint of `value` to detect changes in its view.
+
+    Returns None if there's no cheap way to know that `value` didn't change,
+    i.e. for mutable objects, which need their view to be recomputed.
+    """
+    value_type = type(value)
+    if value_type in SCALAR_TYPES:
+        return (value_type, value)
+    elif value_type in STRING_TYPES:
+        # Ids can be reused after an object is garbage collected, so the hash
+        # is needed too. It's cached by Python after computing it once.
+        return (value_type, id(value), hash(value))
+    return None
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Sampling profiler and storage for its results.
+
+The profiler periodically records the call stack of the thread that runs the
+profiled code. Stacks are aggregated in a columnar form that can be sent to the
+frontend incrementally and converted to the stats format used by `pstats`.
+"""
+
+import logging
+import marshal
+import sys
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class SampledStacks:
+    """
+    Aggregated call stacks, stored by columns.
+
+    Functions are stored once, in the `filenames`, `linenos` and `names`
+    lists, and referenced by their index. Each stack is a tuple of function
+    indexes, from the outermost call to the innermost one, and its number of
+    samples and the time they account for are stored in the `counts` and
+    `times` lists.
+    """
+
+    def __init__(self):
+        # Functions
+        self.filenames = []
+        self.linenos = []
+        self.names = []
+        self._function_ids = {}
+
+        # Stacks
+        self.stacks = []
+        self.counts = []
+        self.times = []
+        self._stack_ids = {}
+
+        # What changed since the last chunk
+        self._n_sent_functions = 0
+        self._n_sent_stacks = 0
+        self._n_chunks = 0
+        self._changed = {}
+
+        # To be filled by create_stats, as in profile.Profile
+        self.stats = {}
+
+    def function_id(self, filename, lineno, name):
+        """Get the index of a function, adding it if necessary."""
+        key = (filename, lineno, name)
+        function_id = self._function_ids.get(key)
+        if function_id is None:
+            function_id = len(self.filenames)
+            self._function_ids[key] = function_id
+            self.filenames.append(filename)
+            self.linenos.append(lineno)
+            self.names.append(name)
+        return function_id
+
+    def add(self, stack, elapsed, count=1):
+        """
+        Add samples of a stack.
+
+        Parameters
+        ----------
+        stack: tuple
+            Function indexes, from the outermost call to the innermost one.
+        elapsed: float
+            Time accounted for by the samples, in seconds.
+        count: int
+            Number of samples.
+        """
+        stack_id = self._stack_ids.get(stack)
+        if stack_id is None:
+            stack_id = len(self.stacks)
+            self._stack_ids[stack] = stack_id
+            self.stacks.append(stack)
+            self.counts.append(0)
+            self.times.append(0.)
+
+        self.counts[stack_id] += count
+        self.times[stack_id] += elapsed
+
+        changed = self._changed.get(stack_id)
+        if changed is None:
+            self._changed[stack_id] = [count, elapsed]
+        else:
+            changed[0] += count
+            changed[1] += elapsed
+
+    def pop_chunk(self):
+        """
+        Get what was added since the last chunk.
+
+        Chunks only contain lists of basic types, so they are compact to send
+        to the frontend, where they can be added to another instance of this
+        class with `add_chunk`.
+        """
+        n_functions = len(self.filenames)
+        n_stacks = len(self.stacks)
+        chunk = {
+            "first": self._n_chunks == 0,
+            "filenames": self.filenames[self._n_sent_functions:n_functions],
+            "linenos": self.linenos[self._n_sent_functions:n_functions],
+            "names": self.names[self._n_sent_functions:n_functions],
+            "stacks": self.stacks[self._n_sent_stacks:n_stacks],
+            "stack_ids": list(self._changed.keys()),
+            "counts": [changed[0] for changed in self._changed.values()],
+            "times": [changed[1] for changed in self._changed.values()],
+        }
+
+        self._n_sent_functions = n_functions
+        self._n_sent_stacks = n_stacks
+        self._n_chunks += 1
+        self._changed = {}
+
+        return chunk
+
+    def add_chunk(self, chunk):
+        """Add a chunk created by `pop_chunk`."""
+        for filename, lineno, name in zip(
+            chunk["filenames"], chunk["linenos"], chunk["names"]
+        ):
+            self.function_id(filename, lineno, name)
+
+        for stack in chunk["stacks"]:
+            stack = tuple(stack)
+            self._stack_ids[stack] = len(self.stacks)
+            self.stacks.append(stack)
+            self.counts.append(0)
+            self.times.append(0.)
+
+        for stack_id, count, elapsed in zip(
+            chunk["stack_ids"], chunk["counts"], chunk["times"]
+        ):
+            self.counts[stack_id] += count
+            self.times[stack_id] += elapsed
+
+    def is_empty(self):
+        """Check if no samples were added."""
+        return not self.stacks
+
+    def create_stats(self):
+        """
+        Convert stacks to the format of `profile.Profile.stats`, so they can
+        be loaded with `pstats.Stats`.
+
+        Numbers of calls are numbers of samples in which functions appear.
+        """
+        entries = {}
+        for stack, count, elapsed in zip(self.stacks, self.counts, self.times):
+            seen = set()
+            caller = None
+            leaf = len(stack) - 1
+            for depth, function_id in enumerate(stack):
+                entry = entries.get(function_id)
+                if entry is None:
+                    entry = entries[function_id] = [0, 0, 0., 0., {}]
+
+                # Recursive calls only count once per sample
+                if function_id not in seen:
+                    seen.add(function_id)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += elapsed
+
+                if caller is not None and (caller, function_id) not in seen:
+                    seen.add((caller, function_id))
+                    caller_entry = entry[4].get(caller)
+                    if caller_entry is None:
+                        caller_entry = entry[4][caller] = [0, 0, 0., 0.]
+                    caller_entry[0] += count
+                    caller_entry[1] += count
+                    caller_entry[3] += elapsed
+                    if depth == leaf:
+                        caller_entry[2] += elapsed
+
+                caller = function_id
+
+            # Only the innermost function was running
+            entries[stack[-1]][2] += elapsed
+
+        keys = list(zip(self.filenames, self.linenos, self.names))
+        self.stats = {
+            keys[function_id]: (
+                cc, nc, tt, ct,
+                {
+                    keys[caller]: tuple(caller_entry)
+                    for caller, caller_entry in callers.items()
+                }
+            )
+            for function_id, (cc, nc, tt, ct, callers) in entries.items()
+        }
+
+
+class SamplingProfiler:
+    """
+    Low overhead profiler that samples the call stack of the profiled thread.
+
+    It has the same interface as `cProfile.Profile` to run code and save its
+    results, which can be loaded with `pstats.Stats`.
+
+    Parameters
+    ----------
+    interval: float
+        Time between samples, in seconds.
+    callback: callable, optional
+        Function called from the sampling thread with the chunks of stacks
+        sampled during the last `flush_interval` seconds.
+    flush_interval: float
+        Time between calls to `callback`, in seconds.
+    """
+
+    def __init__(self, interval=0.005, callback=None, flush_interval=1.):
+        self.interval = interval
+        self.callback = callback
+        self.flush_interval = flush_interval
+        self.stacks = SampledStacks()
+        self.stats = {}
+
+        self._code_ids = {}
+        self._thread = None
+        self._thread_id = None
+        self._base_frame = None
+        self._stop_event = threading.Event()
+
+    def runctx(self, cmd, globals, locals):
+        """Run code while sampling it."""
+        self.enable(base_frame=sys._getframe())
+        try:
+            exec(cmd, globals, locals)
+        finally:
+            self.disable()
+        return self
+
+    def enable(self, base_frame=None):
+        """
+        Start sampling the current thread.
+
+        Only frames called from `base_frame`, which is the caller of this
+        method by default, are sampled.
+        """
+        self._thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+        if base_frame is None:
+            base_frame = sys._getframe(1)
+        self._base_frame = base_frame
+
+    def disable(self):
+        """Stop sampling."""
+        self._base_frame = None
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def create_stats(self):
+        """Convert sampled stacks to the format used by `pstats`."""
+        self.disable()
+        self.stacks.create_stats()
+        self.stats = self.stacks.stats
+
+    def dump_stats(self, file):
+        """Save results in the same format as `cProfile.Profile`."""
+        with open(file, 'wb') as f:
+            self.create_stats()
+            marshal.dump(self.stats, f)
+
+    def _get_stack(self, frame):
+        """Get the function indexes of a frame and its callers."""
+        base_frame = self._base_frame
+        if base_frame is None:
+            return None
+
+        stack = []
+        code_ids = self._code_ids
+        while frame is not None and frame is not base_frame:
+            code = frame.f_code
+            function_id = code_ids.get(code)
+            if function_id is None:
+                function_id = code_ids[code] = self.stacks.function_id(
+                    code.co_filename, code.co_firstlineno, code.co_name
+                )
+            stack.append(function_id)
+            frame = frame.f_back
+
+        if frame is None:
+            # Not running profiled code
+            return None
+
+        stack.reverse()
+        return tuple(stack)
+
+    def _sample(self):
+        """Sample the profiled thread until disabled."""
+        last_sample = last_flush = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            stack = self._get_stack(frame)
+            del frame
+
+            # Samples can be delayed because the GIL is not released, so they
+            # account for all the time since the previous one.
+            if stack:
+                self.stacks.add(stack, now - last_sample)
+            last_sample = now
+
+            if (
+                self.callback is not None
+                and now - last_flush >= self.flush_interval
+            ):
+                last_flush = now
+                self._flush()
+
+        if self.callback is not None:
+            self._flush()
+
+    def _flush(self):
+        """Call the callback with the stacks sampled since the last call."""
+        chunk = self.stacks.pop_chunk()
+        if chunk["stack_ids"]:
+            try:
+                self.callback(chunk)
+            except Exception:
+                logger.debug("Could not send sampled stacks", exc_info=True)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Benchmark for the namespace view shown in the Variable Explorer.
+
+Run it with `python -m spyder_kernels.utils.tests.benchmark_nsview [n]`,
+where n is the number of variables in the namespace (10000 by default).
+"""
+
+import datetime
+import sys
+import timeit
+
+from spyder_kernels.utils.nsview import make_remote_view
+
+
+SETTINGS = {
+    'check_all': False,
+    'exclude_private': True,
+    'exclude_uppercase': True,
+    'exclude_capitalized': False,
+    'exclude_unsupported': False,
+    'exclude_callables_and_modules': True,
+    'excluded_names': [],
+    'minmax': False,
+    'show_callable_attributes': True,
+    'show_special_attributes': False,
+    'filter_on': True,
+}
+
+
+def make_namespace(n_variables=10000):
+    """Make a namespace with variables of the most common types."""
+    values = [
+        1,
+        2.5,
+        True,
+        None,
+        'some text',
+        b'some bytes',
+        [1, 2, 3],
+        (1, 'a'),
+        {'a': 1, 'b': [1, 2]},
+        {1, 2},
+        datetime.date(2024, 1, 1),
+    ]
+
+    try:
+        import numpy as np
+        values += [np.arange(10), np.float64(1.5)]
+    except ImportError:
+        pass
+
+    try:
+        import pandas as pd
+        values += [pd.DataFrame({'a': [1, 2]}), pd.Series([1, 2])]
+    except ImportError:
+        pass
+
+    return {
+        f'var_{i}': values[i % len(values)] for i in range(n_variables)
+    }
+
+
+def benchmark(n_variables=10000, number=5):
+    """Print the time taken to compute the namespace view."""
+    namespace = make_namespace(n_variables)
+    time = timeit.timeit(
+        lambda: make_remote_view(namespace, SETTINGS), number=number
+    )
+    print(f'make_remote_view with {n_variables} variables: '
+          f'{time / number * 1e3:.1f} ms')
+
+
+if __name__ == '__main__':
+    benchmark(*[int(arg) for arg in sys.argv[1:2]])
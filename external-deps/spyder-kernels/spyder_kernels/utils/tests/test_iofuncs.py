@@ -13,7 +13,9 @@
 # Standard library imports
 import copy
 import io
+import json
 import os
+import tarfile
 
 # Third party imports
 from PIL import ImageFile
@@ -340,6 +342,43 @@ def test_spydata_export(input_namespace, expected_namespace,
                 pass
 
 
+def test_spydata_export_large_arrays(tmp_path):
+    """
+    Test that large arrays are saved out-of-band and loaded lazily as
+    writable arrays that don't modify the file.
+    """
+    path = str(tmp_path / 'large_arrays.spydata')
+    size = iofuncs.SPYDATA_MMAP_MIN_SIZE // 8 + 1
+    namespace = {
+        'small': np.arange(10),
+        'large': np.arange(size, dtype=np.float64),
+        'fortran': np.asfortranarray(np.ones((size // 4, 4))),
+        'nested': {'array': np.arange(size, dtype=np.int64)},
+    }
+
+    assert iofuncs.save_dictionary(namespace, path) is None
+    assert not os.path.isfile(path + '.tmp')
+
+    with tarfile.open(path) as tar:
+        index = json.load(tar.extractfile(iofuncs.SPYDATA_INDEX))
+    assert index['version'] == iofuncs.SPYDATA_FORMAT_VERSION
+    assert [v['name'] for v in index['variables']] == list(namespace)
+
+    data, error = iofuncs.load_dictionary(path)
+    assert error is None
+    assert are_namespaces_equal(data, namespace)
+    assert data['fortran'].flags.f_contiguous
+
+    # Arrays can be modified without changing the saved file
+    data['large'][0] = -1
+    data_reloaded, error = iofuncs.load_dictionary(path)
+    assert data_reloaded['large'][0] == 0
+
+    # Saving over the loaded file keeps the loaded arrays valid
+    assert iofuncs.save_dictionary({'a': 1}, path) is None
+    assert data['large'][1] == 1
+
+
 def test_save_load_hdf5_files(tmp_path):
     """Simple test to check that we can save and load HDF5 files."""
     import h5py
@@ -8,6 +8,7 @@
 
 import pytest
 
+from spyder_kernels.utils import lazymodules
 from spyder_kernels.utils.lazymodules import LazyModule, FakeObject
 
 
@@ -38,3 +39,27 @@ def test_existing_modules():
     # The lazy module should have these extra attributes
     assert np.__spy_mod__
     assert np.__spy_modname__
+
+
+def test_module_resolved_once(monkeypatch):
+    """Test that modules are only looked for on the first attribute access."""
+    calls = []
+
+    def is_module_installed(modname):
+        calls.append(modname)
+        return modname == 'os'
+
+    monkeypatch.setattr(
+        lazymodules, 'is_module_installed', is_module_installed
+    )
+
+    os_mod = LazyModule('os')
+    import os
+    assert os_mod.sep == os.sep
+    assert os_mod.path is os.path
+
+    missing_mod = LazyModule('no_module')
+    assert missing_mod.foo is FakeObject
+    assert missing_mod.bar is FakeObject
+
+    assert calls == ['os', 'no_module']
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+import pstats
+
+from spyder_kernels.utils.profiling import SampledStacks, SamplingProfiler
+
+
+CODE = """
+def busy(n):
+    s = 0
+    for i in range(n):
+        s += i
+    return s
+
+def f():
+    busy(2_000_000)
+    g()
+
+def g():
+    busy(1_000_000)
+
+f()
+"""
+
+
+def test_sampled_stacks_stats():
+    """Test that stacks are converted to pstats stats correctly."""
+    stacks = SampledStacks()
+    module = stacks.function_id("test.py", 1, "<module>")
+    f = stacks.function_id("test.py", 2, "f")
+    g = stacks.function_id("test.py", 5, "g")
+
+    stacks.add((module, f), 1.)
+    stacks.add((module, f, g), 2.)
+    stacks.add((module, f, g, g), 1.)
+    stacks.create_stats()
+
+    stats = pstats.Stats(stacks)
+    f_stats = stats.stats[("test.py", 2, "f")]
+    g_stats = stats.stats[("test.py", 5, "g")]
+
+    # Calls, local time and cumulative time
+    assert f_stats[1:4] == (3, 1., 4.)
+    assert g_stats[1:4] == (2, 3., 3.)
+
+    # Recursive calls are callers too
+    assert set(g_stats[4]) == {("test.py", 2, "f"), ("test.py", 5, "g")}
+
+
+def test_sampled_stacks_chunks():
+    """Test that stacks can be sent in chunks."""
+    stacks = SampledStacks()
+    received = SampledStacks()
+
+    a = stacks.function_id("test.py", 1, "a")
+    stacks.add((a,), 1.)
+    chunk = stacks.pop_chunk()
+    assert chunk["first"]
+    received.add_chunk(chunk)
+
+    b = stacks.function_id("test.py", 2, "b")
+    stacks.add((a, b), 1.)
+    stacks.add((a,), 1.)
+    chunk = stacks.pop_chunk()
+    assert not chunk["first"]
+
+    # Only new functions and stacks are sent
+    assert chunk["names"] == ["b"]
+    assert chunk["stacks"] == [(a, b)]
+    received.add_chunk(chunk)
+
+    assert received.names == stacks.names
+    assert received.stacks == stacks.stacks
+    assert received.counts == stacks.counts == [2, 1]
+
+
+def test_sampling_profiler(tmpdir):
+    """Test that the sampling profiler finds where time is spent."""
+    chunks = []
+    profiler = SamplingProfiler(
+        interval=0.001, callback=chunks.append, flush_interval=0.01
+    )
+    namespace = {}
+    profiler.runctx(compile(CODE, "<test>", "exec"), namespace, namespace)
+
+    filename = str(tmpdir.join("profile.prof"))
+    profiler.dump_stats(filename)
+    stats = pstats.Stats(filename)
+
+    busy = stats.stats[("<test>", 2, "busy")]
+    f = stats.stats[("<test>", 8, "f")]
+
+    # Most of the time is spent in busy, called by f
+    assert busy[2] > 0.5 * f[3]
+    assert ("<test>", 8, "f") in busy[4]
+
+    # The profiler frames are not sampled
+    assert all(key[0] == "<test>" for key in stats.stats)
+
+    # Chunks contain all samples
+    received = SampledStacks()
+    for chunk in chunks:
+        received.add_chunk(chunk)
+    assert received.stacks == profiler.stacks.stacks
+    assert received.counts == profiler.stacks.counts
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import asyncio
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import datetime
 import errno
@@ -24,6 +25,92 @@
     from io import FileIO
 
 
+class MetadataCache:
+    """
+    Short-lived cache for the metadata of paths and directory listings.
+
+    Entries expire after `ttl` seconds, so changes done by other processes
+    are seen soon enough. Changes done through the files service invalidate
+    the affected entries right away.
+
+    Directory listings are also checked against the modification time of the
+    directory, which changes when entries are added, removed or renamed.
+    """
+
+    def __init__(self, ttl: float = 2.0, max_infos: int = 4096, max_listings: int = 8):
+        self.ttl = ttl
+        self.max_infos = max_infos
+        self.max_listings = max_listings
+        self._infos: dict[str, tuple[float, dict]] = {}
+        self._listings: dict[str, tuple[float, int, list[dict]]] = {}
+
+    def get_info(self, path: str) -> dict | None:
+        """Get the info of path, if it's cached."""
+        cached = self._infos.get(path)
+        if cached is None:
+            return None
+
+        if time.monotonic() - cached[0] >= self.ttl:
+            del self._infos[path]
+            return None
+
+        return cached[1]
+
+    def set_info(self, path: str, info: dict):
+        """Cache the info of path."""
+        if len(self._infos) >= self.max_infos:
+            # Remove the oldest entry
+            del self._infos[next(iter(self._infos))]
+        self._infos[path] = (time.monotonic(), info)
+
+    def get_listing(self, path: str) -> list[dict] | None:
+        """Get the listing of directory path, if it's cached and valid."""
+        cached = self._listings.get(path)
+        if cached is None:
+            return None
+
+        created, mtime_ns, listing = cached
+        try:
+            valid = (
+                time.monotonic() - created < self.ttl
+                and os.stat(path).st_mtime_ns == mtime_ns
+            )
+        except OSError:
+            valid = False
+
+        if not valid:
+            del self._listings[path]
+            return None
+
+        return listing
+
+    def set_listing(self, path: str, mtime_ns: int, listing: list[dict]):
+        """Cache the listing of directory path."""
+        self._listings.pop(path, None)
+        if len(self._listings) >= self.max_listings:
+            del self._listings[next(iter(self._listings))]
+        self._listings[path] = (time.monotonic(), mtime_ns, listing)
+
+    def invalidate(self, path: Path | str):
+        """Invalidate the entries of path, its parent and its children."""
+        path = str(path)
+        prefix = path.rstrip(os.sep) + os.sep
+        parent = os.path.dirname(path)
+        for cache in (self._infos, self._listings):
+            for key in list(cache):
+                if key == path or key == parent or key.startswith(prefix):
+                    del cache[key]
+
+    def clear(self):
+        """Remove all entries."""
+        self._infos.clear()
+        self._listings.clear()
+
+
+# Shared by all handlers, which are created for each request
+metadata_cache = MetadataCache()
+
+
 class FileWebSocketHandler(WebSocketHandler):
     """
     WebSocket handler for opening files and streaming data.
@@ -42,6 +129,19 @@ class FileWebSocketHandler(WebSocketHandler):
         "error": {"message": "error message",  (required)
                   "traceback": ["line1", "line2", ...]  (optional)}  # if an error occurred  (optional)
       }
+
+    If the client opens the file with `binary=true`, file contents are sent
+    raw in binary frames in both directions, instead of base64-encoded in
+    "data". The JSON message then has the number of frames that follow it
+    with the data, and whether the data is a list of chunks:
+      {
+        "method": "writelines",  # or "status": 200 when sending back
+        "frames": 2,  # number of binary frames that follow  (required)
+        "list": true,  # data is a list of the frames  (optional)
+      }
+
+    The first message sent back to the client has `"binary": true` if binary
+    frames are used.
     """
 
     LOCK_TIMEOUT = 100  # seconds
@@ -60,6 +160,11 @@ async def open(self):
         self.atomic = self.get_argument("atomic", default="false") == "true"
         lock = self.get_argument("lock", default="false") == "true"
         self.encoding = self.get_argument("encoding", default="utf-8")
+        self.binary = self.get_argument("binary", default="false") == "true"
+
+        # JSON message waiting for the binary frames with its data
+        self._message_with_frames: dict | None = None
+        self._frames: list[bytes] = []
 
         self.file: FileIO = None
         try:
@@ -82,7 +187,7 @@ async def open(self):
             self.log.exception("Error opening file")
             self.close(1002, self._parse_error(e))
         else:
-            await self._send_json(HTTPStatus.OK)
+            await self._send_json(HTTPStatus.OK, binary=self.binary)
 
     def on_close(self):
         """Close file."""
@@ -104,7 +209,20 @@ async def on_message(self, raw_message):
     # Internal Helpers
     # ----------------------------------------------------------------
     async def handle_message(self, raw_message):
-        msg = self._decode_json(raw_message)
+        if self._message_with_frames is not None:
+            # This is a binary frame with data for the previous message
+            self._frames.append(raw_message)
+            msg = self._message_with_frames
+            if len(self._frames) < msg["frames"]:
+                return
+            self._message_with_frames = None
+        else:
+            msg = self._decode_json(raw_message)
+            if msg.get("frames"):
+                self._message_with_frames = msg
+                self._frames = []
+                return
+
         method, kwargs = await self._parse_message(msg)
         await self._run_method(method, kwargs)
 
@@ -123,6 +241,8 @@ def _close_file(self):
         self.file.close()
         if self.atomic:
             self.atomic_path.replace(self.path)
+        if any(c in self.mode for c in "wax+"):
+            metadata_cache.invalidate(self.path)
 
     async def _run_method(self, method, kwargs):
         """Run a method with kwargs."""
@@ -138,7 +258,12 @@ async def _parse_message(self, msg):
         """Parse a message into method and kwargs."""
         method = msg.pop("method", None)
 
-        if "data" in msg and isinstance(msg["data"], list):
+        if "frames" in msg:
+            msg.pop("frames")
+            frames, self._frames = self._frames, []
+            data = [self._decode_frame(frame) for frame in frames]
+            msg["data"] = data if msg.pop("list", False) else data[0]
+        elif "data" in msg and isinstance(msg["data"], list):
             msg["data"] = [self._decode_data(d) for d in msg["data"]]
         elif "data" in msg:
             msg["data"] = self._decode_data(msg["data"])
@@ -218,9 +343,27 @@ async def _send_msg_error(self, message):
             HTTPStatus.BAD_REQUEST, message=message,
         )
 
+    async def _send_frames(self, frames: list[bytes], is_list: bool):
+        """Send a JSON message followed by binary frames with data."""
+        await self._send_json(
+            HTTPStatus.OK, frames=len(frames), list=is_list
+        )
+        for frame in frames:
+            await self.write_message(frame, binary=True)
+
     async def _send_result(self, result):
         if result is None:
             await self._send_json(HTTPStatus.NO_CONTENT)
+        elif self.binary and isinstance(result, (bytes, str)):
+            await self._send_frames([self._encode_frame(result)], False)
+        elif (
+            self.binary
+            and isinstance(result, list)
+            and all(isinstance(r, (bytes, str)) for r in result)
+        ):
+            await self._send_frames(
+                [self._encode_frame(r) for r in result], True
+            )
         elif isinstance(result, list):
             await self._send_json(
                 HTTPStatus.OK, data=[self._encode_data(r) for r in result],
@@ -248,6 +391,18 @@ def _encode_data(self, data: bytes | str | object) -> str:
             return base64.b64encode(data.encode(self.encoding)).decode("ascii")
         return data
 
+    def _decode_frame(self, frame: bytes) -> str | bytes:
+        """Decode data from a binary frame."""
+        if "b" in self.mode:
+            return frame
+        return frame.decode(self.encoding)
+
+    def _encode_frame(self, data: bytes | str) -> bytes:
+        """Encode data for a binary frame."""
+        if isinstance(data, str):
+            return data.encode(self.encoding)
+        return data
+
     def _load_path(self, path_str: str) -> Path:
         """Convert path string to a Path object."""
         return Path(path_str).expanduser()
@@ -291,9 +446,9 @@ async def _handle_readlines(self, hint: int = -1) -> list[bytes | str]:
         """Read lines from the file."""
         return self.file.readlines(hint)
 
-    async def _handle_writelines(self, lines: list[bytes | str]):
+    async def _handle_writelines(self, data: list[bytes | str]):
         """Write lines to the file."""
-        return self.file.writelines(lines)
+        return self.file.writelines(data)
 
     async def _handle_isatty(self) -> bool:
         """Check if the file is a TTY."""
@@ -313,9 +468,11 @@ class FilesRESTMixin:
     REST handler for fsspec-like filesystem operations, using pathlib.Path.
 
     Supports:
-        - fs_ls(path_str, detail=True)
+        - fs_ls(path_str, detail=True, offset=0, limit=None)
         - fs_info(path_str)
+        - fs_info_batch(path_strs)
         - fs_exists(path_str)
+        - fs_exists_batch(path_strs)
         - fs_isfile(path_str)
         - fs_isdir(path_str)
         - fs_mkdir(path_str, create_parents=True, exist_ok=False)
@@ -326,11 +483,27 @@ class FilesRESTMixin:
 
     def _info_for_path(self, path: Path) -> dict:
         """Get fsspec-like info about a single path."""
-        out = path.stat(follow_symlinks=False)
+        info = metadata_cache.get_info(str(path))
+        if info is None:
+            info = self._info_from_stat(
+                str(path), path.stat(follow_symlinks=False)
+            )
+            metadata_cache.set_info(str(path), info)
+        return info
+
+    def _info_for_entry(self, entry: os.DirEntry) -> dict:
+        """Get fsspec-like info about a directory entry."""
+        # On most systems this is the only stat call for the entry
+        return self._info_from_stat(
+            entry.path, entry.stat(follow_symlinks=False)
+        )
+
+    def _info_from_stat(self, path_str: str, out: os.stat_result) -> dict:
+        """Get fsspec-like info from the lstat result of a path."""
         link = stat.S_ISLNK(out.st_mode)
         if link:
             # If it's a link, stat the target
-            out = path.stat(follow_symlinks=True)
+            out = os.stat(path_str)
         size = out.st_size
         if stat.S_ISDIR(out.st_mode):
             t = "directory"
@@ -339,7 +512,7 @@ def _info_for_path(self, path: Path) -> dict:
         else:
             t = "other"
         result = {
-            "name": str(path),
+            "name": path_str,
             "size": size,
             "type": t,
             "created": out.st_ctime,
@@ -348,16 +521,52 @@ def _info_for_path(self, path: Path) -> dict:
         for field in ["mode", "uid", "gid", "mtime", "ino", "nlink"]:
             result[field] = getattr(out, f"st_{field}", None)
         if link:
-            result["destination"] = str(path.resolve())
+            result["destination"] = str(Path(path_str).resolve())
 
         return result
 
+    def _list_directory(self, path: Path) -> list[dict]:
+        """Get the info of all entries in a directory."""
+        path_str = str(path)
+        listing = metadata_cache.get_listing(path_str)
+        if listing is None:
+            # Get mtime before scanning so that changes during the scan
+            # invalidate the listing.
+            mtime_ns = os.stat(path_str).st_mtime_ns
+            with os.scandir(path_str) as entries:
+                listing = [self._info_for_entry(entry) for entry in entries]
+            metadata_cache.set_listing(path_str, mtime_ns, listing)
+        return listing
+
+    def _os_error_info(self, path_str: str, error: OSError) -> dict:
+        """Get the info of a path that couldn't be accessed."""
+        return {
+            "name": path_str,
+            "error": {
+                "strerror": error.strerror,
+                "errno": error.errno,
+                "filename": error.filename,
+            },
+        }
+
     def _load_path(self, path_str: str) -> Path | None:
         """Convert a path string to a pathlib.Path object."""
         return Path(path_str).expanduser()
 
-    def fs_ls(self, path_str: str, detail: bool = True):
-        """List objects at path, like fsspec.ls()."""
+    def fs_ls(
+        self,
+        path_str: str,
+        detail: bool = True,
+        offset: int = 0,
+        limit: int | None = None,
+    ):
+        """
+        List objects at path, like fsspec.ls().
+
+        `offset` and `limit` allow to get the entries of large directories in
+        pages. Listings with details are cached for a short time, so pages
+        are taken from the same listing.
+        """
         path = self._load_path(path_str)
         if not path.exists():
             raise FileNotFoundError(
@@ -378,22 +587,50 @@ def fs_ls(self, path_str: str, detail: bool = True):
             return
 
         # Otherwise, it's a directory
-        for p in path.glob("*"):
-            if detail:
-                yield self._info_for_path(p)
-            else:
-                yield str(p)
+        stop = None if limit is None else offset + limit
+        if detail:
+            yield from self._list_directory(path)[offset:stop]
+        else:
+            # Names don't need stat calls, so no need to cache them
+            with os.scandir(str(path)) as entries:
+                for i, entry in enumerate(entries):
+                    if stop is not None and i >= stop:
+                        break
+                    if i >= offset:
+                        yield entry.path
 
     def fs_info(self, path_str: str):
         """Get info about a single path, like fsspec.info()."""
         path = self._load_path(path_str)
         return self._info_for_path(path)
 
+    def fs_info_batch(self, path_strs: list[str]) -> list[dict]:
+        """
+        Get info about several paths.
+
+        Paths that can't be accessed get an `error` entry instead of failing
+        the whole request.
+        """
+        results = []
+        for path_str in path_strs:
+            path = self._load_path(path_str)
+            try:
+                results.append(self._info_for_path(path))
+            except OSError as e:
+                results.append(self._os_error_info(str(path), e))
+        return results
+
     def fs_exists(self, path_str: str) -> bool:
         """Like fsspec.exists()."""
         path = self._load_path(path_str)
+        if metadata_cache.get_info(str(path)) is not None:
+            return True
         return path.exists()
 
+    def fs_exists_batch(self, path_strs: list[str]) -> list[bool]:
+        """Check if several paths exist."""
+        return [self.fs_exists(path_str) for path_str in path_strs]
+
     def fs_isfile(self, path_str: str) -> bool:
         """Like fsspec.isfile()."""
         path = self._load_path(path_str)
@@ -408,6 +645,7 @@ def fs_mkdir(self, path_str: str, create_parents: bool = True, exist_ok: bool =
         """Like fsspec.mkdir()."""
         path = self._load_path(path_str)
         path.mkdir(parents=create_parents, exist_ok=exist_ok)
+        metadata_cache.invalidate(path)
         return {"success": True}
 
     def fs_rmdir(self, path_str: str, non_empty: bool = False):
@@ -417,12 +655,14 @@ def fs_rmdir(self, path_str: str, non_empty: bool = False):
             rmtree(str(path))
         else:
             path.rmdir()
+        metadata_cache.invalidate(path)
         return {"success": True}
 
     def fs_rm_file(self, path_str: str, missing_ok: bool = False):
         """Like fsspec.rm_file(), remove a single file."""
         path = self._load_path(path_str)
         path.unlink(missing_ok=missing_ok)
+        metadata_cache.invalidate(path)
         return {"success": True}
 
     def fs_touch(self, path_str: str, truncate: bool = True):
@@ -438,6 +678,7 @@ def fs_touch(self, path_str: str, truncate: bool = True):
             # create or overwrite
             with path.open("wb"):
                 pass
+        metadata_cache.invalidate(path)
         return {"success": True}
 
     def fs_copy(self, src_str: str, dst_str: str, metadata: bool=False):
@@ -448,6 +689,7 @@ def fs_copy(self, src_str: str, dst_str: str, metadata: bool=False):
             copy2(src, dst)
         else:
             copy(src, dst)
+        metadata_cache.invalidate(dst)
         return {"success": True}
 
     def fs_move(self, src_str: str, dst_str: str):
@@ -459,6 +701,8 @@ def fs_move(self, src_str: str, dst_str: str):
         if dst.exists():
             raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
         src.rename(dst)
+        metadata_cache.invalidate(src)
+        metadata_cache.invalidate(dst)
         return {"success": True}
 
     @contextmanager
@@ -468,7 +712,12 @@ def fs_zip_dir(
         compression: int = 9,
         chunk_size: int = 65536,
     ):
-        """Stream compressed directory content."""
+        """
+        Stream compressed directory content.
+
+        Files are compressed in a thread pool while previous ones are being
+        streamed. zlib releases the GIL, so this uses several cores.
+        """
         path = self._load_path(path_str)
 
         zip_files = []
@@ -486,6 +735,10 @@ def fs_zip_dir(
                     )
                 )
 
+        executor = ThreadPoolExecutor(
+            max_workers=min(32, os.cpu_count() or 1),
+            thread_name_prefix="spyder-zip",
+        )
         try:
             if not zip_files:
                 yield None
@@ -495,7 +748,9 @@ def fs_zip_dir(
                         wbits=-zlib.MAX_WBITS, level=compression,
                     ),
                     chunk_size=chunk_size,
+                    executor=executor,
                 )
         finally:
+            executor.shutdown(wait=True)
             for f in zip_files:
                 f.data.close()
@@ -1,4 +1,5 @@
 from collections import deque
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass
 from datetime import datetime
 import enum
@@ -11,6 +12,7 @@
     Generator,
     Iterable,
     Iterator,
+    Optional,
     Tuple,
     Type,
 )
@@ -37,6 +39,14 @@ class MemberFile:
     crc32: int = 0
 
 
+@dataclass(frozen=True)
+class CompressedData:
+    """Data of a member that was compressed in advance."""
+    chunks: list
+    uncompressed_size: int
+    crc32: int
+
+
 class ZipStream:
     local_header_signature = b"PK\x03\x04"
     local_header_struct = Struct("<HHH4sIIIHH")
@@ -87,12 +97,25 @@ def __init__(
         ),
         extended_timestamps: bool = True,
         auto_upgrade_central_directory: bool = True,
+        executor: Optional[Executor] = None,
+        block_size: int = 1 << 20,
+        max_pending: int = 16,
     ):
+        """
+        If an `executor` is given, compressed members are compressed in it
+        while previous ones are being streamed. Members up to `block_size`
+        bytes are compressed at once, and larger ones in independent blocks
+        of that size. At most `max_pending` members or blocks are compressed
+        ahead of the stream.
+        """
         self.files = files
         self.chunk_size = chunk_size
         self.get_compressobj = get_compressobj
         self.extended_timestamps = extended_timestamps
         self.auto_upgrade_central_directory = auto_upgrade_central_directory
+        self.executor = executor
+        self.block_size = block_size
+        self.max_pending = max_pending
 
         self.offset = 0
         self.central_directory: Deque[Tuple[bytes, bytes, bytes]] = deque()
@@ -154,7 +177,7 @@ def _raise_if_beyond(
             raise exception_class()
 
     def get_zipped_chunks_uneven(self) -> Iterable[bytes]:
-        for memberfile in self.files:
+        for memberfile, compressed_data in self._prefetch_members(self.files):
             name_encoded = memberfile.name.encode("utf-8")
             self._raise_if_beyond(
                 len(name_encoded),
@@ -200,7 +223,11 @@ def get_zipped_chunks_uneven(self) -> Iterable[bytes]:
                 memberfile.size,
                 memberfile.crc32,
                 crc_32_mask,
-                self.io_to_chunks(memberfile.data),
+                (
+                    self.io_to_chunks(memberfile.data)
+                    if compressed_data is None
+                    else compressed_data
+                ),
             )
             self.central_directory_size += (
                 len(self.central_directory_header_signature)
@@ -301,6 +328,100 @@ def io_to_chunks(self, data: BinaryIO) -> Iterable[bytes]:
         while chunk := data.read(self.chunk_size):
             yield chunk
 
+    def _prefetch_members(
+        self, files: Iterable[MemberFile]
+    ) -> Iterator[Tuple[MemberFile, Optional[CompressedData]]]:
+        """
+        Yield members in order with their data compressed in advance, if
+        possible.
+        """
+        if self.executor is None:
+            for memberfile in files:
+                yield memberfile, None
+            return
+
+        pending: Deque[Tuple[MemberFile, Optional[Future]]] = deque()
+        for memberfile in files:
+            future = None
+            if (
+                self.raw_compression[memberfile.method] == 8
+                and memberfile.size <= self.block_size
+            ):
+                future = self.executor.submit(
+                    self._compress_member, memberfile.data
+                )
+            pending.append((memberfile, future))
+
+            if len(pending) > self.max_pending:
+                memberfile, future = pending.popleft()
+                yield memberfile, future and future.result()
+
+        while pending:
+            memberfile, future = pending.popleft()
+            yield memberfile, future and future.result()
+
+    def _compress_member(self, data: BinaryIO) -> CompressedData:
+        """Read and compress all data of a member."""
+        chunk = data.read()
+        compress_obj = self.get_compressobj()
+        return CompressedData(
+            [compress_obj.compress(chunk), compress_obj.flush()],
+            len(chunk),
+            zlib.crc32(chunk),
+        )
+
+    def _compress_block(self, block: bytes) -> bytes:
+        """
+        Compress a block so that it can be followed by other blocks.
+
+        Blocks don't reference data in previous ones, so each one can be
+        compressed independently.
+        """
+        compress_obj = self.get_compressobj()
+        return compress_obj.compress(block) + compress_obj.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def _compress_chunks(
+        self, chunks: Iterable[bytes]
+    ) -> Iterator[Tuple[bytes, bytes]]:
+        """Yield chunks with their compressed data."""
+        if self.executor is None:
+            compress_obj = self.get_compressobj()
+            for chunk in chunks:
+                yield chunk, compress_obj.compress(chunk)
+            yield b"", compress_obj.flush()
+            return
+
+        def blocks() -> Iterator[bytes]:
+            block = []
+            size = 0
+            for chunk in chunks:
+                block.append(chunk)
+                size += len(chunk)
+                if size >= self.block_size:
+                    yield b"".join(block)
+                    block = []
+                    size = 0
+            if block:
+                yield b"".join(block)
+
+        pending: Deque[Tuple[bytes, Future]] = deque()
+        for block in blocks():
+            pending.append(
+                (block, self.executor.submit(self._compress_block, block))
+            )
+            if len(pending) > self.max_pending:
+                block, future = pending.popleft()
+                yield block, future.result()
+
+        while pending:
+            block, future = pending.popleft()
+            yield block, future.result()
+
+        # An empty final block ends the stream
+        yield b"", self.get_compressobj().flush()
+
     def write_zip64_end_of_central_directory(self) -> Iterable[bytes]:
         central_directory_end_offset = self.offset
 
@@ -351,11 +472,28 @@ def _zip_data(
         max_uncompressed_size: int,
         max_compressed_size: int,
     ) -> Generator[bytes, None, Tuple[int, int, int]]:
+        if isinstance(chunks, CompressedData):
+            self._raise_if_beyond(
+                chunks.uncompressed_size,
+                maximum=max_uncompressed_size,
+                exception_class=UncompressedSizeOverflowError,
+            )
+            compressed_size = 0
+            for compressed_chunk in chunks.chunks:
+                compressed_size += len(compressed_chunk)
+                self._raise_if_beyond(
+                    compressed_size,
+                    maximum=max_compressed_size,
+                    exception_class=CompressedSizeOverflowError,
+                )
+                yield from self.write_chunk(compressed_chunk)
+
+            return chunks.uncompressed_size, compressed_size, chunks.crc32
+
         uncompressed_size = 0
         compressed_size = 0
         crc_32 = zlib.crc32(b"")
-        compress_obj = self.get_compressobj()
-        for chunk in chunks:
+        for chunk, compressed_chunk in self._compress_chunks(chunks):
             uncompressed_size += len(chunk)
 
             self._raise_if_beyond(
@@ -365,7 +503,6 @@ def _zip_data(
             )
 
             crc_32 = zlib.crc32(chunk, crc_32)
-            compressed_chunk = compress_obj.compress(chunk)
             compressed_size += len(compressed_chunk)
 
             self._raise_if_beyond(
@@ -376,17 +513,6 @@ def _zip_data(
 
             yield from self.write_chunk(compressed_chunk)
 
-        compressed_chunk = compress_obj.flush()
-        compressed_size += len(compressed_chunk)
-
-        self._raise_if_beyond(
-            compressed_size,
-            maximum=max_compressed_size,
-            exception_class=CompressedSizeOverflowError,
-        )
-
-        yield from self.write_chunk(compressed_chunk)
-
         return uncompressed_size, compressed_size, crc_32
 
     def _zip_64_local_header_and_data(
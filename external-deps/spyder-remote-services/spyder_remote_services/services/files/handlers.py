@@ -92,18 +92,87 @@ def get_path_argument(self, name: str) -> str:
             )
         return match.group("path")
 
+    def get_int_argument(self, name: str, default=None) -> int | None:
+        """Get a non-negative integer argument from the request.
+
+        Args
+        ----
+            name (str): Name of the argument to get.
+            default: Value returned if the argument is missing.
+
+        Returns
+        -------
+            int | None: The integer argument.
+
+        Raises
+        ------
+            HTTPError: If the argument is not a non-negative integer.
+        """
+        value = self.get_argument(name, default=None)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            value = -1
+        if value < 0:
+            raise web.HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                reason=f"Invalid {name} argument",
+            )
+        return value
+
     def write_json(self, data, status=200):
         self.set_status(status)
         self.set_header("Content-Type", "application/json")
         self.finish(orjson.dumps(data))
 
+    def get_path_list_body(self, name: str) -> list[str]:
+        """Get a list of paths from the JSON body of the request.
+
+        Args
+        ----
+            name (str): Name of the list in the body.
+
+        Returns
+        -------
+            list[str]: The paths.
+
+        Raises
+        ------
+            HTTPError: If the list is missing or any path is invalid.
+        """
+        try:
+            paths = orjson.loads(self.request.body)[name]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            raise web.HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                reason=f"Missing {name} argument",
+            )
+
+        matches = [
+            re.match(_path_regex, path) if isinstance(path, str) else None
+            for path in paths
+        ]
+        if not all(matches):
+            raise web.HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                reason=f"Invalid {name} argument",
+            )
+        return [match.group("path") for match in matches]
+
     @asynccontextmanager
-    async def stream_json(self, status=200):
+    async def stream_json(self, status=200, flush_every=1):
+        """Stream JSON lines, flushing them every `flush_every` lines."""
         self.set_status(status)
         self.set_header("Content-Type", "application/stream+json")
+        count = 0
         async def write_json(data):
+            nonlocal count
             self.write(orjson.dumps(data) + b"\n")
-            await self.flush()
+            count += 1
+            if count % flush_every == 0:
+                await self.flush()
         yield write_json
         await self.finish()
 
@@ -161,8 +230,12 @@ async def get(self):
         detail_arg = self.get_argument("detail", default="true").lower()
         detail = detail_arg == "true"
         path = self.get_path_argument("path")
-        async with self.stream_json() as write_json:
-            for result in self.fs_ls(path, detail=detail):
+        offset = self.get_int_argument("offset", default=0)
+        limit = self.get_int_argument("limit")
+        async with self.stream_json(flush_every=_LS_FLUSH_LINES) as write_json:
+            for result in self.fs_ls(
+                path, detail=detail, offset=offset, limit=limit
+            ):
                 await write_json(result)
 
 class InfoHandler(BaseFSHandler):
@@ -173,6 +246,14 @@ def get(self):
         self.write_json(result)
 
 
+class InfoBatchHandler(BaseFSHandler):
+    @web.authenticated
+    @authorized
+    def post(self):
+        result = self.fs_info_batch(self.get_path_list_body("paths"))
+        self.write_json(result)
+
+
 class ExistsHandler(BaseFSHandler):
     @web.authenticated
     @authorized
@@ -181,6 +262,14 @@ def get(self):
         self.write_json({"exists": result})
 
 
+class ExistsBatchHandler(BaseFSHandler):
+    @web.authenticated
+    @authorized
+    def post(self):
+        result = self.fs_exists_batch(self.get_path_list_body("paths"))
+        self.write_json({"exists": result})
+
+
 class IsFileHandler(BaseFSHandler):
     @web.authenticated
     @authorized
@@ -285,11 +374,16 @@ def post(self):
 
 _path_regex = r"file://(?P<path>.+)"
 
+# Number of entries sent at once when listing directories
+_LS_FLUSH_LINES = 1000
+
 handlers = [
     (r"/fs/open", ReadWriteWebsocketHandler),  # WebSocket
     (r"/fs/ls", LsHandler),                  # GET
     (r"/fs/info", InfoHandler),              # GET
+    (r"/fs/info_batch", InfoBatchHandler),   # POST
     (r"/fs/exists", ExistsHandler),          # GET
+    (r"/fs/exists_batch", ExistsBatchHandler),  # POST
     (r"/fs/isfile", IsFileHandler),          # GET
     (r"/fs/isdir", IsDirHandler),            # GET
     (r"/fs/mkdir", MkdirHandler),            # POST
@@ -189,6 +189,9 @@
               # that generate a lot of Command Prompts while running,
               # and that's extremely annoying for Windows users.
               'hide_cmd_windows': True,
+              'kernel_pool/size': 1,
+              'kernel_pool/idle_timeout': 10,
+              'kernel_pool/max_memory_usage': 90,
               }),
             ('variable_explorer',
              {
@@ -397,6 +400,8 @@
               'enable': True,
               'switch_to_plugin': True,
               'n_slow_children': 15,
+              'sampling': False,
+              'sampling_interval': 5,
               }),
             ('pylint',
              {
@@ -404,6 +409,8 @@
               'history_filenames': [],
               'max_entries': 30,
               'project_dir': None,
+              'cache_results': True,
+              'jobs': 0,
               }),
             ('workingdir',
              {
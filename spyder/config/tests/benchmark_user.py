@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Micro-benchmark for config access.
+
+Run it with `python -m spyder.config.tests.benchmark_user`.
+"""
+
+# Standard library imports
+import tempfile
+import timeit
+
+# Local imports
+from spyder.config.main import CONF_VERSION, DEFAULTS
+from spyder.config.user import UserConfig
+
+
+# Options read often by widgets, with different types
+OPTIONS = [
+    ('main', 'high_dpi_custom_scale_factor'),
+    ('main', 'high_dpi_custom_scale_factors'),
+    ('editor', 'wrap'),
+    ('editor', 'tab_stop_width_spaces'),
+    ('main', 'window/size'),
+    ('plots', 'mute_inline_plotting'),
+]
+
+
+def benchmark(number=20000):
+    """Print the time per call of the main config methods."""
+    with tempfile.TemporaryDirectory() as path:
+        conf = UserConfig(
+            'spyder-benchmark', path, defaults=DEFAULTS, load=True,
+            version=CONF_VERSION, backup=False, raw_mode=True
+        )
+
+        for section, option in OPTIONS:
+            time = timeit.timeit(
+                lambda: conf.get(section, option), number=number)
+            print(f'get({section!r}, {option!r}): '
+                  f'{time / number * 1e6:.2f} us')
+
+        time = timeit.timeit(
+            lambda: conf.get_default('editor', 'wrap'), number=number)
+        print(f"get_default('editor', 'wrap'): "
+              f"{time / number * 1e6:.2f} us")
+
+        time = timeit.timeit(
+            lambda: conf.set('editor', 'wrap', True), number=number)
+        print(f"set('editor', 'wrap', True): {time / number * 1e6:.2f} us")
+
+        conf.flush()
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -9,6 +9,7 @@
 # Standard library imports
 import configparser as cp
 import os
+import time
 
 # Third party imports
 import pytest
@@ -277,6 +278,44 @@ def test_userconfig_get_does_not_eval_functions(self, userconfig):
         assert userconfig.get('section', 'option') == 'print("foo")'
 
 
+def test_userconfig_get_cache(userconfig):
+    userconfig.set('section', 'option', [1, 2])
+    value = userconfig.get('section', 'option')
+    assert value == [1, 2]
+
+    # Cached values can't be modified by callers
+    value.append(3)
+    assert userconfig.get('section', 'option') == [1, 2]
+
+    # The cache is invalidated when setting or removing options
+    userconfig.set('section', 'option', [3])
+    assert userconfig.get('section', 'option') == [3]
+
+    userconfig.remove_option('section', 'option')
+    with pytest.raises(cp.NoOptionError):
+        userconfig.get('section', 'option')
+
+
+def test_userconfig_delayed_save(userconfig, monkeypatch):
+    monkeypatch.setattr(UserConfig, 'SAVE_DELAY', 0.1)
+    fpath = userconfig.get_config_fpath()
+    with open(fpath) as inifile:
+        ini_contents = inifile.read()
+
+    # Changes are saved at once after a delay
+    userconfig.set('section', 'option', 'value 1')
+    userconfig.set('section', 'option2', 'value 2')
+    with open(fpath) as inifile:
+        assert inifile.read() == ini_contents
+
+    time.sleep(0.5)
+    with open(fpath) as inifile:
+        ini_contents = inifile.read()
+    assert 'option = value 1' in ini_contents
+    assert 'option2 = value 2' in ini_contents
+    assert not os.path.isfile(fpath + '.tmp')
+
+
 def test_userconfig_set_default(userconfig):
     value = userconfig.get_default('section', 'option')
     assert value == NoDefault
@@ -343,6 +382,7 @@ def test_userconfig_set_invalid(self, defaults, value, tmpdir):
 
     def test_userconfig_set_with_string(self, userconfig):
         userconfig.set('section', 'option', 'new value')
+        userconfig.flush()
         with open(userconfig.get_config_fpath()) as inifile:
             ini_contents = inifile.read()
 
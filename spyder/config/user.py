@@ -12,6 +12,7 @@
 
 # Standard library imports
 import ast
+import atexit
 import configparser as cp
 import copy
 import io
@@ -19,6 +20,7 @@
 import os.path as osp
 import re
 import shutil
+import threading
 import time
 
 # Local imports
@@ -33,6 +35,21 @@ class NoDefault:
     pass
 
 
+# Values of these types can be returned from the cache without copying them
+IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+# Configurations with changes that haven't been written to disk yet, by id.
+# Note: ConfigParser objects are not hashable, so they can't be in a set.
+_UNSAVED_CONFIGS = {}
+
+
+@atexit.register
+def _save_unsaved_configs():
+    """Write pending changes before exiting."""
+    for config in list(_UNSAVED_CONFIGS.values()):
+        config.flush()
+
+
 # ============================================================================
 # Defaults class
 # ============================================================================
@@ -45,6 +62,11 @@ def __init__(self, name, path):
         """
         Class used to save defaults to a file and as UserConfig base class.
         """
+        # Changes are saved from a background thread, so they need to be
+        # serialized with the ones made in the main thread.
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+
         super().__init__(interpolation=None)
 
         self._name = name
@@ -84,9 +106,6 @@ def _write(self, fp):
 
     def _set(self, section, option, value, verbose):
         """Set method."""
-        if not self.has_section(section):
-            self.add_section(section)
-
         if not isinstance(value, str):
             value = repr(value)
 
@@ -94,15 +113,32 @@ def _set(self, section, option, value, verbose):
             text = '[{}][{}] = {}'.format(section, option, value)
             print(text)  # spyder: test-skip
 
-        super().set(section, option, value)
+        with self._lock:
+            if not self.has_section(section):
+                self.add_section(section)
+            super().set(section, option, value)
 
     def _save(self):
         """Save config into the associated .ini file."""
+        with self._save_lock:
+            self._write_to_disk()
+
+    def _write_to_disk(self):
+        """Write config to the associated .ini file in a single step."""
         fpath = self.get_config_fpath()
 
+        with self._lock:
+            configfile = io.StringIO()
+            self.write(configfile)
+            contents = configfile.getvalue()
+
         def _write_file(fpath):
-            with io.open(fpath, 'w', encoding='utf-8') as configfile:
-                self.write(configfile)
+            # Write to a temporary file first and then replace the old one,
+            # so that a crash while writing can't leave a truncated file.
+            tmp_fpath = fpath + '.tmp'
+            with io.open(tmp_fpath, 'w', encoding='utf-8') as configfile:
+                configfile.write(contents)
+            os.replace(tmp_fpath, fpath)
 
         # See spyder-ide/spyder#1086 and spyder-ide/spyder#1242 for background
         # on why this method contains all the exception handling.
@@ -122,6 +158,21 @@ def _write_file(fpath):
                       'the exception shown below')  # spyder: test-skip
                 print(e)  # spyder: test-skip
 
+    def add_section(self, section):
+        """Add a new section."""
+        with self._lock:
+            super().add_section(section)
+
+    def remove_section(self, section):
+        """Remove `section` and all options within it."""
+        with self._lock:
+            return super().remove_section(section)
+
+    def remove_option(self, section, option):
+        """Remove `option` from `section`."""
+        with self._lock:
+            return super().remove_option(section, option)
+
     def get_config_fpath(self):
         """Return the ini file where this configuration is stored."""
         path = self._path
@@ -169,15 +220,32 @@ class UserConfig(DefaultsConfig):
     -----
     The 'get' and 'set' arguments number and type differ from the overriden
     methods. 'defaults' is an attribute and not a method.
+
+    Values returned by 'get' are cached until the option is set or removed.
+    Changes done by 'set' are written to disk in the background after
+    SAVE_DELAY seconds, so that several changes done in a row are saved at
+    once. Use 'flush' to write them immediately.
     """
     DEFAULT_SECTION_NAME = 'main'
 
+    # Time (in secs) to wait before writing changes to disk
+    SAVE_DELAY = 0.5
+
     def __init__(self, name, path, defaults=None, load=True, version=None,
                  backup=False, raw_mode=False, remove_obsolete=False,
                  external_plugin=False):
         """UserConfig class, based on ConfigParser."""
         super().__init__(name=name, path=path)
 
+        # Parsed values by (section, option)
+        self._values_cache = {}
+
+        # Default values by (section, option)
+        self._defaults_index = {}
+
+        self._save_timer = None
+        self._save_pending = False
+
         self._load = load
         self._version = self._check_version(version)
         self._backup = backup
@@ -227,6 +295,25 @@ def __init__(self, name, path, defaults=None, load=True, version=None,
                 # If no defaults are defined set .ini file settings as default
                 self.set_as_defaults()
 
+    # --- Defaults
+    # ------------------------------------------------------------------------
+    @property
+    def defaults(self):
+        """List of tuples (section, options) with the default values."""
+        return self._defaults_list
+
+    @defaults.setter
+    def defaults(self, defaults):
+        self._defaults_list = defaults
+
+        self._defaults_index = {}
+        for section, options in defaults:
+            for option, value in options.items():
+                self._defaults_index.setdefault((section, option), value)
+
+        # Values are parsed according to the type of their defaults
+        self._values_cache.clear()
+
     # --- Helpers and checkers
     # ------------------------------------------------------------------------
     @staticmethod
@@ -330,8 +417,15 @@ def _make_backup(self, version=None, old_version=None):
 
     def _load_from_ini(self, fpath):
         """Load config from the associated .ini file found at `fpath`."""
+        # Other configs for the same file could have pending changes
+        for config in list(_UNSAVED_CONFIGS.values()):
+            if config is not self and config.get_config_fpath() == fpath:
+                config.flush()
+
         try:
-            self.read(fpath, encoding='utf-8')
+            with self._lock:
+                self._values_cache.clear()
+                self.read(fpath, encoding='utf-8')
         except cp.MissingSectionHeaderError:
             error_text = 'Warning: File contains no section headers.'
             print(error_text)  # spyder: test-skip
@@ -365,6 +459,34 @@ def _update_defaults(self, defaults, old_version, verbose=False):
                 if old_val is None or str(new_value) != old_val:
                     self._set(section, option, new_value, verbose)
 
+    def _set(self, section, option, value, verbose):
+        """Set method."""
+        super()._set(section, option, value, verbose)
+        self._values_cache.pop((section, self.optionxform(option)), None)
+
+    def _schedule_save(self):
+        """Write changes to disk after SAVE_DELAY seconds."""
+        with self._lock:
+            self._save_pending = True
+            _UNSAVED_CONFIGS[id(self)] = self
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(
+                    self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _cancel_save(self):
+        """Cancel any pending write and return whether there was one."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+            pending, self._save_pending = self._save_pending, False
+            _UNSAVED_CONFIGS.pop(id(self), None)
+
+        if timer is not None:
+            timer.cancel()
+
+        return pending
+
     def _remove_deprecated_options(self, old_version):
         """
         Remove options which are present in the .ini file but not in defaults.
@@ -459,11 +581,19 @@ def reset_to_defaults(self, save=True, verbose=False, section=None):
                     value = options[option]
                     self._set(sec, option, value, verbose)
         if save:
-            self._save()
+            self._schedule_save()
+
+    def flush(self):
+        """Write pending changes to disk."""
+        # The lock makes sure that files are not written concurrently with
+        # an older version of the config.
+        with self._save_lock:
+            if self._cancel_save():
+                self._write_to_disk()
 
     def set_as_defaults(self):
         """Set defaults from the current config."""
-        self.defaults = []
+        defaults = []
         for section in self.sections():
             secdict = {}
             for option, value in self.items(section, raw=self._raw):
@@ -472,7 +602,8 @@ def set_as_defaults(self):
                 except (SyntaxError, ValueError):
                     pass
                 secdict[option] = value
-            self.defaults.append((section, secdict))
+            defaults.append((section, secdict))
+        self.defaults = defaults
 
     def get_default(self, section, option):
         """
@@ -481,15 +612,7 @@ def get_default(self, section, option):
         This is useful for type checking in `get` method.
         """
         section = self._check_section_option(section, option)
-        for sec, options in self.defaults:
-            if sec == section:
-                if option in options:
-                    value = options[option]
-                    break
-        else:
-            value = NoDefault
-
-        return value
+        return self._defaults_index.get((section, option), NoDefault)
 
     def get(self, section, option, default=NoDefault):
         """
@@ -507,6 +630,10 @@ def get(self, section, option, default=NoDefault):
         """
         section = self._check_section_option(section, option)
 
+        key = (section, self.optionxform(option))
+        if key in self._values_cache:
+            return self._copy_value(self._values_cache[key])
+
         if not self.has_section(section):
             if default is NoDefault:
                 raise cp.NoSectionError(section)
@@ -538,7 +665,18 @@ def get(self, section, option, default=NoDefault):
             except (SyntaxError, ValueError):
                 pass
 
-        return value
+        self._values_cache[key] = value
+        return self._copy_value(value)
+
+    @staticmethod
+    def _copy_value(value):
+        """
+        Copy mutable values from the cache, so they can't be modified by
+        callers.
+        """
+        if isinstance(value, IMMUTABLE_TYPES):
+            return value
+        return copy.deepcopy(value)
 
     def set_default(self, section, option, default_value):
         """
@@ -552,6 +690,9 @@ def set_default(self, section, option, default_value):
         for sec, options in self.defaults:
             if sec == section:
                 options[option] = default_value
+                self._defaults_index[(section, option)] = default_value
+                self._values_cache.pop(
+                    (section, self.optionxform(option)), None)
 
     def set(self, section, option, value, verbose=False, save=True):
         """
@@ -577,21 +718,25 @@ def set(self, section, option, value, verbose=False, save=True):
 
         self._set(section, option, value, verbose)
         if save:
-            self._save()
+            self._schedule_save()
 
     def remove_section(self, section):
         """Remove `section` and all options within it."""
         super().remove_section(section)
-        self._save()
+        self._values_cache.clear()
+        self._schedule_save()
 
     def remove_option(self, section, option):
         """Remove `option` from `section`."""
         super().remove_option(section, option)
-        self._save()
+        self._values_cache.pop((section, self.optionxform(option)), None)
+        self._schedule_save()
 
     def cleanup(self):
         """Remove .ini file associated to config."""
-        os.remove(self.get_config_fpath())
+        with self._save_lock:
+            self._cancel_save()
+            os.remove(self.get_config_fpath())
 
     def to_list(self):
         """
@@ -992,10 +1137,15 @@ def remove_option(self, section, option):
         config = self._get_config(section, option)
         config.remove_option(section, option)
 
+    def flush(self):
+        """Write pending changes of all configurations to disk."""
+        for _, config in self._configs_map.items():
+            config.flush()
+
     def cleanup(self):
         """Remove .ini files associated to configurations."""
         for _, config in self._configs_map.items():
-            os.remove(config.get_config_fpath())
+            config.cleanup()
 
 
 class PluginConfig(UserConfig):
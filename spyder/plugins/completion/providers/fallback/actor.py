@@ -17,12 +17,12 @@
 
 # Third-party imports
 from lsprotocol import types as lsp
-from pygments.lexers import get_lexer_by_name
 from qtpy.QtCore import QObject, QThread, QMutex, QMutexLocker, Signal, Slot
 
 # Local imports
 from spyder.plugins.completion.providers.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+    TokenIndex, get_language_keywords, get_prefixed, is_prefix_valid)
+from spyder.utils.qstringhelpers import qstring_length
 
 
 FALLBACK_COMPLETION = "Fallback"
@@ -48,62 +48,49 @@ def __init__(self, parent):
         self.thread.started.connect(self.started)
         self.sig_mailbox.connect(self.handle_msg)
 
-    def tokenize(self, text, offset, language, current_word):
+    def tokenize(self, text_info, offset, current_word):
         """
-        Return all tokens in `text` and all keywords associated by
-        Pygments to `language`.
+        Return the tokens in a file and the keywords associated by Pygments
+        to its language that start with `current_word`.
         """
-        valid = is_prefix_valid(text, offset, language)
+        text = text_info['text']
+        language = text_info['language']
+        valid = is_prefix_valid(
+            text, offset, language, text_info['utf16_diff'])
         if not valid:
             return []
 
+        prefix = current_word or ''
+
         # Get language keywords provided by Pygments
-        try:
-            lexer = get_lexer_by_name(language)
-            keywords = get_keywords(lexer)
-        except Exception:
-            keywords = []
+        keywords = get_prefixed(get_language_keywords(language), prefix)
         keyword_set = set(keywords)
         keywords = [
-            lsp.CompletionItem(
-                label=keyword,
-                kind=lsp.CompletionItemKind.Keyword,
-                insert_text=keyword,
-                sort_text=keyword,
-                filter_text=keyword,
-                data={'provider': FALLBACK_COMPLETION},
-            )
+            self._make_item(keyword, lsp.CompletionItemKind.Keyword)
             for keyword in keywords
         ]
 
         # Get file tokens
-        tokens = get_words(text, offset, language)
-        tokens = [
-            lsp.CompletionItem(
-                label=token,
-                kind=lsp.CompletionItemKind.Text,
-                insert_text=token,
-                sort_text=token,
-                filter_text=token,
-                data={'provider': FALLBACK_COMPLETION},
-            )
+        tokens = text_info['index'].get_words(text, prefix, offset)
+        keywords += [
+            self._make_item(token, lsp.CompletionItemKind.Text)
             for token in tokens
+            if token not in keyword_set
         ]
-        for token in tokens:
-            if token.label not in keyword_set:
-                keywords.append(token)
-
-        # Filter matching results
-        if current_word is not None:
-            current_word = current_word.lower()
-            keywords = [
-                k
-                for k in keywords
-                if current_word in (k.insert_text or k.label).lower()
-            ]
 
         return keywords
 
+    def _make_item(self, label, kind):
+        """Create a completion item for `label`."""
+        return lsp.CompletionItem(
+            label=label,
+            kind=kind,
+            insert_text=label,
+            sort_text=label,
+            filter_text=label,
+            data={'provider': FALLBACK_COMPLETION},
+        )
+
     def stop(self):
         """Stop actor."""
         with QMutexLocker(self.mutex):
@@ -127,10 +114,13 @@ def handle_msg(self, message):
             message[k] for k in ('type', 'id', 'file', 'msg')]
         logger.debug(u'Perform request {0} with id {1}'.format(msg_type, _id))
         if msg_type == lsp.TEXT_DOCUMENT_DID_OPEN:
+            text = msg['text']
             self.file_tokens[file] = {
-                'text': msg['text'],
+                'text': text,
                 'offset': msg['offset'],
                 'language': msg['language'],
+                'index': TokenIndex(text, msg['language']),
+                'utf16_diff': qstring_length(text) - len(text),
             }
         elif msg_type == lsp.TEXT_DOCUMENT_DID_CHANGE:
             self._apply_content_changes(file, msg.get('content_changes', []))
@@ -141,9 +131,8 @@ def handle_msg(self, message):
             if file in self.file_tokens:
                 text_info = self.file_tokens[file]
                 tokens = self.tokenize(
-                    text_info['text'],
+                    text_info,
                     msg.get('offset', text_info['offset']),
-                    text_info['language'],
                     msg['current_word'])
             self.sig_set_tokens.emit(_id, tokens)
 
@@ -169,22 +158,32 @@ def _apply_content_changes(self, file, content_changes):
             return
 
         current_text = text_info['text']
+        index = text_info['index']
+        utf16_diff = text_info['utf16_diff']
 
         for change in content_changes:
             # Handle whole document replacement
             if hasattr(change, 'text') and not hasattr(change, 'range'):
                 current_text = change.text
+                index = TokenIndex(current_text, text_info['language'])
+                utf16_diff = qstring_length(current_text) - len(current_text)
                 continue
 
             # Handle incremental range-based changes
             if hasattr(change, 'range'):
-                current_text = self._apply_range_change(
-                    current_text, change.range, change.text
+                current_text, removed_text = self._apply_range_change(
+                    current_text, change.range, change.text, index
+                )
+                utf16_diff += (
+                    qstring_length(change.text) - len(change.text)
+                    - qstring_length(removed_text) + len(removed_text)
                 )
 
         text_info['text'] = current_text
+        text_info['index'] = index
+        text_info['utf16_diff'] = utf16_diff
 
-    def _apply_range_change(self, text, range, new_text):
+    def _apply_range_change(self, text, range, new_text, index):
         """
         Apply a range-based text change to the document text.
 
@@ -196,11 +195,13 @@ def _apply_range_change(self, text, range, new_text):
             Start and end positions of the change.
         new_text : str
             Text to insert at the range.
+        index : TokenIndex
+            Index of the document tokens, which is updated with the change.
 
         Returns
         -------
-        str
-            Updated document text.
+        tuple(str, str)
+            Updated document text and the text that was replaced.
         """
         lines = text.splitlines(keepends=True)
 
@@ -213,7 +214,9 @@ def _apply_range_change(self, text, range, new_text):
         )
 
         # Replace the range with new text
-        return text[:start_offset] + new_text + text[end_offset:]
+        removed_text = text[start_offset:end_offset]
+        text = index.replace(text, start_offset, end_offset, new_text)
+        return text, removed_text
 
     def _line_col_to_offset(self, lines, line, character):
         """
@@ -9,7 +9,8 @@
 
 import pytest
 from lsprotocol import types as lsp
-from spyder.plugins.completion.providers.fallback.utils import get_words
+from spyder.plugins.completion.providers.fallback.utils import (
+    TokenIndex, get_words, is_prefix_valid)
 
 
 DATA_PATH = osp.join(osp.dirname(osp.abspath(__file__)), "data")
@@ -88,6 +89,43 @@ def test_get_words():
     assert set(tokens) == {'foo', 'baz', 'car456'}
 
 
+def test_token_index():
+    source = 'foo bar123 baz Bar_2 foo'
+    index = TokenIndex(source, 'python')
+    assert index.get_words(source) == ['bar123', 'Bar_2', 'baz', 'foo']
+    assert index.get_words(source, 'BA') == ['bar123', 'Bar_2', 'baz']
+
+    # The word at the offset is excluded unless it appears elsewhere
+    assert index.get_words(source, 'ba', 5) == ['Bar_2', 'baz']
+    assert index.get_words(source, 'f', 1) == ['foo']
+
+    # Replacing part of a word updates it
+    source = index.replace(source, 13, 14, 'rk bazooka')
+    assert source == 'foo bar123 bark bazooka Bar_2 foo'
+    assert index.get_words(source, 'ba') == [
+        'bar123', 'Bar_2', 'bark', 'bazooka']
+    assert index.counts == TokenIndex(source, 'python').counts
+
+    # Removing one occurrence keeps the other one
+    source = index.replace(source, 0, 4, '')
+    assert index.get_words(source, 'f') == ['foo']
+    source = index.replace(source, len(source) - 4, len(source), '')
+    assert index.get_words(source, 'f') == []
+
+
+def test_is_prefix_valid():
+    source = 'foo bar\n  baz'
+    assert is_prefix_valid(source, 2, 'python')
+    assert not is_prefix_valid(source, 0, 'python')
+
+    # After whitespace
+    assert is_prefix_valid(source, 10, 'python')
+
+    # After the last word of the file
+    assert is_prefix_valid('foo 1a', 6, 'python')
+    assert not is_prefix_valid('foo 1a bar', 6, 'python')
+
+
 @pytest.mark.parametrize('file_fixture', language_list, indirect=True)
 def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
     filename, expected_tokens, contents = file_fixture
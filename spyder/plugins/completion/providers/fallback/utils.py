@@ -9,6 +9,9 @@
 """
 
 # Standard imports
+import bisect
+from collections import Counter
+import functools
 import importlib
 import os
 import os.path as osp
@@ -29,6 +32,7 @@
 
 letter_regex = re.compile(r'\w')
 empty_regex = re.compile(r'\s')
+non_empty_regex = re.compile(r'\S*')
 
 # CamelCase and snake_case regex:
 # Get all valid tokens that start by a letter (Unicode) and are
@@ -98,6 +102,124 @@ def get_keywords(lexer):
     return keywords
 
 
+@functools.lru_cache(maxsize=None)
+def get_language_keywords(language):
+    """
+    Get the keywords associated by Pygments to `language`.
+
+    Returns a sorted list of (keyword.lower(), keyword) tuples without
+    duplicates, which is cached because it's expensive to compute.
+    """
+    try:
+        lexer = get_lexer_by_name(language)
+        keywords = get_keywords(lexer)
+    except Exception:
+        keywords = []
+    return sorted({(keyword.lower(), keyword) for keyword in keywords})
+
+
+def get_word_region(text, start, end):
+    """
+    Extend the region between `start` and `end` up to the whitespace around
+    it.
+
+    Words can't contain whitespace, so the ones that overlap with the region
+    are fully contained in the extended one.
+    """
+    # Not all whitespace characters are checked here, which can only make
+    # the region larger.
+    start = max(text.rfind(char, 0, start) for char in ' \t\n') + 1
+    end = non_empty_regex.match(text, end).end()
+    return start, end
+
+
+def get_prefixed(sorted_words, prefix):
+    """
+    Get the words in `sorted_words` that start with `prefix`, ignoring case.
+
+    `sorted_words` is a sorted list of (word.lower(), word) tuples.
+    """
+    prefix = prefix.lower()
+    index = bisect.bisect_left(sorted_words, (prefix,))
+    words = []
+    for lower_word, word in sorted_words[index:]:
+        if not lower_word.startswith(prefix):
+            break
+        words.append(word)
+    return words
+
+
+class TokenIndex:
+    """
+    Multiset of the words in a file, which can be updated incrementally.
+
+    Words are also kept in a sorted list, so that the ones that start with a
+    prefix can be found with a binary search.
+    """
+
+    def __init__(self, text, language=''):
+        self.regex = LANGUAGE_REGEX.get(language.lower(), all_regex)
+        self.counts = Counter()
+        self.sorted_words = []
+        self.add(text)
+
+    def add(self, text, start=0, end=None):
+        """Add the words in `text[start:end]`."""
+        end = len(text) if end is None else end
+        for match in self.regex.finditer(text, start, end):
+            word = match.group()
+            if self.counts[word] == 0:
+                bisect.insort(self.sorted_words, (word.lower(), word))
+            self.counts[word] += 1
+
+    def remove(self, text, start=0, end=None):
+        """Remove the words in `text[start:end]`."""
+        end = len(text) if end is None else end
+        for match in self.regex.finditer(text, start, end):
+            word = match.group()
+            self.counts[word] -= 1
+            if self.counts[word] <= 0:
+                del self.counts[word]
+                item = (word.lower(), word)
+                index = bisect.bisect_left(self.sorted_words, item)
+                if (index < len(self.sorted_words)
+                        and self.sorted_words[index] == item):
+                    del self.sorted_words[index]
+
+    def replace(self, text, start, end, new_text):
+        """
+        Replace `text[start:end]` with `new_text`, update the words
+        accordingly and return the new text.
+        """
+        region_start, region_end = get_word_region(text, start, end)
+        self.remove(text, region_start, region_end)
+
+        text = text[:start] + new_text + text[end:]
+        region_end += len(new_text) - (end - start)
+        self.add(text, region_start, region_end)
+        return text
+
+    def get_words(self, text, prefix='', exclude_offset=None):
+        """
+        Get the words that start with `prefix`, ignoring case.
+
+        The word at `exclude_offset` in `text` is left out, unless it's
+        present elsewhere.
+        """
+        excluded = Counter()
+        if exclude_offset is not None:
+            offset = min(exclude_offset, len(text))
+            start, end = get_word_region(text, offset, offset)
+            for match in self.regex.finditer(text, start, end):
+                if match.start() <= exclude_offset <= match.end():
+                    excluded[match.group()] += 1
+
+        return [
+            word for word in get_prefixed(self.sorted_words, prefix)
+            if self.counts[word] > excluded[word]
+        ]
+
+
 def get_words(text, exclude_offset=None, language=''):
     """
     Extract all words from a source code file to be used in code completion.
@@ -116,34 +238,45 @@ def get_words(text, exclude_offset=None, language=''):
     return tokens
 
 
-def is_prefix_valid(text, offset, language):
-    """Check if current offset prefix is valid."""
+def is_prefix_valid(text, offset, language, utf16_diff=None):
+    """
+    Check if current offset prefix is valid.
+
+    Only the text around `offset` is checked, so this doesn't depend on the
+    size of `text`. `utf16_diff` is the difference between the length of
+    `text` in UTF-16 code units and in characters. It's computed if not
+    given.
+    """
     # Account for length differences in text when using characters
     # such as emojis in the editor.
     # Fixes spyder-ide/spyder#11862
-    utf16_diff = qstring_length(text) - len(text)
+    if utf16_diff is None:
+        utf16_diff = qstring_length(text) - len(text)
 
     new_offset = offset - utf16_diff - 1
     if new_offset >= len(text) or new_offset < 0:
         return False
 
     current_pos_text = text[new_offset]
+    if empty_regex.match(current_pos_text) is not None:
+        return True
 
-    empty_start = empty_regex.match(current_pos_text) is not None
-    max_end = -1
+    # Words can't contain whitespace, so only the ones around offset can
+    # contain it.
     regex = LANGUAGE_REGEX.get(language.lower(), all_regex)
-    prefix = ''
-
-    for match in regex.finditer(text):
-        start, end = match.span()
-        max_end = max(end, max_end)
-        if offset >= start and offset <= end:
-            prefix = match.group()
-    if offset > max_end:
-        if letter_regex.match(current_pos_text):
-            prefix = current_pos_text
-    valid = prefix != '' or (prefix == '' and empty_start)
-    return valid
+    offset_in_text = min(offset, len(text))
+    start, end = get_word_region(text, offset_in_text, offset_in_text)
+    max_end = -1
+    for match in regex.finditer(text, start, end):
+        if match.start() <= offset <= match.end():
+            return True
+        max_end = max(match.end(), max_end)
+
+    # Offset is after the last word of the text
+    if max_end < offset and regex.search(text, end) is None:
+        return letter_regex.match(current_pos_text) is not None
+
+    return False
 
 
 @memoize
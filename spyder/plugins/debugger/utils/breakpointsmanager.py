@@ -169,6 +169,10 @@ def toogle_breakpoint(
             else:
                 self._breakpoint_blocks[block.blockNumber()] = block
         block.setUserData(data)
+        if data.breakpoint:
+            self.editor.flagged_blocks.add('breakpoint', block)
+        else:
+            self.editor.flagged_blocks.remove('breakpoint', block)
         self.editor.sig_flags_changed.emit()
         self.breakpoints_changed()
 
@@ -196,6 +200,7 @@ def clear_breakpoints(self):
             data.breakpoint = False
             # data.breakpoint_condition = None  # not necessary, but logical
         self._breakpoint_blocks = {}
+        self.editor.flagged_blocks.set('breakpoint', [])
         # Inform the editor that the breakpoints are changed
         self.breakpoints_changed()
         # Inform the editor that the flags must be updated
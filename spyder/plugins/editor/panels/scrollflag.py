@@ -15,8 +15,7 @@
 import sys
 
 # Third party imports
-from lsprotocol import types as lsp
-from qtpy.QtCore import QSize, Qt, QThread
+from qtpy.QtCore import QSize, Qt
 from qtpy.QtGui import QColor, QCursor, QPainter
 from qtpy.QtWidgets import QApplication, QStyle, QStyleOptionSlider
 from superqt.utils import qdebounced
@@ -78,14 +77,12 @@ def __init__(self):
         # Dictionary with flag lists
         self._dict_flag_list = {}
 
+        # Pixel positions of flags by type, and what they were computed for
+        self._flag_positions = {}
+
         # Keep track if todo markers are enabled.
         self.todo_enabled = True
 
-        # Thread to update flags on it.
-        self._update_flags_thread = QThread(None)
-        self._update_flags_thread.run = self._update_flags
-        self._update_flags_thread.finished.connect(self.update)
-
     def on_install(self, editor):
         """Manages install setup of the pane."""
         super().on_install(editor)
@@ -121,11 +118,6 @@ def slider(self):
         """This property holds whether the vertical scrollbar is visible."""
         return self.editor.verticalScrollBar().isVisible()
 
-    def closeEvent(self, event):
-        self._update_flags_thread.quit()
-        self._update_flags_thread.wait()
-        super().closeEvent(event)
-
     def sizeHint(self):
         """Override Qt method"""
         return QSize(self.WIDTH, 0)
@@ -141,48 +133,24 @@ def update_flag_colors(self, color_dict):
 
     @qdebounced(timeout=REFRESH_RATE)
     def update_flags(self):
-        """Update flags list in a thread."""
+        """Update flags list."""
         logger.debug("Updating current flags")
+        self._update_flags()
+        self.update()
 
+    def _update_flags(self):
+        """
+        Update flags list from the blocks flagged in the editor.
+
+        Flags of different types in the same block are painted on top of
+        each other, so only the one painted last is visible.
+        """
+        flagged_blocks = self.editor.flagged_blocks
         self._dict_flag_list = {
-            'error': [],
-            'warning': [],
-            'todo': [],
-            'breakpoint': [],
+            flag_type: flagged_blocks.get(flag_type)
+            for flag_type in flagged_blocks.KINDS
         }
 
-        # Run this computation in a different thread to prevent freezing
-        # the interface
-        if not self._update_flags_thread.isRunning():
-            self._update_flags_thread.start()
-
-    def _update_flags(self):
-        """Update flags list."""
-        editor = self.editor
-        block = editor.document().firstBlock()
-        while block.isValid():
-            # Parse all lines in the file looking for something to flag.
-            data = block.userData()
-            if data:
-                if data.code_analysis:
-                    for _, _, severity, _ in data.code_analysis:
-                        if severity == lsp.DiagnosticSeverity.Error:
-                            flag_type = 'error'
-                            break
-                    else:
-                        flag_type = 'warning'
-                elif data.todo:
-                    flag_type = 'todo'
-                elif data.breakpoint:
-                    flag_type = 'breakpoint'
-                else:
-                    flag_type = None
-
-                if flag_type is not None:
-                    self._dict_flag_list[flag_type].append(block)
-
-            block = block.next()
-
     def paintEvent(self, event):
         """
         Override Qt method.
@@ -242,7 +210,7 @@ def paintEvent(self, event):
         else:
             flag_height_lines = 0
 
-        # All the lists of block numbers for flags
+        # All the lists of blocks or block numbers for flags
         dict_flag_lists = {
             "occurrence": editor.occurrences,
             "found_results": editor.found_results
@@ -261,42 +229,15 @@ def paintEvent(self, event):
 
             painter.setBrush(self._facecolors[flag_type])
             painter.setPen(self._edgecolors[flag_type])
-            if editor.verticalScrollBar().maximum() == 0:
-                # No scroll
-                for block in dict_flag_lists[flag_type]:
-                    if not is_block_safe(block):
-                        continue
-                    geometry = editor.blockBoundingGeometry(block)
-                    rect_y = ceil(
-                        geometry.y() +
-                        geometry.height() / 2 +
-                        rect_h / 2
-                    )
-                    painter.drawRect(rect_x, rect_y, rect_w, rect_h)
-            elif last_line == 0:
-                # Only one line
-                for block in dict_flag_lists[flag_type]:
-                    if not is_block_safe(block):
-                        continue
-                    rect_y = ceil(first_y_pos)
-                    painter.drawRect(rect_x, rect_y, rect_w, rect_h)
-            else:
-                # Many lines
-                if len(dict_flag_lists[flag_type]) < MAX_FLAGS:
-                    # If the file is too long, do not freeze the editor
-                    next_line = 0
-                    for block in dict_flag_lists[flag_type]:
-                        if not is_block_safe(block):
-                            continue
-                        block_line = block.firstLineNumber()
-                        # block_line = -1 if invalid
-                        if block_line < next_line:
-                            # Don't print flags on top of flags
-                            continue
-                        next_line = block_line + flag_height_lines / 2
-                        frac = block_line / last_line
-                        rect_y = ceil(first_y_pos + frac * line_height)
-                        painter.drawRect(rect_x, rect_y, rect_w, rect_h)
+            for rect_y in self._get_flag_positions(
+                flag_type,
+                dict_flag_lists[flag_type],
+                first_y_pos,
+                last_line,
+                line_height,
+                flag_height_lines,
+            ):
+                painter.drawRect(rect_x, rect_y, rect_w, rect_h)
 
         # Paint the slider range
         if not self._unit_testing:
@@ -334,6 +275,74 @@ def paintEvent(self, event):
             else:
                 self._range_indicator_is_visible = False
 
+    def _get_flag_positions(self, flag_type, blocks, first_y_pos, last_line,
+                            line_height, flag_height_lines):
+        """
+        Get the vertical pixel positions of the flags of a type.
+
+        Positions are computed once for the flagged blocks, the contents of
+        the document and the scale of the scroll bar, and are only kept once
+        per pixel row.
+        """
+        editor = self.editor
+        no_scroll = editor.verticalScrollBar().maximum() == 0
+        key = (
+            editor.document().revision(),
+            no_scroll,
+            first_y_pos,
+            last_line,
+            line_height,
+            len(blocks),
+        )
+        cached = self._flag_positions.get(flag_type)
+        if cached is not None and cached[0] is blocks and cached[1] == key:
+            return cached[2]
+
+        rect_h = self.FLAGS_DY
+        positions = set()
+        if no_scroll:
+            # No scroll
+            for block in self._get_blocks(blocks):
+                geometry = editor.blockBoundingGeometry(block)
+                positions.add(
+                    ceil(geometry.y() + geometry.height() / 2 + rect_h / 2)
+                )
+        elif last_line == 0:
+            # Only one line
+            if self._get_blocks(blocks):
+                positions.add(ceil(first_y_pos))
+        elif len(blocks) < MAX_FLAGS:
+            # Many lines
+            # If the file is too long, do not freeze the editor
+            block_lines = sorted(
+                block.firstLineNumber() for block in self._get_blocks(blocks)
+            )
+            next_line = 0
+            for block_line in block_lines:
+                # block_line = -1 if invalid
+                if block_line < next_line:
+                    # Don't print flags on top of flags
+                    continue
+                next_line = block_line + flag_height_lines / 2
+                frac = block_line / last_line
+                positions.add(ceil(first_y_pos + frac * line_height))
+
+        positions = sorted(positions)
+        self._flag_positions[flag_type] = (blocks, key, positions)
+        return positions
+
+    def _get_blocks(self, blocks):
+        """
+        Get the valid blocks in a list of blocks or block numbers.
+
+        Occurrences and found results are given by their block numbers.
+        """
+        if blocks and isinstance(blocks[0], int):
+            document = self.editor.document()
+            blocks = [document.findBlockByNumber(n) for n in blocks]
+            return [block for block in blocks if block.isValid()]
+        return [block for block in blocks if is_block_safe(block)]
+
     def enterEvent(self, event):
         """Override Qt method"""
         self.update()
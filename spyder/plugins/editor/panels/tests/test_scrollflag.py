@@ -177,6 +177,74 @@ def test_flag_painting(editor_bot, qtbot):
         editor.setTextCursor(cursor)
 
 
+def test_flagged_blocks(editor_bot, qtbot):
+    """Test that flags are taken from the blocks flagged in the editor."""
+    editor = editor_bot
+    editor.filename = "file.py"
+    editor.breakpoints_manager = BreakpointsManager(editor)
+    sfa = editor.scrollflagarea
+    editor.resize(450, 300)
+    editor.show()
+    editor.set_text(long_code * 100)
+    qtbot.waitUntil(lambda: sfa.slider)
+
+    editor.breakpoints_manager.toogle_breakpoint(line_number=2)
+    editor.process_todo([[True, 3], [True, 4]])
+    analysis = [
+        lsp.Diagnostic(
+            range=lsp.Range(
+                start=lsp.Position(line=line, character=0),
+                end=lsp.Position(line=line, character=1),
+            ),
+            message='message',
+            severity=severity,
+            source='flake8',
+        )
+        for line, severity in [
+            (4, lsp.DiagnosticSeverity.Warning),
+            (5, lsp.DiagnosticSeverity.Warning),
+            (5, lsp.DiagnosticSeverity.Error),
+        ]
+    ]
+    editor.process_code_analysis(analysis)
+    qtbot.waitUntil(editor.update_diagnostics_thread.isFinished)
+
+    def flagged_lines(flag_type):
+        sfa._update_flags()
+        return [
+            block.blockNumber() + 1
+            for block in sfa._dict_flag_list[flag_type]
+        ]
+
+    assert flagged_lines('breakpoint') == [2]
+    assert flagged_lines('todo') == [3, 4]
+    assert flagged_lines('warning') == [5]
+    assert flagged_lines('error') == [6]
+
+    # Flags move with their blocks
+    cursor = editor.textCursor()
+    cursor.setPosition(0)
+    cursor.insertText("\n")
+    assert flagged_lines('todo') == [4, 5]
+
+    # Previous flags are removed
+    editor.process_todo([[True, 10]])
+    assert flagged_lines('todo') == [10]
+    assert not editor.document().findBlockByNumber(3).userData().todo
+    editor.cleanup_code_analysis()
+    assert flagged_lines('error') == flagged_lines('warning') == []
+    editor.breakpoints_manager.toogle_breakpoint(line_number=3)
+    assert flagged_lines('breakpoint') == []
+
+    # Flags closer than a pixel are only painted once
+    editor.process_todo([[True, line] for line in range(1, 200)])
+    sfa._update_flags()
+    sfa.repaint()
+    positions = sfa._flag_positions['todo'][2]
+    assert 0 < len(positions) < 199
+    assert positions == sorted(set(positions))
+
+
 def test_range_indicator_visible_on_hover_only(editor_bot, qtbot):
     """Test that the slider range indicator is visible only when hovering
     over the scrollflag area when the editor vertical scrollbar is visible.
@@ -16,6 +16,9 @@
 <https://github.com/pyQode/pyqode.core/blob/master/pyqode/core/managers/decorations.py>
 """
 
+# Standard library imports
+from bisect import bisect_left, bisect_right, insort
+
 # Third party imports
 from qtpy.QtCore import QObject, QTimer, Slot
 from qtpy.QtGui import QTextCharFormat
@@ -28,6 +31,9 @@
 # introduces a lot of sluggishness in the editor.
 UPDATE_TIMEOUT = 15  # milliseconds
 
+# Keys of decorations that are painted even if they are not visible
+ALWAYS_PAINTED_KEYS = {'current_cell'}
+
 
 def order_function(sel):
     end = sel.cursor.selectionEnd()
@@ -35,14 +41,30 @@ def order_function(sel):
     return sel.draw_order, -(end - start)
 
 
+def start_function(sel):
+    return sel.cursor.selectionStart()
+
+
+def end_function(sel):
+    return sel.cursor.selectionEnd()
+
+
 class TextDecorationsManager(Manager, QObject):
     """
     Manages the collection of TextDecoration that have been set on the editor
     widget.
+
+    Decorations of each key are kept sorted by the start and end of their
+    selections, which doesn't change when the document is edited because
+    cursors keep their relative order. That allows to find the visible ones
+    by bisection, without going through all of them.
     """
     def __init__(self, editor):
         super().__init__(editor)
+
+        # Decorations sorted by start and by end of their selections
         self._decorations = {"misc": []}
+        self._decorations_by_end = {"misc": []}
 
         # Timer to not constantly update decorations.
         self.update_timer = QTimer(self)
@@ -65,17 +87,20 @@ def add(self, decorations, key="misc"):
         """
         if key != "misc" and self._decorations.get(key) is None:
             self._decorations[key] = []
+            self._decorations_by_end[key] = []
 
         current_decorations = self._decorations[key]
         added = 0
 
         if isinstance(decorations, list):
-            not_repeated = set(decorations) - set(current_decorations)
-            current_decorations.extend(list(not_repeated))
-            self._decorations[key] = current_decorations
+            not_repeated = list(set(decorations) - set(current_decorations))
             added = len(not_repeated)
+            if added == 1:
+                self._insert(key, not_repeated[0])
+            elif added > 1:
+                self._set_key(key, current_decorations + not_repeated)
         elif decorations not in current_decorations:
-            self._decorations[key].append(decorations)
+            self._insert(key, decorations)
             added = 1
 
         if added > 0:
@@ -84,30 +109,47 @@ def add(self, decorations, key="misc"):
 
     def add_key(self, key, decorations):
         """Add decorations to key."""
-        self._decorations[key] = decorations
+        self._set_key(key, decorations)
         self.update()
 
     def remove(self, decoration, key="misc"):
         """
         Removes a text decoration from the editor.
 
-        :param decoration: Text decoration to remove
+        :param decoration: Text decoration to remove, or a list of them to
+            remove them with a single update.
         :type decoration: spyder.api.TextDecoration
-        update: Bool: should the decorations be updated immediately?
-            Set to False to avoid updating several times while removing
-            several decorations
         """
-        try:
-            self._decorations[key].remove(decoration)
-            self.update()
-            return True
-        except (ValueError, KeyError):
+        current_decorations = self._decorations.get(key)
+        if current_decorations is None:
             return False
 
+        if isinstance(decoration, list):
+            to_remove = set(decoration)
+            remaining = [d for d in current_decorations if d not in to_remove]
+            if len(remaining) == len(current_decorations):
+                return False
+
+            self._decorations[key] = remaining
+            self._decorations_by_end[key] = [
+                d for d in self._decorations_by_end[key]
+                if d not in to_remove
+            ]
+        else:
+            try:
+                current_decorations.remove(decoration)
+                self._decorations_by_end[key].remove(decoration)
+            except ValueError:
+                return False
+
+        self.update()
+        return True
+
     def remove_key(self, key):
         """Remove key"""
         try:
             del self._decorations[key]
+            del self._decorations_by_end[key]
             self.update()
         except KeyError:
             pass
@@ -119,6 +161,7 @@ def get(self, key, default=None):
     def clear(self):
         """Removes all text decoration from the editor."""
         self._decorations = {"misc": []}
+        self._decorations_by_end = {"misc": []}
         self.update()
 
     def update(self):
@@ -149,29 +192,15 @@ def _update(self):
             first, last = editor.get_buffer_block_numbers()
 
             # Update visible decorations
-            visible_decorations = []
-            for decoration in self._sorted_decorations():
-                need_update_sel = False
-                cursor = decoration.cursor
-                sel_start = cursor.selectionStart()
-                # This is required to update extra selections from the point
-                # an initial selection was made.
-                # Fixes spyder-ide/spyder#14282
-                if sel_start is not None:
-                    doc = cursor.document()
-                    block_nb_start = doc.findBlock(sel_start).blockNumber()
-                    need_update_sel = first <= block_nb_start <= last
-
-                block_nb = decoration.cursor.block().blockNumber()
-                if (first <= block_nb <= last or need_update_sel or
-                        decoration.kind == 'current_cell'):
-                    visible_decorations.append(decoration)
-                    try:
-                        decoration.format.setFont(
-                            font, QTextCharFormat.FontPropertiesSpecifiedOnly)
-                    except (TypeError, AttributeError):  # Qt < 5.3
-                        decoration.format.setFontFamily(font.family())
-                        decoration.format.setFontPointSize(font.pointSize())
+            visible_decorations = self._visible_decorations(first, last)
+            visible_decorations.sort(key=order_function)
+            for decoration in visible_decorations:
+                try:
+                    decoration.format.setFont(
+                        font, QTextCharFormat.FontPropertiesSpecifiedOnly)
+                except (TypeError, AttributeError):  # Qt < 5.3
+                    decoration.format.setFontFamily(font.family())
+                    decoration.format.setFontPointSize(font.pointSize())
 
             editor.setExtraSelections(visible_decorations)
         except RuntimeError:
@@ -184,6 +213,57 @@ def __iter__(self):
     def __len__(self):
         return len(self._decorations)
 
+    def _insert(self, key, decoration):
+        """Insert a decoration in the sorted lists of its key."""
+        insort(self._decorations[key], decoration, key=start_function)
+        insort(self._decorations_by_end[key], decoration, key=end_function)
+
+    def _set_key(self, key, decorations):
+        """Set the decorations of a key, sorting them."""
+        self._decorations[key] = sorted(decorations, key=start_function)
+        self._decorations_by_end[key] = sorted(decorations, key=end_function)
+
+    def _visible_decorations(self, first, last):
+        """
+        Get the decorations that start or end between blocks `first` and
+        `last`.
+        """
+        doc = self.editor.document()
+        first_block = doc.findBlockByNumber(first)
+        last_block = doc.findBlockByNumber(last)
+        if not last_block.isValid():
+            last_block = doc.lastBlock()
+        start = first_block.position()
+        end = last_block.position() + last_block.length() - 1
+
+        visible_decorations = []
+        for key, decorations in self._decorations.items():
+            if key in ALWAYS_PAINTED_KEYS:
+                visible_decorations.extend(decorations)
+                continue
+
+            # Decorations that start in the visible region. Checking their
+            # start is required to update extra selections from the point an
+            # initial selection was made.
+            # Fixes spyder-ide/spyder#14282
+            visible_decorations.extend(
+                decorations[
+                    bisect_left(decorations, start, key=start_function):
+                    bisect_right(decorations, end, key=start_function)
+                ]
+            )
+
+            # Decorations that start before it and end in it
+            decorations_by_end = self._decorations_by_end[key]
+            for decoration in decorations_by_end[
+                bisect_left(decorations_by_end, start, key=end_function):
+                bisect_right(decorations_by_end, end, key=end_function)
+            ]:
+                if start_function(decoration) < start:
+                    visible_decorations.append(decoration)
+
+        return visible_decorations
+
     def _sorted_decorations(self):
         """Get all sorted decorations."""
         return sorted(
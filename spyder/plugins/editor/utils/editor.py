@@ -128,6 +128,41 @@ def _selection(self):
         return QTextCursor(cursor)
 
 
+class FlaggedBlocks:
+    """
+    Blocks with flags in the scroll flag area, by kind of flag.
+
+    They're updated by what sets the flags, so the blocks of a kind can be
+    obtained without going through the whole document.
+    """
+
+    KINDS = ('error', 'warning', 'todo', 'breakpoint')
+
+    def __init__(self):
+        self._blocks = {kind: [] for kind in self.KINDS}
+
+    def get(self, kind):
+        """Get the blocks with a kind of flag, dropping removed ones."""
+        blocks = [
+            block for block in self._blocks[kind] if is_block_safe(block)
+        ]
+        self._blocks[kind] = blocks
+        return blocks
+
+    def set(self, kind, blocks):
+        """Set the blocks with a kind of flag."""
+        self._blocks[kind] = list(blocks)
+
+    def add(self, kind, block):
+        """Add a block with a kind of flag."""
+        if block not in self._blocks[kind]:
+            self._blocks[kind].append(block)
+
+    def remove(self, kind, block):
+        """Remove a block with a kind of flag."""
+        self._blocks[kind] = [b for b in self._blocks[kind] if b != block]
+
+
 class DelayJobRunner(object):
     """
     Utility class for running job after a certain delay.
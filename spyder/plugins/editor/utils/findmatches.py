@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Matches of search patterns in the text of the editor.
+
+Matches are stored as arrays with their positions, so that only the visible
+ones need to be highlighted and they can be counted without searching again.
+"""
+
+# Standard library imports
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Local imports
+from spyder.utils.qstringhelpers import qstring_length
+
+
+# Number of matches to find before checking if the search was cancelled
+CANCEL_CHECK_INTERVAL = 1000
+
+
+class Matches:
+    """
+    Start and end positions of the matches of a pattern in a text, and the
+    lines where they are.
+
+    Positions are counted in UTF-16 code units, like in Qt documents.
+    """
+
+    def __init__(self, starts=None, ends=None, lines=None, regobj=None,
+                 text_version=None):
+        self.starts = array('q') if starts is None else starts
+        self.ends = array('q') if ends is None else ends
+        self.lines = [] if lines is None else lines
+
+        # Regular expression that was searched and version of the text in
+        # which it was found
+        self.regobj = regobj
+        self.text_version = text_version
+
+    def __len__(self):
+        return len(self.starts)
+
+    def get_spans(self, start, end):
+        """Get the spans of the matches that start between two positions."""
+        first = bisect_left(self.starts, start)
+        last = bisect_right(self.starts, end)
+        return list(zip(self.starts[first:last], self.ends[first:last]))
+
+    def count_before(self, position):
+        """Get the number of matches that end before a position."""
+        return bisect_right(self.ends, position)
+
+
+def find_matches(text, regobj, is_cancelled=None):
+    """
+    Find the matches of a compiled regular expression in a text.
+
+    Parameters
+    ----------
+    text: str
+        Text to search in.
+    regobj: re.Pattern
+        Regular expression to search.
+    is_cancelled: callable, optional
+        Function that returns True if the search must be stopped, in which
+        case None is returned.
+
+    Returns
+    -------
+    Matches
+        Matches found in the text.
+    """
+    matches = Matches()
+    starts, ends, lines = matches.starts, matches.ends, matches.lines
+    has_unicode = len(text) != qstring_length(text)
+
+    line = 0
+    last_start = 0
+    last_start16 = 0
+    for i, match in enumerate(regobj.finditer(text)):
+        if (
+            is_cancelled is not None
+            and i % CANCEL_CHECK_INTERVAL == 0
+            and is_cancelled()
+        ):
+            return None
+
+        start, end = match.span()
+        line += text.count('\n', last_start, start)
+        if not lines or lines[-1] != line:
+            lines.append(line)
+
+        if has_unicode:
+            start16 = last_start16 + qstring_length(text[last_start:start])
+            last_start16 = start16
+            starts.append(start16)
+            ends.append(start16 + qstring_length(text[start:end]))
+        else:
+            starts.append(start)
+            ends.append(end)
+
+        last_start = start
+
+    return matches
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for findmatches.py"""
+
+# Standard library imports
+import re
+
+# Local imports
+from spyder.plugins.editor.utils.findmatches import (
+    CANCEL_CHECK_INTERVAL, find_matches)
+
+
+def test_find_matches():
+    """Test that matches are found with their positions and lines."""
+    text = "foo = 1\nbar = foo\n\nfoo(foo)\n"
+    matches = find_matches(text, re.compile(r"\bfoo\b"))
+
+    assert len(matches) == 4
+    assert list(matches.starts) == [0, 14, 19, 23]
+    assert list(matches.ends) == [3, 17, 22, 26]
+    assert matches.lines == [0, 1, 3]
+
+    assert matches.get_spans(10, 20) == [(14, 17), (19, 22)]
+    assert matches.count_before(0) == 0
+    assert matches.count_before(17) == 2
+
+
+def test_find_matches_unicode():
+    """Test that positions are counted in UTF-16 code units."""
+    text = "a = '\U0001F600'\na\n"
+    matches = find_matches(text, re.compile(r"\ba\b"))
+
+    # The emoji takes two code units
+    assert list(matches.starts) == [0, 9]
+    assert list(matches.ends) == [1, 10]
+    assert matches.lines == [0, 1]
+
+
+def test_find_matches_cancelled():
+    """Test that a cancelled search returns None."""
+    text = "a\n" * (2 * CANCEL_CHECK_INTERVAL)
+    assert find_matches(text, re.compile("a"), lambda: True) is None
+    assert len(find_matches(text, re.compile("a"), lambda: False)) == (
+        2 * CANCEL_CHECK_INTERVAL
+    )
@@ -25,6 +25,7 @@
 import os.path as osp
 import re
 import sys
+import threading
 from typing import TypedDict
 import textwrap
 from unicodedata import category
@@ -35,8 +36,7 @@
 from nbconvert import PythonExporter as nbexporter
 from packaging.version import parse
 from qtpy import QT_VERSION
-from qtpy.QtCore import (
-    QEvent, QRegularExpression, Qt, QTimer, QUrl, Signal, Slot)
+from qtpy.QtCore import QEvent, Qt, QTimer, QUrl, Signal, Slot
 from qtpy.QtGui import (
     QColor,
     QCursor,
@@ -50,7 +50,6 @@
     QTextCharFormat,
     QTextCursor,
     QTextLayout,
-    QTextDocument,
     QTextOption,
 )
 from qtpy.QtWidgets import (
@@ -78,7 +77,9 @@
     ClassFunctionDropdown, EdgeLine, FoldingPanel, IndentationGuide,
     LineNumberArea, PanelsManager, ScrollFlagArea)
 from spyder.plugins.editor.utils.editor import (TextHelper, BlockUserData,
+                                                FlaggedBlocks,
                                                 get_file_language)
+from spyder.plugins.editor.utils.findmatches import Matches, find_matches
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
 from spyder.plugins.editor.utils.languages import ALL_LANGUAGES, CELL_LANGUAGES
 from spyder.plugins.editor.widgets.gotoline import GoToLineDialog
@@ -103,6 +104,7 @@
 from spyder.utils.qthelpers import file_uri, mimedata2url, start_file
 from spyder.utils.vcs import get_git_remotes, remote_to_url
 from spyder.utils.qstringhelpers import qstring_length
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.mixins import HINT_MAX_WIDTH
 
 
@@ -184,6 +186,10 @@ class CodeEditor(
     # the up/down arrow keys.
     UPDATE_DECORATIONS_TIMEOUT = 500  # milliseconds
 
+    # Minimum length of a document to find matches of searched text or
+    # occurrences in a thread
+    FIND_MATCHES_IN_THREAD_MIN_LENGTH = 200_000  # characters
+
     # Custom signal to be emitted upon completion of the editor's paintEvent
     painted = Signal(QPaintEvent)
 
@@ -431,7 +437,6 @@ def __init__(
 
         # Indicate occurrences of the selected word
         self.cursorPositionChanged.connect(self._cursor_position_changed)
-        self.__find_first_pos = None
         self.__find_args = {}
 
         self.language = None
@@ -480,6 +485,17 @@ def __init__(
         self.textChanged.connect(self.__text_has_changed)
         self.found_results = []
 
+        # Matches of found results and occurrences. Only the visible ones
+        # are highlighted.
+        self._found_matches = Matches()
+        self._occurrences_matches = Matches()
+        self._matches_text_version = 0
+        self._matches_cancel_events = {}
+        self._matches_worker_manager = WorkerManager()
+
+        # Blocks with errors, warnings, todos and breakpoints
+        self.flagged_blocks = FlaggedBlocks()
+
         # Docstring
         self.writer_docstring = DocstringWriterExtension(self)
         self.menu_docstring= None
@@ -735,6 +751,13 @@ def closeEvent(self, event):
         if hasattr(self, "update_diagnostics_thread"):
             self.update_diagnostics_thread.quit()
             self.update_diagnostics_thread.wait()
+
+        # Stop searches that are running in threads
+        for cancel_event in self._matches_cancel_events.values():
+            cancel_event.set()
+        self._matches_cancel_events = {}
+        self._matches_worker_manager.terminate_all()
+
         TextEditBaseWidget.closeEvent(self, event)
 
     def get_document_id(self):
@@ -748,6 +771,7 @@ def set_as_clone(self, editor):
         self._rehighlight_timer.timeout.connect(
             self.highlighter.rehighlight)
         self.eol_chars = editor.eol_chars
+        self.flagged_blocks = editor.flagged_blocks
         self._apply_highlighter_color_scheme()
         self.highlighter.sig_font_changed.connect(self.sync_font)
 
@@ -1544,29 +1568,6 @@ def scroll_line_up(self):
 
     # ---- Find occurrences
     # -------------------------------------------------------------------------
-    def __find_first(self, text):
-        """Find first occurrence: scan whole document"""
-        flags = QTextDocument.FindCaseSensitively|QTextDocument.FindWholeWords
-        cursor = self.textCursor()
-        # Scanning whole document
-        cursor.movePosition(QTextCursor.Start)
-        regexp = QRegularExpression(
-            r"\b%s\b" % QRegularExpression.escape(text)
-        )
-        cursor = self.document().find(regexp, cursor, flags)
-        self.__find_first_pos = cursor.position()
-        return cursor
-
-    def __find_next(self, text, cursor):
-        """Find next occurrence"""
-        flags = QTextDocument.FindCaseSensitively|QTextDocument.FindWholeWords
-        regexp = QRegularExpression(
-            r"\b%s\b" % QRegularExpression.escape(text)
-        )
-        cursor = self.document().find(regexp, cursor, flags)
-        if cursor.position() != self.__find_first_pos:
-            return cursor
-
     def _cursor_position_changed(self):
         """Cursor position has changed"""
         # Reject inline completions if there's any cursor change.
@@ -1593,7 +1594,12 @@ def _cursor_position_changed(self):
 
     def clear_occurrences(self):
         """Clear occurrence markers"""
+        cancel_event = self._matches_cancel_events.pop('occurrences', None)
+        if cancel_event is not None:
+            cancel_event.set()
+
         self.occurrences = []
+        self._occurrences_matches = Matches()
         self.clear_extra_selections('occurrences')
         self.sig_flags_changed.emit()
 
@@ -1655,34 +1661,16 @@ def mark_occurrences(self):
             return
 
         # Highlighting all occurrences of word *text*
-        cursor = self.__find_first(text)
-        self.occurrences = []
-        extra_selections = self.get_extra_selections('occurrences')
-        first_occurrence = None
-        while cursor:
-            block = cursor.block()
-            if not block.userData():
-                # Add user data to check block validity
-                block.setUserData(BlockUserData(self))
-            self.occurrences.append(block)
-
-            selection = self.get_selection(cursor)
-            if len(selection.cursor.selectedText()) > 0:
-                extra_selections.append(selection)
-                if len(extra_selections) == 1:
-                    first_occurrence = selection
-                else:
-                    selection.format.setBackground(self.occurrence_color)
-                    first_occurrence.format.setBackground(
-                        self.occurrence_color)
-            cursor = self.__find_next(text, cursor)
-        self.set_extra_selections('occurrences', extra_selections)
-
-        if len(self.occurrences) > 1 and self.occurrences[-1] == 0:
-            # XXX: this is never happening with PySide but it's necessary
-            # for PyQt4... this must be related to a different behavior for
-            # the QTextDocument.find function between those two libraries
-            self.occurrences.pop(-1)
+        regobj = re.compile(r"\b%s\b" % re.escape(text))
+        self._find_matches(
+            'occurrences', regobj, self._set_occurrences_matches
+        )
+
+    def _set_occurrences_matches(self, matches):
+        """Set the occurrences found by mark_occurrences."""
+        self._occurrences_matches = matches
+        self.occurrences = list(matches.lines)
+        self._highlight_visible_matches('occurrences')
         self.sig_flags_changed.emit()
 
     # ---- Highlight found results
@@ -1697,50 +1685,183 @@ def highlight_found_results(self, pattern, word=False, regexp=False,
             'case': case,
         }
 
+        regobj = self._get_find_regobj(pattern, word, regexp, case)
+        if regobj is None:
+            return
+
+        self._find_matches('find', regobj, self._set_found_matches)
+
+    def get_number_matches(self, pattern, source_text='', case=False,
+                           regexp=False, word=False):
+        """Get the number of matches for the searched text."""
+        if not source_text:
+            matches = self._get_current_found_matches(
+                pattern, case, regexp, word
+            )
+            if matches is not None:
+                return len(matches)
+
+        return super().get_number_matches(
+            pattern, source_text=source_text, case=case, regexp=regexp,
+            word=word
+        )
+
+    def get_match_number(self, pattern, case=False, regexp=False, word=False):
+        """Get number of the match for the searched text."""
+        matches = self._get_current_found_matches(pattern, case, regexp, word)
+        if matches is not None:
+            return matches.count_before(self.textCursor().position())
+
+        return super().get_match_number(
+            pattern, case=case, regexp=regexp, word=word
+        )
+
+    def _get_find_regobj(self, pattern, word, regexp, case):
+        """Compile the regular expression to find a pattern."""
         pattern = str(pattern)
         if not pattern:
-            return
+            return None
         if not regexp:
             pattern = re.escape(str(pattern))
         pattern = r"\b%s\b" % pattern if word else pattern
-        text = str(self.toPlainText())
         re_flags = re.MULTILINE if case else re.IGNORECASE | re.MULTILINE
         try:
-            regobj = re.compile(pattern, flags=re_flags)
+            return re.compile(pattern, flags=re_flags)
         except re.error:
+            return None
+
+    def _get_current_found_matches(self, pattern, case, regexp, word):
+        """
+        Get the found results if they are for a pattern and the current text.
+        """
+        matches = self._found_matches
+        if matches.text_version != self._matches_text_version:
+            return None
+
+        regobj = self._get_find_regobj(pattern, word, regexp, case)
+        if regobj is None or matches.regobj is None:
+            return None
+
+        if (regobj.pattern, regobj.flags) != (
+            matches.regobj.pattern, matches.regobj.flags
+        ):
+            return None
+
+        return matches
+
+    def _set_found_matches(self, matches):
+        """Set the matches found by highlight_found_results."""
+        self._found_matches = matches
+        self.found_results = list(matches.lines)
+        self._highlight_visible_matches('find')
+        self.sig_flags_changed.emit()
+
+    def _find_matches(self, key, regobj, callback):
+        """
+        Find the matches of a regular expression in the document and call
+        `callback` with them.
+
+        Large documents are searched in a thread, to not block the interface.
+        """
+        # Cancel the previous search of the same kind
+        cancel_event = self._matches_cancel_events.pop(key, None)
+        if cancel_event is not None:
+            cancel_event.set()
+
+        text = str(self.toPlainText())
+        text_version = self._matches_text_version
+
+        if len(text) < self.FIND_MATCHES_IN_THREAD_MIN_LENGTH:
+            matches = find_matches(text, regobj)
+            matches.regobj = regobj
+            matches.text_version = text_version
+            callback(matches)
+            return
+
+        cancel_event = threading.Event()
+        self._matches_cancel_events[key] = cancel_event
+
+        def worker_output(worker, output, error):
+            """Worker finished callback."""
+            if cancel_event.is_set() or error is not None or output is None:
+                return
+
+            try:
+                del self._matches_cancel_events[key]
+                if text_version != self._matches_text_version:
+                    # The text changed while searching it
+                    self._find_matches(key, regobj, callback)
+                    return
+
+                output.regobj = regobj
+                output.text_version = text_version
+                callback(output)
+            except RuntimeError:
+                # The editor was closed
+                return
+
+        worker = self._matches_worker_manager.create_python_worker(
+            find_matches, text, regobj, cancel_event.is_set
+        )
+        worker.sig_finished.connect(worker_output)
+        worker.start()
+
+    def _highlight_visible_matches(self, key):
+        """
+        Highlight the found results or occurrences in the visible part of the
+        editor and a margin around it.
+        """
+        if key == 'find':
+            matches = self._found_matches
+            color = self.found_results_color
+        else:
+            matches = self._occurrences_matches
+            color = self.occurrence_color
+
+        if matches.text_version != self._matches_text_version:
+            # Keep the current decorations, which follow the text, until the
+            # matches are updated
             return
 
         extra_selections = []
-        self.found_results = []
-        has_unicode = len(text) != qstring_length(text)
-        for match in regobj.finditer(text):
-            if has_unicode:
-                pos1, pos2 = sh.get_span(match)
-            else:
-                pos1, pos2 = match.span()
-            selection = TextDecoration(self.textCursor())
-            selection.format.setBackground(self.found_results_color)
-            selection.cursor.setPosition(pos1)
 
-            block = selection.cursor.block()
-            if not block.userData():
-                # Add user data to check block validity
-                block.setUserData(BlockUserData(self))
-            self.found_results.append(block)
+        # A single occurrence is the word under the cursor, which is not
+        # highlighted
+        if key == 'find' or len(matches) > 1:
+            first, last = self.get_buffer_block_numbers()
+            document = self.document()
+            first_block = document.findBlockByNumber(first)
+            last_block = document.findBlockByNumber(last)
+            if not last_block.isValid():
+                last_block = document.lastBlock()
+
+            for start, end in matches.get_spans(
+                first_block.position(),
+                last_block.position() + last_block.length() - 1
+            ):
+                selection = TextDecoration(self.textCursor())
+                selection.format.setBackground(color)
+                selection.cursor.setPosition(start)
+                selection.cursor.setPosition(end, QTextCursor.KeepAnchor)
+                extra_selections.append(selection)
 
-            selection.cursor.setPosition(pos2, QTextCursor.KeepAnchor)
-            extra_selections.append(selection)
-        self.set_extra_selections('find', extra_selections)
+        self.set_extra_selections(key, extra_selections)
 
     def clear_found_results(self):
         """Clear found results highlighting"""
+        cancel_event = self._matches_cancel_events.pop('find', None)
+        if cancel_event is not None:
+            cancel_event.set()
+
         self.found_results = []
+        self._found_matches = Matches()
         self.clear_extra_selections('find')
         self.sig_flags_changed.emit()
 
     def __text_has_changed(self):
         """Text has changed, eventually clear found results highlighting"""
         self.last_change_position = self.textCursor().position()
+        self._matches_text_version += 1
 
         # If the change was on any of the lines were results were found,
         # rehighlight them.
@@ -2301,6 +2422,9 @@ def update_decorations(self):
         if self.folding_supported and self.code_folding:
             self.highlight_folded_regions()
 
+        self._highlight_visible_matches('find')
+        self._highlight_visible_matches('occurrences')
+
         # This is required to update decorations whether there are or not
         # underline errors in the visible portion of the screen.
         # See spyder-ide/spyder#14268.
@@ -2522,9 +2646,10 @@ def show_todo(self, line_number, data):
 
     def process_todo(self, todo_results):
         """Process todo finder results"""
-        for data in self.blockuserdata_list():
-            data.todo = ''
+        for block in self.flagged_blocks.get('todo'):
+            block.userData().todo = ''
 
+        todo_blocks = []
         for message, line_number in todo_results:
             block = self.document().findBlockByNumber(line_number - 1)
             data = block.userData()
@@ -2532,6 +2657,9 @@ def process_todo(self, todo_results):
                 data = BlockUserData(self)
             data.todo = message
             block.setUserData(data)
+            todo_blocks.append(block)
+
+        self.flagged_blocks.set('todo', todo_blocks)
         self.sig_flags_changed.emit()
 
     # ---- Comments/Indentation
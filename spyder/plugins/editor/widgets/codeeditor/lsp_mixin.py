@@ -676,8 +676,10 @@ def cleanup_code_analysis(self):
         self.setUpdatesEnabled(False)
         self.clear_extra_selections("code_analysis_highlight")
         self.clear_extra_selections("code_analysis_underline")
-        for data in self.blockuserdata_list():
-            data.code_analysis = []
+        for kind in ["error", "warning"]:
+            for block in self.flagged_blocks.get(kind):
+                block.userData().code_analysis = []
+            self.flagged_blocks.set(kind, [])
 
         self.setUpdatesEnabled(True)
         # When the new code analysis results are empty, it is necessary
@@ -743,6 +745,10 @@ def _process_code_analysis(self, underline):
         document = self.document()
         if underline:
             first_block, last_block = self.get_buffer_block_numbers()
+        else:
+            # Blocks with errors and warnings, by block number
+            error_blocks = {}
+            warning_blocks = {}
 
         for diagnostic in self._diagnostics:
             message = diagnostic.message
@@ -805,8 +811,18 @@ def _process_code_analysis(self, underline):
                     data.code_analysis.append(
                         (source, code, severity, message)
                     )
+                    if severity == lsp.DiagnosticSeverity.Error:
+                        error_blocks[block.blockNumber()] = block
+                    else:
+                        warning_blocks[block.blockNumber()] = block
                 block.setUserData(data)
 
+        if not underline and not self.is_cloned:
+            for block_nb in error_blocks:
+                warning_blocks.pop(block_nb, None)
+            self.flagged_blocks.set("error", error_blocks.values())
+            self.flagged_blocks.set("warning", warning_blocks.values())
+
     # ---- Completion
     # -------------------------------------------------------------------------
     @schedule_request(
@@ -16,10 +16,11 @@
 import pytest
 from qtpy import QT_VERSION
 from qtpy.QtCore import Qt
-from qtpy.QtGui import QFont, QTextCursor
+from qtpy.QtGui import QFont, QTextCharFormat, QTextCursor
 
 # Local imports
 from spyder.config.base import running_in_ci
+from spyder.plugins.editor.api.decoration import TextDecoration
 from spyder.plugins.editor.widgets.codeeditor import CodeEditor
 
 
@@ -59,7 +60,11 @@ def test_decorations(codeeditor, qtbot):
     qtbot.wait(3000)
     decorations = editor.decorations._sorted_decorations()
 
-    assert len(decorations) == 2 + text.count('some_variable')
+    # Assert all occurrences were found, but only the visible ones are
+    # decorated
+    n_occurrences = text.count('some_variable')
+    assert len(editor._occurrences_matches) == n_occurrences
+    assert 5 <= len(decorations) < 2 + n_occurrences
 
     # Assert that selection 0 is current cell
     assert decorations[0].kind == 'current_cell'
@@ -95,6 +100,100 @@ def test_decorations(codeeditor, qtbot):
     assert decorations[0].kind == 'current_cell'
 
 
+def test_visible_decorations(codeeditor, qtbot):
+    """Test that only visible decorations are painted, also after edits."""
+    editor = codeeditor
+    editor.resize(640, 300)
+    editor.set_text("foo = 1\n" * 5000)
+
+    # Decorate every line, in reverse order
+    decorations = []
+    for line in reversed(range(5000)):
+        decoration = TextDecoration(
+            editor.textCursor(), start_line=line + 1, end_line=line + 1
+        )
+        decoration.set_as_underlined()
+        decorations.append(decoration)
+
+    editor.decorations.add(decorations)
+    editor.decorations._update()
+    first, last = editor.get_buffer_block_numbers()
+    painted = [
+        d for d in editor.extraSelections()
+        if d.format.underlineStyle() != QTextCharFormat.NoUnderline
+    ]
+    assert 0 < len(painted) <= last - first + 1
+
+    # Decorations are kept sorted when editing the document
+    cursor = editor.textCursor()
+    cursor.setPosition(0)
+    cursor.insertText("bar = 2\n" * 10)
+    sorted_decorations = editor.decorations.get("misc")
+    starts = [d.cursor.selectionStart() for d in sorted_decorations]
+    assert starts == sorted(starts)
+
+    editor.go_to_line(3000)
+    editor.decorations._update()
+    first, last = editor.get_buffer_block_numbers()
+    painted = [
+        d for d in editor.extraSelections()
+        if d.format.underlineStyle() != QTextCharFormat.NoUnderline
+    ]
+    assert painted
+    assert all(first <= d.cursor.blockNumber() <= last for d in painted)
+
+    # Decorations can be removed at once
+    assert editor.decorations.remove(decorations[:4000])
+    assert len(editor.decorations.get("misc")) == 1000
+    assert len(editor.decorations._decorations_by_end["misc"]) == 1000
+
+
+def test_found_results_in_large_file(codeeditor, qtbot):
+    """
+    Test that matches in large files are found in a thread and only the
+    visible ones are decorated.
+    """
+    editor = codeeditor
+    editor.resize(640, 300)
+    text = "foo = bar\n" * (editor.FIND_MATCHES_IN_THREAD_MIN_LENGTH // 5)
+    editor.set_text(text)
+    n_lines = text.count("\n")
+
+    editor.highlight_found_results("foo")
+    qtbot.waitUntil(lambda: len(editor.found_results) == n_lines)
+
+    # Only the buffered lines are decorated
+    first, last = editor.get_buffer_block_numbers()
+    found = editor.decorations.get("find")
+    assert 0 < len(found) <= last - first + 1
+
+    # Matches are counted without searching again
+    editor.go_to_line(101)
+    assert editor.get_number_matches("foo") == n_lines
+    assert editor.get_match_number("foo") == 100
+
+    # Searching something else cancels the previous search
+    editor.highlight_found_results("foo")
+    editor.highlight_found_results("bar")
+    qtbot.waitUntil(
+        lambda: editor._found_matches.regobj is not None
+        and editor._found_matches.regobj.pattern == "bar"
+    )
+    assert len(editor.found_results) == n_lines
+    assert editor.get_number_matches("foo") == n_lines
+
+    editor.clear_found_results()
+    assert editor.found_results == []
+    assert not editor.decorations.get("find")
+
+    # Closing the editor cancels the searches in progress
+    editor.highlight_found_results("foo")
+    cancel_event = editor._matches_cancel_events["find"]
+    editor.close()
+    assert cancel_event.is_set()
+    assert editor._matches_cancel_events == {}
+
+
 @flaky(max_runs=10)
 @pytest.mark.skipif(
     QT_VERSION.startswith("6"),
@@ -791,11 +791,11 @@ def _on_check_if_remote_files_exist(
         else:
             buttons = QMessageBox.Yes | QMessageBox.No
 
-        for path, response in paths_existence:
+        for path, exists in paths_existence:
             filename = os.path.basename(path)
             files_counter = None
 
-            if not yes_to_all and response["exists"]:
+            if not yes_to_all and exists:
                 if operation == RemoteExistenceOperations.Paste:
                     opening_sentence = _(
                         "The file <b>{}</b> that you're trying to paste on "
@@ -908,18 +908,15 @@ def remote_package(future):
     @AsyncDispatcher(loop="explorer")
     async def _check_if_remote_files_exist(self, paths: list[str]):
         """Check if remote files exist in the remote cwd."""
-        paths_existence = []
-
-        for path in paths:
-            remote_file = posixpath.join(
+        remote_files = [
+            posixpath.join(
                 self.root_prefix[self.server_id], os.path.basename(path)
             )
+            for path in paths
+        ]
 
-            paths_existence.append(
-                (path, await self.remote_files_manager.exists(remote_file))
-            )
-
-        return paths_existence
+        response = await self.remote_files_manager.exists_batch(remote_files)
+        return list(zip(paths, response["exists"]))
 
     async def _get_extra_files(self, generator, already_added):
         self.extra_files = []
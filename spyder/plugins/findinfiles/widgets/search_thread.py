@@ -7,6 +7,8 @@
 """Search thread."""
 
 # Standard library imports
+import io
+import mmap
 import os
 import os.path as osp
 import re
@@ -29,6 +31,19 @@
 MAX_RESULT_LENGTH = 80
 MAX_NUM_CHAR_FRAGMENT = 40
 
+# Files larger than this (in bytes) are memory mapped instead of read when
+# checking if they contain matches.
+MMAP_MIN_SIZE = 2**20
+
+# Anchors and tokens of patterns that can match a newline. When searching
+# line by line, newlines are only found at the end of each line, so patterns
+# that have both can give different results when searching the whole file.
+ANCHORS_REGEXP = re.compile(rb'(?<!\[)\^|\$')
+NEWLINE_TOKENS = (
+    b'\n', b'\\n', b'\\x0a', b'\\x0A', b'\\012', b'\\s', b'\\W', b'\\D',
+    b'[^', b'(?s'
+)
+
 
 # ---- Thread
 # ----------------------------------------------------------------------------
@@ -69,6 +84,7 @@ def __init__(self, parent, search_text, text_color, max_results=1000):
         self.exclude = None
         self.texts = None
         self.text_re = None
+        self.prefilters = None
         self.completed = None
         self.case_sensitive = True
         self.total_matches = 0
@@ -91,6 +107,7 @@ def initialize(self, path, is_file, exclude,
         self.stopped = False
         self.completed = False
         self.case_sensitive = case_sensitive
+        self.prefilters = self.get_prefilters()
 
     def run(self):
         try:
@@ -188,7 +205,9 @@ def find_files_in_path(self, path):
                         or ext in EDIT_EXTENSIONS
                         or is_text_file(filename)
                     ):
-                        self.find_string_in_file(filename)
+                        may_match, contents = self.file_may_match(filename)
+                        if may_match:
+                            self.find_string_in_file(filename, contents)
             except re.error:
                 self.error_flag = _("invalid regular expression")
                 return False
@@ -203,11 +222,109 @@ def find_files_in_path(self, path):
 
         return True
 
-    def find_string_in_file(self, fname):
+    def get_prefilters(self):
+        """
+        Get the patterns used to check if a file contains any match.
+
+        These are applied to the whole file contents at once. Regular
+        expressions are compiled in multiline mode so that anchors match at
+        line boundaries as they do when searching line by line.
+
+        Returns None if there's no reliable way to do that.
+        """
+        prefilters = []
+        for text, __ in self.texts:
+            if self.text_re:
+                # These anchors only match at the beginning and end of each
+                # line when searching line by line, and lookarounds can't see
+                # past them.
+                if any(
+                    token in text.pattern
+                    for token in (b'\\A', b'\\Z', b'(?<', b'(?=', b'(?!')
+                ):
+                    return None
+
+                # The same happens with newlines matched next to ^ or $.
+                if ANCHORS_REGEXP.search(text.pattern) and (
+                    text.flags & re.DOTALL
+                    or any(token in text.pattern for token in NEWLINE_TOKENS)
+                ):
+                    return None
+
+                prefilters.append(
+                    re.compile(text.pattern, text.flags | re.MULTILINE)
+                )
+            else:
+                prefilters.append(text)
+
+        return prefilters
+
+    def file_may_match(self, fname):
+        """
+        Check if a file may contain matches.
+
+        Searching the whole file contents at once is much faster than going
+        line by line in Python, so this allows to skip most files quickly.
+        Errors are left to be reported by `find_string_in_file`.
+
+        Returns
+        -------
+        may_match: bool
+            Whether the file may contain matches.
+        contents: bytes or None
+            The file contents, if they were read to check it, so that they
+            don't need to be read again to search them. Large files are
+            mapped in memory instead, so their contents are not returned.
+        """
+        if self.prefilters is None:
+            return True, None
+
+        try:
+            with open(fname, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return False, None
+
+                # Lower case contents need to be a copy, so only use a memory
+                # map for large files in case sensitive searches.
+                if size >= MMAP_MIN_SIZE and self.case_sensitive:
+                    contents = None
+                    search_contents = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                else:
+                    contents = f.read()
+                    if self.case_sensitive:
+                        search_contents = contents
+                    else:
+                        search_contents = contents.lower()
+
+                try:
+                    for prefilter in self.prefilters:
+                        if self.text_re:
+                            if prefilter.search(search_contents) is not None:
+                                return True, contents
+                        elif search_contents.find(prefilter) > -1:
+                            return True, contents
+                finally:
+                    if isinstance(search_contents, mmap.mmap):
+                        search_contents.close()
+        except (OSError, ValueError):
+            return True, None
+
+        return False, None
+
+    def find_string_in_file(self, fname, contents=None):
         self.error_flag = False
         self.sig_current_file.emit(fname)
         try:
-            for lineno, line in enumerate(open(fname, 'rb')):
+            if contents is None:
+                lines = open(fname, 'rb')
+            else:
+                # Contents already read by file_may_match
+                lines = io.BytesIO(contents)
+
+            for lineno, line in enumerate(lines):
                 for text, enc in self.texts:
                     with QMutexLocker(self.mutex):
                         if self.stopped:
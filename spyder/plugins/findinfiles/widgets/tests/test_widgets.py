@@ -11,6 +11,7 @@
 # Test library imports
 import os
 import os.path as osp
+import re
 from unittest.mock import MagicMock
 
 # Third party imports
@@ -264,6 +265,49 @@ def test_truncate_result_with_different_input(findinfiles, qtbot, line_input):
     assert truncated_line['formatted_text'] == expected_result
 
 
+@pytest.mark.parametrize(
+    "options, may_match",
+    [
+        # Literal search
+        ((b'ham', False, True), True),
+        ((b'bacon', False, True), False),
+        # Case insensitive literal search
+        ((b'ham', False, False), True),
+        # Anchors match at line boundaries, as when searching by line
+        ((b'^ham', True, True), True),
+        ((b'eggs$', True, True), True),
+        ((b'^eggs', True, True), False),
+        # Lookarounds can't see other lines when searching by line
+        ((rb'(?<!\n)HAM', True, True), True),
+        # Newlines next to anchors are only at the end of each line when
+        # searching by line
+        ((rb'd\n$', True, True), True),
+        ((rb'd\s$', True, True), True),
+        ((rb'(?s)d.$', True, True), True),
+    ]
+)
+def test_file_may_match(tmp_path, options, may_match):
+    """Check that files without matches are skipped quickly."""
+    text, text_re, case_sensitive = options
+    if text_re:
+        text = re.compile(text)
+
+    filename = tmp_path / "spam.txt"
+    filename.write_text("ham and\nHAM and eggs\n")
+
+    thread = SearchThread(None, '', text_color=SpyderPalette.COLOR_TEXT_1)
+    thread.initialize(
+        str(tmp_path), False, None, [(text, 'utf-8')], text_re,
+        case_sensitive
+    )
+    file_may_match, contents = thread.file_may_match(str(filename))
+    assert file_may_match == may_match
+
+    # Contents are returned so they're not read again to search them
+    if may_match and thread.prefilters is not None:
+        assert contents == filename.read_bytes()
+
+
 @pytest.mark.parametrize('findinfiles',
                          [{'case_sensitive': False}],
                          indirect=True)
@@ -26,6 +26,10 @@
     f'>={SPYDER_KERNELS_MIN_VERSION},<{SPYDER_KERNELS_MAX_VERSION}'
 )
 
+# First Spyder-kernels versions with features that older kernels lack
+SPYDER_KERNELS_NAMESPACE_VIEW_DELTA_VERSION = "3.2.0a2.dev0"
+SPYDER_KERNELS_PICKLED_VALUE_VERSION = "3.2.0a2.dev0"
+
 if is_stable_version(SPYDER_KERNELS_MIN_VERSION):
     SPYDER_KERNELS_CONDA = (
         f'conda install spyder{_d}kernels={SPYDER_KERNELS_MIN_VERSION[:-2]}'
@@ -13,11 +13,14 @@
 import os
 
 # Test imports
+import numpy as np
 import pytest
 from tornado import ioloop
 
 
 # Local imports
+from spyder_kernels.comms import commbase
+from spyder_kernels.comms.commbase import PickledValue
 from spyder_kernels.utils.test_utils import get_kernel
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
@@ -112,7 +115,7 @@ class DummyKernelClient():
         shell_channel = 0
         control_channel = 0
 
-        def is_alive():
+        def is_alive(self):
             return True
 
     kernel_comm.kernel_client = DummyKernelClient()
@@ -177,5 +180,60 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_request_pickled_value(comms, monkeypatch):
+    """Test that pickled values are sent in chunks with their buffers."""
+    kernel_comm, frontend_comm = comms
+    monkeypatch.setattr(commbase, 'BUFFER_CHUNK_SIZE', 100)
+
+    progress = []
+    monkeypatch.setattr(
+        kernel_comm,
+        '_on_transfer_progress',
+        lambda call_id, received, total: progress.append((received, total))
+    )
+
+    def handler(value):
+        return PickledValue.dumps(value.loads() * 2)
+
+    kernel_comm.register_call_handler('test_request', handler)
+
+    value = PickledValue.dumps(np.arange(100))
+    res = frontend_comm.remote_call(blocking=True).test_request(value)
+
+    assert np.array_equal(res.loads(), np.arange(100) * 2)
+    assert len(progress) > 1
+    assert progress[-1][0] == progress[-1][1]
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_send_pickled_value(comms, monkeypatch):
+    """Test that pickled values are sent in chunks to the kernel."""
+    kernel_comm, frontend_comm = comms
+    monkeypatch.setattr(commbase, 'BUFFER_CHUNK_SIZE', 100)
+
+    progress = []
+    monkeypatch.setattr(
+        frontend_comm,
+        '_on_transfer_progress',
+        lambda call_id, received, total: progress.append((received, total))
+    )
+
+    received = []
+
+    def handler(value):
+        received.append(value.loads())
+
+    frontend_comm.register_call_handler('test_request', handler)
+
+    value = PickledValue.dumps(np.arange(100))
+    kernel_comm.remote_call().test_request(value)
+
+    assert len(received) == 1
+    assert np.array_equal(received[0], np.arange(100))
+    assert len(progress) > 1
+    assert progress[-1][0] == progress[-1][1]
+
+
 if __name__ == "__main__":
     pytest.main()
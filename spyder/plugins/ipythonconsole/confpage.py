@@ -441,6 +441,55 @@ def setup_page(self):
         prompts_layout.addLayout(prompts_g_layout)
         prompts_group.setLayout(prompts_layout)
 
+        # Kernel pool group
+        kernel_pool_group = QGroupBox(_("Pre-started kernels"))
+        kernel_pool_label = QLabel(_(
+            "Start kernels in advance for each environment in which consoles "
+            "are opened, so that new consoles and kernel restarts are faster."
+        ))
+        kernel_pool_label.setWordWrap(True)
+        kernel_pool_size_spin = self.create_spinbox(
+            _("Kernels per environment:"),
+            "",
+            'kernel_pool/size',
+            min_=0,
+            max_=10,
+            step=1,
+            tip=_("Set it to 0 to not start kernels in advance."),
+        )
+        kernel_pool_timeout_spin = self.create_spinbox(
+            _("Close unused ones after:"),
+            _(" min"),
+            'kernel_pool/idle_timeout',
+            min_=1,
+            max_=1440,
+            step=1,
+            tip=_(
+                "Kernels of environments in which no console was opened for "
+                "this time are closed. Kernels of the last environment used "
+                "are always kept."
+            ),
+        )
+        kernel_pool_memory_spin = self.create_spinbox(
+            _("Memory usage limit:"),
+            " %",
+            'kernel_pool/max_memory_usage',
+            min_=10,
+            max_=100,
+            step=5,
+            tip=_(
+                "Kernels are not started in advance while the memory usage "
+                "of your system is above this limit."
+            ),
+        )
+
+        kernel_pool_layout = QVBoxLayout()
+        kernel_pool_layout.addWidget(kernel_pool_label)
+        kernel_pool_layout.addWidget(kernel_pool_size_spin)
+        kernel_pool_layout.addWidget(kernel_pool_timeout_spin)
+        kernel_pool_layout.addWidget(kernel_pool_memory_spin)
+        kernel_pool_group.setLayout(kernel_pool_layout)
+
         # Windows adjustments
         windows_group = QGroupBox(_("Windows adjustments"))
         hide_cmd_windows = newcb(
@@ -470,7 +519,8 @@ def setup_page(self):
 
         self.create_tab(
             _("Advanced"),
-            [autocall_group, autoreload_group, prompts_group, windows_group]
+            [autocall_group, autoreload_group, prompts_group,
+             kernel_pool_group, windows_group]
         )
 
     def warn_if_large_buffer(self):
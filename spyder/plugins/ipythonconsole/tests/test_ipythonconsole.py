@@ -699,6 +699,29 @@ def test_unicode_vars(ipyconsole, qtbot):
     assert shell.get_value('д') == 20
 
 
+@flaky(max_runs=3)
+def test_values_old_kernels(ipyconsole, qtbot):
+    """
+    Test that values are exchanged without PickledValues with kernels that
+    don't support them.
+    """
+    shell = ipyconsole.get_current_shellwidget()
+    assert shell.supports_pickled_values
+
+    # Pretend the kernel is older
+    shell.kernel_handler.spyder_kernel_version = "3.2.0a1"
+    assert not shell.supports_pickled_values
+
+    with qtbot.waitSignal(shell.executed):
+        shell.execute('import numpy as np; arr = np.arange(10)')
+
+    assert np.array_equal(shell.get_value('arr'), np.arange(10))
+
+    shell.set_value('arr', np.arange(5))
+    qtbot.waitUntil(lambda: len(shell.get_value('arr')) == 5)
+    assert np.array_equal(shell.get_value('arr'), np.arange(5))
+
+
 @flaky(max_runs=10)
 @pytest.mark.no_xvfb
 @pytest.mark.skipif(
@@ -1095,9 +1118,10 @@ def test_kernel_crash(ipyconsole, qtbot):
             timeout=6000)
 
         # Wait until the error has been received by the cached kernel_handler
-        qtbot.waitUntil(lambda: bool(
-            ipyconsole.get_widget()._cached_kernel_properties[-1]._init_stderr
-        ))
+        kernel_pool = ipyconsole.get_widget()._kernel_pools[-1]
+        qtbot.waitUntil(
+            lambda: bool(kernel_pool.kernel_handlers[-1]._init_stderr)
+        )
 
         # Create a new client
         ipyconsole.create_new_client()
@@ -2354,7 +2378,7 @@ def test_old_kernel_version(ipyconsole, qtbot):
     # Set a false _spyder_kernels_version in the cached kernel
     w = ipyconsole.get_widget()
 
-    kernel_handler = w._cached_kernel_properties[-1]
+    kernel_handler = w._kernel_pools[-1].kernel_handlers[-1]
     kernel_handler.kernel_client.sig_spyder_kernel_info.disconnect()
 
     # Wait until it is launched
@@ -2379,6 +2403,41 @@ def test_old_kernel_version(ipyconsole, qtbot):
     )
 
 
+def test_kernel_pool(ipyconsole, qtbot):
+    """Test that new consoles use kernels started in advance."""
+    widget = ipyconsole.get_widget()
+    ipyconsole.set_conf('kernel_pool/size', 2)
+
+    def get_stat(name):
+        return widget.get_kernel_pools_stats()[name]
+
+    try:
+        stats = widget.get_kernel_pools_stats()
+
+        # The first new console fills the pool
+        ipyconsole.create_new_client()
+        qtbot.waitUntil(lambda: get_stat("hits") == stats["hits"] + 1)
+        qtbot.waitUntil(lambda: get_stat("kernels") == 2)
+
+        # And the next one takes a kernel from it, which is then replaced
+        ipyconsole.create_new_client()
+        qtbot.waitUntil(lambda: get_stat("hits") == stats["hits"] + 2)
+        qtbot.waitUntil(lambda: get_stat("kernels") == 2)
+        assert get_stat("misses") == stats["misses"]
+
+        shell = ipyconsole.get_current_shellwidget()
+        qtbot.waitUntil(
+            lambda: (
+                shell.spyder_kernel_ready and shell._prompt_html is not None
+            ),
+            timeout=SHELL_TIMEOUT)
+        with qtbot.waitSignal(shell.executed):
+            shell.execute('a = 1')
+        assert shell.get_value('a') == 1
+    finally:
+        ipyconsole.set_conf('kernel_pool/size', 1)
+
+
 def test_run_script(ipyconsole, qtbot, tmp_path):
     """
     Test running multiple scripts at the same time.
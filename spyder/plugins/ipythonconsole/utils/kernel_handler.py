@@ -27,6 +27,7 @@
     SPYDER_KERNELS_VERSION,
     SPYDER_KERNELS_CONDA,
     SPYDER_KERNELS_PIP,
+    SPYDER_KERNELS_PICKLED_VALUE_VERSION,
     SpyderKernelError,
 )
 from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
@@ -190,6 +191,7 @@ def __init__(
 
         self.kernel_error_message = None
         self.connection_state = KernelConnectionState.Connecting
+        self.spyder_kernel_version = None
 
         # Comm
         self.kernel_comm = KernelComm()
@@ -276,6 +278,13 @@ def check_spyder_kernel_info(self, spyder_kernel_info):
             return
 
         version, pyexec = spyder_kernel_info
+        self.spyder_kernel_version = version
+
+        # Older kernels can't reassemble buffers sent in chunks
+        self.kernel_comm.chunk_buffers = check_version_range(
+            version, f">={SPYDER_KERNELS_PICKLED_VALUE_VERSION}"
+        )
+
         if not check_version_range(version, SPYDER_KERNELS_VERSION):
             # Development versions are acceptable
             if "dev0" not in version:
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Pool of pre-started kernels."""
+
+# Standard library imports
+import time
+
+
+class KernelPool:
+    """
+    Kernels that were started in advance with the same kernel spec, so that
+    new consoles and restarts don't have to wait for a kernel to start.
+    """
+
+    def __init__(self, kernel_spec):
+        self.kernel_spec = kernel_spec
+
+        # These are saved because they could change after the pool is created
+        self.env = kernel_spec.env
+        self.argv = kernel_spec.argv
+
+        self.kernel_handlers = []
+        self.last_used = time.monotonic()
+
+    def __len__(self):
+        return len(self.kernel_handlers)
+
+    def matches(self, kernel_spec):
+        """Check if kernel_spec is the one of this pool."""
+        # Call interrupt_mode so the dict will be the same
+        kernel_spec.interrupt_mode
+        self.kernel_spec.interrupt_mode
+
+        if "PYTEST_CURRENT_TEST" in self.env:
+            # Make tests faster by using cached kernels
+            # hopefully the kernel will never use PYTEST_CURRENT_TEST
+            self.env["PYTEST_CURRENT_TEST"] = (
+                kernel_spec.env["PYTEST_CURRENT_TEST"])
+        return (
+            self.kernel_spec.__dict__ == kernel_spec.__dict__
+            and kernel_spec.argv == self.argv
+            and kernel_spec.env == self.env
+        )
+
+    def add(self, kernel_handler):
+        """Add a started kernel to the pool."""
+        self.kernel_handlers.append(kernel_handler)
+
+    def pop(self):
+        """
+        Take the kernel that was started first out of the pool.
+
+        Returns
+        -------
+        kernel_handler: KernelHandler or None
+            The kernel, or None if the pool is empty or its kernels failed
+            to start. In the last case, they are closed.
+        """
+        self.last_used = time.monotonic()
+        if not self.kernel_handlers:
+            return None
+
+        kernel_handler = self.kernel_handlers.pop(0)
+        if kernel_handler._init_stderr:
+            # The other kernels must have failed in the same way
+            self.kernel_handlers.append(kernel_handler)
+            self.close()
+            return None
+
+        return kernel_handler
+
+    def trim(self, size, now=False):
+        """Close the last kernels in the pool until it has size kernels."""
+        n_closed = 0
+        while len(self.kernel_handlers) > max(size, 0):
+            self.kernel_handlers.pop().close(now=now)
+            n_closed += 1
+        return n_closed
+
+    def close(self, now=False):
+        """Close all kernels in the pool."""
+        return self.trim(0, now=now)
+
+    def idle_time(self):
+        """Time in seconds since a kernel was last taken from the pool."""
+        return time.monotonic() - self.last_used
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""Tests for the pool of pre-started kernels."""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.ipythonconsole.utils.kernel_pool import KernelPool
+from spyder.plugins.ipythonconsole.utils.kernelspec import SpyderKernelSpec
+
+
+class KernelHandlerMock:
+    def __init__(self, init_stderr=""):
+        self._init_stderr = init_stderr
+        self.closed = False
+
+    def close(self, now=False):
+        self.closed = True
+
+
+@pytest.fixture
+def kernel_spec():
+    kernel_spec = SpyderKernelSpec()
+    kernel_spec.env = {"SPY_TEST": "1"}
+    return kernel_spec
+
+
+def test_kernel_pool(kernel_spec):
+    """Test that kernels are taken from the pool in order."""
+    pool = KernelPool(kernel_spec)
+    assert pool.pop() is None
+
+    kernel_handlers = [KernelHandlerMock() for __ in range(3)]
+    for kernel_handler in kernel_handlers:
+        pool.add(kernel_handler)
+
+    assert pool.pop() is kernel_handlers[0]
+    assert len(pool) == 2
+
+    # Trimming closes the last started kernels
+    assert pool.trim(1) == 1
+    assert kernel_handlers[2].closed
+    assert pool.pop() is kernel_handlers[1]
+    assert not kernel_handlers[1].closed
+
+
+def test_kernel_pool_crashed(kernel_spec):
+    """Test that kernels that failed to start are not used."""
+    pool = KernelPool(kernel_spec)
+    kernel_handlers = [KernelHandlerMock("Error"), KernelHandlerMock()]
+    for kernel_handler in kernel_handlers:
+        pool.add(kernel_handler)
+
+    assert pool.pop() is None
+    assert len(pool) == 0
+    assert all(kernel_handler.closed for kernel_handler in kernel_handlers)
+
+
+def test_kernel_pool_matches(kernel_spec):
+    """Test that pools are only used for their kernel spec."""
+    pool = KernelPool(kernel_spec)
+
+    same_spec = SpyderKernelSpec()
+    same_spec.env = {"SPY_TEST": "1"}
+    assert pool.matches(same_spec)
+
+    other_env_spec = SpyderKernelSpec()
+    other_env_spec.env = {"SPY_TEST": "2"}
+    assert not pool.matches(other_env_spec)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -9,64 +9,58 @@
 """
 
 # Standard library imports
+import functools
+import logging
 import os
 import os.path as osp
 
 # Third-party imports
 from packaging.version import parse
+from qtpy.QtCore import QTimer
 
 # Local imports
 from spyder.plugins.ipythonconsole.utils.kernel_handler import KernelHandler
+from spyder.plugins.ipythonconsole.utils.kernel_pool import KernelPool
 from spyder.utils.conda import conda_version, find_conda
+from spyder.utils.system import memory_usage
+
+
+logger = logging.getLogger(__name__)
 
 
 class CachedKernelMixin:
     """Cached kernel mixin."""
 
+    # Interval in milliseconds to check for pools of kernels that are idle
+    IDLE_KERNEL_POOLS_CHECK_INTERVAL = 60 * 1000
+
     def __init__(self):
         super().__init__()
-        self._cached_kernel_properties = None
+        # Pools of pre-started kernels, from the least to the most recently
+        # used one
+        self._kernel_pools = []
+        self._kernel_pools_timer = None
+        self._kernel_pools_stats = {
+            "hits": 0,
+            "misses": 0,
+            "started": 0,
+            "closed": 0,
+            "skipped": 0,
+        }
         self._conda_exec = find_conda()
 
     def close_cached_kernel(self):
-        """Close the cached kernel."""
-        if self._cached_kernel_properties is None:
-            return
-        kernel = self._cached_kernel_properties[-1]
-        kernel.close(now=True)
-        self._cached_kernel_properties = None
+        """Close the cached kernels."""
+        for pool in self._kernel_pools:
+            self._kernel_pools_stats["closed"] += pool.close(now=True)
+        self._kernel_pools = []
 
     def check_cached_kernel_spec(self, kernel_spec):
-        """Test if kernel_spec corresponds to the cached kernel_spec."""
-        if self._cached_kernel_properties is None:
-            return False
-        (
-            cached_spec,
-            cached_env,
-            cached_argv,
-            _,
-        ) = self._cached_kernel_properties
-
-        # Call interrupt_mode so the dict will be the same
-        kernel_spec.interrupt_mode
-        cached_spec.interrupt_mode
-
-        if "PYTEST_CURRENT_TEST" in cached_env:
-            # Make tests faster by using cached kernels
-            # hopefully the kernel will never use PYTEST_CURRENT_TEST
-            cached_env["PYTEST_CURRENT_TEST"] = (
-                kernel_spec.env["PYTEST_CURRENT_TEST"])
-        return (
-            cached_spec.__dict__ == kernel_spec.__dict__
-            and kernel_spec.argv == cached_argv
-            and kernel_spec.env == cached_env
-        )
+        """Test if there are cached kernels for kernel_spec."""
+        return self._get_kernel_pool(kernel_spec) is not None
 
     def get_cached_kernel(self, kernel_spec, cache=True):
-        """Get a new kernel, and cache one for next time."""
-        # Cache another kernel for next time.
-        new_kernel_handler = KernelHandler.new_from_spec(kernel_spec)
-
+        """Get a new kernel, and cache others for next time."""
         # Don't use cache if requested or needed
         if (
             not cache
@@ -81,30 +75,113 @@ def get_cached_kernel(self, kernel_spec, cache=True):
             )
         ):
             self.close_cached_kernel()
-            return new_kernel_handler
-
-        # Check cached kernel has the same configuration as is being asked or
-        # it crashed.
-        cached_kernel_handler = None
-        if self._cached_kernel_properties is not None:
-            cached_kernel_handler = self._cached_kernel_properties[-1]
-            if (
-                not self.check_cached_kernel_spec(kernel_spec)
-                or cached_kernel_handler._init_stderr
-            ):
-                # Close the kernel
-                self.close_cached_kernel()
-                cached_kernel_handler = None
-
-        # Cache the new kernel
-        self._cached_kernel_properties = (
-            kernel_spec,
-            kernel_spec.env,
-            kernel_spec.argv,
-            new_kernel_handler,
+            return KernelHandler.new_from_spec(kernel_spec)
+
+        pool = self._get_kernel_pool(kernel_spec)
+        if pool is None:
+            pool = KernelPool(kernel_spec)
+        else:
+            self._kernel_pools.remove(pool)
+        self._kernel_pools.append(pool)
+
+        # Take a kernel that has the same configuration as is being asked and
+        # didn't crash.
+        kernel_handler = pool.pop()
+        if kernel_handler is None:
+            self._kernel_pools_stats["misses"] += 1
+            kernel_handler = KernelHandler.new_from_spec(kernel_spec)
+        else:
+            self._kernel_pools_stats["hits"] += 1
+
+        # Cache a kernel for next time now and the rest of the pool later,
+        # to not delay this one.
+        size = self.get_conf("kernel_pool/size")
+        self._kernel_pools_stats["closed"] += pool.trim(size)
+        self._fill_kernel_pool(pool, max_kernels=1)
+        if len(pool) < size:
+            QTimer.singleShot(
+                0, functools.partial(self._fill_kernel_pool, pool)
+            )
+
+        self._close_idle_kernel_pools()
+        logger.debug(f"Kernel pools stats: {self.get_kernel_pools_stats()}")
+
+        return kernel_handler
+
+    def get_kernel_pools_stats(self):
+        """
+        Get the number of cached kernels and how they were used.
+
+        Returns
+        -------
+        dict
+            Number of pools and of kernels in them, kernels taken from a pool
+            (hits) or started when requested (misses), and kernels started
+            for, closed in or not started for a pool due to high memory usage
+            (skipped).
+        """
+        return dict(
+            self._kernel_pools_stats,
+            pools=len(self._kernel_pools),
+            kernels=sum(len(pool) for pool in self._kernel_pools),
         )
 
-        if cached_kernel_handler is None:
-            return KernelHandler.new_from_spec(kernel_spec)
+    def _get_kernel_pool(self, kernel_spec):
+        """Get the pool of kernels of kernel_spec, if there's one."""
+        for pool in self._kernel_pools:
+            if pool.matches(kernel_spec):
+                return pool
+        return None
+
+    def _fill_kernel_pool(self, pool, max_kernels=None):
+        """
+        Start kernels for a pool until it has the configured size, starting
+        max_kernels at most.
+        """
+        n_started = 0
+        while (
+            # The pool could have been closed in the meantime
+            pool in self._kernel_pools
+            and len(pool) < self.get_conf("kernel_pool/size")
+            and (max_kernels is None or n_started < max_kernels)
+        ):
+            if memory_usage() > self.get_conf("kernel_pool/max_memory_usage"):
+                self._kernel_pools_stats["skipped"] += 1
+                return
+
+            try:
+                pool.add(KernelHandler.new_from_spec(pool.kernel_spec))
+            except Exception:
+                # The error will be shown when the kernel is requested
+                logger.debug("Error starting a kernel", exc_info=True)
+                return
+
+            self._kernel_pools_stats["started"] += 1
+            n_started += 1
+
+    def _close_idle_kernel_pools(self):
+        """
+        Close the kernels of the pools that haven't been used for the idle
+        timeout, except for the most recently used one.
+        """
+        timeout = self.get_conf("kernel_pool/idle_timeout") * 60
+        for pool in self._kernel_pools[:-1]:
+            if pool.idle_time() >= timeout:
+                self._kernel_pools_stats["closed"] += pool.close()
+                self._kernel_pools.remove(pool)
+
+        # Check again later if there are other pools
+        if self._kernel_pools_timer is None:
+            self._kernel_pools_timer = QTimer(self)
+            self._kernel_pools_timer.setInterval(
+                self.IDLE_KERNEL_POOLS_CHECK_INTERVAL
+            )
+            self._kernel_pools_timer.timeout.connect(
+                self._close_idle_kernel_pools
+            )
 
-        return cached_kernel_handler
+        if len(self._kernel_pools) > 1:
+            if not self._kernel_pools_timer.isActive():
+                self._kernel_pools_timer.start()
+        else:
+            self._kernel_pools_timer.stop()
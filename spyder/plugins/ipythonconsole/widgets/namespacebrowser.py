@@ -19,11 +19,15 @@
 import cloudpickle
 from packaging.version import parse
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
-from spyder_kernels.comms.commbase import CommError
+from spyder_kernels.comms.commbase import CommError, PickledValue
 
 # Local imports
 from spyder.api.translations import _
 from spyder.config.base import is_conda_based_app
+from spyder.plugins.ipythonconsole import (
+    SPYDER_KERNELS_NAMESPACE_VIEW_DELTA_VERSION,
+    SPYDER_KERNELS_PICKLED_VALUE_VERSION,
+)
 
 # For logging
 logger = logging.getLogger(__name__)
@@ -45,6 +49,32 @@ class NamepaceBrowserWidget(RichJupyterWidget):
     between the IPython Console and the kernel namespace
     """
     # --- Public API --------------------------------------------------
+    def check_spyder_kernel_version(self, version):
+        """
+        Check if the Spyder-kernels version of the kernel is at least
+        `version`.
+        """
+        kernel_version = getattr(
+            self.kernel_handler, "spyder_kernel_version", None
+        )
+        if kernel_version is None:
+            return False
+        return parse(kernel_version) >= parse(version)
+
+    @property
+    def supports_namespace_view_delta(self):
+        """Check if the kernel can send namespace view deltas."""
+        return self.check_spyder_kernel_version(
+            SPYDER_KERNELS_NAMESPACE_VIEW_DELTA_VERSION
+        )
+
+    @property
+    def supports_pickled_values(self):
+        """Check if values can be exchanged with the kernel out of band."""
+        return self.check_spyder_kernel_version(
+            SPYDER_KERNELS_PICKLED_VALUE_VERSION
+        )
+
     def get_value(self, name):
         """Ask kernel for a value"""
         # ---- Reasons
@@ -138,7 +168,9 @@ def get_value(self, name):
         # ---- Raise error which includes the message
         kernel_call_success = False
         show_full_msg = True
+        out_of_band = self.supports_pickled_values
         try:
+            kwargs = {"out_of_band": True} if out_of_band else {}
             value = self.call_kernel(
                 blocking=True,
                 # We prefer not to display errors because it's not clear that
@@ -147,9 +179,12 @@ def get_value(self, name):
                 # See spyder-ide/spyder#22411
                 display_error=False,
                 timeout=CALL_KERNEL_TIMEOUT
-            ).get_value(name, encoded=True)
+            ).get_value(name, encoded=True, **kwargs)
             kernel_call_success = True
-            value = cloudpickle.loads(value)
+            if out_of_band:
+                value = value.loads()
+            else:
+                value = cloudpickle.loads(value)
             return value
         except TimeoutError:
             raise ValueError(msg % reason_big)
@@ -292,8 +327,12 @@ def set_value(self, name, value):
             "<a href='{}'>Github</a>."
         ).format(GH_ISSUES)
 
-        # Encode with cloudpickle and base64
-        encoded_value = cloudpickle.dumps(value)
+        if self.supports_pickled_values:
+            # Encode with cloudpickle, sending the data of arrays separately
+            encoded_value = PickledValue.dumps(value)
+        else:
+            # Encode with cloudpickle
+            encoded_value = cloudpickle.dumps(value)
 
         try:
             self.call_kernel(
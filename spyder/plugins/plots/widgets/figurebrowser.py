@@ -41,6 +41,7 @@
 from spyder.api.translations import _
 from spyder.api.shellconnect.mixins import ShellConnectWidgetForStackMixin
 from spyder.api.widgets.mixins import SpyderWidgetMixin
+from spyder.plugins.plots.widgets.figurestore import FigureStore
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import AppStyle
@@ -177,9 +178,13 @@ def __init__(self, parent=None, background_color=None):
         self.zoom_disp_value = None
         self._update_when_shown = True
 
+        # Data and pixmaps of the figures shown by this widget
+        self.figure_store = FigureStore()
+
         # Setup the figure viewer.
         self.figviewer = FigureViewer(parent=self,
-                                      background_color=self.background_color)
+                                      background_color=self.background_color,
+                                      store=self.figure_store)
         self.figviewer.sig_context_menu_requested.connect(
             self.sig_figure_menu_requested)
         self.figviewer.sig_figure_loaded.connect(self.sig_figure_loaded)
@@ -191,7 +196,8 @@ def __init__(self, parent=None, background_color=None):
             self.figviewer,
             parent=self,
             background_color=self.background_color,
-            max_plots=self.get_conf('max_plots', section='plots')
+            max_plots=self.get_conf('max_plots', section='plots'),
+            store=self.figure_store
         )
         self.thumbnails_sb.sig_context_menu_requested.connect(
             self.sig_thumbnail_menu_requested)
@@ -340,7 +346,10 @@ def close_all_figures(self):
 
     def copy_figure(self):
         """Copy figure from figviewer to clipboard."""
-        if self.figviewer and self.figviewer.figcanvas.fig:
+        if (
+            self.figviewer
+            and self.figviewer.figcanvas.fig_key is not None
+        ):
             self.figviewer.figcanvas.copy_figure()
 
     # ---- Qt methods
@@ -384,7 +393,7 @@ class FigureViewer(SpyderWidgetMixin, QScrollArea):
     sig_figure_loaded = Signal()
     """This signal is emitted when a new figure is loaded."""
 
-    def __init__(self, parent=None, background_color=None):
+    def __init__(self, parent=None, background_color=None, store=None):
         QScrollArea.__init__(self, parent)
         SpyderWidgetMixin.__init__(self, class_parent=parent)
 
@@ -395,6 +404,7 @@ def __init__(self, parent=None, background_color=None):
         self.setFrameStyle(0)
 
         self.background_color = background_color
+        self.store = store
         self.current_thumbnail = None
         self.scalefactor = 0
 
@@ -456,7 +466,11 @@ def scalefactor(self, value):
     def setup_figcanvas(self):
         """Setup the FigureCanvas."""
         self.figcanvas = FigureCanvas(parent=self,
-                                      background_color=self.background_color)
+                                      background_color=self.background_color,
+                                      store=self.store)
+
+        # The figure is painted at many sizes when zooming it
+        self.figcanvas.keep_original = True
         self.figcanvas.installEventFilter(self)
         self.figcanvas.customContextMenuRequested.connect(
             self.show_context_menu)
@@ -464,7 +478,7 @@ def setup_figcanvas(self):
 
     def show_context_menu(self, qpoint):
         """Only emit context menu signal if there is a figure."""
-        if self.figcanvas and self.figcanvas.fig is not None:
+        if self.figcanvas and self.figcanvas.fig_key is not None:
             # Convert to global
             point = self.figcanvas.mapToGlobal(qpoint)
             self.sig_context_menu_requested.emit(point)
@@ -475,6 +489,14 @@ def set_current_thumbnail(self, thumbnail):
 
     def load_figure(self, fig, fmt):
         """Set a new figure in the figure canvas."""
+        self._load_figure(lambda: self.figcanvas.load_figure(fig, fmt))
+
+    def load_figure_key(self, key):
+        """Set a figure that's already in the figure store in the canvas."""
+        self._load_figure(lambda: self.figcanvas.load_figure_key(key))
+
+    def _load_figure(self, load_in_canvas):
+        """Load a figure in the canvas with `load_in_canvas` and scale it."""
         self.auto_fit_plotting = self.current_thumbnail.auto_fit
 
         # Let scale_image compute the scale factor for the thumbnail if it
@@ -482,7 +504,7 @@ def load_figure(self, fig, fmt):
         if self.current_thumbnail.scalefactor is not None:
             self.scalefactor = self.current_thumbnail.scalefactor
 
-        self.figcanvas.load_figure(fig, fmt)
+        load_in_canvas()
         self.sig_figure_loaded.emit()
         self.scale_image()
         self.figcanvas.repaint()
@@ -630,7 +652,7 @@ def scale_image(self):
                     new_width = int(height / fheight * fwidth)
             except ZeroDivisionError:
                 icon = self.create_icon('broken_image')
-                self.figcanvas._qpix_orig = icon.pixmap(fwidth, fheight)
+                self.figcanvas._broken_qpix = icon.pixmap(fwidth, fheight)
                 self.figcanvas.setToolTip(
                     _('The image is broken, please try to generate it again')
                 )
@@ -748,11 +770,13 @@ class ThumbnailScrollBar(QFrame):
     """
 
     def __init__(
-        self, figure_viewer, parent=None, background_color=None, max_plots=30
+        self, figure_viewer, parent=None, background_color=None, max_plots=30,
+        store=None
     ):
         super().__init__(parent)
         self._max_plots = max_plots
         self._thumbnails = []
+        self.store = FigureStore() if store is None else store
 
         self.background_color = background_color
         self.save_dir = getcwd_or_home()
@@ -1028,7 +1052,8 @@ def add_thumbnail(self, fig, fmt):
             stick_at_end = True
 
         thumbnail = FigureThumbnail(
-            parent=self, background_color=self.background_color
+            parent=self, background_color=self.background_color,
+            store=self.store
         )
         thumbnail.canvas.load_figure(fig, fmt)
         thumbnail.sig_canvas_clicked.connect(self.set_current_thumbnail)
@@ -1085,6 +1110,7 @@ def remove_all_thumbnails(self):
             thumbnail.setParent(None)
             thumbnail.hide()
             thumbnail.close()
+            thumbnail.canvas.clear_canvas()
 
         self._thumbnails = []
         self.current_thumbnail = None
@@ -1122,6 +1148,7 @@ def remove_thumbnail(self, thumbnail):
         self.layout().removeWidget(thumbnail)
         thumbnail.hide()
         thumbnail.close()
+        thumbnail.canvas.clear_canvas()
 
         # See: spyder-ide/spyder#12459
         QTimer.singleShot(
@@ -1164,9 +1191,7 @@ def set_current_thumbnail(self, thumbnail):
             self.current_thumbnail.highlight_canvas(False)
         self.current_thumbnail = thumbnail
         self.figure_viewer.set_current_thumbnail(thumbnail)
-        self.figure_viewer.load_figure(
-            thumbnail.canvas.fig, thumbnail.canvas.fmt
-        )
+        self.figure_viewer.load_figure_key(thumbnail.canvas.fig_key)
         self.current_thumbnail.highlight_canvas(True)
 
     def go_previous_thumbnail(self):
@@ -1288,7 +1313,8 @@ class FigureThumbnail(QWidget):
         The QPoint in global coordinates where the menu was requested.
     """
 
-    def __init__(self, parent=None, background_color=None, auto_fit=True):
+    def __init__(self, parent=None, background_color=None, auto_fit=True,
+                 store=None):
         super().__init__(parent)
 
         self.auto_fit = auto_fit
@@ -1298,7 +1324,8 @@ def __init__(self, parent=None, background_color=None, auto_fit=True):
 
         self.canvas = FigureCanvas(
             parent=self,
-            background_color=background_color
+            background_color=background_color,
+            store=store
         )
         self.canvas.sig_context_menu_requested.connect(
             self.sig_context_menu_requested)
@@ -1393,7 +1420,7 @@ class FigureCanvas(SpyderConfigurationAccessor, QFrame):
         The QPoint in global coordinates where the menu was requested.
     """
 
-    def __init__(self, parent=None, background_color=None):
+    def __init__(self, parent=None, background_color=None, store=None):
         super().__init__(parent)
         self.setLineWidth(2)
         self.setMidLineWidth(1)
@@ -1401,15 +1428,28 @@ def __init__(self, parent=None, background_color=None):
         self.setStyleSheet(
             "#figcanvas {background-color:" + str(background_color) + "}")
 
-        self.fig = None
+        # Figures are saved in a store shared with other canvases, which
+        # decodes them only when they're painted.
+        self.store = FigureStore() if store is None else store
+        self.fig_key = None
         self.fmt = None
         self.fwidth, self.fheight = 200, 200
+        self.keep_original = False
+        self._owns_fig = False
+        self._broken_qpix = None
         self._blink_flag = False
 
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(
             self.sig_context_menu_requested)
 
+    @property
+    def fig(self):
+        """Data of the figure painted on the widget, or None."""
+        if self.fig_key is None:
+            return None
+        return self.store.get(self.fig_key)
+
     @Slot()
     def copy_figure(self):
         """Copy figure to clipboard."""
@@ -1426,7 +1466,7 @@ def copy_figure(self):
 
     def blink_figure(self):
         """Blink figure once."""
-        if self.fig:
+        if self.fig_key is not None:
             self._blink_flag = not self._blink_flag
             self.repaint()
             if self._blink_flag:
@@ -1435,28 +1475,31 @@ def blink_figure(self):
 
     def clear_canvas(self):
         """Clear the figure that was painted on the widget."""
-        self.fig = None
-        self.fmt = None
-        self._qpix_scaled = None
+        self._set_fig_key(None)
         self.repaint()
 
     def load_figure(self, fig, fmt):
         """
-        Load the figure from a png, jpg, or svg image, convert it in
-        a QPixmap, and force a repaint of the widget.
+        Load the figure from a png, jpg, or svg image in the figure store, and
+        force a repaint of the widget.
         """
-        self.fig = fig
-        self.fmt = fmt
+        self._set_fig_key(self.store.add(fig, fmt), owns_fig=True)
+
+    def load_figure_key(self, key):
+        """Load a figure that's already in the figure store."""
+        self._set_fig_key(key)
 
-        if fmt in ['image/png', 'image/jpeg']:
-            self._qpix_orig = QPixmap()
-            self._qpix_orig.loadFromData(fig, fmt.upper())
-        elif fmt == 'image/svg+xml':
-            self._qpix_orig = QPixmap(svg_to_image(fig))
+    def _set_fig_key(self, key, owns_fig=False):
+        """Set the key of the figure to paint."""
+        if self._owns_fig and self.fig_key != key:
+            self.store.remove(self.fig_key)
 
-        self._qpix_scaled = self._qpix_orig
-        self.fwidth = self._qpix_orig.width()
-        self.fheight = self._qpix_orig.height()
+        self.fig_key = key
+        self.fmt = self.store.get_format(key)
+        self._owns_fig = owns_fig
+        self._broken_qpix = None
+        if key is not None:
+            self.fwidth, self.fheight = self.store.get_size(key)
 
     def paintEvent(self, event):
         """Qt method override to paint a custom image on the Widget."""
@@ -1477,28 +1520,27 @@ def paintEvent(self, event):
                      self.size().width() - 2 * fw,
                      self.size().height() - 2 * fw)
 
-        if self.fig is None or self._blink_flag:
+        if self.fig_key is None or self._blink_flag:
             return
 
-        # Prepare the scaled qpixmap to paint on the widget.
-        if (self._qpix_scaled is None or
-                self._qpix_scaled.size().width() != rect.width()):
-            if self.fmt in ['image/png', 'image/jpeg']:
-                if scale_factor == 1:
-                    target_width = rect.width()
-                else:
-                    target_width = int(self._qpix_orig.width() * scale_factor)
-                self._qpix_scaled = self._qpix_orig.scaledToWidth(
-                    target_width,
-                    mode=Qt.SmoothTransformation
-                )
-            elif self.fmt == 'image/svg+xml':
-                self._qpix_scaled = QPixmap(svg_to_image(
-                    self.fig, rect.size()))
+        # Get the qpixmap to paint on the widget, which is decoded at this
+        # size only if it's not in the figure store cache.
+        if self._broken_qpix is not None:
+            qpix = self._broken_qpix
+        else:
+            if self.fmt in ['image/png', 'image/jpeg'] and scale_factor != 1:
+                width = int(self.fwidth * scale_factor)
+                height = int(self.fheight * scale_factor)
+            else:
+                width, height = rect.width(), rect.height()
+
+            qpix = self.store.get_pixmap(
+                self.fig_key, width, height, keep_original=self.keep_original
+            )
 
-        if self._qpix_scaled is not None:
+        if qpix is not None:
             # Paint the image on the widget.
             qp = QPainter()
             qp.begin(self)
-            qp.drawPixmap(rect, self._qpix_scaled)
+            qp.drawPixmap(rect, qpix)
             qp.end()
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Figure store
+
+Storage with bounded memory for the figures shown in the Plots plugin.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import logging
+import os
+import os.path as osp
+import tempfile
+import zlib
+
+# Third library imports
+from qtconsole.svg import svg_to_image
+from qtpy.QtCore import QBuffer, QByteArray, QSize, Qt
+from qtpy.QtGui import QImageReader, QPixmap
+from qtpy.QtSvg import QSvgRenderer
+
+
+logger = logging.getLogger(__name__)
+
+# Default memory budgets, in bytes
+DATA_BUDGET = 64 * 1024 ** 2
+PIXMAP_BUDGET = 128 * 1024 ** 2
+
+SVG_FORMAT = 'image/svg+xml'
+
+
+class StoredFigure:
+    """Information about a figure in the store."""
+
+    def __init__(self, fmt, is_text, width, height):
+        self.fmt = fmt
+        self.is_text = is_text
+        self.width = width
+        self.height = height
+        self.path = None
+
+
+class FigureStore:
+    """
+    Storage for the data of figures and the pixmaps they're painted with.
+
+    Figures are kept in memory up to `data_budget` bytes. When that's
+    exceeded, the least recently used ones are moved to files in a temporary
+    directory, compressed if they're SVG figures, and read back when needed.
+
+    Pixmaps are only decoded when figures are painted, at the size they're
+    painted at, and the most recently used ones are cached up to
+    `pixmap_budget` bytes.
+    """
+
+    def __init__(self, data_budget=DATA_BUDGET, pixmap_budget=PIXMAP_BUDGET):
+        self.data_budget = data_budget
+        self.pixmap_budget = pixmap_budget
+
+        self._figures = {}
+        self._next_key = 0
+
+        # Figure data in memory and pixmaps, from the least to the most
+        # recently used
+        self._data = OrderedDict()
+        self._data_size = 0
+        self._pixmaps = OrderedDict()
+        self._pixmaps_size = 0
+
+        self._tempdir = None
+
+    def __len__(self):
+        return len(self._figures)
+
+    def __contains__(self, key):
+        return key in self._figures
+
+    # ---- Figures
+    def add(self, fig, fmt):
+        """Add a figure and return the key to get it."""
+        is_text = isinstance(fig, str)
+        data = fig.encode('utf-8') if is_text else bytes(fig)
+        width, height = self._get_figure_size(data, fmt)
+
+        key = self._next_key
+        self._next_key += 1
+        self._figures[key] = StoredFigure(fmt, is_text, width, height)
+        self._set_data(key, data)
+        return key
+
+    def get(self, key):
+        """Get the data of a figure, or None if it's not in the store."""
+        figure = self._figures.get(key)
+        if figure is None:
+            return None
+
+        data = self._get_data(key)
+        if data is None:
+            return None
+        return data.decode('utf-8') if figure.is_text else data
+
+    def get_format(self, key):
+        """Get the format of a figure."""
+        figure = self._figures.get(key)
+        return None if figure is None else figure.fmt
+
+    def get_size(self, key):
+        """Get the width and height of a figure, without decoding it."""
+        figure = self._figures.get(key)
+        return (0, 0) if figure is None else (figure.width, figure.height)
+
+    def remove(self, key):
+        """Remove a figure and its pixmaps."""
+        figure = self._figures.pop(key, None)
+        if figure is None:
+            return
+
+        data = self._data.pop(key, None)
+        if data is not None:
+            self._data_size -= len(data)
+
+        if figure.path is not None:
+            try:
+                os.remove(figure.path)
+            except OSError:
+                pass
+
+        for pixmap_key in [k for k in self._pixmaps if k[0] == key]:
+            self._pixmaps_size -= self._get_pixmap_size(
+                self._pixmaps.pop(pixmap_key)
+            )
+
+    def clear(self):
+        """Remove all figures."""
+        for key in list(self._figures):
+            self.remove(key)
+
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    # ---- Pixmaps
+    def get_pixmap(self, key, width, height, keep_original=False):
+        """
+        Get a pixmap of a figure with the given size.
+
+        If `keep_original` is True, the pixmap of bitmap figures is scaled from
+        a cached pixmap of their original size, which is faster when the
+        figure is painted at many sizes, as when zooming it.
+        """
+        figure = self._figures.get(key)
+        if figure is None or width <= 0 or height <= 0:
+            return None
+
+        pixmap_key = (key, width, height)
+        pixmap = self._pixmaps.get(pixmap_key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(pixmap_key)
+            return pixmap
+
+        is_original = (width, height) == (figure.width, figure.height)
+        if figure.fmt == SVG_FORMAT:
+            pixmap = QPixmap.fromImage(
+                svg_to_image(self._get_data(key), QSize(width, height))
+            )
+        elif keep_original and not is_original:
+            original = self.get_pixmap(key, figure.width, figure.height)
+            if original is None:
+                return None
+            pixmap = original.scaled(
+                width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+            )
+        else:
+            reader = self._get_image_reader(self._get_data(key), figure.fmt)
+            if not is_original:
+                reader.setScaledSize(QSize(width, height))
+            pixmap = QPixmap.fromImage(reader.read())
+
+        self._pixmaps[pixmap_key] = pixmap
+        self._pixmaps_size += self._get_pixmap_size(pixmap)
+        while (
+            self._pixmaps_size > self.pixmap_budget
+            and len(self._pixmaps) > 1
+        ):
+            __, evicted = self._pixmaps.popitem(last=False)
+            self._pixmaps_size -= self._get_pixmap_size(evicted)
+
+        return pixmap
+
+    # ---- Private API
+    def _get_image_reader(self, data, fmt):
+        """Get a reader for the image in `data`."""
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        reader = QImageReader(buffer, fmt.split('/')[-1].encode())
+
+        # The reader doesn't own its device
+        reader._buffer = buffer
+        return reader
+
+    def _get_figure_size(self, data, fmt):
+        """Get the size of a figure by only reading its header."""
+        if fmt == SVG_FORMAT:
+            size = QSvgRenderer(QByteArray(data)).defaultSize()
+        else:
+            size = self._get_image_reader(data, fmt).size()
+
+        if not size.isValid():
+            return 0, 0
+        return size.width(), size.height()
+
+    def _get_pixmap_size(self, pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def _set_data(self, key, data):
+        """Keep the data of a figure in memory, moving old data to disk."""
+        self._data[key] = data
+        self._data_size += len(data)
+
+        while self._data_size > self.data_budget and len(self._data) > 1:
+            old_key, old_data = self._data.popitem(last=False)
+            self._data_size -= len(old_data)
+            if not self._save_data(old_key, old_data):
+                # Keep it in memory if it can't be saved
+                self._data[old_key] = old_data
+                self._data_size += len(old_data)
+                self._data.move_to_end(old_key, last=False)
+                break
+
+    def _get_data(self, key):
+        """Get the data of a figure, reading it from disk if necessary."""
+        data = self._data.get(key)
+        if data is not None:
+            self._data.move_to_end(key)
+            return data
+
+        figure = self._figures[key]
+        try:
+            with open(figure.path, 'rb') as f:
+                data = f.read()
+        except (OSError, TypeError):
+            logger.debug("Could not read figure %s", key, exc_info=True)
+            return None
+
+        if figure.fmt == SVG_FORMAT:
+            data = zlib.decompress(data)
+
+        self._set_data(key, data)
+        return data
+
+    def _save_data(self, key, data):
+        """Save the data of a figure to disk, if it isn't already."""
+        figure = self._figures[key]
+        if figure.path is not None:
+            return True
+
+        try:
+            if self._tempdir is None:
+                self._tempdir = tempfile.TemporaryDirectory(
+                    prefix='spyder-plots-'
+                )
+
+            path = osp.join(self._tempdir.name, '{}.fig'.format(key))
+            with open(path, 'wb') as f:
+                # Bitmap formats are already compressed
+                if figure.fmt == SVG_FORMAT:
+                    data = zlib.compress(data, 1)
+                f.write(data)
+        except OSError:
+            logger.debug("Could not save figure %s", key, exc_info=True)
+            return False
+
+        figure.path = path
+        return True
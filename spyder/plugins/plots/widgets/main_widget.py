@@ -105,7 +105,7 @@ def get_title(self):
     def get_focus_widget(self):
         widget = self.current_widget()
         if widget and widget.thumbnails_sb.current_thumbnail is not None:
-            if widget.figviewer.figcanvas.fig:
+            if widget.figviewer.figcanvas.fig_key is not None:
                 widget = widget.thumbnails_sb.scrollarea
 
         return widget
@@ -272,7 +272,7 @@ def update_actions(self):
 
         if widget and not self.is_current_widget_error_message():
             figviewer = widget.figviewer
-            value = figviewer.figcanvas.fig is not None
+            value = figviewer.figcanvas.fig_key is not None
 
             widget.set_pane_empty(not value)
             with signals_blocked(self.fit_action):
@@ -355,6 +355,7 @@ def close_widget(self, fig_browser):
         fig_browser.sig_zoom_changed.disconnect(self.zoom_disp.setValue)
         fig_browser.close()
         fig_browser.setParent(None)
+        fig_browser.figure_store.clear()
 
     def switch_widget(self, fig_browser, old_fig_browser):
         option_keys = [
@@ -422,7 +423,11 @@ def copy_image(self):
         context menu in the thumbnails scrollbar into the clipboard.
         """
         widget = self.current_widget()
-        if widget and widget.figviewer and widget.figviewer.figcanvas.fig:
+        if (
+            widget
+            and widget.figviewer
+            and widget.figviewer.figcanvas.fig_key is not None
+        ):
             if self._right_clicked_thumbnail is None:
                 widget.figviewer.figcanvas.copy_figure()
             else:
@@ -22,12 +22,13 @@
 import numpy as np
 from qtpy.QtWidgets import QApplication, QStyle
 from qtpy.QtGui import QPixmap
-from qtpy.QtCore import Qt
+from qtpy.QtCore import QPoint, Qt
 
 # Local imports
 from spyder.plugins.plots.widgets.figurebrowser import (FigureBrowser,
                                                         FigureThumbnail)
 from spyder.plugins.plots.widgets.figurebrowser import get_unique_figname
+from spyder.plugins.plots.widgets.figurestore import FigureStore
 
 
 # =============================================================================
@@ -505,5 +506,78 @@ def test_autofit_figure_viewer(figbrowser, tmpdir, fmt):
             round(figcanvas.width() / fwidth * 100))
 
 
+
+@pytest.mark.parametrize("fmt", ['image/png', 'image/svg+xml'])
+def test_figure_store(tmpdir, fmt):
+    """
+    Test that the figure store moves figures to disk and caches pixmaps
+    within its budgets.
+    """
+    fext = '.svg' if fmt == 'image/svg+xml' else '.png'
+    figs = [
+        create_figure(osp.join(str(tmpdir), 'mplfig' + str(i) + fext))
+        for i in range(4)
+    ]
+    if fmt == 'image/svg+xml':
+        figs = [fig.decode('utf-8') for fig in figs]
+
+    store = FigureStore(data_budget=len(figs[0]) + 1, pixmap_budget=1)
+    keys = [store.add(fig, fmt) for fig in figs]
+
+    # Only the last figure is kept in memory
+    assert list(store._data) == keys[-1:]
+    assert all(store.get(key) == fig for key, fig in zip(keys, figs))
+
+    # Figure sizes are known without decoding them
+    width, height = store.get_size(keys[0])
+    assert width * 2 == height * 3
+    assert not store._pixmaps
+
+    # Pixmaps are decoded at the requested size and the cache is bounded
+    pixmap = store.get_pixmap(keys[0], width // 2, height // 2)
+    assert (pixmap.width(), pixmap.height()) == (width // 2, height // 2)
+    store.get_pixmap(keys[1], width // 2, height // 2)
+    assert list(store._pixmaps) == [(keys[1], width // 2, height // 2)]
+
+    # Removing figures removes their files
+    path = store._figures[keys[0]].path
+    assert osp.isfile(path)
+    store.remove(keys[0])
+    assert not osp.isfile(path)
+    assert store.get(keys[0]) is None
+
+    store.clear()
+    assert len(store) == 0
+
+
+def test_remove_figures_from_store(figbrowser, tmpdir):
+    """Test that closing figures removes them from the figure store."""
+    add_figures_to_browser(figbrowser, 3, tmpdir, 'image/png')
+    store = figbrowser.figure_store
+    assert len(store) == 3
+
+    figbrowser.close_figure()
+    assert len(store) == 2
+
+    figbrowser.close_all_figures()
+    assert len(store) == 0
+
+
+def test_figure_checks_dont_read_figures(figbrowser, tmpdir, mocker):
+    """
+    Test that checking if there's a figure to show doesn't read its data
+    from the figure store.
+    """
+    add_figures_to_browser(figbrowser, 2, tmpdir, 'image/png')
+    store = figbrowser.figure_store
+    mocker.spy(store, 'get')
+    mocker.patch.object(figbrowser.figviewer.figcanvas, 'copy_figure')
+
+    figbrowser.figviewer.show_context_menu(QPoint(0, 0))
+    figbrowser.copy_figure()
+    assert store.get.call_count == 0
+    assert figbrowser.figviewer.figcanvas.copy_figure.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -32,8 +32,33 @@ def setup_page(self):
             step=1
         )
 
+        sampling_cb = self.create_checkbox(
+            _("Sample code instead of tracing all function calls"),
+            "sampling",
+            tip=_(
+                "Sampling has a much lower overhead for long running code "
+                "and shows partial results while profiling, but it doesn't "
+                "count calls and misses very short ones."
+            ),
+        )
+
+        sampling_spin = self.create_spinbox(
+            _("Sampling interval"),
+            _("ms"),
+            'sampling_interval',
+            min_=1,
+            max_=1000,
+            step=1
+        )
+        for widget in [sampling_spin.plabel, sampling_spin.spinbox,
+                       sampling_spin.slabel]:
+            sampling_cb.checkbox.toggled.connect(widget.setEnabled)
+            widget.setEnabled(self.get_option('sampling'))
+
         vlayout = QVBoxLayout()
         vlayout.addWidget(switch_to_plugin_cb)
         vlayout.addWidget(slow_spin)
+        vlayout.addWidget(sampling_cb)
+        vlayout.addWidget(sampling_spin)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
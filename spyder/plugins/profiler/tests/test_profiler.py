@@ -9,23 +9,56 @@
 """
 
 
+# Standard library imports
+import cProfile
+
 # Third party imports
 import pytest
+from spyder_kernels.utils.profiling import SamplingProfiler
 
 # Local imports
-from spyder.plugins.profiler.widgets.profiler_data_tree import TreeWidgetItem
+from spyder.plugins.profiler.widgets.profiler_data_tree import (
+    ProfilerSubWidget,
+    ProfilerTreeItem,
+)
 from spyder.utils.palette import SpyderPalette
 
 
 ERROR = SpyderPalette.COLOR_ERROR_1
 SUCESS = SpyderPalette.COLOR_SUCCESS_1
 
+CODE = """
+def busy(n):
+    s = 0
+    for i in range(n):
+        s += i
+    return s
+
+def f():
+    busy(200_000)
+    g()
+
+def g():
+    busy(100_000)
+
+f()
+"""
+
+
+# --- Fixtures
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def profiler_widget(qtbot):
+    widget = ProfilerSubWidget()
+    qtbot.addWidget(widget)
+    return widget
+
 
 # --- Tests
 # -----------------------------------------------------------------------------
 def test_format_measure():
     """ Test ProfilerDataTree.format_measure()."""
-    fm = TreeWidgetItem.format_measure
+    fm = ProfilerTreeItem.format_measure
     assert fm(125) == '125'
     assert fm(1.25e-8) == '12.50 ns'
     assert fm(1.25e-5) == u'12.50 \u03BCs'
@@ -45,7 +78,7 @@ def test_format_measure():
 
 def test_color_string():
     """ Test ProfilerDataTree.color_diff()."""
-    cs = TreeWidgetItem.color_diff
+    cs = ProfilerTreeItem.color_diff
     assert cs(0.) == ('', 'black')
     assert cs(1.) == ('+1000.00 ms', ERROR)
     assert cs(-1.) == ('-1000.00 ms', SUCESS)
@@ -54,5 +87,58 @@ def test_color_string():
     assert cs(-1) == ('-1', SUCESS)
 
 
+def test_lazy_tree(profiler_widget, tmpdir):
+    """Test that tree items are only created when expanded."""
+    filename = str(tmpdir.join("profile.prof"))
+    namespace = {}
+    cProfile.runctx(
+        compile(CODE, "<test>", "exec"), namespace, namespace, filename
+    )
+    with open(filename, "rb") as f:
+        profiler_widget.show_profile_buffer(f.read(), [])
+
+    data_tree = profiler_widget.data_tree
+    model = data_tree.model()
+
+    # Only f is called by the module
+    items = data_tree.get_items(2)
+    assert [item.function_name for item in items] == ["f"]
+    assert items[0].children is None
+    assert model.hasChildren(model.item_index(items[0]))
+
+    # Expanding the tree creates children, sorted by total time
+    data_tree.change_view(1)
+    items = data_tree.get_items(1)
+    assert [item.function_name for item in items[1:]] == ["busy", "g"]
+    assert model.rowCount(model.item_index(items[0])) == 2
+
+    # Items can be selected
+    data_tree.setCurrentItem(items[2])
+    assert data_tree.currentItem() is items[2]
+    assert model.data(model.item_index(items[2], 7)) == "<test> : 12"
+
+
+def test_sampled_data(profiler_widget):
+    """Test that partial results sent while sampling code are shown."""
+    chunks = []
+    profiler = SamplingProfiler(
+        interval=0.001, callback=chunks.append, flush_interval=0.01
+    )
+    namespace = {}
+    profiler.runctx(compile(CODE, "<test>", "exec"), namespace, namespace)
+    assert chunks
+
+    for chunk in chunks:
+        profiler_widget.update_profile_data(chunk)
+
+    data_tree = profiler_widget.data_tree
+    assert [item.function_name for item in data_tree.get_items(0)] == ["f"]
+
+    # The first chunk of a new run replaces previous results
+    profiler_widget.update_profile_data(chunks[0])
+    sampled_stacks = profiler_widget._sampled_stacks
+    assert sum(sampled_stacks.counts) == sum(chunks[0]["counts"])
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -464,6 +464,10 @@ def create_new_widget(self, shellwidget):
         shellwidget.register_kernel_call_handler(
             "start_profiling", self._start_profiling
         )
+        shellwidget.register_kernel_call_handler(
+            "update_profile_data", widget.update_profile_data
+        )
+        shellwidget.sig_config_spyder_kernel.connect(widget.on_config_kernel)
         widget.on_kernel_ready_callback = functools.partial(
             self._on_kernel_ready, widget
         )
@@ -483,6 +487,12 @@ def close_widget(self, widget):
         # Unregister
         widget.shellwidget.unregister_kernel_call_handler("show_profile_file")
         widget.shellwidget.unregister_kernel_call_handler("start_profiling")
+        widget.shellwidget.unregister_kernel_call_handler(
+            "update_profile_data"
+        )
+        widget.shellwidget.sig_config_spyder_kernel.disconnect(
+            widget.on_config_kernel
+        )
         widget.shellwidget.sig_kernel_is_ready.disconnect(
             widget.on_kernel_ready_callback
         )
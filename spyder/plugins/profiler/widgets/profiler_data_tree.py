@@ -22,24 +22,19 @@
 import textwrap
 
 # Third party imports
-from qtpy.QtCore import Qt, Signal
+from qtpy.QtCore import QAbstractItemModel, QModelIndex, Qt, Signal
 from qtpy.QtGui import QColor
-from qtpy.QtWidgets import (
-    QMessageBox,
-    QTreeWidget,
-    QTreeWidgetItem,
-    QVBoxLayout,
-    QWidget,
-)
+from qtpy.QtWidgets import QMessageBox, QTreeView, QVBoxLayout, QWidget
+from spyder_kernels.utils.profiling import SampledStacks
 
 # Local imports
+from spyder.api.config.decorators import on_conf_change
 from spyder.api.config.mixins import SpyderConfigurationAccessor
 from spyder.api.shellconnect.mixins import ShellConnectWidgetForStackMixin
 from spyder.api.translations import _
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.utils.icon_manager import ima
 from spyder.utils.palette import SpyderPalette
-from spyder.utils.qthelpers import set_item_user_text
 from spyder.widgets.helperwidgets import FinderWidget
 
 
@@ -72,6 +67,8 @@ class ProfilerSubWidget(
 ):
     """Profiler widget for shellwidget"""
 
+    CONF_SECTION = 'profiler'
+
     # Signals
     sig_display_requested = Signal(object)
     sig_hide_finder_requested = Signal()
@@ -87,6 +84,10 @@ def __init__(self, parent=None):
         self.is_profiling = False
         self.recreate_custom_view = False
         self.on_kernel_ready_callback: Callable | None = None
+        self.shellwidget = None
+
+        # Stacks sampled by the kernel while profiling
+        self._sampled_stacks: SampledStacks | None = None
 
         self.setup()
 
@@ -155,6 +156,7 @@ def show_profile_buffer(self, prof_buffer, lib_pathlist):
 
         # If we're going to show results, profiling has stopped
         self.is_profiling = False
+        self._sampled_stacks = None
 
         tmp_dir = None
         if sys.platform.startswith('linux'):
@@ -178,9 +180,37 @@ def show_profile_buffer(self, prof_buffer, lib_pathlist):
         self.data_tree._show_tree()
         self.sig_display_requested.emit(self)
 
+    def update_profile_data(self, chunk):
+        """Show the partial results sent by the kernel while sampling code."""
+        if chunk["first"] or self._sampled_stacks is None:
+            self._sampled_stacks = SampledStacks()
+        self._sampled_stacks.add_chunk(chunk)
+
+        self.data_tree.load_sampled_data(self._sampled_stacks)
+        if self.data_tree.profdata is None:
+            return
+
+        self.set_pane_empty(False)
+        self._reset()
+
     def set_context_menu(self, menu):
         self.data_tree.menu = menu
 
+    def on_config_kernel(self):
+        """Send profiler configuration to the kernel."""
+        self.shellwidget.set_kernel_configuration(
+            "profiler",
+            {
+                "sampling": self.get_conf("sampling"),
+                "sampling_interval": self.get_conf("sampling_interval"),
+            }
+        )
+
+    @on_conf_change(option=["sampling", "sampling_interval"])
+    def on_sampling_option_update(self, option, value):
+        if self.shellwidget is not None:
+            self.on_config_kernel()
+
     # ---- ProfilerDataTree API
     # -------------------------------------------------------------------------
     @property
@@ -252,98 +282,48 @@ def _reset(self):
             self.data_tree._show_tree()
 
 
-class TreeWidgetItem(QTreeWidgetItem):
-    """Item to show in the tree. It represent a function call."""
-    def __init__(self, parent, item_key, profile_data, compare_data, icon_list,
-                 index_dict):
-        QTreeWidgetItem.__init__(self, parent)
+class ProfilerTreeItem:
+    """
+    Item to show in the tree. It represent a function call.
 
+    Items are plain Python objects, which are much lighter than Qt items, and
+    their children are only created when they are expanded.
+    """
+
+    def __init__(self, parent, item_key, profile_data, compare_data):
+        self.parent_item = parent
         self.item_key = item_key
-        self.index_dict = index_dict
+        self.row = 0
+
+        # Keys of the children to create when expanding this item, and
+        # children already created.
+        self.children_keys = []
+        self.children = None
 
         # Order is from profile data
         self.total_calls, self.local_time, self.total_time = profile_data[1:4]
         (
-            filename,
-            line_number,
-            function_name,
-            file_and_line,
-            node_type,
+            self.filename,
+            self.line_number,
+            self.function_name,
+            self.file_and_line,
+            self.node_type,
         ) = self.function_info(item_key)
+        self.recursive = self.is_recursive()
 
-        self.function_name = function_name
-        self.filename = filename
-        self.line_number = line_number
-
-        self.set_item_data(filename, line_number)
-        self.setIcon(self.index_dict["function_name"], icon_list[node_type])
-        self.set_tooltips()
-
-        data = {
-            "function_name": function_name,
-            "total_time": self.format_measure(self.total_time),
-            "local_time": self.format_measure(self.local_time),
-            "number_calls": self.format_measure(self.total_calls),
-            "file:line": file_and_line
-        }
-        self.set_data(data)
-        alignment = {
-            "total_time": Qt.AlignRight,
-            "local_time": Qt.AlignRight,
-            "number_calls": Qt.AlignRight,
-        }
-        self.set_alignment(alignment)
-
-        if self.is_recursive():
-            self.setData(
-                self.index_dict["file:line"],
-                Qt.DisplayRole,
-                "(%s)" % _("recursion"),
-            )
-            self.setDisabled(True)
-
-        if compare_data is None:
-            return
-
-        diff_data = {}
-        diff_colors = {}
         # Keep same order as profile data
-        compare_keys = [
-            "unused",
-            "number_calls_diff",
-            "local_time_diff",
-            "total_time_diff"
-        ]
-        for i in range(1, 4):
-            diff_str, color = self.color_diff(
-                profile_data[i] - compare_data[i]
-            )
-            diff_data[compare_keys[i]] = diff_str
-            diff_colors[compare_keys[i]] = color
-
-        self.set_data(diff_data)
-        self.set_color(diff_colors)
-        diff_alignment = {
-            "total_time_diff": Qt.AlignLeft,
-            "local_time_diff": Qt.AlignLeft,
-            "number_calls_diff": Qt.AlignLeft
-        }
-        self.set_alignment(diff_alignment)
-
-    def set_data(self, data):
-        """Set data in columns."""
-        for k, v in data.items():
-            self.setData(self.index_dict[k], Qt.DisplayRole, v)
-
-    def set_color(self, colors):
-        """Set colors"""
-        for k, v in colors.items():
-            self.setForeground(self.index_dict[k], QColor(v))
-
-    def set_alignment(self, alignment):
-        """Set alignment."""
-        for k, v in alignment.items():
-            self.setTextAlignment(self.index_dict[k], v)
+        self.diffs = None
+        if compare_data is not None:
+            self.diffs = {
+                key: self.color_diff(profile_data[i] - compare_data[i])
+                for i, key in [
+                    (1, "number_calls_diff"),
+                    (2, "local_time_diff"),
+                    (3, "total_time_diff"),
+                ]
+            }
+
+        self._texts = {}
 
     @staticmethod
     def color_diff(difference):
@@ -357,7 +337,7 @@ def color_diff(difference):
                 else (SpyderPalette.COLOR_ERROR_1, '+')
             )
             diff_str = '{}{}'.format(
-                sign, TreeWidgetItem.format_measure(difference)
+                sign, ProfilerTreeItem.format_measure(difference)
             )
         return diff_str, color
 
@@ -393,24 +373,42 @@ def format_measure(measure):
             measure = u"{0:.0f}h:{1:.0f}min".format(h, m)
         return measure
 
-    def __lt__(self, otherItem):
-        column = self.treeWidget().sortColumn()
-        try:
-            if column == self.index_dict["total_time"]:
-                return self.total_time > otherItem.total_time
-            if column == self.index_dict["local_time"]:
-                return self.local_time > otherItem.local_time
-
-            return float(self.text(column)) > float(otherItem.text(column))
-        except ValueError:
-            return self.text(column) > otherItem.text(column)
-
-    def set_item_data(self, filename, line_number):
-        """Set tree item user data: filename (string) and line_number (int)"""
-        # separator between filename and linenumber
-        SEP = r"<[=]>"
-        # (must be improbable as a filename)
-        set_item_user_text(self, '%s%s%d' % (filename, SEP, line_number))
+    def text(self, column_name):
+        """Text to show in a column."""
+        text = self._texts.get(column_name)
+        if text is not None:
+            return text
+
+        if column_name == "function_name":
+            text = self.function_name
+        elif column_name == "total_time":
+            text = self.format_measure(self.total_time)
+        elif column_name == "local_time":
+            text = self.format_measure(self.local_time)
+        elif column_name == "number_calls":
+            text = self.format_measure(self.total_calls)
+        elif column_name == "file:line":
+            if self.recursive:
+                text = "(%s)" % _("recursion")
+            else:
+                text = self.file_and_line
+        elif self.diffs is not None and column_name in self.diffs:
+            text = self.diffs[column_name][0]
+        else:
+            text = ""
+
+        self._texts[column_name] = text
+        return text
+
+    def sort_key(self, column_name):
+        """Value used to sort items by a column."""
+        if column_name == "total_time":
+            return self.total_time
+        if column_name == "local_time":
+            return self.local_time
+        if column_name == "number_calls":
+            return self.total_calls
+        return self.text(column_name)
 
     def function_info(self, functionKey):
         """Returns processed information about the function's name and file."""
@@ -436,7 +434,7 @@ def function_info(self, functionKey):
 
     def is_recursive(self):
         """Returns True is a function is a descendant of itself."""
-        ancestor = self.parent()
+        ancestor = self.parent_item
         while ancestor:
             if (
                 self.function_name == ancestor.function_name
@@ -445,25 +443,222 @@ def is_recursive(self):
             ):
                 return True
             else:
-                ancestor = ancestor.parent()
+                ancestor = ancestor.parent_item
         return False
 
-    def set_tooltips(self):
-        """Set item tooltips."""
-        self.setToolTip(self.index_dict["function_name"], self.function_name)
+    def has_children(self):
+        """Check if this item has or will have children."""
+        if self.children is not None:
+            return bool(self.children)
+        return not self.recursive and bool(self.children_keys)
+
+    def tooltip(self, column_name):
+        """Tooltip to show in a column."""
+        if column_name == "function_name":
+            return self.function_name
+
+        if column_name == "file:line":
+            if not self.filename or self.filename == '~':
+                return "(built-in)"
+            return f"{self.filename}:{self.line_number}"
+
+        return None
+
+
+class ProfilerTreeModel(QAbstractItemModel):
+    """
+    Model for the profiler tree.
+
+    Children of items are created by `create_items` when the view fetches
+    them, i.e. when items are expanded.
+    """
+
+    def __init__(self, parent, header_list, index_dict, icon_list,
+                 header_tooltips, create_items):
+        QAbstractItemModel.__init__(self, parent)
+        self.header_list = header_list
+        self.column_names = {
+            column: name for name, column in index_dict.items()
+        }
+        self.icon_list = icon_list
+        self.header_tooltips = header_tooltips
+        self.create_items = create_items
+        self.items = []
+
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+        self._header_icon = ima.icon('question_tip_hover')
+        self._alignments = {
+            "total_time": int(Qt.AlignRight | Qt.AlignVCenter),
+            "local_time": int(Qt.AlignRight | Qt.AlignVCenter),
+            "number_calls": int(Qt.AlignRight | Qt.AlignVCenter),
+            "total_time_diff": int(Qt.AlignLeft | Qt.AlignVCenter),
+            "local_time_diff": int(Qt.AlignLeft | Qt.AlignVCenter),
+            "number_calls_diff": int(Qt.AlignLeft | Qt.AlignVCenter),
+        }
+
+    def set_items(self, items):
+        """Set the top level items."""
+        self.beginResetModel()
+        self.items = items
+        self._sort_items(self.items)
+        self.endResetModel()
+
+    def item_index(self, item, column=0):
+        """Get the index of an item."""
+        if item is None:
+            return QModelIndex()
+        return self.createIndex(item.row, column, item)
+
+    def _get_children(self, parent):
+        """Get the children of an index."""
+        if not parent.isValid():
+            return self.items
+        return parent.internalPointer().children or []
+
+    # ---- Qt methods
+    # -------------------------------------------------------------------------
+    def index(self, row, column, parent=QModelIndex()):
+        children = self._get_children(parent)
+        if 0 <= row < len(children) and 0 <= column < len(self.header_list):
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_item = index.internalPointer().parent_item
+        return self.item_index(parent_item)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._get_children(parent))
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.header_list)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.items)
+        return parent.internalPointer().has_children()
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+        item = parent.internalPointer()
+        return item.children is None and item.has_children()
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+
+        item = parent.internalPointer()
+        children = self.create_items(item, item.children_keys)
+        self._sort_items(children)
 
-        if not self.filename or self.filename == '~':
-            fname_tip = "(built-in)"
+        if children:
+            self.beginInsertRows(parent, 0, len(children) - 1)
+            item.children = children
+            self.endInsertRows()
         else:
-            fname_tip = f"{self.filename}:{self.line_number}"
+            item.children = children
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalPointer().recursive:
+            return Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        item = index.internalPointer()
+        column_name = self.column_names[index.column()]
+
+        if role == Qt.DisplayRole:
+            return item.text(column_name)
+        elif role == Qt.DecorationRole:
+            if column_name == "function_name":
+                return self.icon_list[item.node_type]
+        elif role == Qt.ToolTipRole:
+            return item.tooltip(column_name)
+        elif role == Qt.TextAlignmentRole:
+            return self._alignments.get(column_name)
+        elif role == Qt.ForegroundRole:
+            if item.diffs is not None and column_name in item.diffs:
+                diff_str, color = item.diffs[column_name]
+                if diff_str:
+                    return QColor(color)
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+
+        column_name = self.column_names[section]
+        if role == Qt.DisplayRole:
+            return self.header_list[section]
+        elif role == Qt.ToolTipRole:
+            return self.header_tooltips.get(column_name)
+        elif role == Qt.DecorationRole:
+            if column_name in self.header_tooltips:
+                return self._header_icon
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_items = [
+            (index.internalPointer(), index.column()) for index in old_indexes
+        ]
+
+        pending = [self.items]
+        while pending:
+            items = pending.pop()
+            self._sort_items(items)
+            pending.extend(
+                item.children for item in items if item.children
+            )
 
-        self.setToolTip(self.index_dict["file:line"], fname_tip)
+        self.changePersistentIndexList(
+            old_indexes,
+            [
+                self.item_index(item, column) if item is not None
+                else QModelIndex()
+                for item, column in old_items
+            ]
+        )
+        self.layoutChanged.emit()
 
+    def _sort_items(self, items):
+        """
+        Sort items in place by the current sort column.
 
-class ProfilerDataTree(SpyderConfigurationAccessor, QTreeWidget):
+        Items are shown from the largest to the smallest value in ascending
+        order, so that the slowest functions come first.
+        """
+        if self._sort_column is not None:
+            column_name = self.column_names[self._sort_column]
+            items.sort(
+                key=lambda item: item.sort_key(column_name),
+                reverse=self._sort_order == Qt.AscendingOrder,
+            )
+
+        for row, item in enumerate(items):
+            item.row = row
+
+
+class ProfilerDataTree(SpyderConfigurationAccessor, QTreeView):
     """
-    Convenience tree widget (with built-in model)
-    to store and view profiler data.
+    Convenience tree view to store and view profiler data.
 
     The quantities calculated by the profiler are as follows
     (from profile.Profile):
@@ -490,7 +685,7 @@ class ProfilerDataTree(SpyderConfigurationAccessor, QTreeWidget):
     sig_refresh = Signal()
 
     def __init__(self, parent=None):
-        QTreeWidget.__init__(self, parent)
+        QTreeView.__init__(self, parent)
 
         self.header_list = [
             _("Function/Module"),
@@ -519,7 +714,6 @@ def __init__(self, parent=None):
             "file:line": 7
         }
         self.profdata = None   # To be filled by self.load_data()
-        self.items_to_be_shown = None
         self.current_view_depth = None
         self.compare_data = None
         self.inverted_tree = False
@@ -529,15 +723,32 @@ def __init__(self, parent=None):
         self.root_key = None
         self.menu = None
         self._last_children = None
-        self.setColumnCount(len(self.header_list))
-        self.setHeaderLabels(self.header_list)
-        self.initialize_view()
-        self.itemExpanded.connect(self.item_expanded)
-        self.lib_pathlist = None
+        self._lib_pathlist = None
+        self._builtin_paths = {}
         self.history = []
         self.redo_history = []
 
-        self.set_tooltips()
+        self._model = ProfilerTreeModel(
+            self,
+            self.header_list,
+            self.index_dict,
+            self.icon_list,
+            self.get_tooltips(),
+            self._create_items,
+        )
+        self.setModel(self._model)
+        self.setUniformRowHeights(True)
+        self.expanded.connect(self.item_expanded)
+        self.initialize_view()
+
+    @property
+    def lib_pathlist(self):
+        return self._lib_pathlist
+
+    @lib_pathlist.setter
+    def lib_pathlist(self, lib_pathlist):
+        self._lib_pathlist = lib_pathlist
+        self._builtin_paths = {}
 
     def contextMenuEvent(self, event):
         """Reimplement Qt method"""
@@ -549,8 +760,7 @@ def contextMenuEvent(self, event):
 
     def initialize_view(self):
         """Clean the tree and view parameters"""
-        self.clear()
-        self.items_to_be_shown = {}
+        self._model.set_items([])
         self.current_view_depth = 0
         if (
             self.compare_data is not None
@@ -578,6 +788,19 @@ def load_data(self, profdatafile):
             self.profdata = None
             return
 
+    def load_sampled_data(self, sampled_stacks):
+        """Load profiler data from stacks sampled by the kernel."""
+        self.history = []
+        self.redo_history = []
+        if sampled_stacks.is_empty():
+            return
+        import pstats
+
+        sampled_stacks.create_stats()
+        self.profdata = pstats.Stats(sampled_stacks)
+        self.profdata.calc_callees()
+        self.root_key = self.find_root()
+
     def compare(self, filename):
         """Load compare file."""
         if filename is None:
@@ -644,15 +867,26 @@ def is_builtin(self, key):
         if path.startswith("<"):
             return True
 
-        path = os.path.normcase(os.path.normpath(path))
+        is_builtin = self._builtin_paths.get(path)
+        if is_builtin is not None:
+            return is_builtin
+
+        is_builtin = False
+        norm_path = os.path.normcase(os.path.normpath(path))
         if self.lib_pathlist is not None:
             for libpath in self.lib_pathlist:
                 libpath = os.path.normcase(os.path.normpath(libpath))
-                commonpath = os.path.commonpath([libpath, path])
+                try:
+                    commonpath = os.path.commonpath([libpath, norm_path])
+                except ValueError:
+                    # Paths on different drives
+                    continue
                 if libpath == commonpath:
-                    return True
+                    is_builtin = True
+                    break
 
-        return False
+        self._builtin_paths[path] = is_builtin
+        return is_builtin
 
     def find_children(self, parent):
         """Find all functions called by (parent) function."""
@@ -736,6 +970,21 @@ def redo(self):
         if len(self.redo_history) > 0:
             self._show_tree(self.redo_history.pop(-1), reset_redo=False)
 
+    def currentItem(self):
+        """Get the current item."""
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def setCurrentItem(self, item):
+        """Set the current item."""
+        self.setCurrentIndex(self._model.item_index(item))
+
+    def sortColumn(self):
+        """Get the column used to sort items."""
+        return self.header().sortIndicatorSection()
+
     def _show_tree(
         self,
         children=None,
@@ -750,6 +999,12 @@ def _show_tree(
 
         self._last_children = children
 
+        if self.root_key is None:
+            # No function was profiled
+            self.initialize_view()
+            self.sig_refresh.emit()
+            return
+
         # List of frames to hide at the top
         head_list = [self.root_key, ]
         head_list += list(
@@ -799,39 +1054,32 @@ def _show_tree(
                     self.redo_history = []
 
             # Populate the tree
-            self.populate_tree(self, children)
+            self._model.set_items(self._create_items(None, children))
             self.setSortingEnabled(True)
-            self.sortItems(self.index_dict[sort_time], Qt.AscendingOrder)
+            self.sortByColumn(self.index_dict[sort_time], Qt.AscendingOrder)
             self.resizeColumnToContents(0)
 
         self.sig_refresh.emit()
 
-    def populate_tree(self, parentItem, children_list):
-        """
-        Recursive method to create each item (and associated data)
-        in the tree.
-        """
-        children_list = [
-            c for c in children_list if c not in self.FUNCTIONS_TO_EXCLUDE
-        ]
-
+    def _create_items(self, parent_item, children_list):
+        """Create the items (and associated data) of a list of functions."""
+        items = []
         for child_key in children_list:
+            if child_key in self.FUNCTIONS_TO_EXCLUDE:
+                continue
+
             item_profdata, item_compdata = self.get_item_data(child_key)
-            child_item = TreeWidgetItem(
-                parentItem,
+            child_item = ProfilerTreeItem(
+                parent_item,
                 child_key,
                 item_profdata,
                 item_compdata,
-                self.icon_list,
-                self.index_dict
             )
-            if not child_item.is_recursive():
-                grandchildren_list = self.find_children(child_key)
-                if grandchildren_list:
-                    child_item.setChildIndicatorPolicy(
-                        QTreeWidgetItem.ShowIndicator
-                    )
-                    self.items_to_be_shown[id(child_item)] = grandchildren_list
+            if not child_item.recursive:
+                child_item.children_keys = self.find_children(child_key)
+            items.append(child_item)
+
+        return items
 
     def get_item_data(self, item_key):
         """Return the profile and compare data for the item_key."""
@@ -843,16 +1091,14 @@ def get_item_data(self, item_key):
             )
         return item_profdata, item_compdata
 
-    def item_expanded(self, item):
+    def item_expanded(self, index):
         """Fill item children."""
-        if item.childCount() == 0 and id(item) in self.items_to_be_shown:
-            children_list = self.items_to_be_shown[id(item)]
-            self.populate_tree(item, children_list)
+        if self._model.canFetchMore(index):
+            self._model.fetchMore(index)
 
     def get_top_level_items(self):
         """Iterate over top level items."""
-        return [self.topLevelItem(_i)
-                for _i in range(self.topLevelItemCount())]
+        return list(self._model.items)
 
     def get_items(self, maxlevel):
         """Return all items with a level <= `maxlevel`"""
@@ -860,8 +1106,7 @@ def get_items(self, maxlevel):
 
         def add_to_itemlist(item, maxlevel, level=1):
             level += 1
-            for index in range(item.childCount()):
-                citem = item.child(index)
+            for citem in item.children or []:
                 itemlist.append(citem)
                 if level <= maxlevel:
                     add_to_itemlist(citem, maxlevel, level)
@@ -883,10 +1128,12 @@ def change_view(self, change_in_depth):
         self.collapseAll()
         if self.current_view_depth > 0:
             for item in self.get_items(maxlevel=self.current_view_depth-1):
-                item.setExpanded(True)
+                index = self._model.item_index(item)
+                self.item_expanded(index)
+                self.expand(index)
 
-    def set_tooltips(self):
-        """Set tooltips."""
+    def get_tooltips(self):
+        """Get header tooltips."""
         tooltips = {
             "function_name": _('Function or module name'),
             "total_time": _(
@@ -899,12 +1146,7 @@ def set_tooltips(self):
             "file:line": _('File and line where the function is defined')
         }
 
-        for column_name, tip_text in tooltips.items():
-            self.headerItem().setIcon(
-                self.index_dict[column_name], ima.icon('question_tip_hover')
-            )
-
-            tip_text = '\n'.join(textwrap.wrap(tip_text, 50))
-            self.headerItem().setToolTip(
-                self.index_dict[column_name], tip_text
-            )
+        return {
+            column_name: '\n'.join(textwrap.wrap(tip_text, 50))
+            for column_name, tip_text in tooltips.items()
+        }
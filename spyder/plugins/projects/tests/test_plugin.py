@@ -21,6 +21,7 @@
 # Third party imports
 import pytest
 from flaky import flaky
+from lsprotocol import types as lsp
 
 # Local imports
 from spyder.app.cli_options import get_options
@@ -468,6 +469,45 @@ def test_filesystem_notifications(qtbot, projects, tmpdir):
         png_file.write("")
 
 
+def test_batched_filesystem_notifications(projects, tmpdir, mocker):
+    """
+    Test that the LSP is notified of every change in a folder with too many
+    of them, and that switcher paths are updated once per batch of events.
+    """
+    widget = projects.get_widget()
+    widget.completions_available = True
+    mocker.patch.object(widget, 'emit_request')
+    mocker.patch.object(widget, '_update_default_switcher_paths')
+
+    watcher = widget.watcher
+    watcher._coalescer.folder_threshold = 3
+    folder = tmpdir.mkdir('folder')
+    other_file = str(tmpdir.join('other.py'))
+
+    watcher.on_created(str(folder.join('a.py')), False)
+    watcher.on_deleted(str(folder.join('b.py')), False)
+    watcher.on_modified(str(folder.join('c.py')), False)
+    watcher.on_created(str(folder.join('d')), True)
+    watcher.on_created(other_file, False)
+    watcher._emit_events()
+
+    assert widget.emit_request.call_count == 2
+    method, params, __ = widget.emit_request.call_args_list[0][0]
+    assert method == lsp.WORKSPACE_DID_CHANGE_WATCHED_FILES
+    assert params['params'] == [
+        {'file': str(folder.join('a.py')), 'kind': lsp.FileChangeType.Created},
+        {'file': str(folder.join('b.py')), 'kind': lsp.FileChangeType.Deleted},
+        {'file': str(folder.join('c.py')), 'kind': lsp.FileChangeType.Changed},
+    ]
+
+    method, params, __ = widget.emit_request.call_args_list[1][0]
+    assert params['params'] == [
+        {'file': other_file, 'kind': lsp.FileChangeType.Created}
+    ]
+
+    assert widget._update_default_switcher_paths.call_count == 1
+
+
 def test_loaded_and_closed_signals(create_projects, tmpdir, mocker, qtbot):
     """
     Test that loaded and closed signals are emitted when switching
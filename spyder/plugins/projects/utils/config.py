@@ -26,6 +26,7 @@
       'save_data_on_exit': True,
       'save_history': True,
       'save_non_project_files': False,
+      'watcher_backend': 'auto',
       }
      ),
     (CODESTYLE,
@@ -59,6 +60,7 @@
             'save_data_on_exit',
             'save_history',
             'save_non_project_files',
+            'watcher_backend',
             ],
          ),
     ],
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the workspace watcher.
+"""
+
+# Standard library imports
+import os.path as osp
+import sys
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils.watcher import (
+    EventCoalescer, WorkspaceWatcher, get_observer_backend, ignore_path)
+
+
+def test_event_coalescer():
+    """Test that events are coalesced as expected."""
+    coalescer = EventCoalescer(folder_threshold=3)
+    folder = osp.join('root', 'folder')
+    file0 = osp.join('root', 'file0.py')
+    file1 = osp.join('root', 'file1.py')
+    file2 = osp.join('root', 'file2.py')
+
+    coalescer.add_event('created', file0, False)
+    coalescer.add_event('modified', file0, False)
+    coalescer.add_event('created', file1, False)
+    coalescer.add_event('deleted', file1, False)
+    coalescer.add_event('deleted', file2, False)
+    coalescer.add_event('created', file2, False)
+    coalescer.add_event('moved', file0, False, dest_path=file1)
+
+    assert coalescer.pop_events() == [
+        ('created', (file0, False)),
+        ('modified', (file2, False)),
+        ('moved', (file0, file1, False)),
+    ]
+    assert not coalescer
+
+    # Too many events in the same folder are reported as a single one
+    for i in range(3):
+        coalescer.add_event('created', osp.join(folder, f'{i}.py'), False)
+    coalescer.add_event('modified', file0, False)
+
+    assert coalescer.pop_events() == [
+        ('folder_changed', (folder, [
+            ('created', osp.join(folder, f'{i}.py'), False)
+            for i in range(3)
+        ])),
+        ('modified', (file0, False)),
+    ]
+
+
+def test_ignore_path():
+    """Test that only parts inside the root path are checked."""
+    root = osp.join('home', '.hidden', 'project')
+    assert not ignore_path(osp.join(root, 'file.py'), root)
+    assert ignore_path(osp.join(root, '.git', 'index'), root)
+    assert ignore_path(osp.join(root, '__pycache__', 'file.pyc'), root)
+
+
+def test_get_observer_backend():
+    """Test the observer backend selected for each option."""
+    assert get_observer_backend('polling') == 'polling'
+    assert get_observer_backend('unknown') == get_observer_backend('auto')
+    if sys.platform.startswith('linux'):
+        assert get_observer_backend('native') == 'native'
+    else:
+        assert get_observer_backend('native') == 'polling'
+
+
+@pytest.mark.parametrize('backend', ['native', 'polling'])
+def test_workspace_watcher(qtbot, tmp_path, backend):
+    """Test that events are coalesced and emitted by the watcher."""
+    watcher = WorkspaceWatcher()
+    watcher.start(str(tmp_path), backend=backend)
+    git_folder = tmp_path / '.git'
+    git_folder.mkdir()
+
+    try:
+        file0 = tmp_path / 'file0.py'
+        with qtbot.waitSignal(watcher.sig_file_created,
+                              timeout=10000) as blocker:
+            file0.write_text('')
+            file0.write_text('a = 1')
+            (git_folder / 'index.py').write_text('')
+
+        assert blocker.args == [str(file0), False]
+
+        with qtbot.waitSignal(watcher.sig_file_deleted,
+                              timeout=10000) as blocker:
+            file0.unlink()
+
+        assert blocker.args == [str(file0), False]
+    finally:
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    pytest.main()
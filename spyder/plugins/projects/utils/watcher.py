@@ -7,16 +7,25 @@
 """Watcher to detect filesystem changes in the project's directory."""
 
 # Standard lib imports
+from functools import partial
 import os
 import logging
 from pathlib import Path
+import sys
+import time
 
 # Third-party imports
-from qtpy.QtCore import QObject, Signal
-from superqt.utils import qthrottled
+from qtpy.QtCore import QObject, QTimer, Signal
 import watchdog
 from watchdog.events import FileSystemEventHandler, PatternMatchingEventHandler
-from watchdog.observers.polling import PollingObserverVFS
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingEmitter
+
+try:
+    from watchdog.observers.inotify import InotifyObserver
+except ImportError:
+    # Not available on other OSes than Linux
+    InotifyObserver = None
 
 # Local imports
 from spyder.config.utils import EDIT_EXTENSIONS
@@ -31,6 +40,20 @@
     "build",
 ]
 
+# Observer backends that can be selected per project
+WATCHER_BACKENDS = ["auto", "native", "polling"]
+
+# Time in ms to collect events before emitting them
+EVENTS_TIMEOUT = 200
+
+# Number of events in the same folder after which they are reported as a
+# single change to that folder (e.g. when switching git branches).
+FOLDER_EVENTS_THRESHOLD = 50
+
+# Limits in seconds for the polling interval
+MIN_POLLING_INTERVAL = 1
+MAX_POLLING_INTERVAL = 8
+
 
 # ---- Monkey patches
 # -----------------------------------------------------------------------------
@@ -78,6 +101,29 @@ def ignore_entry(entry: os.DirEntry) -> bool:
     return False
 
 
+def ignore_path(path: str, root_path: str) -> bool:
+    """
+    Check if a path reported by the observer of `root_path` should be
+    ignored.
+
+    This is the same check done by `ignore_entry`, but only for the parts of
+    path inside `root_path`.
+    """
+    try:
+        parts = Path(path).relative_to(root_path).parts
+    except ValueError:
+        return False
+
+    if any([p.startswith(".") for p in parts]):
+        return True
+
+    for folder in FOLDERS_TO_IGNORE:
+        if folder in parts:
+            return True
+
+    return False
+
+
 def editable_file(entry: os.DirEntry) -> bool:
     """Check if an entry file is editable."""
     if entry.is_file():
@@ -96,6 +142,159 @@ def filter_scandir(path):
     )
 
 
+# ---- Observers
+# -----------------------------------------------------------------------------
+class AdaptivePollingEmitter(PollingEmitter):
+    """
+    Polling emitter that adapts its interval to the time it takes to take a
+    snapshot of the watched folder and to how often it changes.
+
+    The interval grows while nothing changes and goes back to the minimum
+    after a change is detected. It's also kept well above the time taken by
+    a snapshot, so that large folders don't keep a core busy.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.interval = MIN_POLLING_INTERVAL
+        self._changed = False
+
+    def queue_event(self, event):
+        self._changed = True
+        super().queue_event(event)
+
+    def queue_events(self, timeout):
+        self._changed = False
+        start = time.monotonic()
+        super().queue_events(self.interval)
+        snapshot_time = time.monotonic() - start - self.interval
+
+        if self._changed:
+            interval = MIN_POLLING_INTERVAL
+        else:
+            interval = self.interval * 1.5
+
+        self.interval = min(
+            max(interval, 10 * snapshot_time, MIN_POLLING_INTERVAL),
+            MAX_POLLING_INTERVAL
+        )
+
+
+class AdaptivePollingObserver(BaseObserver):
+    """Polling observer that uses AdaptivePollingEmitter."""
+
+    def __init__(self, stat, listdir):
+        super().__init__(
+            partial(AdaptivePollingEmitter, stat=stat, listdir=listdir),
+            timeout=MIN_POLLING_INTERVAL
+        )
+
+
+def get_observer_backend(backend):
+    """
+    Get the observer backend to use for `backend`, which is one of
+    WATCHER_BACKENDS.
+
+    `auto` uses the native observer on Linux and polling on other OSes, and
+    `native` falls back to polling if a native observer is not available.
+    """
+    if backend not in WATCHER_BACKENDS:
+        logger.debug(f"Unknown watcher backend {backend}. Using auto.")
+        backend = "auto"
+
+    if backend == "polling":
+        return "polling"
+
+    # The OS-based observer on Windows has many shortcomings (see
+    # openmsi/openmsistream#56) and the one on Mac is not well tested with
+    # Spyder, so we only use it on Linux.
+    if InotifyObserver is not None and sys.platform.startswith("linux"):
+        return "native"
+    else:
+        return "polling"
+
+
+# ---- Event coalescing
+# -----------------------------------------------------------------------------
+class EventCoalescer:
+    """
+    Collect filesystem events and reduce them to the smallest list of events
+    with the same result.
+
+    For instance, a file created and then modified is reported as created,
+    and a file created and then deleted is not reported at all. Besides,
+    if a folder gets too many events, they are reported as a single change
+    to it.
+    """
+
+    def __init__(self, folder_threshold=FOLDER_EVENTS_THRESHOLD):
+        self.folder_threshold = folder_threshold
+        self._events = {}
+
+    def __bool__(self):
+        return bool(self._events)
+
+    def add_event(self, kind, src_path, is_dir, dest_path=None):
+        """
+        Add an event.
+
+        `kind` can be `created`, `deleted`, `modified` or `moved`.
+        """
+        if kind == "moved":
+            self._events[(src_path, dest_path)] = ("moved", is_dir)
+            return
+
+        previous = self._events.get(src_path)
+        if previous is not None:
+            previous_kind = previous[0]
+            if previous_kind == "created" and kind == "deleted":
+                del self._events[src_path]
+                return
+            elif previous_kind == "created" and kind == "modified":
+                kind = "created"
+            elif previous_kind == "deleted" and kind == "created":
+                kind = "created" if is_dir else "modified"
+
+        self._events[src_path] = (kind, is_dir)
+
+    def pop_events(self):
+        """
+        Return the collected events and clear them.
+
+        Events are returned as a list of `(kind, args)`, where `args` are the
+        arguments of the corresponding signal. Events in folders with too many
+        of them are returned as `("folder_changed", (folder, events))`, where
+        `events` is a list of `(kind, path, is_dir)`.
+        """
+        events, self._events = self._events, {}
+
+        by_folder = {}
+        for key in events:
+            if isinstance(key, str):
+                folder = os.path.dirname(key)
+                by_folder[folder] = by_folder.get(folder, 0) + 1
+
+        result = []
+        batched_folders = {}
+        for key, (kind, is_dir) in events.items():
+            if kind == "moved":
+                result.append((kind, key + (is_dir,)))
+                continue
+
+            folder = os.path.dirname(key)
+            if by_folder[folder] >= self.folder_threshold:
+                if folder not in batched_folders:
+                    batched_folders[folder] = []
+                    result.append(
+                        ("folder_changed", (folder, batched_folders[folder]))
+                    )
+                batched_folders[folder].append((kind, key, is_dir))
+            else:
+                result.append((kind, (key, is_dir)))
+
+        return result
+
+
 # ---- Event handler
 # -----------------------------------------------------------------------------
 class WorkspaceEventHandler(QObject, PatternMatchingEventHandler):
@@ -126,6 +325,10 @@ def __init__(self, parent=None):
             patterns=[f"*{ext}" for ext in EDIT_EXTENSIONS],
         )
 
+        # Root path of the observer. It's used to ignore events that the
+        # native observer reports for hidden and ignored folders.
+        self.root_path = None
+
     def fmt_is_dir(self, is_dir):
         return 'directory' if is_dir else 'file'
 
@@ -159,6 +362,19 @@ def on_modified(self, event):
         self.sig_file_modified.emit(src_path, is_dir)
 
     def dispatch(self, event):
+        if self.root_path is not None:
+            paths = [event.src_path, getattr(event, "dest_path", "")]
+            if all(
+                not path or ignore_path(path, self.root_path)
+                for path in paths
+            ):
+                return
+
+        # Folders are reported as modified every time a file in them changes,
+        # which is not useful and very noisy with the native observer.
+        if event.is_directory and event.event_type == "modified":
+            return
+
         # Don't apply patterns to directories, only to files
         if event.is_directory:
             FileSystemEventHandler.dispatch(self, event)
@@ -173,6 +389,10 @@ class WorkspaceWatcher(QObject):
     Wrapper class around watchdog observer and notifier.
 
     It provides methods to start and stop watching folders.
+
+    Events are collected for a short time and coalesced before they are
+    emitted, so that the many events generated e.g. when switching git
+    branches don't freeze the interface.
     """
 
     observer = None
@@ -182,9 +402,36 @@ class WorkspaceWatcher(QObject):
     sig_file_deleted = Signal(str, bool)
     sig_file_modified = Signal(str, bool)
 
+    sig_folder_changed = Signal(str, list)
+    """
+    This signal is emitted instead of the ones above when a folder has too
+    many changes.
+
+    Parameters
+    ----------
+    folder: str
+        Path to the folder.
+    events: list
+        Changes in the folder, as `(kind, path, is_dir)`, where `kind` can be
+        `created`, `deleted` or `modified`.
+    """
+
+    sig_tree_changed = Signal()
+    """
+    This signal is emitted once after the signals above if files or folders
+    were created, deleted or moved.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.backend = None
         self.event_handler = WorkspaceEventHandler(self)
+        self._coalescer = EventCoalescer()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(EVENTS_TIMEOUT)
+        self._timer.timeout.connect(self._emit_events)
 
         self.event_handler.sig_file_moved.connect(self.on_moved)
         self.event_handler.sig_file_created.connect(self.on_created)
@@ -196,31 +443,57 @@ def connect_signals(self, project):
         self.sig_file_moved.connect(project.file_moved)
         self.sig_file_deleted.connect(project.file_deleted)
         self.sig_file_modified.connect(project.file_modified)
+        self.sig_folder_changed.connect(project.folder_changed)
+        self.sig_tree_changed.connect(project.tree_changed)
+
+    def start(self, workspace_folder, backend="auto"):
+        """
+        Start watching `workspace_folder`.
+
+        Parameters
+        ----------
+        workspace_folder: str
+            Folder to watch.
+        backend: str, optional
+            Observer backend to use. It can be any of WATCHER_BACKENDS.
+        """
+        self.backend = get_observer_backend(backend)
+        self.event_handler.root_path = workspace_folder
+
+        if self.backend == "native":
+            try:
+                self._start_observer(InotifyObserver(), workspace_folder)
+                return
+            except OSError as e:
+                # This happens e.g. when the inotify watches limit is reached
+                logger.debug(
+                    f"Native observer could not be started for "
+                    f"{workspace_folder}: {e}. Using polling instead."
+                )
+                self.observer = None
+                self.backend = "polling"
 
-    def start(self, workspace_folder):
-        # We use a polling observer because:
-        # * It doesn't introduce long freezes on Linux when switching git
-        #   branches that have many changes between them. That's because the
-        #   OS-based observer (i.e. inotify) generates way too many events.
-        # * The OS-based observer on Windows has many shortcomings (see
-        #   openmsi/openmsistream#56).
-        # * There doesn't seem to be issues on Mac, but it's simpler to use a
-        #   single observer for all OSes.
-        self.observer = PollingObserverVFS(
-            stat=os.stat, listdir=filter_scandir
-        )
-
-        self.observer.schedule(
-            self.event_handler, workspace_folder, recursive=True
-        )
-
+        # Polling doesn't introduce long freezes on any OS and we can avoid
+        # scanning ignored folders with it.
         try:
-            self.observer.start()
+            self._start_observer(
+                AdaptivePollingObserver(
+                    stat=os.stat, listdir=filter_scandir
+                ),
+                workspace_folder
+            )
         except Exception:
             logger.debug(
                 f"Observer could not be started for: {workspace_folder}."
             )
 
+    def _start_observer(self, observer, workspace_folder):
+        self.observer = observer
+        self.observer.schedule(
+            self.event_handler, workspace_folder, recursive=True
+        )
+        self.observer.start()
+
     def stop(self):
         if self.observer is not None:
             # This is required to avoid showing an error when closing
@@ -234,18 +507,45 @@ def stop(self):
             except RuntimeError:
                 pass
 
-    @qthrottled(timeout=200)
+        # Discard events of the previous folder
+        self._timer.stop()
+        self._coalescer.pop_events()
+
     def on_moved(self, src_path, dest_path, is_dir):
-        self.sig_file_moved.emit(src_path, dest_path, is_dir)
+        self._add_event("moved", src_path, is_dir, dest_path)
 
-    @qthrottled(timeout=200)
     def on_created(self, path, is_dir):
-        self.sig_file_created.emit(path, is_dir)
+        self._add_event("created", path, is_dir)
 
-    @qthrottled(timeout=200)
     def on_deleted(self, path, is_dir):
-        self.sig_file_deleted.emit(path, is_dir)
+        self._add_event("deleted", path, is_dir)
 
-    @qthrottled(timeout=200)
     def on_modified(self, path, is_dir):
-        self.sig_file_modified.emit(path, is_dir)
+        self._add_event("modified", path, is_dir)
+
+    def _add_event(self, kind, src_path, is_dir, dest_path=None):
+        self._coalescer.add_event(kind, src_path, is_dir, dest_path)
+
+        # Events are emitted at most every EVENTS_TIMEOUT ms, so that they
+        # are not delayed for too long when they keep coming.
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _emit_events(self):
+        signals = {
+            "moved": self.sig_file_moved,
+            "created": self.sig_file_created,
+            "deleted": self.sig_file_deleted,
+            "modified": self.sig_file_modified,
+            "folder_changed": self.sig_folder_changed,
+        }
+
+        tree_changed = False
+        for kind, args in self._coalescer.pop_events():
+            signals[kind].emit(*args)
+            if kind != "modified":
+                tree_changed = True
+
+        # This is emitted once per batch because it's expensive to handle
+        if tree_changed:
+            self.sig_tree_changed.emit()
@@ -427,6 +427,7 @@ def open_project(self, path=None, project_type=None, restart_console=True,
             # TODO: Don't emit sig_project_closed when we support
             # multiple workspaces.
             self.sig_project_closed.emit(self.current_active_project.root_path)
+            self.current_active_project.config.flush()
             self.watcher.stop()
 
         self.current_active_project = project_type
@@ -442,7 +443,10 @@ def open_project(self, path=None, project_type=None, restart_console=True,
             else:
                 self.sig_project_loaded.emit(path)
 
-        self.watcher.start(path)
+        self.watcher.start(
+            path,
+            backend=project_type.get_option('watcher_backend', default='auto')
+        )
 
         if restart_console:
             self.sig_restart_console_requested.emit()
@@ -470,6 +474,7 @@ def close_project(self):
                 QMessageBox.warning(self, "Project close", message)
                 return
 
+            self.current_active_project.config.flush()
             self.current_active_project = None
             self.set_conf('current_project_path', None)
             self._setup_menu_actions()
@@ -755,8 +760,6 @@ def handle_response(self, method, params):
     @Slot(str, bool)
     def file_created(self, src_file, is_dir):
         """Notify LSP server about file creation."""
-        self._update_default_switcher_paths()
-
         # LSP specification only considers file updates
         if is_dir:
             return
@@ -775,8 +778,6 @@ def file_created(self, src_file, is_dir):
     )
     def file_moved(self, src_file, dest_file, is_dir):
         """Notify LSP server about a file that is moved."""
-        self._update_default_switcher_paths()
-
         if is_dir:
             return
 
@@ -802,8 +803,6 @@ def file_moved(self, src_file, dest_file, is_dir):
     @Slot(str, bool)
     def file_deleted(self, src_file, is_dir):
         """Notify LSP server about file deletion."""
-        self._update_default_switcher_paths()
-
         if is_dir:
             return
 
@@ -832,6 +831,40 @@ def file_modified(self, src_file, is_dir):
         }
         return params
 
+    @request(
+        method=lsp.WORKSPACE_DID_CHANGE_WATCHED_FILES, requires_response=False
+    )
+    @Slot(str, list)
+    def folder_changed(self, folder, events):
+        """
+        Notify LSP server about the changes in a folder that had too many of
+        them to report them one by one.
+        """
+        kinds = {
+            'created': lsp.FileChangeType.Created,
+            'deleted': lsp.FileChangeType.Deleted,
+            'modified': lsp.FileChangeType.Changed,
+        }
+
+        # LSP specification only considers file updates
+        entries = [
+            {'file': path, 'kind': kinds[kind]}
+            for kind, path, is_dir in events
+            if not is_dir
+        ]
+        if not entries:
+            return
+
+        params = {
+            'params': entries
+        }
+        return params
+
+    @Slot()
+    def tree_changed(self):
+        """Update switcher paths after files or folders were changed."""
+        self._update_default_switcher_paths()
+
     @request(
         method=lsp.WORKSPACE_DID_CHANGE_WORKSPACE_FOLDERS,
         requires_response=False,
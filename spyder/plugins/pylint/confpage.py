@@ -24,6 +24,21 @@ def setup_page(self):
         settings_group = QGroupBox(_("Settings"))
         save_box = self.create_checkbox(_("Save file before analyzing it"),
                                         'save_before', default=True)
+        cache_box = self.create_checkbox(
+            _("Reuse results of files that didn't change"),
+            'cache_results',
+            tip=_("Don't analyze files again if their contents and pylintrc "
+                  "file didn't change since their last analysis"),
+        )
+        jobs_spin = self.create_spinbox(
+            _("Parallel jobs to analyze several files: "),
+            "",
+            "jobs",
+            min_=0,
+            max_=64,
+            step=1,
+            tip=_("Use 0 to run as many jobs as processors"),
+        )
 
         hist_group = QGroupBox(_("History"))
         hist_label1 = QLabel(_("The following option will be applied at next "
@@ -53,6 +68,8 @@ def setup_page(self):
 
         settings_layout = QVBoxLayout()
         settings_layout.addWidget(save_box)
+        settings_layout.addWidget(cache_box)
+        settings_layout.addWidget(jobs_spin)
         settings_group.setLayout(settings_layout)
 
         hist_layout = QVBoxLayout()
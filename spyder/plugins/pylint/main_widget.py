@@ -12,16 +12,16 @@
 # pylint: disable=R0201
 
 # Standard library imports
+import hashlib
 import os
 import os.path as osp
-import pickle
 import re
 import sys
 import time
 
 # Third party imports
 import pylint
-from qtpy.compat import getopenfilename
+from qtpy.compat import getopenfilenames
 from qtpy.QtCore import (QByteArray, QProcess, QProcessEnvironment, Signal,
                          Slot)
 from qtpy.QtWidgets import (
@@ -38,7 +38,13 @@
 from spyder.api.translations import _
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.config.base import get_conf_path
-from spyder.plugins.pylint.utils import get_pylintrc_path
+from spyder.plugins.pylint.utils import (
+    compute_rate,
+    count_statements,
+    get_module_name,
+    get_pylintrc_path,
+    PylintResultsStore,
+)
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home, get_home_dir
@@ -279,7 +285,8 @@ class PylintWidget(PluginMainWidget):
         "practices, potential bugs, and suggested improvements in your code."
     )
 
-    DATAPATH = get_conf_path("pylint.results")
+    DATAPATH = get_conf_path("pylint.results.sqlite")
+    LEGACY_DATAPATH = get_conf_path("pylint.results")
     VERSION = "1.1.0"
 
     # --- Signals
@@ -313,11 +320,18 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.output = None
         self.error_output = None
         self.filename = None
-        self.rdata = []
+        self.results_store = PylintResultsStore(self.DATAPATH)
+        self.results_store.import_legacy(self.LEGACY_DATAPATH, self.VERSION)
         self.curr_filenames = self.get_conf("history_filenames")
         self.code_analysis_action = None
         self.browse_action = None
 
+        # Files analyzed by the running process, keys of their results and
+        # pending groups of files to analyze together.
+        self._batch = None
+        self._cache_keys = {}
+        self._batches = []
+
         # Widgets
         self.filecombo = PythonModulesComboBox(
             self, id_=PylintWidgetToolbarItems.FileComboBox)
@@ -331,16 +345,6 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.treewidget = ResultsTree(self)
         self.set_content_widget(self.treewidget)
 
-        if osp.isfile(self.DATAPATH):
-            try:
-                with open(self.DATAPATH, "rb") as fh:
-                    data = pickle.loads(fh.read())
-
-                if data[0] == self.VERSION:
-                    self.rdata = data[1:]
-            except (EOFError, ImportError):
-                pass
-
         # Widget setup
         self.filecombo.setInsertPolicy(QComboBox.InsertPolicy.InsertAtTop)
         for fname in self.curr_filenames[::-1]:
@@ -356,6 +360,45 @@ def __init__(self, name=None, plugin=None, parent=None):
     @Slot()
     def _start(self):
         """Start the code analysis."""
+        filename = self.get_filename()
+        cache_key = self.get_cache_key(filename)
+        if (
+            cache_key is not None
+            and cache_key == self.results_store.get_key(osp.abspath(filename))
+        ):
+            # The file and settings didn't change, so show saved results
+            self.output = self.results_store.get_output(
+                osp.abspath(filename)
+            )
+            self.show_data(justanalyzed=True)
+            return
+
+        self._batch = None
+        self._cache_keys = {filename: cache_key}
+        self._start_process(filename)
+
+    def _start_next_batch(self):
+        """Start the analysis of the next group of files, if any."""
+        if not self._batches:
+            self._batch = None
+            self._cache_keys = {}
+            self.output = self.results_store.get_output(
+                osp.abspath(self.get_filename())
+            )
+            self.stop_spinner()
+            self.show_data(justanalyzed=True)
+            self.update_actions()
+            return
+
+        self._batch = self._batches.pop(0)
+        self._start_process(self._batch)
+        self.update_actions()
+
+    def _start_process(self, filename):
+        """
+        Start a pylint process to analyze `filename`, which can also be a list
+        of files to analyze together.
+        """
         self.start_spinner()
         self.output = ""
         self.error_output = ""
@@ -369,7 +412,7 @@ def _start(self):
         process.finished.connect(
             lambda ec, es=QProcess.ExitStatus: self._finished(ec, es))
 
-        command_args = self.get_command(self.get_filename())
+        command_args = self.get_command(filename)
         pythonpath_manager_values = self.get_conf(
             'spyder_pythonpath', default=[], section='pythonpath_manager'
         )
@@ -379,6 +422,7 @@ def _start(self):
         process.start(sys.executable, command_args)
         running = process.waitForStarted()
         if not running:
+            self._batches = []
             self.stop_spinner()
             QMessageBox.critical(
                 self,
@@ -410,6 +454,8 @@ def _read_output(self, error=False):
 
     def _finished(self, exit_code, exit_status):
         if not self.output:
+            self._batch = None
+            self._batches = []
             self.stop_spinner()
             if self.error_output:
                 QMessageBox.critical(
@@ -420,15 +466,58 @@ def _finished(self, exit_code, exit_status):
                 print("pylint error:\n\n" + self.error_output, file=sys.stderr)
             return
 
+        self.output = self.error_output + self.output
+        if self._batch is not None:
+            self._set_batch_data(self._batch)
+            self._start_next_batch()
+            return
+
         filename = self.get_filename()
         rate, previous, results = self.parse_output(self.output)
         self._save_history()
-        self.set_data(filename, (time.localtime(), rate, previous, results))
-        self.output = self.error_output + self.output
+        self.set_data(
+            filename,
+            (time.localtime(), rate, previous, results),
+            key=self._cache_keys.get(filename),
+            output=self.output,
+        )
         self.show_data(justanalyzed=True)
         self.update_actions()
         self.stop_spinner()
 
+    def _set_batch_data(self, filenames):
+        """
+        Split the output of a process that analyzed several files and set
+        the data of each one.
+
+        Pylint only gives the global rate of all files in that case, so the
+        rate of each file is computed from its messages.
+        """
+        _rate, _previous, results = self.parse_output(self.output)
+        modules = {get_module_name(filename): filename
+                   for filename in filenames}
+        file_results = {
+            filename: {"C:": [], "R:": [], "W:": [], "E:": []}
+            for filename in filenames
+        }
+        for category, messages in results.items():
+            for message in messages:
+                filename = modules.get(message[0])
+                if filename is not None:
+                    file_results[filename][category].append(message)
+
+        for filename in filenames:
+            data = self.get_data(filename)
+            previous = data[1] if data is not None and data[1] else ""
+            results = file_results[filename]
+            rate = compute_rate(results, count_statements(filename))
+            self.set_data(
+                filename,
+                (time.localtime(), rate, previous, results),
+                key=self._cache_keys.get(filename),
+                output=self.output,
+            )
+
     def _check_new_file(self):
         fname = self.get_filename()
         if fname != self.filename:
@@ -440,6 +529,8 @@ def _is_running(self):
         return process is not None and process.state() == QProcess.Running
 
     def _kill_process(self):
+        self._batch = None
+        self._batches = []
         self._process.close()
         self._process.waitForFinished(1000)
         self.stop_spinner()
@@ -579,7 +670,7 @@ def setup(self):
 
         self.show_data()
 
-        if self.rdata:
+        if self.results_store:
             self.remove_obsolete_items()
             self.filecombo.insertItems(0, self.get_filenames())
             self.code_analysis_action.setEnabled(self.filecombo.is_valid())
@@ -607,6 +698,7 @@ def update_actions(self):
 
     def on_close(self):
         self.stop_code_analysis()
+        self.results_store.close()
 
     # --- Public API
     # ------------------------------------------------------------------------
@@ -665,8 +757,6 @@ def set_filename(self, filename):
         if self.get_filename() == filename:
             return
 
-        index, _data = self.get_data(filename)
-
         if filename not in self.curr_filenames:
             self.filecombo.insertItem(0, filename)
             self.curr_filenames.insert(0, filename)
@@ -708,6 +798,70 @@ def start_code_analysis(self, filename=None):
 
         self.update_actions()
 
+    def start_batch_analysis(self, filenames):
+        """
+        Perform code analysis for several `filenames`.
+
+        Files are analyzed together, with the number of parallel jobs set in
+        Preferences, in as few pylint processes as possible. Files whose
+        contents and settings didn't change since their last analysis are
+        skipped.
+        """
+        if self._is_running():
+            self._kill_process()
+
+        filenames = [
+            osp.normpath(filename) for filename in filenames
+            if is_module_or_package(filename)
+        ]
+        if not filenames:
+            return
+
+        # Leave the first file as the current one
+        for filename in filenames[::-1]:
+            self.set_filename(filename)
+        self._save_history()
+
+        self._cache_keys = {}
+        pending = []
+        for filename in filenames:
+            cache_key = self.get_cache_key(filename)
+            if (
+                cache_key is None
+                or cache_key != self.results_store.get_key(
+                    osp.abspath(filename))
+            ):
+                self._cache_keys[filename] = cache_key
+                pending.append(filename)
+
+        self.output = ""
+        self._batches = self.get_batches(pending)
+        self._start_next_batch()
+
+    def get_batches(self, filenames):
+        """
+        Group `filenames` to analyze them in the same pylint process.
+
+        Files in a group use the same pylintrc file and have different
+        module names, so that their results can be told apart.
+        """
+        batches = []
+        for filename in filenames:
+            pylintrc_path = self.get_pylintrc_path(filename)
+            module_name = get_module_name(filename)
+            for batch_pylintrc_path, module_names, batch in batches:
+                if (
+                    batch_pylintrc_path == pylintrc_path
+                    and module_name not in module_names
+                ):
+                    module_names.add(module_name)
+                    batch.append(filename)
+                    break
+            else:
+                batches.append((pylintrc_path, {module_name}, [filename]))
+
+        return [batch for __, __, batch in batches]
+
     def stop_code_analysis(self):
         """
         Stop the code analysis process.
@@ -719,42 +873,33 @@ def remove_obsolete_items(self):
         """
         Removing obsolete items.
         """
-        self.rdata = [(filename, data) for filename, data in self.rdata
-                      if is_module_or_package(filename)]
+        self.results_store.remove([
+            filename for filename in self.results_store.filenames()
+            if not is_module_or_package(filename)
+        ])
 
     def get_filenames(self):
         """
         Return all filenames for which there is data available.
         """
-        return [filename for filename, _data in self.rdata]
+        return self.results_store.filenames()
 
     def get_data(self, filename):
         """
-        Get and load code analysis data for given `filename`.
+        Get code analysis data for given `filename`, or None if it wasn't
+        analyzed.
         """
-        filename = osp.abspath(filename)
-        for index, (fname, data) in enumerate(self.rdata):
-            if fname == filename:
-                return index, data
-        else:
-            return None, None
+        return self.results_store.get(osp.abspath(filename))
 
-    def set_data(self, filename, data):
+    def set_data(self, filename, data, key=None, output=None):
         """
         Set and save code analysis `data` for given `filename`.
-        """
-        filename = osp.abspath(filename)
-        index, _data = self.get_data(filename)
-        if index is not None:
-            self.rdata.pop(index)
-
-        self.rdata.insert(0, (filename, data))
 
-        while len(self.rdata) > self.get_conf("max_entries"):
-            self.rdata.pop(-1)
-
-        with open(self.DATAPATH, "wb") as fh:
-            pickle.dump([self.VERSION] + self.rdata, fh, 2)
+        `key` identifies the file contents and settings used to get `data`
+        (see `get_cache_key`) and `output` is the pylint output.
+        """
+        self.results_store.set(osp.abspath(filename), data, key, output)
+        self.results_store.trim(self.get_conf("max_entries"))
 
     def show_data(self, justanalyzed=False):
         """
@@ -776,7 +921,7 @@ def show_data(self, justanalyzed=False):
         if not filename:
             return
 
-        _index, data = self.get_data(filename)
+        data = self.get_data(filename)
         if data is None:
             text = _("Source code has not been rated yet.")
             self.treewidget.clear_results()
@@ -859,14 +1004,20 @@ def select_file(self, filename=None):
         """
         if filename is None or isinstance(filename, bool):
             self.sig_redirect_stdio_requested.emit(False)
-            filename, _selfilter = getopenfilename(
+            filenames, _selfilter = getopenfilenames(
                 self,
-                _("Select Python file"),
+                _("Select Python files"),
                 getcwd_or_home(),
                 _("Python files") + " (*.py ; *.pyw)",
             )
             self.sig_redirect_stdio_requested.emit(True)
 
+            if len(filenames) > 1:
+                self.start_batch_analysis(filenames)
+                return
+
+            filename = filenames[0] if filenames else None
+
         if filename:
             self.set_filename(filename)
             self.start_code_analysis()
@@ -903,10 +1054,47 @@ def test_for_custom_interpreter(self):
 
         return path_of_custom_interpreter
 
+    def get_cache_key(self, filename):
+        """
+        Get a key that identifies the contents of `filename` and the settings
+        used to analyze it, to reuse its results if they don't change.
+
+        Returns None if results shouldn't be reused.
+        """
+        if not self.get_conf("cache_results"):
+            return None
+
+        key = hashlib.sha256()
+        settings = [
+            PYLINT_VER,
+            self.test_for_custom_interpreter(),
+            self.get_conf(
+                'spyder_pythonpath', default=[], section='pythonpath_manager'
+            ),
+        ]
+        key.update(repr(settings).encode("utf-8"))
+
+        pylintrc_path = self.get_pylintrc_path(filename=filename)
+        try:
+            with open(filename, "rb") as f:
+                key.update(f.read())
+            if pylintrc_path is not None:
+                key.update(pylintrc_path.encode("utf-8"))
+                with open(pylintrc_path, "rb") as f:
+                    key.update(f.read())
+        except OSError:
+            return None
+
+        return key.hexdigest()
+
     def get_command(self, filename):
         """
-        Return command to use to run code analysis on given filename
+        Return command to use to run code analysis on given filename.
+
+        If `filename` is a list of filenames, they are analyzed together, with
+        parallel jobs.
         """
+        filenames = filename if isinstance(filename, list) else [filename]
         command_args = []
         if PYLINT_VER is not None:
             command_args = [
@@ -927,11 +1115,14 @@ def get_command(self, filename):
                         path_of_custom_interpreter.replace("\\", "\\\\")),
             ]
 
-        pylintrc_path = self.get_pylintrc_path(filename=filename)
+        pylintrc_path = self.get_pylintrc_path(filename=filenames[0])
         if pylintrc_path is not None:
             command_args += ["--rcfile={}".format(pylintrc_path)]
 
-        command_args.append(filename)
+        if len(filenames) > 1:
+            command_args.append("--jobs={}".format(self.get_conf("jobs")))
+
+        command_args += filenames
         return command_args
 
     @staticmethod
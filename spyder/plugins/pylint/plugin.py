@@ -254,6 +254,18 @@ def start_code_analysis(self, filename=None):
         self.switch_to_plugin(force_focus=True)
         self.get_widget().start_code_analysis(filename)
 
+    def start_batch_analysis(self, filenames):
+        """
+        Perform code analysis for several `filenames` in as few pylint
+        processes as possible, with parallel jobs.
+        """
+        editor = self.get_plugin(Plugins.Editor)
+        if editor and self.get_conf("save_before", True):
+            editor.save_all()
+
+        self.switch_to_plugin(force_focus=True)
+        self.get_widget().start_batch_analysis(filenames)
+
     def stop_code_analysis(self):
         """
         Stop the code analysis process.
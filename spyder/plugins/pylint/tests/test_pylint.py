@@ -34,7 +34,11 @@
 from spyder.config.base import running_in_ci
 from spyder.config.manager import CONF
 from spyder.plugins.pylint.plugin import Pylint
-from spyder.plugins.pylint.utils import get_pylintrc_path
+from spyder.plugins.pylint.utils import (
+    get_module_name,
+    get_pylintrc_path,
+    PylintResultsStore,
+)
 from spyder.utils.conda import get_list_conda_envs
 from spyder.utils.misc import get_python_executable
 
@@ -218,7 +222,7 @@ def test_pylint_widget_noproject(pylint_plugin, pylint_test_script, mocker,
     pylint_widget = pylint_plugin.get_widget()
 
     qtbot.waitUntil(
-        lambda: pylint_widget.get_data(pylint_test_script)[1] is not None,
+        lambda: pylint_widget.get_data(pylint_test_script) is not None,
         timeout=10000)
     pylint_data = pylint_widget.get_data(filename=pylint_test_script)
 
@@ -245,14 +249,14 @@ def test_pylint_widget_pylintrc(
     pylint_widget = pylint_plugin.get_widget()
     pylint_plugin.start_code_analysis(filename=pylint_test_script)
     qtbot.waitUntil(
-        lambda: pylint_widget.get_data(pylint_test_script)[1] is not None,
+        lambda: pylint_widget.get_data(pylint_test_script) is not None,
         timeout=5000)
     pylint_data = pylint_widget.get_data(filename=pylint_test_script)
 
     print(pylint_data)
 
     assert pylint_data
-    conventions = pylint_data[1][3]["C:"]
+    conventions = pylint_data[3]["C:"]
     assert conventions
     assert len(conventions) == len(bad_names)
     assert all([sum([bad_name in message[2] for message in conventions]) == 1
@@ -324,18 +328,112 @@ def test_custom_interpreter(pylint_plugin, tmp_path, qtbot,
     pylint_widget = pylint_plugin.get_widget()
     pylint_plugin.start_code_analysis(filename=str(file_path))
     qtbot.waitUntil(
-        lambda: pylint_widget.get_data(file_path)[1] is not None,
+        lambda: pylint_widget.get_data(file_path) is not None,
         timeout=5000)
     pylint_data = pylint_widget.get_data(filename=str(file_path))
 
     # Assert no import errors are reported for custom interpreters
-    errors = pylint_data[1][3]["E:"]
+    errors = pylint_data[3]["E:"]
     if custom_interpreter:
         assert not errors
     else:
         assert errors
 
 
+def test_results_store(tmp_path):
+    """Test that results are saved and loaded from disk."""
+    path = str(tmp_path / "results.sqlite")
+    store = PylintResultsStore(path)
+    for n in range(4):
+        store.set("file_{}.py".format(n), {"n": n}, key=str(n), output="")
+
+    # Setting results again makes them the most recent ones
+    store.set("file_0.py", {"n": 0}, key="new")
+    store.remove(["file_1.py"])
+    store.trim(2)
+    assert store.filenames() == ["file_0.py", "file_3.py"]
+    store.close()
+
+    store = PylintResultsStore(path)
+    assert store.filenames() == ["file_0.py", "file_3.py"]
+    assert store.get("file_3.py") == {"n": 3}
+    assert store.get_key("file_0.py") == "new"
+    assert store.get("file_1.py") is None
+    store.close()
+
+
+def test_get_module_name(tmp_path):
+    """Test that module names are the ones used by pylint."""
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (tmp_path / "script.py").write_text("")
+
+    assert get_module_name(str(tmp_path / "script.py")) == "script"
+    assert get_module_name(str(package / "module.py")) == "package.module"
+    assert get_module_name(str(package / "__init__.py")) == "package"
+
+
+def test_pylint_cached_results(pylint_plugin, pylint_test_script, qtbot,
+                               mocker):
+    """Test that files are not analyzed again if they didn't change."""
+    pylint_widget = pylint_plugin.get_widget()
+    pylint_plugin.start_code_analysis(filename=pylint_test_script)
+    qtbot.waitUntil(
+        lambda: pylint_widget.get_data(pylint_test_script) is not None,
+        timeout=10000)
+    qtbot.waitUntil(lambda: not pylint_widget._is_running(), timeout=5000)
+    data = pylint_widget.get_data(pylint_test_script)
+
+    # Results are reused
+    start_process = mocker.patch.object(pylint_widget, "_start_process")
+    pylint_plugin.start_code_analysis(filename=pylint_test_script)
+    assert not start_process.called
+    assert pylint_widget.get_data(pylint_test_script) == data
+    assert pylint_widget.output
+
+    # Until the file changes
+    with open(pylint_test_script, "a") as f:
+        f.write("\n# Changed\n")
+    pylint_plugin.start_code_analysis(filename=pylint_test_script)
+    assert start_process.called
+
+
+def test_pylint_batch_analysis(pylint_plugin, pylint_test_scripts, qtbot,
+                               mocker):
+    """Test that several files are analyzed in a single pylint process."""
+    pylint_widget = pylint_plugin.get_widget()
+    pylint_widget.set_conf("jobs", 2)
+    scripts = pylint_test_scripts(
+        ["test_batch_{}.py".format(n) for n in range(3)])
+    with open(scripts[2], "a") as f:
+        f.write("print(undefined_name)\n")
+
+    start_process = mocker.spy(pylint_widget, "_start_process")
+    pylint_plugin.start_batch_analysis(scripts)
+    qtbot.waitUntil(
+        lambda: all(pylint_widget.get_data(s) is not None for s in scripts),
+        timeout=20000)
+    qtbot.waitUntil(lambda: not pylint_widget._is_running(), timeout=5000)
+
+    assert start_process.call_count == 1
+    command = pylint_widget.get_command(scripts)
+    assert "--jobs=2" in command
+    assert command[-3:] == scripts
+
+    # Results are split by file
+    for script in scripts[:2]:
+        date, rate, previous, results = pylint_widget.get_data(script)
+        assert not results["E:"]
+        assert float(rate) > 0
+    errors = pylint_widget.get_data(scripts[2])[3]["E:"]
+    assert [message[3] for message in errors] == ["E0602"]
+
+    # The first file is shown
+    assert pylint_widget.get_filename() == scripts[0]
+    assert "test_batch_0.py" in pylint_widget.treewidget.filename
+
+
 def test_get_environment(mocker):
     """Test that the environment variables depend on the OS."""
     if os.name == 'nt':
@@ -9,8 +9,12 @@
 
 
 # Standard library imports
+import ast
+import logging
 import os
 import os.path as osp
+import pickle
+import sqlite3
 
 # Third party imports
 # This is necessary to avoid a crash at startup
@@ -21,6 +25,9 @@
     pylint_config = None
 
 
+logger = logging.getLogger(__name__)
+
+
 def _find_pylintrc_path(path):
     if pylint_config is not None:
         os.chdir(path)
@@ -50,9 +57,197 @@ def get_pylintrc_path(search_paths=None, home_path=None):
             ):
                 break
     except Exception:
-        # * Capturing all exceptions is necessary to solve issues such as
+        # Capturing all exceptions is necessary to solve issues such as
         # spyder-ide/spyder#21218.
-        # * Ensure working directory is restored if any error occurs.
+        pass
+    finally:
+        # Restore the working directory, which was changed to search for
+        # pylintrc files, so that it doesn't change the next search.
         os.chdir(current_cwd)
 
     return pylintrc_path
+
+
+def get_module_name(filename):
+    """
+    Get the name pylint uses for the module of a file in its output.
+
+    That's the dotted name from the topmost package that contains the file.
+    """
+    directory, basename = osp.split(osp.abspath(filename))
+    name = osp.splitext(basename)[0]
+    parts = [] if name == "__init__" else [name]
+    while osp.isfile(osp.join(directory, "__init__.py")):
+        directory, package = osp.split(directory)
+        if not package:
+            break
+        parts.insert(0, package)
+
+    return ".".join(parts)
+
+
+def count_statements(filename):
+    """
+    Count the statements of a file, as pylint does to compute its score.
+
+    Returns None if the file can't be parsed.
+    """
+    try:
+        with open(filename, "rb") as f:
+            tree = ast.parse(f.read(), filename=filename)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    return sum(isinstance(node, ast.stmt) for node in ast.walk(tree))
+
+
+def compute_rate(results, statements):
+    """
+    Compute the score of a file from its results with the default formula
+    of pylint.
+
+    Returns None if the score can't be computed.
+    """
+    if not statements:
+        return None
+
+    errors = len(results["E:"])
+    others = len(results["W:"]) + len(results["R:"]) + len(results["C:"])
+    score = max(0, 10.0 - (float(5 * errors + others) / statements) * 10)
+    return "{:.2f}".format(score)
+
+
+class PylintResultsStore:
+    """
+    History of code analysis results, saved in an SQLite database.
+
+    Entries are kept in memory, from the least to the most recently analyzed
+    file, and only the ones that change are written to disk. If the database
+    can't be opened, results are only kept in memory.
+
+    Each entry has the analysis data of a file, the key of the file contents
+    and settings that produced it, and the pylint output.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = {}
+        self._last_position = 0
+        self._connection = None
+
+        try:
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "filename TEXT PRIMARY KEY, position INTEGER, key TEXT, "
+                    "data BLOB, output TEXT)"
+                )
+            rows = connection.execute(
+                "SELECT filename, position, key, data, output FROM results "
+                "ORDER BY position"
+            ).fetchall()
+        except sqlite3.Error:
+            logger.debug("Could not open %s", path, exc_info=True)
+            return
+
+        self._connection = connection
+        for filename, position, key, data, output in rows:
+            try:
+                data = pickle.loads(data)
+            except Exception:
+                continue
+            self._entries[filename] = (key, data, output)
+            self._last_position = position
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, filename):
+        return filename in self._entries
+
+    def filenames(self):
+        """Get the filenames with results, most recently analyzed first."""
+        return list(reversed(self._entries))
+
+    def get(self, filename):
+        """Get the analysis data of `filename`, or None."""
+        entry = self._entries.get(filename)
+        return None if entry is None else entry[1]
+
+    def get_key(self, filename):
+        """Get the key of the results of `filename`, or None."""
+        entry = self._entries.get(filename)
+        return None if entry is None else entry[0]
+
+    def get_output(self, filename):
+        """Get the pylint output of the results of `filename`, or None."""
+        entry = self._entries.get(filename)
+        return None if entry is None else entry[2]
+
+    def set(self, filename, data, key=None, output=None):
+        """Set the results of `filename`, as the most recent ones."""
+        self._entries.pop(filename, None)
+        self._entries[filename] = (key, data, output)
+        self._last_position += 1
+        self._execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+            [(filename, self._last_position, key,
+              pickle.dumps(data, 2), output)]
+        )
+
+    def remove(self, filenames):
+        """Remove the results of `filenames`."""
+        filenames = [f for f in filenames if f in self._entries]
+        for filename in filenames:
+            del self._entries[filename]
+        if filenames:
+            self._execute(
+                "DELETE FROM results WHERE filename = ?",
+                [(filename,) for filename in filenames]
+            )
+
+    def trim(self, max_entries):
+        """Only keep the results of the `max_entries` most recent files."""
+        excess = len(self._entries) - max_entries
+        if excess > 0:
+            self.remove(list(self._entries)[:excess])
+
+    def import_legacy(self, path, version):
+        """
+        Import results saved by previous versions in a pickle file, which is
+        removed afterwards.
+        """
+        if not osp.isfile(path):
+            return
+
+        try:
+            with open(path, "rb") as fh:
+                data = pickle.loads(fh.read())
+        except Exception:
+            data = None
+
+        if data and data[0] == version and not self._entries:
+            # Legacy results are sorted from the most recent
+            for filename, file_data in reversed(data[1:]):
+                self.set(filename, file_data)
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def close(self):
+        """Close the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _execute(self, query, parameters):
+        if self._connection is None:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(query, parameters)
+        except sqlite3.Error:
+            logger.debug("Could not write to %s", self.path, exc_info=True)
@@ -79,6 +79,9 @@ class SpyderRemoteFileIOAPI(SpyderBaseJupyterAPI, RawIOBase):
     copy of the file, and then the file will be replaced with the copy upon
     closing.
 
+    File contents are sent in binary websocket frames if the server supports
+    them, and base64-encoded in JSON messages otherwise.
+
     Parameters
     ----------
     file : str
@@ -120,6 +123,7 @@ def __init__(
         self.lock = lock
 
         self._websocket: aiohttp.ClientWebSocketResponse = None
+        self._binary = False
 
     async def _raise_for_status(self, response):
         response.raise_for_status()
@@ -138,7 +142,11 @@ async def connect(self):
                 "atomic": str(self.atomic).lower(),
                 "lock": str(self.lock).lower(),
                 "encoding": self.encoding,
+                "binary": "true",
             },
+            # Data is not split in several frames, so this has to be as large
+            # as the largest chunk read from the file.
+            max_msg_size=0,
         )
 
         try:
@@ -157,7 +165,10 @@ async def connect(self):
     async def _check_connection(self):
         status = await self._websocket.receive()
 
-        if status.type == aiohttp.WSMsgType.CLOSE:
+        if status.type == aiohttp.WSMsgType.BINARY:
+            # Servers that don't support binary frames don't send this
+            self._binary = json.loads(status.data).get("binary", False)
+        elif status.type == aiohttp.WSMsgType.CLOSE:
             await self._websocket.close()
             if status.data == 1002:
                 data = json.loads(status.extra)
@@ -215,9 +226,39 @@ def _encode_data(self, data: bytes | str | object) -> str:
             return base64.b64encode(data.encode(self.encoding)).decode("ascii")
         return data
 
+    def _decode_frame(self, frame: bytes) -> str | bytes:
+        """Decode data from a binary frame."""
+        if "b" in self.mode:
+            return frame
+        return frame.decode(self.encoding)
+
+    def _encode_frame(self, data: bytes | str) -> bytes:
+        """Encode data for a binary frame."""
+        if isinstance(data, str):
+            return data.encode(self.encoding)
+        return data
+
     async def _send_request(self, method: str, **args):
         await self._websocket.send_json({"method": method, **args})
 
+    async def _send_data_request(self, method: str, data, **args):
+        """Send a request with file contents, which can be a list."""
+        if not self._binary:
+            if isinstance(data, list):
+                data = [self._encode_data(d) for d in data]
+            else:
+                data = self._encode_data(data)
+            await self._send_request(method, data=data, **args)
+            return
+
+        is_list = isinstance(data, list)
+        frames = data if is_list else [data]
+        await self._send_request(
+            method, frames=len(frames), list=is_list, **args
+        )
+        for frame in frames:
+            await self._websocket.send_bytes(self._encode_frame(frame))
+
     async def _get_response(self, timeout=None):
         message = json.loads(
             await self._websocket.receive_bytes(timeout=timeout)
@@ -236,6 +277,15 @@ async def _get_response(self, timeout=None):
                 message.get("tracebacks", []),
             )
 
+        if "frames" in message:
+            data = [
+                self._decode_frame(
+                    await self._websocket.receive_bytes(timeout=timeout)
+                )
+                for __ in range(message["frames"])
+            ]
+            return data if message.get("list") else data[0]
+
         data = message.get("data")
         if data is None:
             return None
@@ -261,7 +311,7 @@ async def __anext__(self):
 
     async def write(self, s: bytes | str) -> int:
         """Write data to the file."""
-        await self._send_request("write", data=self._encode_data(s))
+        await self._send_data_request("write", s)
         return await self._get_response()
 
     async def flush(self):
@@ -316,9 +366,7 @@ async def readlines(self, hint: int = -1) -> list[bytes | str]:
 
     async def writelines(self, lines: list[bytes | str]):
         """Write lines to the file."""
-        await self._send_request(
-            "writelines", lines=list(map(self._encode_data, lines))
-        )
+        await self._send_data_request("writelines", list(lines))
         return await self._get_response()
 
     async def isatty(self) -> bool:
@@ -381,15 +429,26 @@ async def _raise_for_status(self, response: aiohttp.ClientResponse):
             data.get("tracebacks", []),
         )
 
-    async def ls(self, path: Path, *, detail: bool = True):
+    async def ls(
+        self,
+        path: Path,
+        *,
+        detail: bool = True,
+        offset: int = 0,
+        limit: int | None = None,
+    ):
+        params = {
+            "path": f"file://{path}",
+            "detail": str(detail).lower(),
+            "offset": offset,
+        }
+        if limit is not None:
+            params["limit"] = limit
+
         # The try/except is neccessary to prevent an error on CIs
         try:
             async with self.session.get(
-                self.api_url / "ls",
-                params={
-                    "path": f"file://{path}",
-                    "detail": str(detail).lower(),
-                },
+                self.api_url / "ls", params=params
             ) as response:
                 async for line in response.content:
                     yield json.loads(line)
@@ -407,6 +466,18 @@ async def info(self, path: Path):
         ) as response:
             return await response.json()
 
+    async def info_batch(self, paths: list[Path]):
+        """
+        Get info about several paths in a single request.
+
+        Paths that can't be accessed get an `error` entry in the result.
+        """
+        async with self.session.post(
+            self.api_url / "info_batch",
+            json={"paths": [f"file://{path}" for path in paths]},
+        ) as response:
+            return await response.json()
+
     async def exists(self, path: Path):
         async with self.session.get(
             self.api_url / "exists",
@@ -414,6 +485,14 @@ async def exists(self, path: Path):
         ) as response:
             return await response.json()
 
+    async def exists_batch(self, paths: list[Path]):
+        """Check if several paths exist in a single request."""
+        async with self.session.post(
+            self.api_url / "exists_batch",
+            json={"paths": [f"file://{path}" for path in paths]},
+        ) as response:
+            return await response.json()
+
     async def is_file(self, path: Path):
         async with self.session.get(
             self.api_url / "isfile",
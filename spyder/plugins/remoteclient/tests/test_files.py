@@ -56,6 +56,28 @@ async def test_write_file(
                 await f.seek(0)
                 assert await f.read() == "Hello, world!"
 
+    @AsyncDispatcher(early_return=False)
+    async def test_write_binary_file(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+    ):
+        """Test that binary data and lines are transferred unchanged."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        # Outside of remote_temp_dir to not change the listings checked below
+        path = self.remote_temp_dir + "-binary.bin"
+        data = bytes(range(256)) * 1024
+        async with file_api_class() as file_api:
+            async with await file_api.open(path, "wb+") as f:
+                assert await f.write(data) == len(data)
+                await f.writelines([b"a\n", b"b\n"])
+                await f.seek(0)
+                assert await f.read() == data + b"a\nb\n"
+
+            assert await file_api.unlink(path) == {"success": True}
+
     @AsyncDispatcher(early_return=False)
     async def test_list_directories(
         self,
@@ -110,6 +132,55 @@ async def test_copy_file(
             )
             assert ls_content[0]["size"] == ls_content[1]["size"]
 
+    @AsyncDispatcher(early_return=False)
+    async def test_list_directories_in_pages(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+    ):
+        """Test that a directory can be listed in pages."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        async with file_api_class() as file_api:
+            ls_content = [
+                ls_file async for ls_file in file_api.ls(self.remote_temp_dir)
+            ]
+            pages = []
+            for offset in range(len(ls_content)):
+                pages += [
+                    ls_file
+                    async for ls_file in file_api.ls(
+                        self.remote_temp_dir, offset=offset, limit=1
+                    )
+                ]
+            assert pages == ls_content
+
+    @AsyncDispatcher(early_return=False)
+    async def test_batch_info(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+    ):
+        """Test getting info of several paths at once."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        paths = [
+            self.remote_temp_dir + "/test.txt",
+            self.remote_temp_dir + "/missing.txt",
+        ]
+        async with file_api_class() as file_api:
+            assert await file_api.exists_batch(paths) == {
+                "exists": [True, False]
+            }
+
+            info, missing = await file_api.info_batch(paths)
+            assert info["name"] == paths[0]
+            assert info["size"] == 13
+            assert missing["name"] == paths[1]
+            assert missing["error"]["errno"] == 2
+
     @AsyncDispatcher(early_return=False)
     async def test_zip_dir(
         self,
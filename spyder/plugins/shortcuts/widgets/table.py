@@ -29,7 +29,7 @@
 from spyder.utils.icon_manager import ima
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.qthelpers import create_toolbutton
-from spyder.utils.stringmatching import get_search_regex, get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher, get_search_regex
 from spyder.widgets.helperwidgets import (
     ClearLineEdit,
     HTMLDelegate,
@@ -524,6 +524,8 @@ def __init__(self, parent):
         self.normal_text = []
         self.context_rich_text = []
         self.letters = ''
+        self.context_matcher = FuzzyMatcher(template='<b>{0}</b>')
+        self.name_matcher = FuzzyMatcher(template='<b>{0}</b>')
         self.label = QLabel()
         self.widths = []
 
@@ -634,9 +636,10 @@ def update_search_letters(self, text):
         self.letters = text
         contexts = [shortcut.context for shortcut in self.shortcuts]
         names = [shortcut.name for shortcut in self.shortcuts]
-        context_results = get_search_scores(
-            text, contexts, template='<b>{0}</b>')
-        results = get_search_scores(text, names, template='<b>{0}</b>')
+        self.context_matcher.set_choices(contexts)
+        self.name_matcher.set_choices(names)
+        context_results = self.context_matcher.get_search_scores(text)
+        results = self.name_matcher.get_search_scores(text)
         __, self.context_rich_text, context_scores = (
             zip(*context_results))
         self.normal_text, self.rich_text, self.scores = zip(*results)
@@ -30,7 +30,7 @@
     SwitcherItem, SwitcherSeparatorItem)
 from spyder.utils.palette import SpyderPalette
 from spyder.widgets.helperwidgets import HTMLDelegate
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher
 from spyder.plugins.switcher.utils import clean_string
 
 
@@ -142,6 +142,7 @@ def __init__(self, parent, help_text=None):
         # Attributes
         self._modes = {}
         self._mode_on = ''
+        self._matcher = FuzzyMatcher(template="<b>{0}</b>")
 
         font_size = self.get_font(SpyderFontType.Interface).pointSize()
         self._item_styles = {
@@ -317,11 +318,8 @@ def setup(self):
             titles.append(title)
 
         search_text = clean_string(search_text)
-        scores = get_search_scores(
-            str(search_text),
-            titles,
-            template=u"<b>{0}</b>"
-        )
+        self._matcher.set_choices(titles)
+        scores = self._matcher.get_search_scores(str(search_text))
 
         for idx, (title, rich_title, score_value) in enumerate(scores):
             item = self.model.item(idx)
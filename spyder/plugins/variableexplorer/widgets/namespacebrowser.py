@@ -93,6 +93,9 @@ def __init__(self, parent):
         self.filename = None
         self.plots_plugin_enabled = False
 
+        # Number of the last namespace view delta received from the kernel
+        self._namespace_view_seq = None
+
         # Widgets
         self.editor = None
         self.shellwidget = None
@@ -187,6 +190,7 @@ def get_view_settings(self):
     def set_shellwidget(self, shellwidget):
         """Bind shellwidget instance to namespace browser"""
         self.shellwidget = shellwidget
+        self._namespace_view_seq = None
 
     def refresh_table(self):
         """Refresh variable table."""
@@ -208,6 +212,10 @@ def update_view(self, kernel_state):
             A new kernel state. The structure of this dictionary is defined in
             the `SpyderKernel.get_state` method of Spyder-kernels.
         """
+        if "namespace_view_delta" in kernel_state:
+            self.process_namespace_view_delta(
+                kernel_state.pop("namespace_view_delta")
+            )
         if "namespace_view" in kernel_state:
             self.process_remote_view(kernel_state.pop("namespace_view"))
         if "var_properties" in kernel_state:
@@ -217,15 +225,23 @@ def refresh_namespacebrowser(self, *, interrupt=True):
         """Refresh namespace browser"""
         if not self.shellwidget.spyder_kernel_ready:
             return
-        self.shellwidget.call_kernel(
-            interrupt=interrupt,
-            callback=self.process_remote_view
-        ).get_namespace_view()
 
-        self.shellwidget.call_kernel(
-            interrupt=interrupt,
-            callback=self.set_var_properties
-        ).get_var_properties()
+        if self.shellwidget.supports_namespace_view_delta:
+            self.shellwidget.call_kernel(
+                interrupt=interrupt,
+                callback=self.process_namespace_view_delta
+            ).get_namespace_view_delta(full=True)
+        else:
+            # Older kernels need two calls
+            self.shellwidget.call_kernel(
+                interrupt=interrupt,
+                callback=self.process_remote_view
+            ).get_namespace_view()
+
+            self.shellwidget.call_kernel(
+                interrupt=interrupt,
+                callback=self.set_var_properties
+            ).get_var_properties()
 
     def set_namespace_view_settings(self):
         """Set the namespace view settings"""
@@ -241,6 +257,57 @@ def process_remote_view(self, remote_view):
         if remote_view is not None:
             self.set_data(remote_view)
 
+    def process_namespace_view_delta(self, delta):
+        """
+        Process the changes in the namespace sent by the kernel.
+
+        Parameters
+        ----------
+        delta: dict
+            The structure of this dictionary is defined in the
+            `SpyderKernel.get_namespace_view_delta` method of Spyder-kernels.
+        """
+        if delta is None:
+            return
+
+        # Deltas can only be applied on top of the previous one, so ask for
+        # the full view if one was missed.
+        if not delta["full"]:
+            if (
+                self._namespace_view_seq is None
+                or delta["seq"] != self._namespace_view_seq + 1
+            ):
+                self.refresh_namespacebrowser(interrupt=False)
+                return
+        self._namespace_view_seq = delta["seq"]
+
+        current_view = self.editor.source_model.get_data() or {}
+        if delta["full"]:
+            view = {}
+            properties = {}
+        else:
+            view = dict(current_view)
+            properties = dict(self.editor.var_properties)
+
+        for name in delta["removed"]:
+            view.pop(name, None)
+            properties.pop(name, None)
+
+        changed_views = {}
+        for name, entry in delta["changed"].items():
+            view[name] = changed_views[name] = entry["view"]
+            properties[name] = entry["properties"]
+
+        self.set_var_properties(properties)
+
+        # Patch rows in place when no variables were added or removed to
+        # avoid resetting the table.
+        if view.keys() == current_view.keys():
+            if changed_views:
+                self.editor.source_model.update_values(changed_views)
+        else:
+            self.set_data(view)
+
     def set_var_properties(self, properties):
         """Set properties of variables"""
         if properties is not None:
@@ -205,6 +205,84 @@ def test_filtering_with_large_rows(namespacebrowser, qtbot):
     assert model.rowCount() == 1
 
 
+def test_namespace_view_delta(namespacebrowser):
+    """
+    Test that deltas sent by the kernel update the namespace browser and
+    that rows are patched in place when no variables are added or removed.
+    """
+    browser = namespacebrowser
+    model = browser.editor.source_model
+
+    def entry(value):
+        return {
+            'view': {'type': 'int', 'size': 1, 'view': str(value),
+                     'python_type': 'int', 'numpy_type': 'Unknown'},
+            'properties': {'len': 1}
+        }
+
+    browser.process_namespace_view_delta(
+        {'full': True, 'seq': 1, 'changed': {'a': entry(1), 'b': entry(2)},
+         'removed': []}
+    )
+    assert model.rowCount() == 2
+    assert set(browser.editor.var_properties) == {'a', 'b'}
+
+    # Changing a value doesn't reset the model
+    with patch.object(model, 'reset') as mock_reset:
+        browser.process_namespace_view_delta(
+            {'full': False, 'seq': 2, 'changed': {'b': entry(3)},
+             'removed': []}
+        )
+        mock_reset.assert_not_called()
+    assert model.get_data()['b']['view'] == '3'
+    assert model.rowCount() == 2
+
+    # Removing and adding variables
+    browser.process_namespace_view_delta(
+        {'full': False, 'seq': 3, 'changed': {'c': entry(4)},
+         'removed': ['a']}
+    )
+    assert list(model.get_data()) == ['b', 'c']
+    assert set(browser.editor.var_properties) == {'b', 'c'}
+
+    # A missed delta is not applied and the full view is requested
+    with patch.object(browser, 'refresh_namespacebrowser') as mock_refresh:
+        browser.process_namespace_view_delta(
+            {'full': False, 'seq': 5, 'changed': {'e': entry(6)},
+             'removed': []}
+        )
+        mock_refresh.assert_called_once()
+    assert list(model.get_data()) == ['b', 'c']
+
+    # Full views replace everything
+    browser.process_namespace_view_delta(
+        {'full': True, 'seq': 5, 'changed': {'d': entry(5)}, 'removed': []}
+    )
+    assert list(model.get_data()) == ['d']
+
+
+def test_refresh_with_old_kernels(namespacebrowser):
+    """
+    Test that the full view is requested with two calls to kernels that
+    can't send namespace view deltas.
+    """
+    browser = namespacebrowser
+    shellwidget = browser.shellwidget
+    call_kernel = shellwidget.call_kernel
+
+    shellwidget.supports_namespace_view_delta = True
+    browser.refresh_namespacebrowser()
+    call_kernel().get_namespace_view_delta.assert_called_once_with(full=True)
+    call_kernel().get_namespace_view.assert_not_called()
+
+    call_kernel.reset_mock()
+    shellwidget.supports_namespace_view_delta = False
+    browser.refresh_namespacebrowser()
+    call_kernel().get_namespace_view_delta.assert_not_called()
+    call_kernel().get_namespace_view.assert_called_once()
+    call_kernel().get_var_properties.assert_called_once()
+
+
 def test_namespacebrowser_plot_with_mute_inline_plotting_true(
         namespacebrowser, qtbot):
     """
@@ -34,6 +34,7 @@ def tmpconfig(tmpdir, request):
 
     def fin():
         """Fixture finalizer to delete the temporary CONF element."""
+        conf.flush()
         shutil.rmtree(path)
 
     request.addfinalizer(fin)
@@ -13,6 +13,9 @@
 NOT_FOUND_SCORE = -1
 NO_SCORE = 0
 
+# Maximum number of queries whose matches are kept by FuzzyMatcher
+MATCHES_CACHE_SIZE = 32
+
 
 def get_search_regex(query, ignore_case=True):
     """Returns a compiled regex pattern to search for query letters in order.
@@ -232,6 +235,157 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+def get_char_mask(text):
+    """
+    Return a bitmask of the characters in text.
+
+    If a text contains another one as a subsequence, all the bits of the mask
+    of the second are set in the mask of the first.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+class FuzzyMatcher:
+    """
+    Search for queries in a list of choices, as get_search_scores does.
+
+    The choices that match a query are kept, so that only they need to be
+    searched when the query is extended, e.g. while it's being typed.
+
+    Parameters
+    ----------
+    ignore_case : bool, optional
+        Optional value perform a case insensitive search (True by default).
+    template : str, optional
+        Optional template string to surround letters found in choices. This is
+        useful when using a rich text editor ('{}' by default).
+        Examples: '<b>{}</b>', '<code>{}</code>', '<i>{}</i>'
+    """
+
+    def __init__(self, ignore_case=True, template='{}'):
+        self.ignore_case = ignore_case
+        self.template = template
+        self.set_choices([])
+
+    def set_choices(self, choices):
+        """
+        Set the list of choices to search in.
+
+        Nothing is done if they didn't change, so the matches of previous
+        queries can be reused.
+        """
+        choices = [str(choice) for choice in choices]
+        if getattr(self, '_choices', None) == choices:
+            return
+
+        self._choices = choices
+        if self.ignore_case:
+            self._search_choices = [choice.lower() for choice in choices]
+        else:
+            self._search_choices = choices
+        self._masks = [
+            get_char_mask(choice) for choice in self._search_choices]
+        self._matches = {}
+
+    def get_matches(self, query):
+        """
+        Return the indexes of the choices that match query.
+
+        Spaces in query are ignored.
+        """
+        query = query.replace(' ', '')
+        key = query.lower() if self.ignore_case else query
+        if not key:
+            return list(range(len(self._choices)))
+
+        if key in self._matches:
+            # Move it to the end to keep the most recent queries
+            matches = self._matches.pop(key)
+            self._matches[key] = matches
+            return matches
+
+        # Choices that don't match a query can't match queries that extend
+        # it, so start from the matches of the longest one of them.
+        candidates = range(len(self._choices))
+        for n in range(len(key) - 1, 0, -1):
+            if key[:n] in self._matches:
+                candidates = self._matches[key[:n]]
+                break
+
+        if len(key) == 1 and key.isascii():
+            search_choices = self._search_choices
+            matches = [i for i in candidates if key in search_choices[i]]
+        else:
+            mask = get_char_mask(key)
+            masks = self._masks
+            choices = self._choices
+            search = get_search_regex(query, self.ignore_case).search
+            matches = [
+                i for i in candidates
+                if masks[i] & mask == mask and search(choices[i])
+            ]
+
+        self._matches[key] = matches
+        if len(self._matches) > MATCHES_CACHE_SIZE:
+            self._matches.pop(next(iter(self._matches)))
+
+        return matches
+
+    def get_search_scores(self, query, valid_only=False, sort=False):
+        """
+        Search for query inside the choices and return a list of tuples.
+
+        This returns the same results as get_search_scores.
+
+        Parameters
+        ----------
+        query : str
+            String with letters to search in each choice (in order of
+            appearance).
+        valid_only : bool, optional
+            Return only the choices that match query.
+        sort : bool, optional
+            Sort the results by score.
+
+        Returns
+        -------
+        results : list of tuples
+            List of tuples where the first item is the text (enriched if a
+            template was used) and a search score. Lower scores means better
+            match.
+        """
+        query = query.replace(' ', '')
+        choices = self._choices
+        if not query:
+            return [(choice, choice, NO_SCORE) for choice in choices]
+
+        matches = self.get_matches(query)
+        results = [(choice, choice, NOT_FOUND_SCORE) for choice in choices]
+        for i in matches:
+            results[i] = self._get_result(query, i)
+
+        if valid_only:
+            results = [r for r in results if r[-1] != NOT_FOUND_SCORE]
+
+        if sort:
+            results = sorted(results, key=lambda row: row[-1])
+
+        return results
+
+    def _get_result(self, query, index):
+        """Get the search result of a choice that matches query."""
+        return get_search_score(
+            query,
+            self._choices[index],
+            ignore_case=self.ignore_case,
+            apply_regex=False,
+            template=self.template
+        )
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
@@ -11,6 +11,8 @@
 
 # Standard library imports
 from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
 import builtins
 import keyword
 import os
@@ -115,6 +117,63 @@ def create_patterns(patterns, compile=False):
 DEFAULT_COMPILED_PATTERNS = re.compile(create_patterns(DEFAULT_PATTERNS,
                                                        compile=True))
 
+# Characters that take two UTF-16 code units in a QString
+ASTRAL_CHARS_REGEXP = re.compile('[\U00010000-\U0010FFFF]')
+
+# Size of the chunks compared at once to find the common prefix and suffix of
+# two texts
+COMPARISON_CHUNK_SIZE = 4096
+
+# Number of lines on which the old and new token streams must agree before
+# reusing the old formats when lexing incrementally
+SYNC_LINES = 2
+
+
+def get_common_prefix_length(text1, text2):
+    """Get the length of the common prefix of two texts."""
+    max_length = min(len(text1), len(text2))
+    length = 0
+
+    # Compare chunks first to avoid a Python loop per character
+    while length < max_length:
+        end = length + COMPARISON_CHUNK_SIZE
+        if text1[length:end] != text2[length:end]:
+            break
+        length = end
+    length = min(length, max_length)
+
+    while length < max_length and text1[length] == text2[length]:
+        length += 1
+
+    return length
+
+
+def get_common_suffix_length(text1, text2, max_length):
+    """
+    Get the length of the common suffix of two texts, up to `max_length`.
+    """
+    len1 = len(text1)
+    len2 = len(text2)
+    length = 0
+
+    # Compare chunks first to avoid a Python loop per character
+    while length < max_length:
+        size = min(COMPARISON_CHUNK_SIZE, max_length - length)
+        if (
+            text1[len1 - length - size:len1 - length]
+            != text2[len2 - length - size:len2 - length]
+        ):
+            break
+        length += size
+
+    while (
+        length < max_length
+        and text1[len1 - length - 1] == text2[len2 - length - 1]
+    ):
+        length += 1
+
+    return length
+
 
 #==============================================================================
 # Syntax highlighting color schemes
@@ -1313,8 +1372,16 @@ def __init__(self, parent, font=None, color_scheme=None):
         # parsing
         self._worker_manager = WorkerManager()
 
-        # Store the format for all the tokens after Pygments parsing
-        self._charlist = []
+        # Store the format for all the tokens after Pygments parsing. This is
+        # a run-length encoded table with the start position of each run of
+        # characters with the same format and the name of that format.
+        self._charlist = (array('q'), [])
+
+        # Text that corresponds to the runs in self._charlist
+        self._charlist_text = None
+
+        # Cache to map Pygments token types to Spyder formats
+        self._fmt_cache = {}
 
         # Flag variable to avoid unnecessary highlights if the worker has not
         # yet finished processing
@@ -1324,74 +1391,299 @@ def stop(self):
         self._worker_manager.terminate_all()
 
     def make_charlist(self):
-        """Parses the complete text and stores format for each character."""
+        """
+        Parses the text that changed and stores format for each character.
+        """
+        text = str(self.document().toPlainText())
 
         def worker_output(worker, output, error):
             """Worker finished callback."""
-            self._charlist = output
             if error is None and output:
+                self._charlist, start, end = output
+                self._charlist_text = text
                 self._allow_highlight = True
-                self.rehighlight()
+                if start == 0 and end >= len(text):
+                    self.rehighlight()
+                else:
+                    self._rehighlight_range(start, end)
             self._allow_highlight = False
 
-        text = str(self.document().toPlainText())
-        tokens = self._lexer.get_tokens(text)
-
         # Before starting a new worker process make sure to end previous
         # incarnations
         self._worker_manager.terminate_all()
 
         worker = self._worker_manager.create_python_worker(
             self._make_charlist,
-            tokens,
-            self._tokmap,
-            self.formats,
+            text,
+            self._charlist_text,
+            self._charlist,
         )
         worker.sig_finished.connect(worker_output)
         worker.start()
 
-    def _make_charlist(self, tokens, tokmap, formats):
+    def _rehighlight_range(self, start, end):
+        """Rehighlight the blocks between positions `start` and `end`."""
+        document = self.document()
+        block = document.findBlock(start)
+        last_block = document.findBlock(max(end - 1, start))
+        while block.isValid():
+            self.rehighlightBlock(block)
+            if block == last_block:
+                break
+            block = block.next()
+
+    def _get_fmt(self, typ):
+        """Get the Spyder format name for the given Pygments token type."""
+        try:
+            return self._fmt_cache[typ]
+        except KeyError:
+            pass
+
+        fmt = 'normal'
+        if typ in self._tokmap:
+            # Exact matches first
+            fmt = self._tokmap[typ]
+        else:
+            # Partial (parent-> child) matches
+            for key, val in self._tokmap.items():
+                if typ in key:  # Checks if typ is a subtype of key.
+                    fmt = val
+                    break
+
+        self._fmt_cache[typ] = fmt
+        return fmt
+
+    def _is_restart_point(self, text, position, runs):
         """
-        Parses the complete text and stores format for each character.
+        Check if lexing can be safely restarted at `position` in `text`.
+
+        Pygments doesn't expose the lexer state, so we use as restart points
+        the beginning of unindented lines that come after a blank line, as
+        long as the text before that line doesn't end in a string or comment
+        (according to `runs`), which could continue after it.
+        """
+        if position == 0:
+            return True
+        if (
+            position < 2
+            or position >= len(text)
+            or text[position - 2:position] != '\n\n'
+            or text[position].isspace()
+        ):
+            return False
+
+        # Last character before the blank lines
+        last = position - 3
+        while last >= 0 and text[last].isspace():
+            last -= 1
+        if last < 0:
+            return True
+
+        starts, fmts = runs
+        index = bisect_right(starts, last) - 1
+        return index >= 0 and fmts[index] not in ('string', 'comment')
+
+    def _get_tokens(self, text, start=0, has_surrogates=False):
+        """
+        Lex `text` from `start` and yield (position, type, token) tuples.
+
+        If `has_surrogates` is True, positions are counted in UTF-16 code
+        units.
+        """
+        # Some lexers need a newline at the end of the text
+        lex_text = text[start:]
+        if not lex_text.endswith('\n'):
+            lex_text += '\n'
+
+        position = start
+        for __, typ, token in self._lexer.get_tokens_unprocessed(lex_text):
+            yield position, typ, token
+            if has_surrogates:
+                position += qstring_length(token)
+            else:
+                position += len(token)
+
+    def _make_charlist(self, text, old_text=None, old_runs=None):
+        """
+        Parses the text and stores format for each run of characters.
 
         Uses the attached lexer to parse into a list of tokens and Pygments
-        token types.  Then breaks tokens into individual letters, each with a
-        Spyder token type attached.  Stores this list as self._charlist.
+        token types. Then merges consecutive tokens with the same Spyder
+        format into runs.
+
+        If the text that corresponds to `old_runs` is given, only the part
+        between the closest restart points around the changed region is
+        lexed again and the rest of the runs are reused. When that can't be
+        done safely, the whole text is lexed.
+
+        Returns
+        -------
+        tuple
+            The new runs and the (start, end) positions of the region whose
+            formats could have changed.
+        """
+        # Qt positions are measured in UTF-16 code units, so characters
+        # outside the BMP count twice. Those documents are always lexed in
+        # full.
+        has_surrogates = ASTRAL_CHARS_REGEXP.search(text) is not None
+        if (
+            old_runs is not None
+            and old_text is not None
+            and not has_surrogates
+        ):
+            if text == old_text:
+                return old_runs, len(text), len(text)
+
+            output = self._make_charlist_incrementally(
+                text, old_text, old_runs
+            )
+            if output is not None:
+                return output
+
+        # Positions are counted in UTF-16 code units, so the length of the
+        # text must be too
+        text_length = qstring_length(text) if has_surrogates else len(text)
+
+        starts = array('q')
+        fmts = []
+        for position, typ, __ in self._get_tokens(
+            text, has_surrogates=has_surrogates
+        ):
+            if position >= text_length:
+                break
+
+            fmt = self._get_fmt(typ)
+            if not fmts or fmts[-1] != fmt:
+                starts.append(position)
+                fmts.append(fmt)
+
+        return (starts, fmts), 0, text_length
 
-        It's attached to the contentsChange signal of the parent QTextDocument
-        so that the charlist is updated whenever the document changes.
+    def _make_charlist_incrementally(self, text, old_text, old_runs):
         """
+        Lex again only the part of `text` that changed from `old_text`.
+
+        Pygments doesn't expose the lexer state, so both texts are lexed
+        again from the closest restart point before the change. The old runs
+        after the change are reused once both token streams line up again at
+        the same offset for `SYNC_LINES` lines, as long as lexing the old
+        text that way reproduces `old_runs` (otherwise the restart point
+        wasn't safe).
+
+        Returns
+        -------
+        tuple or None
+            The same as `_make_charlist`, or None if the whole text needs to
+            be lexed.
+        """
+        # Find the region that changed
+        old_starts, old_fmts = old_runs
+        max_length = min(len(text), len(old_text))
+        prefix_len = get_common_prefix_length(text, old_text)
+        suffix_len = get_common_suffix_length(
+            text, old_text, max_length - prefix_len
+        )
+        new_end = len(text) - suffix_len
+        delta = len(text) - len(old_text)
+
+        # Look for the closest restart point before the change
+        restart = prefix_len
+        while not self._is_restart_point(old_text, restart, old_runs):
+            restart = old_text.rfind('\n\n', 0, restart - 1)
+            restart = 0 if restart == -1 else restart + 2
+
+        index = bisect_left(old_starts, restart)
+        starts = old_starts[:index]
+        fmts = old_fmts[:index]
+
+        old_tokens = self._get_tokens(old_text, restart)
+        old_token = next(old_tokens, None)
+        sync_start = None
+
+        def advance_old_tokens(end):
+            """
+            Advance the old token stream up to `end`, checking that it gives
+            the same formats as the old runs.
+            """
+            nonlocal old_token
+            end = min(end, len(old_text))
+            while old_token is not None and old_token[0] < end:
+                token_start, old_typ, old_value = old_token
+                old_index = bisect_right(old_starts, token_start) - 1
+                if (
+                    old_value
+                    and old_fmts[old_index] != self._get_fmt(old_typ)
+                ):
+                    return False
+                old_token = next(old_tokens, None)
+            return True
+
+        for position, typ, token in self._get_tokens(text, restart):
+            if position >= len(text):
+                break
 
-        def _get_fmt(typ):
-            """Get the Spyder format code for the given Pygments token type."""
-            # Exact matches first
-            if typ in tokmap:
-                return tokmap[typ]
-            # Partial (parent-> child) matches
-            for key, val in tokmap.items():
-                if typ in key: # Checks if typ is a subtype of key.
-                    return val
+            if position >= new_end:
+                old_position = position - delta
+                if not advance_old_tokens(old_position):
+                    return None
+
+                if old_token != (old_position, typ, token):
+                    sync_start = None
+                elif sync_start is None:
+                    # Both streams line up again. Start checking that they
+                    # keep doing it if we're at a restart point in both texts.
+                    if (
+                        self._is_restart_point(text, position, (starts, fmts))
+                        and self._is_restart_point(
+                            old_text, old_position, old_runs
+                        )
+                    ):
+                        sync_start = position
+                elif text.count('\n', sync_start, position) >= SYNC_LINES:
+                    # Reuse the rest of the old runs
+                    old_index = bisect_right(old_starts, old_position) - 1
+                    if not fmts or fmts[-1] != old_fmts[old_index]:
+                        starts.append(position)
+                        fmts.append(old_fmts[old_index])
+                    starts.extend(
+                        start + delta for start in old_starts[old_index + 1:]
+                    )
+                    fmts.extend(old_fmts[old_index + 1:])
+                    return (starts, fmts), restart, position
 
-            return 'normal'
+            fmt = self._get_fmt(typ)
+            if not fmts or fmts[-1] != fmt:
+                starts.append(position)
+                fmts.append(fmt)
 
-        charlist = []
-        for typ, token in tokens:
-            fmt = formats[_get_fmt(typ)]
-            for letter in token:
-                charlist.append((fmt, letter))
+        # No old runs were reused, but lexing from the restart point still
+        # needs to be checked
+        if not advance_old_tokens(len(old_text)):
+            return None
 
-        return charlist
+        return (starts, fmts), restart, len(text)
 
     def highlightBlock(self, text):
         """ Actually highlight the block"""
-        # Note that an undefined blockstate is equal to -1, so the first block
-        # will have the correct behaviour of starting at 0.
         if self._allow_highlight:
-            start = self.previousBlockState() + 1
+            starts, fmts = self._charlist
+            start = self.currentBlock().position()
             end = start + qstring_length(text)
-            for i, (fmt, letter) in enumerate(self._charlist[start:end]):
-                self.setFormat(i, 1, fmt)
-            self.setCurrentBlockState(end)
+
+            index = max(bisect_right(starts, start) - 1, 0)
+            while index < len(starts) and starts[index] < end:
+                run_start = max(starts[index], start)
+                if index + 1 < len(starts):
+                    run_end = min(starts[index + 1], end)
+                else:
+                    run_end = end
+                self.setFormat(
+                    run_start - start,
+                    run_end - run_start,
+                    self.formats[fmts[index]]
+                )
+                index += 1
+
             self.highlight_extras(text)
 
 
@@ -15,7 +15,7 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher, get_search_scores
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +216,30 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_fuzzy_matcher():
+    """Test that FuzzyMatcher gives the same results as get_search_scores."""
+    template = '<b>{0}</b>'
+    names = ['layout preferences', 'use next layout', 'save current layout',
+             'use previous layout', 're-run last script', 'run', 'run file',
+             'Run cell', 'toggle-comment', 'clear line', 'señal', '']
+    matcher = FuzzyMatcher(template=template)
+    matcher.set_choices(names)
+
+    # Extend the query as if it was typed, to reuse previous matches
+    for query in ['r', 'ru', 'run', 'run ', 'run l', 'run la', 'lay', 'e-',
+                  'L', 'se', 'señ', 'xyz', '']:
+        assert matcher.get_search_scores(query) == get_search_scores(
+            query, names, template=template)
+
+        results = get_search_scores(
+            query, names, template=template, valid_only=True, sort=True)
+        assert matcher.get_search_scores(
+            query, valid_only=True, sort=True) == results
+
+    # Changing choices discards previous matches
+    matcher.set_choices(['run', 'cell'])
+    assert matcher.get_matches('ru') == [0]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -5,11 +5,14 @@
 
 """Tests for syntaxhighlighters.py"""
 
+import random
+
 import pytest
 from qtpy.QtWidgets import QApplication
 from qtpy.QtGui import QTextDocument
 
-from spyder.utils.syntaxhighlighters import HtmlSH, PythonSH, MarkdownSH
+from spyder.utils.syntaxhighlighters import (
+    HtmlSH, PythonSH, MarkdownSH, guess_pygments_highlighter)
 
 def compare_formats(actualFormats, expectedFormats, sh):
     assert len(actualFormats) == len(expectedFormats)
@@ -73,6 +76,153 @@ def test_PythonSH_UTF16_string():
     compare_formats(doc.firstBlock().layout().formats(), res, sh)
 
 
+def test_PygmentsSH_incremental_charlist():
+    """
+    Check that only the paragraph that changed is lexed again and that the
+    result is the same as lexing the whole text.
+    """
+    doc = QTextDocument()
+    sh = guess_pygments_highlighter('test.yaml')(doc, color_scheme='Spyder')
+
+    old_text = (
+        'key: 1\n\nother: "x"\n\nlast: 2\n\nmore: 3\nagain: 4\n\nend: "y"\n'
+    )
+    old_runs, start, end = sh._make_charlist(old_text)
+    assert (start, end) == (0, len(old_text))
+
+    new_text = old_text.replace('other', 'another')
+    new_runs, start, end = sh._make_charlist(new_text, old_text, old_runs)
+    full_runs, __, __ = sh._make_charlist(new_text)
+
+    assert list(new_runs[0]) == list(full_runs[0]) == [0, 17, 20, 54, 57]
+    assert new_runs[1] == full_runs[1]
+    assert (start, end) == (new_text.index('another'), new_text.index('end'))
+
+
+@pytest.mark.parametrize(
+    "old_text, new_text",
+    [
+        # Remove blank lines at the beginning
+        ('\n\nfoo: 1\n', 'foo: 1\n'),
+        # YAML plain scalars span blank lines
+        ("b\n\n\n'x'\nb", "b\n\n\n'x'1b"),
+        # The flow sequence opened by the change spans blank lines, but the
+        # comment after them is lexed the same way
+        (
+            'name: x\nversion: 6\n\n# Deps\ndeps:\n  - qtpy\n  - "x"\n\n'
+            'last: true\n',
+            'name: x\nversion:  [\n\n# Deps\ndeps:\n  - qtpy\n  - "x"\n\n'
+            'last: true\n',
+        ),
+    ]
+)
+def test_PygmentsSH_incremental_charlist_fallback(old_text, new_text):
+    """
+    Check that the old runs are only reused when lexing again gives the same
+    result as lexing the whole text.
+    """
+    doc = QTextDocument()
+    sh = guess_pygments_highlighter('test.yaml')(doc, color_scheme='Spyder')
+
+    old_runs, __, __ = sh._make_charlist(old_text)
+    new_runs, __, __ = sh._make_charlist(new_text, old_text, old_runs)
+    full_runs, __, __ = sh._make_charlist(new_text)
+
+    assert list(new_runs[0]) == list(full_runs[0])
+    assert new_runs[1] == full_runs[1]
+
+
+@pytest.mark.parametrize(
+    "filename, text",
+    [
+        (
+            'test.yaml',
+            'name: spyder\nversion: 6\n\n# Dependencies\ndeps:\n  - qtpy\n'
+            '  - "pygments >=2"\n\nauthors:\n  main: "Spyder team"\n'
+            "  other: 'x'\n\nmultiline: |\n  text here\n\n  more\n\n"
+            'last: true\n'
+        ),
+        (
+            'test.json',
+            '{\n  "a": 1,\n  "b": [1, 2, "x"],\n\n  "c": {"d": null}\n}\n\n'
+        ),
+        (
+            'test.toml',
+            '[tool]\nname = "x"\n\n# comment\n[tool.other]\nvalue = 3\n'
+            'list = ["a", \'b\']\n\n[last]\nflag = true\n'
+        ),
+        (
+            'test.c',
+            '#include <stdio.h>\n\n/* comment */\nint main(void)\n{\n'
+            '    printf("hi %d\\n", 1);\n\n    return 0; // done\n}\n\n'
+            'static int x = 3;\n'
+        ),
+        (
+            'test.sh',
+            '#!/bin/bash\n\necho "hello $USER"\n\n# comment\n'
+            'for i in 1 2 3; do\n  echo $i\ndone\n\nexit 0\n'
+        ),
+    ]
+)
+def test_PygmentsSH_incremental_charlist_random_edits(filename, text):
+    """
+    Check that lexing incrementally gives the same result as lexing the whole
+    text after random edits.
+    """
+    doc = QTextDocument()
+    sh = guess_pygments_highlighter(filename)(doc, color_scheme='Spyder')
+    pieces = [
+        'a', 'x', '1', ' ', '\n', '\n\n', ':', ',', '-', '=', '"s"', "'q'",
+        '# c', '[', ']', '{', '}', ';', 'key: v', '/* c */', '//c\n'
+    ]
+    rng = random.Random(filename)
+
+    for __ in range(50):
+        old_text = text * rng.randint(1, 3)
+        old_runs, __, __ = sh._make_charlist(old_text)
+
+        for __ in range(5):
+            start = rng.randint(0, len(old_text))
+            end = rng.randint(start, min(len(old_text), start + 3))
+            inserted = ''.join(
+                rng.choice(pieces) for __ in range(rng.randint(0, 2))
+            )
+            new_text = old_text[:start] + inserted + old_text[end:]
+
+            new_runs, __, __ = sh._make_charlist(
+                new_text, old_text, old_runs
+            )
+            full_runs, __, __ = sh._make_charlist(new_text)
+            assert list(new_runs[0]) == list(full_runs[0])
+            assert new_runs[1] == full_runs[1]
+
+            old_text, old_runs = new_text, new_runs
+
+
+def test_PygmentsSH_UTF16_charlist():
+    """Check that runs are measured in UTF-16 code units."""
+    doc = QTextDocument()
+    sh = guess_pygments_highlighter('test.yaml')(doc, color_scheme='Spyder')
+    runs, __, __ = sh._make_charlist('a: "𨭎"\nb: 1\n')
+    assert list(runs[0]) == [0, 3, 7]
+    assert runs[1] == ['normal', 'string', 'normal']
+
+
+def test_PygmentsSH_UTF16_charlist_end():
+    """
+    Check that the last tokens are not lost when there are many characters
+    outside the BMP.
+    """
+    doc = QTextDocument()
+    sh = guess_pygments_highlighter('test.yaml')(doc, color_scheme='Spyder')
+    text = "a: '" + '😀' * 10 + "'\nb: 1\nc: 'zz'\n# comment\n"
+    runs, __, end = sh._make_charlist(text)
+
+    assert runs[1][-2:] == ['comment', 'normal']
+    assert runs[0][-2] == text.index('#') + 10
+    assert end == len(text) + 10
+
+
 def test_python_string_prefix():
     prefixes = ("r", "u", "R", "U", "f", "F", "fr", "Fr", "fR", "FR",
                 "rf", "rF", "Rf", "RF", "b", "B", "br", "Br", "bR", "BR",
@@ -71,7 +71,7 @@
 from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.qthelpers import mimedata2url
-from spyder.utils.stringmatching import get_search_scores, get_search_regex
+from spyder.utils.stringmatching import FuzzyMatcher, get_search_regex
 from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
     CollectionsDelegate,
     SELECT_ROW_BUTTON_SIZE,
@@ -218,6 +218,7 @@ def __init__(self, parent, data, title="", names=False,
             data = {}
         self._parent = parent
         self.scores = []
+        self.matcher = FuzzyMatcher(template='<b>{0}</b>')
         self.names = names
         self.minmax = minmax
         self.remote = remote
@@ -515,7 +516,8 @@ def update_search_letters(self, text=""):
         """Update search letters with text input in search box."""
         self.letters = text
         names = [str(key) for key in self.keys]
-        results = get_search_scores(text, names, template='<b>{0}</b>')
+        self.matcher.set_choices(names)
+        results = self.matcher.get_search_scores(text)
         if results:
             self.normal_text, _, self.scores = zip(*results)
             self.reset()
@@ -633,6 +635,39 @@ def set_value(self, index, value):
         self.types[index.row()] = get_human_readable_type(value)
         self.sig_setting_data.emit()
 
+    def update_values(self, values):
+        """
+        Update the values of existing keys in place.
+
+        This avoids resetting the model, which is slow for large collections,
+        when only the values of some keys changed.
+
+        Parameters
+        ----------
+        values: dict
+            New values for some of the keys in the model.
+        """
+        rows = {key: row for row, key in enumerate(self.keys)}
+        for key, value in values.items():
+            self._data[key] = value
+            row = rows[key]
+            if row >= self.rows_loaded:
+                continue
+
+            if self.remote:
+                self.sizes[row] = value['size']
+                self.types[row] = value['type']
+            else:
+                self.sizes[row] = get_size(value)
+                self.types[row] = get_human_readable_type(value)
+
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, self.columnCount() - 1)
+            )
+
+        self.sig_setting_data.emit()
+
     def type_to_color(self, python_type, numpy_type):
         """Get the color that corresponds to a Python type."""
         # Color for unknown types